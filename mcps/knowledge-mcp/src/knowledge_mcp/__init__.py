@@ -15,6 +15,8 @@ Attributes:
     __version__: Package version string.
 """
 
+from typing import TYPE_CHECKING
+
 from knowledge_mcp.exceptions import (
     AuthenticationError,
     ConfigurationError,
@@ -26,7 +28,10 @@ from knowledge_mcp.exceptions import (
     TimeoutError,
     ValidationError,
 )
-from knowledge_mcp.server import KnowledgeMCPServer
+from knowledge_mcp.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from knowledge_mcp.server import KnowledgeMCPServer
 
 __version__ = "0.1.0"
 __all__ = [
@@ -44,4 +49,10 @@ __all__ = [
     "InternalError",
     # Metadata
     "__version__",
-]
\ No newline at end of file
+]
+
+# Imported on first access so submodules (e.g. the CLI) don't load the server
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"KnowledgeMCPServer": "knowledge_mcp.server"},
+)
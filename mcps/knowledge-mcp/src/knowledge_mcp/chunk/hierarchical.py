@@ -14,6 +14,9 @@ Example:
 from __future__ import annotations
 
 import re
+from bisect import bisect_left
+from functools import cached_property
+from typing import TYPE_CHECKING, NamedTuple
 
 from knowledge_mcp.chunk.base import (
     BaseChunker,
@@ -22,10 +25,36 @@ from knowledge_mcp.chunk.base import (
     DocumentMetadata,
     ParsedElement,
 )
-from knowledge_mcp.utils.tokenizer import truncate_to_tokens
+from knowledge_mcp.utils.tokenizer import encode_batch, get_encoding, token_offsets
+
+if TYPE_CHECKING:
+    import tiktoken
 
 __all__ = ["HierarchicalChunker"]
 
+# Separator inserted between the overlap and the chunk it precedes
+_OVERLAP_MARKER = "\n\n---\n\n"
+
+# Characters of a chunk's tail encoded to find its overlap. cl100k tokens
+# average about four characters, so this holds roughly twice overlap_tokens.
+_OVERLAP_CHARS_PER_TOKEN = 8
+
+_WHITESPACE = re.compile(r"\s")
+
+
+class _Span(NamedTuple):
+    """Character and token range of one piece of an element's content."""
+
+    start: int
+    end: int
+    first_token: int
+    last_token: int
+
+    @property
+    def tokens(self) -> int:
+        """Number of tokens that start inside the piece."""
+        return self.last_token - self.first_token
+
 
 class HierarchicalChunker(BaseChunker):
     """
@@ -38,6 +67,13 @@ class HierarchicalChunker(BaseChunker):
     - Never splitting tables mid-row
     - Preserving section hierarchy and metadata
 
+    Each element is tokenized once, in a single batched encode for the
+    document. Paragraph, row and overlap boundaries are placed using the
+    character offsets of those token ids, and chunk token counts are
+    summed from them rather than re-encoding joined text, so chunking is
+    linear in document tokens. Summed counts can differ from re-encoding
+    the chunk text by a token at each join.
+
     Attributes:
         config: Chunking configuration.
 
@@ -58,6 +94,12 @@ class HierarchicalChunker(BaseChunker):
         """
         super().__init__(config)
         self._clause_pattern = re.compile(r"\b(\d+(?:\.\d+){0,4})\b")
+        self._separator_tokens: dict[str, int] = {}
+
+    @cached_property
+    def _encoding(self) -> tiktoken.Encoding:
+        """tiktoken encoding for the configured model (loaded on first use)."""
+        return get_encoding(self.config.model)
 
     def chunk(
         self,
@@ -92,10 +134,20 @@ class HierarchicalChunker(BaseChunker):
         if not elements:
             raise ValueError("Elements list cannot be empty")
 
+        # Tokenize every element (and table caption) in one batch
+        captions = [
+            element.metadata.get("caption", "") if element.element_type == "table" else ""
+            for element in elements
+        ]
+        encoded = encode_batch(
+            [element.content for element in elements] + captions, self.config.model
+        )
+
         chunks: list[ChunkResult] = []
 
-        for element in elements:
-            element_chunks = self._chunk_element(element)
+        for i, element in enumerate(elements):
+            caption_tokens = len(encoded[len(elements) + i])
+            element_chunks = self._chunk_element(element, encoded[i], caption_tokens)
             chunks.extend(element_chunks)
 
         # Add overlap between adjacent chunks
@@ -108,49 +160,110 @@ class HierarchicalChunker(BaseChunker):
 
         return chunks
 
-    def _chunk_element(self, element: ParsedElement) -> list[ChunkResult]:
+    def _count_separator(self, separator: str) -> int:
+        """Token count of a join separator, memoized per chunker."""
+        if separator not in self._separator_tokens:
+            self._separator_tokens[separator] = self._count_tokens(separator)
+        return self._separator_tokens[separator]
+
+    def _spans(
+        self,
+        content: str,
+        token_ids: list[int],
+        separator: str,
+        include_separator: bool = False,
+    ) -> list[_Span]:
+        """
+        Split content on separator and locate each piece's tokens.
+
+        A token belongs to the piece its first character falls in, so the
+        tokens of pieces first..last are token_ids[first.first_token:last.last_token].
+
+        Args:
+            content: Element content.
+            token_ids: Token ids of content.
+            separator: Piece separator (paragraph or table row).
+            include_separator: Also count tokens starting in the separator
+                after each piece, for pieces that are rejoined out of order.
+
+        Returns:
+            One span per piece of content.split(separator).
+        """
+        offsets = token_offsets(token_ids, self.config.model)
+        trailing = len(separator) if include_separator else 0
+        spans: list[_Span] = []
+        start = 0
+        for piece in content.split(separator):
+            end = start + len(piece)
+            spans.append(
+                _Span(
+                    start,
+                    end,
+                    bisect_left(offsets, start),
+                    bisect_left(offsets, end + trailing),
+                )
+            )
+            start = end + len(separator)
+        return spans
+
+    def _make_chunk(
+        self,
+        element: ParsedElement,
+        content: str,
+        token_count: int,
+    ) -> ChunkResult:
+        """Build a chunk carrying the element's hierarchy and metadata."""
+        return ChunkResult(
+            content=content,
+            token_count=token_count,
+            section_hierarchy=element.section_hierarchy.copy(),
+            clause_number=self._extract_clause_number(
+                element.section_hierarchy, element.heading
+            ),
+            page_numbers=element.page_numbers.copy(),
+            chunk_type=element.element_type,
+            has_overlap=False,
+            metadata=element.metadata.copy(),
+        )
+
+    def _chunk_element(
+        self,
+        element: ParsedElement,
+        token_ids: list[int],
+        caption_tokens: int = 0,
+    ) -> list[ChunkResult]:
         """
         Chunk a single parsed element.
 
         Args:
             element: Parsed document element.
+            token_ids: Token ids of the element content.
+            caption_tokens: Token count of a table's caption.
 
         Returns:
             List of chunk results for this element.
         """
         if element.element_type == "table":
-            return self._chunk_table(element)
+            return self._chunk_table(element, token_ids, caption_tokens)
 
         # For text elements, split by token limit
-        content = element.content
-        token_count = self._count_tokens(content)
-
-        if token_count <= self.config.max_tokens:
+        if len(token_ids) <= self.config.max_tokens:
             # Single chunk
-            return [
-                ChunkResult(
-                    content=content,
-                    token_count=token_count,
-                    section_hierarchy=element.section_hierarchy.copy(),
-                    clause_number=self._extract_clause_number(
-                        element.section_hierarchy, element.heading
-                    ),
-                    page_numbers=element.page_numbers.copy(),
-                    chunk_type=element.element_type,
-                    has_overlap=False,
-                    metadata=element.metadata.copy(),
-                )
-            ]
+            return [self._make_chunk(element, element.content, len(token_ids))]
 
         # Split large text into chunks
-        return self._split_text(element)
+        return self._split_text(element, token_ids)
 
-    def _split_text(self, element: ParsedElement) -> list[ChunkResult]:
+    def _split_text(self, element: ParsedElement, token_ids: list[int]) -> list[ChunkResult]:
         """
         Split large text element into multiple chunks.
 
+        Paragraphs are grouped up to target_tokens; a paragraph over
+        max_tokens is cut at max_tokens.
+
         Args:
             element: Parsed element with content exceeding max_tokens.
+            token_ids: Token ids of the element content.
 
         Returns:
             List of chunk results from splitting.
@@ -159,101 +272,57 @@ class HierarchicalChunker(BaseChunker):
         content = element.content
 
         # Split by paragraphs (double newline) to respect structure
-        paragraphs = content.split("\n\n")
-        current_chunk: list[str] = []
+        paragraphs = self._spans(content, token_ids, "\n\n")
+        current: list[_Span] = []
         current_tokens = 0
 
-        for para in paragraphs:
-            para_tokens = self._count_tokens(para)
+        def flush() -> None:
+            first, last = current[0], current[-1]
+            chunks.append(
+                self._make_chunk(
+                    element,
+                    content[first.start : last.end],
+                    last.last_token - first.first_token,
+                )
+            )
+            current.clear()
 
+        for para in paragraphs:
             # If single paragraph exceeds max_tokens, truncate it
-            if para_tokens > self.config.max_tokens:
+            if para.tokens > self.config.max_tokens:
                 # Flush current chunk if any
-                if current_chunk:
-                    chunk_content = "\n\n".join(current_chunk)
-                    chunks.append(
-                        ChunkResult(
-                            content=chunk_content,
-                            token_count=self._count_tokens(chunk_content),
-                            section_hierarchy=element.section_hierarchy.copy(),
-                            clause_number=self._extract_clause_number(
-                                element.section_hierarchy, element.heading
-                            ),
-                            page_numbers=element.page_numbers.copy(),
-                            chunk_type=element.element_type,
-                            has_overlap=False,
-                            metadata=element.metadata.copy(),
-                        )
-                    )
-                    current_chunk = []
+                if current:
+                    flush()
                     current_tokens = 0
 
                 # Truncate oversized paragraph
-                truncated = truncate_to_tokens(
-                    para, self.config.max_tokens, self.config.model
-                )
+                window = token_ids[para.first_token : para.first_token + self.config.max_tokens]
                 chunks.append(
-                    ChunkResult(
-                        content=truncated,
-                        token_count=self._count_tokens(truncated),
-                        section_hierarchy=element.section_hierarchy.copy(),
-                        clause_number=self._extract_clause_number(
-                            element.section_hierarchy, element.heading
-                        ),
-                        page_numbers=element.page_numbers.copy(),
-                        chunk_type=element.element_type,
-                        has_overlap=False,
-                        metadata=element.metadata.copy(),
-                    )
+                    self._make_chunk(element, self._encoding.decode(window), len(window))
                 )
                 continue
 
             # Check if adding paragraph would exceed target
-            if current_tokens + para_tokens > self.config.target_tokens and current_chunk:
-                # Flush current chunk
-                chunk_content = "\n\n".join(current_chunk)
-                chunks.append(
-                    ChunkResult(
-                        content=chunk_content,
-                        token_count=self._count_tokens(chunk_content),
-                        section_hierarchy=element.section_hierarchy.copy(),
-                        clause_number=self._extract_clause_number(
-                            element.section_hierarchy, element.heading
-                        ),
-                        page_numbers=element.page_numbers.copy(),
-                        chunk_type=element.element_type,
-                        has_overlap=False,
-                        metadata=element.metadata.copy(),
-                    )
-                )
-                current_chunk = []
+            if current_tokens + para.tokens > self.config.target_tokens and current:
+                flush()
                 current_tokens = 0
 
             # Add paragraph to current chunk
-            current_chunk.append(para)
-            current_tokens += para_tokens
+            current.append(para)
+            current_tokens += para.tokens
 
         # Flush remaining chunk
-        if current_chunk:
-            chunk_content = "\n\n".join(current_chunk)
-            chunks.append(
-                ChunkResult(
-                    content=chunk_content,
-                    token_count=self._count_tokens(chunk_content),
-                    section_hierarchy=element.section_hierarchy.copy(),
-                    clause_number=self._extract_clause_number(
-                        element.section_hierarchy, element.heading
-                    ),
-                    page_numbers=element.page_numbers.copy(),
-                    chunk_type=element.element_type,
-                    has_overlap=False,
-                    metadata=element.metadata.copy(),
-                )
-            )
+        if current:
+            flush()
 
         return chunks
 
-    def _chunk_table(self, element: ParsedElement) -> list[ChunkResult]:
+    def _chunk_table(
+        self,
+        element: ParsedElement,
+        token_ids: list[int] | None = None,
+        caption_tokens: int | None = None,
+    ) -> list[ChunkResult]:
         """
         Chunk a table element, splitting by rows if needed.
 
@@ -262,6 +331,8 @@ class HierarchicalChunker(BaseChunker):
 
         Args:
             element: Parsed table element.
+            token_ids: Token ids of the table content. Encoded if None.
+            caption_tokens: Token count of the caption. Counted if None.
 
         Returns:
             List of chunk results for the table.
@@ -278,101 +349,56 @@ class HierarchicalChunker(BaseChunker):
             'table'
         """
         content = element.content
-        token_count = self._count_tokens(content)
+        caption = element.metadata.get("caption", "")
+        if token_ids is None:
+            token_ids = self._encoding.encode(content)
+        if caption_tokens is None:
+            caption_tokens = self._count_tokens(caption)
+        # Caption and the blank line after it
+        prefix_tokens = caption_tokens + self._count_separator("\n\n") if caption else 0
 
         # If table fits in max_tokens, return as single chunk
-        if token_count <= self.config.max_tokens:
-            caption = element.metadata.get("caption", "")
+        if len(token_ids) <= self.config.max_tokens:
             chunk_content = f"{caption}\n\n{content}" if caption else content
+            return [self._make_chunk(element, chunk_content, prefix_tokens + len(token_ids))]
 
-            return [
-                ChunkResult(
-                    content=chunk_content,
-                    token_count=self._count_tokens(chunk_content),
-                    section_hierarchy=element.section_hierarchy.copy(),
-                    clause_number=self._extract_clause_number(
-                        element.section_hierarchy, element.heading
-                    ),
-                    page_numbers=element.page_numbers.copy(),
-                    chunk_type="table",
-                    has_overlap=False,
-                    metadata=element.metadata.copy(),
-                )
-            ]
-
-        # Split table by rows
-        rows = content.split("\n")
-        if not rows:
-            return []
-
-        # Assume first row is header
-        header = rows[0] if rows else ""
-        caption = element.metadata.get("caption", "")
+        # Split table by rows; assume first row is header
+        header, *rows = self._spans(content, token_ids, "\n", include_separator=True)
         chunks: list[ChunkResult] = []
         current_rows = [header]
-        current_tokens = self._count_tokens(header) + self._count_tokens(caption)
+        current_tokens = prefix_tokens + header.tokens
 
-        for row in rows[1:]:
-            row_tokens = self._count_tokens(row)
+        def flush() -> None:
+            chunk_content = "\n".join(content[row.start : row.end] for row in current_rows)
+            if caption:
+                chunk_content = f"{caption}\n\n{chunk_content}"
+            chunks.append(self._make_chunk(element, chunk_content, current_tokens))
 
+        for row in rows:
             # Check if adding row would exceed max_tokens
-            if current_tokens + row_tokens > self.config.max_tokens and len(current_rows) > 1:
-                # Flush current chunk
-                chunk_content = "\n".join(current_rows)
-                if caption:
-                    chunk_content = f"{caption}\n\n{chunk_content}"
-
-                chunks.append(
-                    ChunkResult(
-                        content=chunk_content,
-                        token_count=self._count_tokens(chunk_content),
-                        section_hierarchy=element.section_hierarchy.copy(),
-                        clause_number=self._extract_clause_number(
-                            element.section_hierarchy, element.heading
-                        ),
-                        page_numbers=element.page_numbers.copy(),
-                        chunk_type="table",
-                        has_overlap=False,
-                        metadata=element.metadata.copy(),
-                    )
-                )
+            if current_tokens + row.tokens > self.config.max_tokens and len(current_rows) > 1:
+                flush()
                 # Start new chunk with header
                 current_rows = [header]
-                current_tokens = self._count_tokens(header) + self._count_tokens(caption)
+                current_tokens = prefix_tokens + header.tokens
 
             # Add row to current chunk
             current_rows.append(row)
-            current_tokens += row_tokens
+            current_tokens += row.tokens
 
         # Flush remaining chunk
         if len(current_rows) > 1:  # More than just header
-            chunk_content = "\n".join(current_rows)
-            if caption:
-                chunk_content = f"{caption}\n\n{chunk_content}"
-
-            chunks.append(
-                ChunkResult(
-                    content=chunk_content,
-                    token_count=self._count_tokens(chunk_content),
-                    section_hierarchy=element.section_hierarchy.copy(),
-                    clause_number=self._extract_clause_number(
-                        element.section_hierarchy, element.heading
-                    ),
-                    page_numbers=element.page_numbers.copy(),
-                    chunk_type="table",
-                    has_overlap=False,
-                    metadata=element.metadata.copy(),
-                )
-            )
+            flush()
 
-        return chunks if chunks else []
+        return chunks
 
     def _add_overlap(self, chunks: list[ChunkResult]) -> list[ChunkResult]:
         """
         Add overlap between adjacent chunks for context continuity.
 
-        Takes the last overlap_tokens from each chunk and prepends
-        to the next chunk with a separator.
+        Takes the last overlap_tokens from each chunk, moved forward to a
+        word boundary, and prepends them to the next chunk with a
+        separator. Only the tail of each chunk is encoded, in one batch.
 
         Args:
             chunks: List of chunks to add overlap to.
@@ -391,46 +417,29 @@ class HierarchicalChunker(BaseChunker):
         if len(chunks) <= 1:
             return chunks
 
+        window_chars = self.config.overlap_tokens * _OVERLAP_CHARS_PER_TOKEN
+        tails = [chunk.content[-window_chars:] if window_chars else "" for chunk in chunks[:-1]]
+        tail_ids = encode_batch(tails, self.config.model)
+        # Whether each tail begins at a word boundary of its chunk
+        word_starts = [
+            len(chunk.content) <= window_chars or chunk.content[-window_chars - 1].isspace()
+            for chunk in chunks[:-1]
+        ]
+        marker_tokens = self._count_separator(_OVERLAP_MARKER)
+
         overlapped_chunks: list[ChunkResult] = [chunks[0]]
 
         for i in range(1, len(chunks)):
-            prev_chunk = chunks[i - 1]
             curr_chunk = chunks[i]
-
-            # Get overlap from previous chunk
-            overlap_text = truncate_to_tokens(
-                prev_chunk.content,
-                self.config.overlap_tokens,
-                self.config.model,
+            overlap_text, overlap_tokens = self._overlap(
+                tails[i - 1], tail_ids[i - 1], word_starts[i - 1]
             )
 
-            # Find where to take overlap from (end of previous chunk)
-            # Use last N tokens instead of first N
-            prev_tokens = self._count_tokens(prev_chunk.content)
-            if prev_tokens > self.config.overlap_tokens:
-                # Take from end by splitting and taking suffix
-                words = prev_chunk.content.split()
-                # Approximate: take last ~20% of words
-                overlap_start = max(0, len(words) - len(words) // 5)
-                overlap_text = " ".join(words[overlap_start:])
-                # Verify it's within token limit
-                if self._count_tokens(overlap_text) > self.config.overlap_tokens:
-                    overlap_text = truncate_to_tokens(
-                        overlap_text,
-                        self.config.overlap_tokens,
-                        self.config.model,
-                    )
-            else:
-                overlap_text = prev_chunk.content
-
             # Prepend overlap to current chunk
-            new_content = f"{overlap_text}\n\n---\n\n{curr_chunk.content}"
-            new_token_count = self._count_tokens(new_content)
-
             overlapped_chunks.append(
                 ChunkResult(
-                    content=new_content,
-                    token_count=new_token_count,
+                    content=f"{overlap_text}{_OVERLAP_MARKER}{curr_chunk.content}",
+                    token_count=overlap_tokens + marker_tokens + curr_chunk.token_count,
                     section_hierarchy=curr_chunk.section_hierarchy,
                     clause_number=curr_chunk.clause_number,
                     page_numbers=curr_chunk.page_numbers,
@@ -442,6 +451,40 @@ class HierarchicalChunker(BaseChunker):
 
         return overlapped_chunks
 
+    def _overlap(
+        self,
+        tail: str,
+        token_ids: list[int],
+        word_start: bool = True,
+    ) -> tuple[str, int]:
+        """
+        Take the last overlap_tokens of a chunk tail, starting on a word.
+
+        Args:
+            tail: End of the previous chunk's content.
+            token_ids: Token ids of tail.
+            word_start: Whether tail itself begins at a word boundary.
+
+        Returns:
+            Tuple of (overlap text, its token count).
+        """
+        first = max(0, len(token_ids) - self.config.overlap_tokens)
+        if first == len(token_ids):
+            return "", 0
+        offsets = token_offsets(token_ids, self.config.model)
+        start = offsets[first]
+
+        # Skip a partial leading word unless the whole tail is one word
+        mid_word = not tail[start - 1].isspace() if start > 0 else not word_start
+        if mid_word:
+            boundary = _WHITESPACE.search(tail, start)
+            if boundary is not None:
+                start = boundary.end()
+
+        overlap_text = tail[start:].lstrip()
+        start = len(tail) - len(overlap_text)
+        return overlap_text, len(token_ids) - bisect_left(offsets, start)
+
     def _merge_small_chunks(self, chunks: list[ChunkResult]) -> list[ChunkResult]:
         """
         Merge chunks under 100 tokens with adjacent chunks.
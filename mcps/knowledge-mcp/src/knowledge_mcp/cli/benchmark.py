@@ -0,0 +1,241 @@
+# src/knowledge_mcp/cli/benchmark.py
+"""Retrieval benchmark command.
+
+Replays the golden queries through the search path and reports per-stage
+latency percentiles, queries per second and recall@k. The offline backend
+(hashing embedder, in-memory store, lexical reranker) needs no services;
+the configured backend benchmarks the real embedder and store from the
+environment. Reports written with --output can be checked against an
+earlier one with --baseline.
+
+Example:
+    >>> knowledge benchmark
+    >>> knowledge benchmark --searcher hybrid --rerank -c 8 -o benchmark.json
+    >>> knowledge benchmark -o current.json --baseline benchmark.json
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+if TYPE_CHECKING:
+    from knowledge_mcp.evaluation.benchmark import BenchmarkReport, RetrievalBenchmark
+    from knowledge_mcp.evaluation.golden_set import GoldenTestSet
+
+console = Console()
+
+
+def benchmark_command(
+    golden_file: Path = typer.Option(
+        Path("data/golden_queries.yml"),
+        "--golden",
+        "-g",
+        help="Golden queries YAML file",
+    ),
+    backend: str = typer.Option(
+        "offline",
+        "--backend",
+        "-b",
+        help=(
+            "offline (deterministic fakes, no services) or configured "
+            "(embedder and store from env)"
+        ),
+    ),
+    searcher: str = typer.Option(
+        "semantic",
+        "--searcher",
+        "-s",
+        help="Search path to benchmark: semantic or hybrid",
+    ),
+    rerank: bool = typer.Option(False, "--rerank/--no-rerank", help="Rerank retrieved candidates"),
+    k: int = typer.Option(5, "--top-k", "-k", help="Results per query checked for recall@k"),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Searches in flight"),
+    rounds: int = typer.Option(3, "--rounds", "-r", help="Timed passes over the query set"),
+    corpus_size: int = typer.Option(
+        2000,
+        "--corpus-size",
+        help="Synthetic corpus size for the offline backend",
+    ),
+    output: Path | None = typer.Option(None, "--output", "-o", help="Write the report as JSON"),
+    baseline: Path | None = typer.Option(
+        None,
+        "--baseline",
+        help="Earlier JSON report; exit 1 on latency, throughput or recall regressions",
+    ),
+    tolerance: float = typer.Option(
+        0.25,
+        "--tolerance",
+        help="Allowed relative latency/throughput change before a regression",
+    ),
+) -> None:
+    """Benchmark retrieval latency, throughput and recall@k on the golden queries.
+
+    Example:
+        $ knowledge benchmark --searcher hybrid --rerank -o benchmark.json
+        $ knowledge benchmark --searcher hybrid --rerank --baseline benchmark.json
+    """
+    import asyncio
+
+    from knowledge_mcp.evaluation.benchmark import build_offline_benchmark, compare_reports
+    from knowledge_mcp.evaluation.golden_set import GoldenTestSet
+
+    if backend not in ("offline", "configured"):
+        console.print(f"[red]Error:[/red] Unknown backend '{backend}'. Use offline or configured.")
+        raise typer.Exit(1)
+    if searcher not in ("semantic", "hybrid"):
+        console.print(f"[red]Error:[/red] Unknown searcher '{searcher}'. Use semantic or hybrid.")
+        raise typer.Exit(1)
+    if not golden_file.exists():
+        console.print(f"[red]Error:[/red] Golden queries file not found: {golden_file}")
+        raise typer.Exit(1)
+
+    golden_set = GoldenTestSet(golden_file, k=k)
+
+    async def run() -> BenchmarkReport:
+        if backend == "offline":
+            benchmark = await build_offline_benchmark(
+                golden_set,
+                searcher=searcher,  # type: ignore[arg-type]
+                rerank=rerank,
+                corpus_size=corpus_size,
+                concurrency=concurrency,
+                rounds=rounds,
+            )
+        else:
+            benchmark = _configured_benchmark(
+                golden_set, searcher, rerank, concurrency, rounds
+            )
+        return await benchmark.run()
+
+    console.print(f"\n[bold]Benchmarking {searcher} search ({backend} backend)...[/bold]")
+    try:
+        report = asyncio.run(run())
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+
+    _print_report(report)
+
+    if output is not None:
+        report.save(output)
+        console.print(f"\n  [green]OK[/green] Report written to {output}")
+
+    if baseline is not None:
+        with open(baseline, encoding="utf-8") as f:
+            baseline_report = json.load(f)
+        try:
+            regressions = compare_reports(
+                baseline_report,
+                report.to_dict(),
+                latency_tolerance=tolerance,
+            )
+        except ValueError as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1) from e
+        if regressions:
+            console.print(f"\n[red]FAIL[/red] {len(regressions)} regression(s) vs {baseline}:")
+            for regression in regressions:
+                console.print(f"  - {regression}")
+            raise typer.Exit(1)
+        console.print(f"\n[green]OK[/green] No regressions vs {baseline}")
+
+
+def _configured_benchmark(
+    golden_set: GoldenTestSet,
+    searcher: str,
+    rerank: bool,
+    concurrency: int,
+    rounds: int,
+) -> RetrievalBenchmark:
+    """Build a benchmark over the embedder, store and BM25 index from config.
+
+    The reranker is created with its score cache disabled so every timed
+    search pays for scoring.
+    """
+    from knowledge_mcp.embed import create_embedder
+    from knowledge_mcp.evaluation.benchmark import RetrievalBenchmark
+    from knowledge_mcp.store import create_store
+    from knowledge_mcp.utils.config import load_config
+
+    config = load_config()
+
+    bm25 = None
+    if searcher == "hybrid":
+        from knowledge_mcp.search.bm25 import BM25Searcher
+
+        bm25 = BM25Searcher.open(config.bm25_index_dir, config.versioned_collection_name)
+        if not bm25.is_indexed:
+            msg = f"No BM25 index for {config.versioned_collection_name} in {config.bm25_index_dir}"
+            raise ValueError(msg)
+
+    reranker = None
+    if rerank:
+        from knowledge_mcp.search.reranker import Reranker
+
+        reranker = Reranker(
+            provider="local",
+            backend=config.local_backend,
+            onnx_file_name=config.local_onnx_file_name or None,
+            cache_size=0,
+        )
+
+    return RetrievalBenchmark(
+        golden_set,
+        create_embedder(config),
+        create_store(config),
+        searcher=searcher,  # type: ignore[arg-type]
+        bm25=bm25,
+        reranker=reranker,
+        concurrency=concurrency,
+        rounds=rounds,
+        config={
+            "backend": "configured",
+            "collection": config.versioned_collection_name,
+            "embedding_model": config.embedding_model,
+            # Recorded so recall deltas from quantization or shortened
+            # embeddings can be compared across reports
+            "embedding_dimensions": config.embedding_dimensions,
+            "quantization": config.qdrant_quantization,
+        },
+    )
+
+
+def _print_report(report: BenchmarkReport) -> None:
+    """Print latency, throughput and recall tables."""
+    table = Table(title="Latency (ms)")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("p50", justify="right")
+    table.add_column("p95", justify="right")
+    table.add_column("p99", justify="right")
+    table.add_column("Max", justify="right")
+    for stage, stats in report.latency.items():
+        table.add_row(
+            stage,
+            str(stats.count),
+            f"{stats.p50:.2f}",
+            f"{stats.p95:.2f}",
+            f"{stats.p99:.2f}",
+            f"{stats.max:.2f}",
+        )
+    console.print(table)
+
+    console.print(
+        f"\n[bold]Throughput:[/bold] {report.qps:.1f} queries/s "
+        f"({report.requests} searches, concurrency {report.config['concurrency']}, "
+        f"{report.elapsed_seconds:.2f}s)"
+    )
+
+    recall = report.recall
+    console.print(
+        f"[bold]Recall@{recall['k']}:[/bold] {recall['avg_recall']:.1%} "
+        f"(pass rate {recall['pass_rate']:.1%}, {recall['passed']}/{recall['total']})"
+    )
+    for category, value in recall["by_category"].items():
+        console.print(f"  {category}: {value:.1%}")
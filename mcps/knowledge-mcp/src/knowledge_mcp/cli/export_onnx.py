@@ -0,0 +1,125 @@
+# src/knowledge_mcp/cli/export_onnx.py
+"""Export command for quantized ONNX Runtime models.
+
+Exports a local embedding model or cross-encoder to ONNX, applies int8
+dynamic quantization, and checks the result against the PyTorch model.
+
+Example:
+    >>> knowledge export-onnx all-MiniLM-L6-v2 ./models/minilm-onnx
+    >>> knowledge export-onnx cross-encoder/ms-marco-MiniLM-L6-v2 ./models/rerank-onnx
+    ...     --kind reranker
+    >>> knowledge export-onnx all-MiniLM-L6-v2 ./models/minilm-onnx --quantization avx512_vnni
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+
+def export_onnx_command(
+    model: str = typer.Argument(..., help="HuggingFace model name or local model directory"),
+    output_dir: Path = typer.Argument(..., help="Directory to write the exported model into"),
+    kind: str = typer.Option(
+        "embedder",
+        "--kind",
+        "-k",
+        help="Model type: embedder (bi-encoder) or reranker (cross-encoder)",
+    ),
+    quantization: str = typer.Option(
+        "avx2",
+        "--quantization",
+        "-q",
+        help="int8 preset for the target CPU (arm64, avx2, avx512, avx512_vnni) or none",
+    ),
+    check: bool = typer.Option(
+        True,
+        "--check/--no-check",
+        help="Compare the exported model's outputs with the PyTorch model",
+    ),
+) -> None:
+    """Export a local model to quantized ONNX for CPU inference.
+
+    Example:
+        $ knowledge export-onnx all-MiniLM-L6-v2 ./models/minilm-onnx
+        $ knowledge export-onnx cross-encoder/ms-marco-MiniLM-L6-v2 ./models/rerank-onnx -k reranker
+    """
+    from knowledge_mcp.embed.onnx_export import (
+        embedding_parity,
+        export_onnx_model,
+        load_model,
+        rerank_parity,
+    )
+
+    if kind not in ("embedder", "reranker"):
+        console.print(f"[red]Error:[/red] Unknown kind '{kind}'. Use embedder or reranker.")
+        raise typer.Exit(1)
+
+    preset = None if quantization == "none" else quantization
+
+    console.print(f"\n[bold]Exporting {model} ({kind}) to ONNX...[/bold]")
+    try:
+        file_name = export_onnx_model(
+            model,
+            output_dir,
+            kind=kind,  # type: ignore[arg-type]
+            quantization=preset,
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1) from e
+    except ImportError as e:
+        console.print(
+            f"[red]Error:[/red] {e}\n"
+            'Install ONNX support with: pip install "sentence-transformers[onnx]"'
+        )
+        raise typer.Exit(1) from e
+
+    console.print(f"  [green]OK[/green] Written to {output_dir}")
+
+    if check:
+        console.print("\n[bold]Checking parity with PyTorch...[/bold]")
+        reference = load_model(model, kind)  # type: ignore[arg-type]
+        candidate = load_model(
+            str(output_dir),
+            kind,  # type: ignore[arg-type]
+            backend="onnx",
+            onnx_file_name=file_name,
+        )
+        if kind == "embedder":
+            report = embedding_parity(reference, candidate)
+            metric = "Cosine similarity"
+        else:
+            report = rerank_parity(reference, candidate)
+            metric = "Pairwise order agreement"
+
+        table = Table(title="ONNX parity")
+        table.add_column("Metric", style="cyan")
+        table.add_column("Value", justify="right")
+        table.add_row("Samples", str(report.samples))
+        table.add_row(f"{metric} (worst)", f"{report.worst:.4f}")
+        table.add_row(f"{metric} (mean)", f"{report.mean:.4f}")
+        table.add_row("Threshold", f"{report.threshold:.4f}")
+        console.print(table)
+
+        if not report.passed:
+            console.print(
+                "[red]FAIL[/red] Exported model diverges from PyTorch. "
+                "Try another --quantization preset or --quantization none."
+            )
+            raise typer.Exit(1)
+        console.print("[green]OK[/green] Parity check passed")
+
+    console.print("\n[bold]To use it, set:[/bold]")
+    if kind == "embedder":
+        console.print(f"  LOCAL_EMBEDDING_MODEL={output_dir}")
+    console.print("  LOCAL_BACKEND=onnx")
+    if file_name:
+        console.print(f"  LOCAL_ONNX_FILE_NAME={file_name}")
+    if kind == "reranker":
+        console.print(f"  and pass model='{output_dir}' to Reranker.from_config()")
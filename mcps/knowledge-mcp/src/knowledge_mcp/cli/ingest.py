@@ -9,6 +9,9 @@ Example:
     >>> knowledge ingest docs /path/to/documents
     >>> knowledge ingest docs /path/to/file.pdf --collection my_collection
     >>> knowledge ingest docs /path/to/standards --validate
+    >>> knowledge ingest docs /path/to/standards --parse-workers 4
+    >>> knowledge ingest docs /path/to/standards --store --parse-workers 4
+    >>> knowledge ingest docs /path/to/standards --store --full
 """
 
 from __future__ import annotations
@@ -19,11 +22,14 @@ from typing import TYPE_CHECKING
 import typer
 from rich.console import Console
 from rich.progress import track
+from rich.table import Table
 
 from knowledge_mcp.ingest.pipeline import IngestionPipeline
 
 if TYPE_CHECKING:
     from knowledge_mcp.models.chunk import KnowledgeChunk
+    from knowledge_mcp.search.bm25 import BM25Searcher
+    from knowledge_mcp.utils.config import KnowledgeConfig
 
 ingest_app = typer.Typer(help="Document ingestion commands")
 console = Console()
@@ -56,6 +62,27 @@ def ingest_docs(
         "--validate",
         help="Run RCCA table validation after ingestion",
     ),
+    store: bool = typer.Option(
+        False,
+        "--store",
+        help="Embed chunks and upsert them into the vector store (streaming pipeline)",
+    ),
+    parse_workers: int = typer.Option(
+        1,
+        "--parse-workers",
+        min=1,
+        help="Worker processes for parsing (1 parses in-process unless --store)",
+    ),
+    resume: bool = typer.Option(
+        True,
+        "--resume/--no-resume",
+        help="With --store, skip documents completed in a previous run",
+    ),
+    incremental: bool = typer.Option(
+        True,
+        "--incremental/--full",
+        help="With --store, only embed changed chunks and delete vanished ones",
+    ),
 ) -> None:
     """Ingest local documents into the knowledge base."""
 
@@ -82,7 +109,15 @@ def ingest_docs(
 
     console.print(f"\n[bold]Ingesting {len(files)} document(s)...[/bold]\n")
 
-    # Initialize pipeline
+    if store:
+        _run_streaming_ingest(
+            files, parse_workers=parse_workers, resume=resume, incremental=incremental
+        )
+        if validate:
+            _run_post_ingest_validation(collection)
+        return
+
+    # Initialize pipeline (parse and chunk only; BM25 indexes stored chunks)
     pipeline = IngestionPipeline()
 
     # Track results
@@ -90,16 +125,37 @@ def ingest_docs(
     successful = 0
     failed: list[tuple[Path, str]] = []
 
-    # Process files with progress bar
-    for file_path in track(files, description="Processing..."):
-        try:
-            chunks: list[KnowledgeChunk] = pipeline.ingest(file_path)
-            total_chunks += len(chunks)
-            successful += 1
-            console.print(f"  [green]OK[/green] {file_path.name}: {len(chunks)} chunks")
-        except Exception as e:
-            failed.append((file_path, str(e)))
-            console.print(f"  [red]FAIL[/red] {file_path.name}: {e}")
+    if parse_workers > 1:
+        from knowledge_mcp.ingest.parallel import ParallelParser
+
+        # Parse across worker processes; chunk here as each file arrives
+        with ParallelParser(workers=parse_workers) as parser:
+            for outcome in track(
+                parser.parse_many(files), total=len(files), description="Processing..."
+            ):
+                try:
+                    if outcome.document is None:
+                        raise RuntimeError(outcome.error)
+                    chunks: list[KnowledgeChunk] = pipeline.process_parsed(outcome.document)
+                    total_chunks += len(chunks)
+                    successful += 1
+                    console.print(
+                        f"  [green]OK[/green] {outcome.path.name}: {len(chunks)} chunks"
+                    )
+                except Exception as e:
+                    failed.append((outcome.path, str(e)))
+                    console.print(f"  [red]FAIL[/red] {outcome.path.name}: {e}")
+    else:
+        # Process files with progress bar
+        for file_path in track(files, description="Processing..."):
+            try:
+                chunks = pipeline.ingest(file_path)
+                total_chunks += len(chunks)
+                successful += 1
+                console.print(f"  [green]OK[/green] {file_path.name}: {len(chunks)} chunks")
+            except Exception as e:
+                failed.append((file_path, str(e)))
+                console.print(f"  [red]FAIL[/red] {file_path.name}: {e}")
 
     # Summary
     console.print("\n[bold]Summary:[/bold]")
@@ -119,6 +175,126 @@ def ingest_docs(
         _run_post_ingest_validation(collection)
 
 
+def _run_streaming_ingest(
+    files: list[Path], parse_workers: int, resume: bool, incremental: bool = True
+) -> None:
+    """Parse, chunk, embed and upsert files with overlapped stages.
+
+    Args:
+        files: Documents to ingest.
+        parse_workers: Size of the parsing process pool.
+        resume: Skip documents recorded in the ingest checkpoint.
+        incremental: Diff chunks against per-document manifests so only
+            changed chunks are embedded and vanished chunks are deleted.
+
+    Raises:
+        typer.Exit: With code 1 if any document failed.
+    """
+    import asyncio
+
+    from knowledge_mcp.embed import create_embedder
+    from knowledge_mcp.ingest.streaming import DocumentOutcome, StreamingIngestionPipeline
+    from knowledge_mcp.store import create_store
+    from knowledge_mcp.utils.config import load_config
+
+    config = load_config()
+    bm25_index = _open_bm25_index(config)
+
+    def report(outcome: DocumentOutcome) -> None:
+        if outcome.skipped:
+            console.print(f"  [dim]SKIP[/dim] {outcome.path.name}: already ingested")
+        elif outcome.success and (outcome.unchanged or outcome.removed):
+            console.print(
+                f"  [green]OK[/green] {outcome.path.name}: {outcome.chunks} new/changed, "
+                f"{outcome.unchanged} unchanged, {outcome.removed} removed"
+            )
+        elif outcome.success:
+            console.print(f"  [green]OK[/green] {outcome.path.name}: {outcome.chunks} chunks")
+        else:
+            console.print(f"  [red]FAIL[/red] {outcome.path.name}: {outcome.error}")
+
+    streaming = StreamingIngestionPipeline(
+        IngestionPipeline(),
+        create_embedder(config),
+        create_store(config),
+        parse_workers=parse_workers,
+        checkpoint_file=config.ingest_checkpoint_file if resume else None,
+        manifest_dir=config.ingest_manifest_dir if incremental else None,
+        bm25_index=bm25_index,
+        on_document=report,
+    )
+    try:
+        result = asyncio.run(streaming.run(files))
+    finally:
+        streaming.close()
+        _save_bm25_index(bm25_index)
+
+    # Summary
+    console.print("\n[bold]Summary:[/bold]")
+    console.print(f"  Processed: {result.succeeded + result.skipped}/{len(files)} documents")
+    console.print(f"  Skipped (already ingested): {result.skipped}")
+    console.print(f"  Total chunks: {result.total_chunks}")
+    console.print(f"  Elapsed: {result.elapsed_seconds:.1f}s")
+
+    table = Table(title="Stage throughput")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Items", justify="right")
+    table.add_column("Busy (s)", justify="right")
+    table.add_column("Items/s", justify="right")
+    table.add_column("Errors", justify="right", style="red")
+    for metrics in result.stages.values():
+        table.add_row(
+            metrics.name,
+            str(metrics.items),
+            f"{metrics.busy_seconds:.1f}",
+            f"{metrics.throughput:.1f}",
+            str(metrics.errors),
+        )
+    console.print(table)
+
+    if result.failed:
+        console.print(f"\n[red]Failed files ({len(result.failed)}):[/red]")
+        for outcome in result.failed:
+            console.print(f"  - {outcome.path.name}: {outcome.error}")
+        raise typer.Exit(1)
+
+    console.print("\n[green]Ingestion complete.[/green]")
+
+
+def _open_bm25_index(config: KnowledgeConfig) -> BM25Searcher:
+    """Open the persistent BM25 index for the configured collection.
+
+    Args:
+        config: Configuration providing the index directory and versioned
+            collection name.
+
+    Returns:
+        The existing index, or an empty one bound to the same directory.
+    """
+    from knowledge_mcp.search.bm25 import BM25Searcher
+
+    return BM25Searcher.open(config.bm25_index_dir, config.versioned_collection_name)
+
+
+def _save_bm25_index(bm25_index: BM25Searcher) -> None:
+    """Compact the BM25 index to disk after a --store ingest run.
+
+    Every added chunk is already in the index's delta log, so a failed
+    save only delays compaction until the next run.
+
+    Args:
+        bm25_index: Index updated by the streaming pipeline.
+    """
+    if not bm25_index.is_indexed:
+        return
+    try:
+        bm25_index.save()
+    except OSError as e:
+        console.print(f"[yellow]Warning:[/yellow] Could not save BM25 index: {e}")
+        return
+    console.print(f"  BM25 index: {bm25_index.document_count} chunks in {bm25_index.index_dir}")
+
+
 def _run_post_ingest_validation(collection: str) -> None:
     """Run RCCA table validation after ingestion.
 
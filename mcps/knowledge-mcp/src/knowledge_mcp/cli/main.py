@@ -9,12 +9,16 @@ Example:
     >>> knowledge --help
     >>> knowledge ingest docs /path/to/documents
     >>> knowledge validate collection my_standards
+    >>> knowledge export-onnx all-MiniLM-L6-v2 ./models/minilm-onnx
+    >>> knowledge benchmark --searcher hybrid --rerank -o benchmark.json
 """
 
 from __future__ import annotations
 
 import typer
 
+from knowledge_mcp.cli.benchmark import benchmark_command
+from knowledge_mcp.cli.export_onnx import export_onnx_command
 from knowledge_mcp.cli.ingest import ingest_app
 from knowledge_mcp.cli.validate import validate_app
 from knowledge_mcp.cli.verify import verify_command
@@ -34,6 +38,12 @@ app.add_typer(validate_app, name="validate")
 # Register verify command
 app.command("verify")(verify_command)
 
+# Register ONNX export command
+app.command("export-onnx")(export_onnx_command)
+
+# Register retrieval benchmark command
+app.command("benchmark")(benchmark_command)
+
 
 def cli() -> None:
     """CLI entry point."""
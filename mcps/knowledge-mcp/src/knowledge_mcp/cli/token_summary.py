@@ -31,7 +31,8 @@ def token_summary_command(
     log_file = log_file or Path("data/token_usage.json")
     console = Console()
 
-    if not log_file.exists():
+    journal_file = log_file.with_name(log_file.name + ".journal")
+    if not log_file.exists() and not journal_file.exists():
         console.print("[yellow]No token usage data found.[/yellow]")
         console.print(f"Expected file: {log_file}")
         return
@@ -13,7 +13,7 @@ Example:
 from __future__ import annotations
 
 import asyncio
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
@@ -158,10 +158,11 @@ class _SearcherAdapter:
             config: Knowledge MCP configuration.
             collection: Collection name to search (for validation/logging).
         """
-        from knowledge_mcp.embed import OpenAIEmbedder
+        from knowledge_mcp.embed import create_embedder
         from knowledge_mcp.store import create_store
 
-        self._embedder = OpenAIEmbedder(api_key=config.openai_api_key)
+        # Same provider, model and dimensions as the collection create_store opens
+        self._embedder = create_embedder(config)
         self._store = create_store(config)
         self._collection = collection
 
@@ -184,9 +185,45 @@ class _SearcherAdapter:
         Raises:
             ValueError: If collection doesn't match adapter's collection.
         """
-        import logging
+        self._check_collection(collection)
 
-        from knowledge_mcp.models.chunk import KnowledgeChunk
+        query_embedding = await self._embedder.embed(query)
+        raw_results = self._store.search(
+            query_embedding=query_embedding,
+            n_results=n_results,
+        )
+
+        return self._to_chunks(raw_results)
+
+    async def search_many(
+        self,
+        queries: list[str],
+        collection: str,
+        n_results: int = 10,
+    ) -> list[list[KnowledgeChunk]]:
+        """Search for several queries with one embedding and one store call.
+
+        Args:
+            queries: Search query strings.
+            collection: Collection name (must match adapter's collection).
+            n_results: Maximum number of results per query.
+
+        Returns:
+            One list of KnowledgeChunk objects per query, in query order.
+        """
+        self._check_collection(collection)
+
+        query_embeddings = await self._embedder.embed_batch(queries)
+        raw_batches = self._store.search_batch(
+            query_embeddings=query_embeddings,
+            n_results=n_results,
+        )
+
+        return [self._to_chunks(raw_results) for raw_results in raw_batches]
+
+    def _check_collection(self, collection: str) -> None:
+        """Warn if a search targets a different collection than configured."""
+        import logging
 
         logger = logging.getLogger(__name__)
 
@@ -197,11 +234,10 @@ class _SearcherAdapter:
                 self._collection,
             )
 
-        query_embedding = await self._embedder.embed(query)
-        raw_results = self._store.search(
-            query_embedding=query_embedding,
-            n_results=n_results,
-        )
+    @staticmethod
+    def _to_chunks(raw_results: list[dict[str, Any]]) -> list[KnowledgeChunk]:
+        """Convert raw store results to KnowledgeChunk objects."""
+        from knowledge_mcp.models.chunk import KnowledgeChunk
 
         chunks: list[KnowledgeChunk] = []
         for r in raw_results:
@@ -24,22 +24,32 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from knowledge_mcp.embed.base import BaseEmbedder
-from knowledge_mcp.embed.cache import EmbeddingCache
-from knowledge_mcp.embed.openai_embedder import OpenAIEmbedder
+from knowledge_mcp.utils.lazy import lazy_exports
 
 if TYPE_CHECKING:
-    from knowledge_mcp.utils.config import KnowledgeConfig
-
-__all__: list[str] = ["BaseEmbedder", "EmbeddingCache", "OpenAIEmbedder", "create_embedder"]
-
-# Conditionally export LocalEmbedder if sentence-transformers is available
-try:
+    from knowledge_mcp.embed.cache import EmbeddingCache
     from knowledge_mcp.embed.local_embedder import LocalEmbedder
+    from knowledge_mcp.embed.openai_embedder import OpenAIEmbedder
+    from knowledge_mcp.utils.config import KnowledgeConfig
 
-    __all__.append("LocalEmbedder")
-    _HAS_LOCAL = True
-except ImportError:
-    _HAS_LOCAL = False
+__all__: list[str] = [
+    "BaseEmbedder",
+    "EmbeddingCache",
+    "LocalEmbedder",
+    "OpenAIEmbedder",
+    "create_embedder",
+]
+
+# Imported on first access so openai, diskcache and sentence-transformers
+# load only with the embedder that uses them
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "EmbeddingCache": "knowledge_mcp.embed.cache",
+        "LocalEmbedder": "knowledge_mcp.embed.local_embedder",
+        "OpenAIEmbedder": "knowledge_mcp.embed.openai_embedder",
+    },
+)
 
 
 def create_embedder(config: KnowledgeConfig) -> BaseEmbedder:
@@ -64,19 +74,32 @@ def create_embedder(config: KnowledgeConfig) -> BaseEmbedder:
         >>> vector = await embedder.embed("test query")
     """
     if config.embedding_provider == "openai":
+        from knowledge_mcp.embed.openai_embedder import OpenAIEmbedder
+
         return OpenAIEmbedder(
             api_key=config.openai_api_key,
             model=config.embedding_model,
             dimensions=config.embedding_dimensions,
+            max_concurrency=config.embedding_max_concurrency,
+            requests_per_minute=config.embedding_requests_per_minute or None,
+            tokens_per_minute=config.embedding_tokens_per_minute or None,
         )
     elif config.embedding_provider == "local":
-        if not _HAS_LOCAL:
+        try:
+            from knowledge_mcp.embed.local_embedder import LocalEmbedder
+        except ImportError as e:
             raise ValueError(
                 "Local embeddings require sentence-transformers. "
                 "Install with: poetry install --with local"
-            )
-        from knowledge_mcp.embed.local_embedder import LocalEmbedder
-
-        return LocalEmbedder(model_name=config.local_embedding_model)
+            ) from e
+
+        return LocalEmbedder(
+            model_name=config.local_embedding_model,
+            batch_window_ms=config.local_embedding_batch_window_ms,
+            max_batch_size=config.local_embedding_max_batch_size,
+            intra_op_threads=config.local_embedding_threads or None,
+            backend=config.local_backend,
+            onnx_file_name=config.local_onnx_file_name or None,
+        )
     else:
         raise ValueError(f"Unknown embedding provider: {config.embedding_provider}")
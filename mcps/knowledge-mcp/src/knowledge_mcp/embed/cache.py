@@ -1,15 +1,118 @@
-"""Embedding cache with content hashing."""
+"""
+Embedding cache with content hashing.
+
+Vectors are stored on disk as packed bytes rather than pickled lists:
+a 4-byte header (format tag plus padding, keeping the payload 4-byte
+aligned) followed by the raw float32, float16 or int8 values. int8
+entries carry a float32 scale ahead of the payload and are dequantized
+on read. Entries written by older versions (pickled lists) still load.
+"""
 
 from __future__ import annotations
 
 import hashlib
+import struct
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 from diskcache import Cache
 
+from knowledge_mcp.embed.memory_cache import MemoryLRUCache
+from knowledge_mcp.monitoring.spans import increment, timed
+
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Sequence
+
+DEFAULT_MEMORY_SIZE_LIMIT = 64 * 1024 * 1024  # 64MB
+
+CacheDType = Literal["float32", "float16", "int8"]
+
+# Format tags for packed vectors
+_TAG_FLOAT32 = 1
+_TAG_FLOAT16 = 2
+_TAG_INT8 = 3
+_HEADER_SIZE = 4
+_SCALE = struct.Struct("<f")
+
+
+def encode_vector(
+    embedding: Sequence[float] | np.ndarray[Any, Any],
+    dtype: CacheDType = "float32",
+) -> bytes:
+    """
+    Pack an embedding into the cache's binary format.
+
+    Args:
+        embedding: Embedding vector.
+        dtype: Storage precision. "int8" quantizes symmetrically with a
+            per-vector scale (max absolute value / 127).
+
+    Returns:
+        Header followed by the packed little-endian payload.
+
+    Raises:
+        ValueError: If dtype is not supported.
+
+    Example:
+        >>> len(encode_vector([0.1] * 1536))  # 4-byte header + 1536 * 4
+        6148
+    """
+    vector = np.asarray(embedding, dtype=np.float32)
+    if dtype == "float32":
+        return bytes((_TAG_FLOAT32, 0, 0, 0)) + vector.astype("<f4").tobytes()
+    if dtype == "float16":
+        return bytes((_TAG_FLOAT16, 0, 0, 0)) + vector.astype("<f2").tobytes()
+    if dtype == "int8":
+        peak = float(np.max(np.abs(vector))) if vector.size else 0.0
+        scale = peak / 127.0 if peak > 0 else 1.0
+        quantized = np.clip(np.rint(vector / scale), -127, 127).astype(np.int8)
+        return bytes((_TAG_INT8, 0, 0, 0)) + _SCALE.pack(scale) + quantized.tobytes()
+    msg = f"Unsupported cache dtype: {dtype}"
+    raise ValueError(msg)
+
+
+def decode_vector(value: bytes | Sequence[float]) -> np.ndarray[Any, Any]:
+    """
+    Unpack a cached value into a float32 array.
+
+    float32 entries are returned as a read-only view over the stored
+    bytes, so no per-element Python objects are created.
+
+    Args:
+        value: Packed bytes from encode_vector, or a legacy pickled list.
+
+    Returns:
+        1-D float32 array.
+
+    Raises:
+        ValueError: If the format tag is unknown.
+    """
+    if not isinstance(value, (bytes, bytearray, memoryview)):
+        return np.asarray(value, dtype=np.float32)
+
+    # diskcache returns bytes (no copy); other buffers are copied
+    data = bytes(value)
+    tag = data[0]
+    if tag == _TAG_FLOAT32:
+        return np.frombuffer(data, dtype="<f4", offset=_HEADER_SIZE)
+    if tag == _TAG_FLOAT16:
+        return np.frombuffer(data, dtype="<f2", offset=_HEADER_SIZE).astype(np.float32)
+    if tag == _TAG_INT8:
+        (scale,) = _SCALE.unpack_from(data, _HEADER_SIZE)
+        quantized = np.frombuffer(data, dtype=np.int8, offset=_HEADER_SIZE + _SCALE.size)
+        return quantized.astype(np.float32) * np.float32(scale)
+    msg = f"Unknown cached vector format tag: {tag}"
+    raise ValueError(msg)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for cache keys: strip whitespace, collapse multiple spaces.
+
+    This ensures "Hello  world" and "Hello world" map to same cache key.
+    """
+    return " ".join(text.split())
 
 
 class EmbeddingCache:
@@ -18,17 +121,29 @@ class EmbeddingCache:
 
     Cache key: SHA-256 hash of normalized text content.
     Cache invalidation: Only on embedding model change (model in path).
+    Hot entries are also kept in an in-process, byte-bounded LRU tier so
+    repeated lookups skip the disk cache entirely. On disk, vectors are
+    packed bytes (see encode_vector), about a quarter of the size of a
+    pickled list at float32 and smaller still at float16/int8.
 
     Args:
         cache_dir: Base directory for cache storage.
         embedding_model: Model name (used in cache path for auto-invalidation).
         size_limit: Maximum cache size in bytes (default 10GB).
+        memory_size_limit: In-memory LRU tier size in bytes (default 64MB,
+            0 disables the tier).
+        dtype: On-disk precision for newly written vectors: "float32"
+            (default, lossless for OpenAI embeddings), "float16" or "int8".
+            Entries of any precision can be read regardless of setting.
 
     Example:
         >>> cache = EmbeddingCache(Path("data/cache"), "text-embedding-3-small")
         >>> cache.set("Hello world", [0.1, 0.2, ...])
         >>> embedding = cache.get("Hello world")  # Returns cached embedding
         >>> embedding = cache.get("Unknown text")  # Returns None
+        >>> vectors = cache.get_many(["Hello world", "Unknown text"])
+        >>> vectors[0].shape, vectors[1]
+        ((1536,), None)
     """
 
     def __init__(
@@ -36,14 +151,21 @@ class EmbeddingCache:
         cache_dir: Path,
         embedding_model: str,
         size_limit: int = 10 * 1024 * 1024 * 1024,  # 10GB default
+        memory_size_limit: int = DEFAULT_MEMORY_SIZE_LIMIT,
+        dtype: CacheDType = "float32",
     ) -> None:
         """Initialize cache with model-specific namespace."""
+        if dtype not in ("float32", "float16", "int8"):
+            msg = f"Unsupported cache dtype: {dtype}"
+            raise ValueError(msg)
         # Model version in cache path ensures auto-invalidation on model change
         model_safe = embedding_model.replace("/", "_").replace(":", "_")
         self.cache_path = cache_dir / model_safe
         self.cache_path.mkdir(parents=True, exist_ok=True)
         self.cache = Cache(str(self.cache_path), size_limit=size_limit)
         self.embedding_model = embedding_model
+        self.memory = MemoryLRUCache(memory_size_limit)
+        self.dtype: CacheDType = dtype
 
     def _hash_content(self, text: str) -> str:
         """
@@ -52,23 +174,87 @@ class EmbeddingCache:
         Normalization: strip whitespace, collapse multiple spaces.
         This ensures "Hello  world" and "Hello world" map to same cache key.
         """
-        normalized = " ".join(text.split())
+        normalized = normalize_text(text)
         return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
     def get(self, text: str) -> list[float] | None:
         """
         Retrieve cached embedding by content hash.
 
+        Checks the in-memory tier first; disk hits are promoted into it.
+
         Args:
             text: Original text content.
 
         Returns:
             Cached embedding vector, or None if not cached.
         """
-        key = self._hash_content(text)
-        return self.cache.get(key)
+        vector = self.get_vector(text)
+        return None if vector is None else vector.tolist()
+
+    @timed("embedding_cache.get")
+    def get_vector(self, text: str) -> np.ndarray[Any, Any] | None:
+        """
+        Retrieve a cached embedding as a float32 array.
+
+        Args:
+            text: Original text content.
+
+        Returns:
+            Read-only float32 array, or None if not cached.
+        """
+        vector = self._lookup(self._hash_content(text))
+        increment("embedding_cache.misses" if vector is None else "embedding_cache.hits")
+        return vector
+
+    def _lookup(self, key: str) -> np.ndarray[Any, Any] | None:
+        """Look up one key in the memory tier, then on disk."""
+        vector = self.memory.get_array(key)
+        if vector is not None:
+            return vector
+        value = self.cache.get(key)
+        if value is None:
+            return None
+        vector = decode_vector(value)
+        self.memory.set(key, vector)
+        return vector
+
+    @timed("embedding_cache.get_many")
+    def get_many(self, texts: Sequence[str]) -> list[np.ndarray[Any, Any] | None]:
+        """
+        Retrieve cached embeddings for several texts at once.
 
-    def set(self, text: str, embedding: list[float]) -> None:
+        Disk lookups for memory-tier misses run inside a single SQLite
+        transaction instead of one per text.
+
+        Args:
+            texts: Original text contents.
+
+        Returns:
+            One float32 array (or None on a miss) per text, in order.
+        """
+        if not texts:
+            return []
+        keys = [self._hash_content(text) for text in texts]
+        results: list[np.ndarray[Any, Any] | None] = [
+            self.memory.get_array(key) for key in keys
+        ]
+        missing = [i for i, vector in enumerate(results) if vector is None]
+        if missing:
+            with self.cache.transact():
+                values = [self.cache.get(keys[i]) for i in missing]
+            for i, value in zip(missing, values):
+                if value is not None:
+                    vector = decode_vector(value)
+                    self.memory.set(keys[i], vector)
+                    results[i] = vector
+        misses = sum(1 for vector in results if vector is None)
+        increment("embedding_cache.hits", len(results) - misses)
+        increment("embedding_cache.misses", misses)
+        return results
+
+    @timed("embedding_cache.set")
+    def set(self, text: str, embedding: Sequence[float] | np.ndarray[Any, Any]) -> None:
         """
         Store embedding with content hash key.
 
@@ -77,29 +263,64 @@ class EmbeddingCache:
             embedding: Embedding vector to cache.
         """
         key = self._hash_content(text)
-        self.cache.set(key, embedding)
+        self.cache.set(key, encode_vector(embedding, self.dtype))
+        self.memory.set(key, embedding)
+
+    @timed("embedding_cache.set_many")
+    def set_many(
+        self,
+        texts: Sequence[str],
+        embeddings: Sequence[Sequence[float] | np.ndarray[Any, Any]],
+    ) -> None:
+        """
+        Store several embeddings in a single SQLite transaction.
+
+        Args:
+            texts: Original text contents.
+            embeddings: Embedding vectors, aligned with texts.
+
+        Raises:
+            ValueError: If texts and embeddings differ in length.
+        """
+        if len(texts) != len(embeddings):
+            msg = "texts and embeddings must have the same length"
+            raise ValueError(msg)
+        keys = [self._hash_content(text) for text in texts]
+        packed = [encode_vector(embedding, self.dtype) for embedding in embeddings]
+        with self.cache.transact():
+            for key, value in zip(keys, packed):
+                self.cache.set(key, value)
+        for key, embedding in zip(keys, embeddings):
+            self.memory.set(key, embedding)
 
     def contains(self, text: str) -> bool:
         """Check if text content is cached."""
         key = self._hash_content(text)
-        return key in self.cache
+        return key in self.memory or key in self.cache
 
     def stats(self) -> dict[str, object]:
         """
         Get cache statistics.
 
         Returns:
-            Dict with size, disk_usage_mb, model, hits, misses.
+            Dict with size, disk_usage_mb, model, dtype, and in-memory tier
+            entries, usage and hits/misses.
         """
         return {
             "size": len(self.cache),
             "disk_usage_mb": round(self.cache.volume() / (1024 * 1024), 2),
             "model": self.embedding_model,
+            "dtype": self.dtype,
+            "memory_entries": len(self.memory),
+            "memory_usage_mb": round(self.memory.size_bytes / (1024 * 1024), 2),
+            "memory_hits": self.memory.hits,
+            "memory_misses": self.memory.misses,
         }
 
     def clear(self) -> None:
         """Clear all cached embeddings."""
         self.cache.clear()
+        self.memory.clear()
 
     def close(self) -> None:
         """Close cache connection."""
@@ -8,6 +8,11 @@ Supported models:
 - all-MiniLM-L6-v2: 384 dimensions, fast (default)
 - all-mpnet-base-v2: 768 dimensions, higher quality
 
+Concurrent embed() calls are micro-batched: calls arriving within a few
+milliseconds of each other share one model.encode() forward pass, so a
+CPU-only server under load approaches batch throughput instead of running
+one pass per query.
+
 Example:
     >>> embedder = LocalEmbedder(model_name="all-MiniLM-L6-v2")
     >>> vector = await embedder.embed("What is systems engineering?")
@@ -22,14 +27,21 @@ Security Note:
 from __future__ import annotations
 
 import asyncio
+import logging
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Literal
 
 from knowledge_mcp.embed.base import BaseEmbedder
+from knowledge_mcp.monitoring.spans import timed
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH_SIZE = 32
+
 
 class LocalEmbedder(BaseEmbedder):
     """Local embedding using sentence-transformers models.
@@ -38,9 +50,15 @@ class LocalEmbedder(BaseEmbedder):
     models. Synchronous model inference is wrapped with asyncio.run_in_executor
     to avoid blocking the event loop.
 
+    embed() calls are queued for up to batch_window_ms (or until
+    max_batch_size texts are waiting) and encoded together; each caller
+    receives its own vector.
+
     Attributes:
         dimensions: The dimensionality of generated embeddings (384 for default model).
         model_name: The name of the HuggingFace model being used.
+        batch_window_ms: How long the first queued embed() waits for others.
+        max_batch_size: Queue length that triggers an immediate encode.
 
     Example:
         >>> embedder = LocalEmbedder()
@@ -53,13 +71,29 @@ class LocalEmbedder(BaseEmbedder):
         on first run (downloads from HuggingFace Hub).
     """
 
-    __slots__ = ("_model_name", "_normalize", "_executor", "_model", "_dimensions")
+    __slots__ = (
+        "_model_name",
+        "_normalize",
+        "_executor",
+        "_model",
+        "_dimensions",
+        "batch_window_ms",
+        "max_batch_size",
+        "_pending",
+        "_flush_handle",
+    )
 
     def __init__(
         self,
         model_name: str = "all-MiniLM-L6-v2",
         device: str | None = None,
         normalize_embeddings: bool = True,
+        *,
+        batch_window_ms: float = DEFAULT_BATCH_WINDOW_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        intra_op_threads: int | None = None,
+        backend: Literal["torch", "onnx"] = "torch",
+        onnx_file_name: str | None = None,
     ) -> None:
         """Initialize local embedder.
 
@@ -70,25 +104,82 @@ class LocalEmbedder(BaseEmbedder):
                 None will auto-detect GPU availability.
             normalize_embeddings: L2-normalize embeddings for cosine similarity.
                 Default is True (CRITICAL for correct similarity scores).
+            batch_window_ms: Milliseconds the first pending embed() waits for
+                concurrent calls to join its batch. 0 disables micro-batching.
+            max_batch_size: Pending calls that trigger an encode without
+                waiting for the window to close.
+            intra_op_threads: Threads used inside one forward pass. None
+                keeps the runtime default (all cores). With the torch backend
+                this applies to the whole process.
+            backend: "torch" (PyTorch) or "onnx" (ONNX Runtime on CPU; see
+                knowledge_mcp.embed.onnx_export for exporting a quantized model).
+            onnx_file_name: ONNX file inside the model directory, e.g.
+                "onnx/model_qint8_avx2.onnx". None uses the unquantized model.
 
         Raises:
             ImportError: If sentence-transformers is not installed.
             OSError: If model cannot be loaded (network error on first run).
+            ValueError: If batch_window_ms < 0, max_batch_size < 1 or
+                intra_op_threads < 1.
 
         Example:
             >>> embedder = LocalEmbedder()  # Uses default all-MiniLM-L6-v2
             >>> embedder = LocalEmbedder(model_name="all-mpnet-base-v2")  # Higher quality
             >>> embedder = LocalEmbedder(device="cpu")  # Force CPU
+            >>> embedder = LocalEmbedder(batch_window_ms=5, intra_op_threads=4)
+            >>> embedder = LocalEmbedder(
+            ...     "models/minilm-onnx",
+            ...     backend="onnx",
+            ...     onnx_file_name="onnx/model_qint8_avx2.onnx",
+            ... )
         """
+        if batch_window_ms < 0:
+            msg = "batch_window_ms must be non-negative"
+            raise ValueError(msg)
+        if max_batch_size < 1:
+            msg = "max_batch_size must be at least 1"
+            raise ValueError(msg)
+        if intra_op_threads is not None and intra_op_threads < 1:
+            msg = "intra_op_threads must be at least 1"
+            raise ValueError(msg)
+
         # Import inside __init__ for lazy loading (optional dependency)
         from sentence_transformers import SentenceTransformer
 
+        model_kwargs: dict[str, Any] = {}
+        if backend == "onnx":
+            from knowledge_mcp.embed.onnx_export import onnx_model_kwargs
+
+            model_kwargs = onnx_model_kwargs(onnx_file_name)
+            if intra_op_threads is not None:
+                import onnxruntime
+
+                session_options = onnxruntime.SessionOptions()
+                session_options.intra_op_num_threads = intra_op_threads
+                model_kwargs["session_options"] = session_options
+        elif intra_op_threads is not None:
+            import torch
+
+            torch.set_num_threads(intra_op_threads)
+
         self._model_name = model_name
         self._normalize = normalize_embeddings
+        # One worker: batches run back to back, each using intra-op threads
         self._executor = ThreadPoolExecutor(max_workers=1)
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self._pending: list[tuple[str, asyncio.Future[list[float]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Strong references so in-flight batches are not garbage collected
+        self._encode_tasks: set[asyncio.Task[None]] = set()
 
         # Load model (blocking on first call, downloads from HuggingFace)
-        self._model = SentenceTransformer(model_name, device=device)
+        if backend == "onnx":
+            self._model = SentenceTransformer(
+                model_name, device=device, backend="onnx", model_kwargs=model_kwargs
+            )
+        else:
+            self._model = SentenceTransformer(model_name, device=device)
         self._dimensions: int = self._model.get_sentence_embedding_dimension()
 
     @property
@@ -121,11 +212,13 @@ class LocalEmbedder(BaseEmbedder):
         """
         return self._model_name
 
+    @timed("embedder.embed")
     async def embed(self, text: str) -> list[float]:
         """Generate embedding asynchronously.
 
-        Wraps synchronous SentenceTransformer.encode() with run_in_executor
-        to avoid blocking the event loop.
+        The text joins the pending micro-batch, which is encoded in one
+        SentenceTransformer.encode() call (run in an executor thread) when
+        the batch window closes or the batch is full.
 
         Args:
             text: The input text to embed. Must be non-empty.
@@ -143,12 +236,57 @@ class LocalEmbedder(BaseEmbedder):
             True
         """
         loop = asyncio.get_running_loop()
-        embedding = await loop.run_in_executor(
-            self._executor,
-            self._sync_embed,
-            text,
-        )
-        return embedding
+        if self.batch_window_ms <= 0:
+            return await loop.run_in_executor(self._executor, self._sync_embed, text)
+
+        future: asyncio.Future[list[float]] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window_ms / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Close the current micro-batch and start encoding it."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._encode_pending(batch))
+            self._encode_tasks.add(task)
+            task.add_done_callback(self._encode_tasks.discard)
+
+    async def _encode_pending(
+        self, batch: list[tuple[str, asyncio.Future[list[float]]]]
+    ) -> None:
+        """Encode a micro-batch and resolve each caller's future."""
+        loop = asyncio.get_running_loop()
+        texts = [text for text, _ in batch]
+        try:
+            if len(texts) == 1:
+                embeddings = [
+                    await loop.run_in_executor(self._executor, self._sync_embed, texts[0])
+                ]
+            else:
+                embeddings = await loop.run_in_executor(
+                    self._executor, self._sync_embed_batch, texts, len(texts)
+                )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.debug(f"Encoded micro-batch of {len(texts)} queries")
+        for (_, future), embedding in zip(batch, embeddings):
+            # A caller may have been cancelled while the batch was encoding
+            if not future.done():
+                future.set_result(embedding)
 
     def _sync_embed(self, text: str) -> list[float]:
         """Synchronous embedding (run in executor).
@@ -166,6 +304,7 @@ class LocalEmbedder(BaseEmbedder):
         )
         return embedding.tolist()
 
+    @timed("embedder.embed_batch")
     async def embed_batch(
         self,
         texts: Sequence[str],
@@ -0,0 +1,132 @@
+# src/knowledge_mcp/embed/memory_cache.py
+"""In-process LRU tier for embeddings, bounded by bytes."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+# Approximate per-entry overhead (key string, OrderedDict node, array header)
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+class MemoryLRUCache:
+    """
+    Byte-bounded LRU cache of float32 embedding vectors.
+
+    Sits in front of the disk-backed EmbeddingCache so hot queries are
+    served without hashing into SQLite or unpickling. Vectors are held as
+    contiguous float32 arrays (4 bytes per dimension rather than a Python
+    float object per element).
+
+    Args:
+        max_bytes: Memory budget. Least recently used entries are evicted
+            once the budget is exceeded. 0 disables the cache.
+
+    Example:
+        >>> memory = MemoryLRUCache(max_bytes=64 * 1024 * 1024)
+        >>> memory.set("3f2a...", [0.1, 0.2, 0.3])
+        >>> memory.get("3f2a...")
+        [0.1..., 0.2..., 0.3...]
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize an empty cache with the given byte budget."""
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, np.ndarray[Any, Any]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _entry_size(vector: np.ndarray[Any, Any]) -> int:
+        return int(vector.nbytes) + _ENTRY_OVERHEAD_BYTES
+
+    def get(self, key: str) -> list[float] | None:
+        """
+        Look up a vector and mark it most recently used.
+
+        Args:
+            key: Content hash key.
+
+        Returns:
+            Embedding as a list of floats, or None if absent.
+        """
+        vector = self.get_array(key)
+        return None if vector is None else vector.tolist()
+
+    def get_array(self, key: str) -> np.ndarray[Any, Any] | None:
+        """
+        Look up a vector without converting it to Python floats.
+
+        Args:
+            key: Content hash key.
+
+        Returns:
+            Read-only float32 array, or None if absent.
+        """
+        with self._lock:
+            vector = self._entries.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return vector
+
+    def set(self, key: str, embedding: Sequence[float] | np.ndarray[Any, Any]) -> None:
+        """
+        Store a vector, evicting least recently used entries as needed.
+
+        Vectors larger than the whole budget are not cached.
+
+        Args:
+            key: Content hash key.
+            embedding: Embedding vector.
+        """
+        if self.max_bytes <= 0:
+            return
+
+        vector = np.array(embedding, dtype=np.float32)
+        vector.flags.writeable = False
+        size = self._entry_size(vector)
+        if size > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= self._entry_size(previous)
+            self._entries[key] = vector
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= self._entry_size(evicted)
+
+    def __contains__(self, key: str) -> bool:
+        """Check membership without updating recency or counters."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return the number of cached vectors."""
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by cached vectors."""
+        return self._bytes
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
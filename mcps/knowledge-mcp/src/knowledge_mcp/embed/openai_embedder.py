@@ -20,9 +20,11 @@ Security Note:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 from typing import TYPE_CHECKING
 
-from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
+from openai import NOT_GIVEN, APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -31,6 +33,8 @@ from tenacity import (
 )
 
 from knowledge_mcp.embed.base import BaseEmbedder
+from knowledge_mcp.embed.cache import normalize_text
+from knowledge_mcp.embed.rate_limiter import RateLimiter
 from knowledge_mcp.exceptions import (
     AuthenticationError,
     ConnectionError,
@@ -38,6 +42,9 @@ from knowledge_mcp.exceptions import (
     TimeoutError,
     ValidationError,
 )
+from knowledge_mcp.monitoring.spans import timed
+from knowledge_mcp.utils.config import OPENAI_MODEL_DIMENSIONS
+from knowledge_mcp.utils.tokenizer import count_tokens
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -46,10 +53,14 @@ if TYPE_CHECKING:
     from knowledge_mcp.monitoring.token_tracker import TokenTracker
 
 
+logger = logging.getLogger(__name__)
+
 # Default configuration per A-REQ-IF-002
 DEFAULT_MODEL = "text-embedding-3-small"
 DEFAULT_DIMENSIONS = 1536
 MAX_BATCH_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RATE_LIMIT_RETRIES = 5
 
 
 class OpenAIEmbedder(BaseEmbedder):
@@ -62,8 +73,14 @@ class OpenAIEmbedder(BaseEmbedder):
     - Exponential backoff (1s, 2s, 4s)
     - Retries on ConnectionError, TimeoutError
 
+    embed_batch keeps up to max_concurrency batches in flight, admits them
+    against optional requests/tokens-per-minute budgets, and on 429 pauses
+    all batches with adaptive backoff before retrying. Output order always
+    matches input order.
+
     Attributes:
-        dimensions: Returns 1536 for text-embedding-3-small.
+        dimensions: Embedding size (1536 for text-embedding-3-small unless
+            shortened).
         model_name: Returns the configured model name.
 
     Example:
@@ -77,7 +94,18 @@ class OpenAIEmbedder(BaseEmbedder):
         in error messages.
     """
 
-    __slots__ = ("_client", "_model", "_dimensions", "_cache", "_token_tracker")
+    __slots__ = (
+        "_client",
+        "_model",
+        "_dimensions",
+        "_request_dimensions",
+        "_cache",
+        "_token_tracker",
+        "_max_concurrency",
+        "_max_rate_limit_retries",
+        "_rate_limiter",
+        "_inflight",
+    )
 
     def __init__(
         self,
@@ -87,6 +115,10 @@ class OpenAIEmbedder(BaseEmbedder):
         dimensions: int = DEFAULT_DIMENSIONS,
         cache: EmbeddingCache | None = None,
         token_tracker: TokenTracker | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        max_rate_limit_retries: int = DEFAULT_MAX_RATE_LIMIT_RETRIES,
     ) -> None:
         """
         Initialize the OpenAI embedder.
@@ -94,12 +126,21 @@ class OpenAIEmbedder(BaseEmbedder):
         Args:
             api_key: OpenAI API key. Must be valid and have embeddings access.
             model: Model name. Defaults to "text-embedding-3-small".
-            dimensions: Expected embedding dimensions. Defaults to 1536.
+            dimensions: Embedding dimensions. Defaults to 1536. Below the
+                model's full size, text-embedding-3 models are asked for
+                shortened (Matryoshka) embeddings.
             cache: Optional embedding cache for cost savings.
             token_tracker: Optional token usage tracker for monitoring.
+            max_concurrency: Maximum batch requests in flight in embed_batch.
+            requests_per_minute: Request budget for embed_batch (None = unlimited).
+            tokens_per_minute: Token budget for embed_batch (None = unlimited).
+            max_rate_limit_retries: Retries per batch after 429 responses
+                before raising RateLimitError.
 
         Raises:
-            ValidationError: If api_key is empty.
+            ValidationError: If api_key is empty, max_concurrency < 1, or
+                dimensions exceed the model's size or shorten a model that
+                does not support it.
 
         Example:
             >>> embedder = OpenAIEmbedder(api_key="sk-proj-...")
@@ -110,12 +151,31 @@ class OpenAIEmbedder(BaseEmbedder):
         """
         if not api_key:
             raise ValidationError("OpenAI API key is required")
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be at least 1")
+
+        native = OPENAI_MODEL_DIMENSIONS.get(model)
+        if native is not None and dimensions > native:
+            raise ValidationError(f"{model} returns at most {native} dimensions")
+        shortened = native is not None and dimensions < native
+        if shortened and not model.startswith("text-embedding-3"):
+            raise ValidationError(f"{model} does not support shortened embeddings")
 
         self._client = AsyncOpenAI(api_key=api_key)
         self._model = model
         self._dimensions = dimensions
+        # Sent only when shortening, so full-size requests are unchanged
+        self._request_dimensions = dimensions if shortened else None
         self._cache = cache
         self._token_tracker = token_tracker
+        self._max_concurrency = max_concurrency
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._rate_limiter = RateLimiter(
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute,
+        )
+        # In-flight single-text embeds keyed by normalized text
+        self._inflight: dict[str, asyncio.Future[list[float]]] = {}
 
     @property
     def dimensions(self) -> int:
@@ -133,6 +193,7 @@ class OpenAIEmbedder(BaseEmbedder):
         wait=wait_exponential(multiplier=1, min=1, max=4),
         reraise=True,
     )
+    @timed("embedder.api")
     async def _call_embedding_api(
         self,
         texts: list[str],
@@ -154,15 +215,18 @@ class OpenAIEmbedder(BaseEmbedder):
         response = await self._client.embeddings.create(
             model=self._model,
             input=texts,
+            dimensions=self._request_dimensions or NOT_GIVEN,
         )
         return [item.embedding for item in response.data]
 
+    @timed("embedder.embed")
     async def embed(self, text: str) -> list[float]:
         """
         Generate an embedding vector for a single text.
 
         Checks cache before calling API. Stores result in cache and tracks
-        token usage when configured.
+        token usage when configured. Concurrent calls for the same
+        normalized text share a single cache lookup and API request.
 
         Args:
             text: The input text to embed. Must be non-empty.
@@ -185,6 +249,50 @@ class OpenAIEmbedder(BaseEmbedder):
         if not text or not text.strip():
             raise ValidationError("Text cannot be empty")
 
+        # Coalesce with an identical request already in flight
+        key = normalize_text(text)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                embedding = await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                task = asyncio.current_task()
+                if task is not None and task.cancelling():
+                    raise
+                # The leading request was cancelled, not us: embed independently
+                return await self._embed_single(text)
+            if self._token_tracker is not None:
+                self._token_tracker.track_embedding(text, cache_hit=True)
+            return list(embedding)
+
+        future: asyncio.Future[list[float]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            embedding = await self._embed_single(text)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception with no waiters is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(embedding)
+        finally:
+            del self._inflight[key]
+        return embedding
+
+    async def _embed_single(self, text: str) -> list[float]:
+        """
+        Embed one text via cache or API (the non-coalesced path of embed).
+
+        Args:
+            text: Non-empty input text.
+
+        Returns:
+            Embedding vector.
+        """
         # Check cache first (if configured)
         if self._cache is not None:
             cached = self._cache.get(text)
@@ -249,6 +357,7 @@ class OpenAIEmbedder(BaseEmbedder):
                 "Embedding generation failed"
             ) from e
 
+    @timed("embedder.embed_batch")
     async def embed_batch(
         self,
         texts: Sequence[str],
@@ -258,9 +367,11 @@ class OpenAIEmbedder(BaseEmbedder):
         """
         Generate embedding vectors for multiple texts.
 
-        Processes texts in batches to optimize API calls.
-        Uses per-text caching for optimal cache hit rate.
-        Maximum batch size is 100 per OpenAI limits.
+        Processes texts in batches to optimize API calls, keeping up to
+        max_concurrency batches in flight. Uses per-text caching for optimal
+        cache hit rate. Maximum batch size is 100 per OpenAI limits.
+        429 responses are retried with adaptive backoff; results are always
+        returned in input order.
 
         Args:
             texts: Sequence of texts to embed.
@@ -275,7 +386,7 @@ class OpenAIEmbedder(BaseEmbedder):
             ConnectionError: If OpenAI API is unreachable.
             TimeoutError: If batch embedding times out.
             AuthenticationError: If API key is invalid.
-            RateLimitError: If rate limit is exceeded.
+            RateLimitError: If still rate limited after max_rate_limit_retries.
 
         Example:
             >>> texts = ["term 1", "term 2", "term 3"]
@@ -297,74 +408,152 @@ class OpenAIEmbedder(BaseEmbedder):
         result_embeddings: dict[int, list[float]] = {}
         texts_to_embed: list[tuple[int, str]] = []
 
-        for i, text in enumerate(texts_list):
-            if self._cache is not None:
-                cached = self._cache.get(text)
-                if cached is not None:
-                    result_embeddings[i] = cached
-                    if self._token_tracker is not None:
-                        self._token_tracker.track_embedding(text, cache_hit=True)
-                    continue
+        # One bulk lookup instead of a disk round-trip per text
+        cached_vectors = (
+            self._cache.get_many(texts_list)
+            if self._cache is not None
+            else [None] * len(texts_list)
+        )
+        for i, (text, cached) in enumerate(zip(texts_list, cached_vectors)):
+            if cached is not None:
+                result_embeddings[i] = cached.tolist()
+                continue
             texts_to_embed.append((i, text))
 
-        # Process uncached texts in batches
+        if self._token_tracker is not None and len(result_embeddings) > 0:
+            self._token_tracker.track_batch(
+                [texts_list[i] for i in result_embeddings], cache_hit=True
+            )
+
+        # Process uncached texts in concurrent batches
         if texts_to_embed:
             # Clamp batch size to maximum
             effective_batch_size = min(batch_size, MAX_BATCH_SIZE)
+            batches = [
+                texts_to_embed[start : start + effective_batch_size]
+                for start in range(0, len(texts_to_embed), effective_batch_size)
+            ]
 
-            for batch_start in range(0, len(texts_to_embed), effective_batch_size):
-                batch_items = texts_to_embed[batch_start : batch_start + effective_batch_size]
-                batch_texts = [text for _, text in batch_items]
+            semaphore = asyncio.Semaphore(self._max_concurrency)
 
-                try:
-                    batch_embeddings = await self._call_embedding_api(batch_texts)
+            async def run_batch(batch_items: list[tuple[int, str]]) -> None:
+                batch_texts = [text for _, text in batch_items]
+                # Token counts are only needed to enforce a TPM budget;
+                # when computed they are reused for usage tracking
+                batch_tokens: int | None = None
+                if self._rate_limiter.tokens_per_minute is not None:
+                    batch_tokens = sum(count_tokens(text, self._model) for text in batch_texts)
+
+                async with semaphore:
+                    batch_embeddings = await self._embed_batch_with_backoff(
+                        batch_texts, batch_tokens or 0
+                    )
+
+                # Validate dimensions before caching anything from this batch
+                for (original_idx, _), embedding in zip(batch_items, batch_embeddings):
+                    if len(embedding) != self._dimensions:
+                        raise ValidationError(
+                            f"Embedding dimension mismatch at index {original_idx}: "
+                            f"expected {self._dimensions}, got {len(embedding)}"
+                        )
+
+                # Store in cache (if configured), one transaction per batch
+                if self._cache is not None:
+                    self._cache.set_many(batch_texts, batch_embeddings)
+
+                # Track API usage (if tracker configured)
+                if self._token_tracker is not None:
+                    self._token_tracker.track_batch(batch_texts, tokens=batch_tokens)
 
-                    # Validate dimensions and store results
-                    for (original_idx, text), embedding in zip(batch_items, batch_embeddings):
-                        if len(embedding) != self._dimensions:
-                            raise ValidationError(
-                                f"Embedding dimension mismatch at index {original_idx}: "
-                                f"expected {self._dimensions}, got {len(embedding)}"
-                            )
+                for (original_idx, _), embedding in zip(batch_items, batch_embeddings):
+                    result_embeddings[original_idx] = embedding
 
-                        # Store in cache (if configured)
-                        if self._cache is not None:
-                            self._cache.set(text, embedding)
+            tasks = [asyncio.ensure_future(run_batch(batch)) for batch in batches]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop remaining batches on the first failure
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
 
-                        # Track API usage (if tracker configured)
-                        if self._token_tracker is not None:
-                            self._token_tracker.track_embedding(text, cache_hit=False)
+        # Reassemble results in original order
+        return [result_embeddings[i] for i in range(len(texts_list))]
 
-                        result_embeddings[original_idx] = embedding
+    async def _embed_batch_with_backoff(
+        self,
+        batch_texts: list[str],
+        batch_tokens: int = 0,
+    ) -> list[list[float]]:
+        """
+        Embed one batch within the rate budgets, retrying on 429.
 
-                except APITimeoutError as e:
-                    raise TimeoutError(
-                        "OpenAI embedding batch request timed out"
-                    ) from e
+        Args:
+            batch_texts: Texts for a single API request (max 100).
+            batch_tokens: Token count of the batch, charged against the
+                TPM budget (0 when no TPM budget is set).
 
-                except APIConnectionError as e:
-                    raise ConnectionError(
-                        "Failed to connect to OpenAI embedding service"
-                    ) from e
+        Returns:
+            Embedding vectors in batch order.
 
-                except RateLimitError as e:
+        Raises:
+            RateLimitError: If still rate limited after max_rate_limit_retries.
+            TimeoutError, ConnectionError, AuthenticationError: On API failure.
+        """
+        attempt = 0
+        while True:
+            await self._rate_limiter.acquire(batch_tokens)
+            try:
+                embeddings = await self._call_embedding_api(batch_texts)
+            except RateLimitError as e:
+                if attempt >= self._max_rate_limit_retries:
                     raise KMCPRateLimitError(
                         "OpenAI rate limit exceeded during batch processing"
                     ) from e
+                attempt += 1
+                await self._rate_limiter.record_rate_limited(_retry_after_seconds(e))
+                continue
+            except APITimeoutError as e:
+                raise TimeoutError(
+                    "OpenAI embedding batch request timed out"
+                ) from e
+            except APIConnectionError as e:
+                raise ConnectionError(
+                    "Failed to connect to OpenAI embedding service"
+                ) from e
+            except Exception as e:
+                error_msg = str(e).lower()
+                if "invalid api key" in error_msg or "unauthorized" in error_msg:
+                    raise AuthenticationError(
+                        "Invalid or expired OpenAI API key"
+                    ) from e
+                raise ConnectionError(
+                    "Batch embedding generation failed"
+                ) from e
 
-                except ValidationError:
-                    # Let validation errors propagate unchanged
-                    raise
+            self._rate_limiter.record_success()
+            return embeddings
 
-                except Exception as e:
-                    error_msg = str(e).lower()
-                    if "invalid api key" in error_msg or "unauthorized" in error_msg:
-                        raise AuthenticationError(
-                            "Invalid or expired OpenAI API key"
-                        ) from e
-                    raise ConnectionError(
-                        "Batch embedding generation failed"
-                    ) from e
 
-        # Reassemble results in original order
-        return [result_embeddings[i] for i in range(len(texts_list))]
+def _retry_after_seconds(error: RateLimitError) -> float | None:
+    """
+    Extract the server-suggested retry delay from a 429 response.
+
+    Args:
+        error: OpenAI rate limit error.
+
+    Returns:
+        Delay in seconds, or None if the response carries no usable header.
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if headers is None:
+        return None
+    for header, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        value = headers.get(header)
+        if isinstance(value, (str, int, float)):
+            try:
+                return float(value) * scale
+            except ValueError:
+                continue
+    return None
@@ -0,0 +1,163 @@
+# src/knowledge_mcp/embed/rate_limiter.py
+"""
+Request and token budget limiter for embedding API calls.
+
+Tracks requests and tokens admitted in a sliding one-minute window and
+delays new calls that would exceed the configured requests-per-minute
+(RPM) or tokens-per-minute (TPM) budgets. When the provider still
+answers 429, all callers pause together with an exponentially growing,
+jittered backoff (or the server's Retry-After), which shrinks again once
+calls succeed.
+
+Example:
+    >>> limiter = RateLimiter(requests_per_minute=3000, tokens_per_minute=1_000_000)
+    >>> await limiter.acquire(tokens=8_000)
+    >>> try:
+    ...     response = await call_api()
+    ...     limiter.record_success()
+    ... except RateLimitError as e:
+    ...     await limiter.record_rate_limited(retry_after=parse_retry_after(e))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+# Backoff bounds for repeated 429 responses (seconds)
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 60.0
+
+
+class RateLimiter:
+    """
+    Sliding-window RPM/TPM limiter with shared adaptive 429 backoff.
+
+    A budget of None disables that limit. Admission is serialized so
+    concurrent callers are granted budget in arrival order.
+
+    Attributes:
+        requests_per_minute: Request budget per 60s window (None = unlimited).
+        tokens_per_minute: Token budget per 60s window (None = unlimited).
+        consecutive_rate_limits: 429s since the last successful call.
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=500)
+        >>> await limiter.acquire()
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+        *,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_minute: Maximum requests per window. None disables.
+            tokens_per_minute: Maximum tokens per window. None disables.
+            base_delay: First backoff delay after a 429.
+            max_delay: Upper bound for backoff delays.
+            window: Window length in seconds.
+            clock: Monotonic time source (injectable for tests).
+        """
+        self.requests_per_minute = requests_per_minute or None
+        self.tokens_per_minute = tokens_per_minute or None
+        self.consecutive_rate_limits = 0
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._window = window
+        self._clock = clock
+        self._events: deque[tuple[float, int]] = deque()
+        self._tokens_in_window = 0
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """
+        Wait until a request of the given size fits the budgets.
+
+        A single request larger than the whole token budget is admitted
+        once the window is empty, rather than blocking forever.
+
+        Args:
+            tokens: Tokens the request will consume.
+        """
+        async with self._lock:
+            while True:
+                wait = self._time_until_admissible(tokens)
+                if wait <= 0:
+                    self._events.append((self._clock(), tokens))
+                    self._tokens_in_window += tokens
+                    return
+                await asyncio.sleep(wait)
+
+    def _time_until_admissible(self, tokens: int) -> float:
+        """Seconds until a request of this size may start (<= 0 means now)."""
+        now = self._clock()
+
+        # Drop events that left the window
+        while self._events and self._events[0][0] <= now - self._window:
+            _, expired_tokens = self._events.popleft()
+            self._tokens_in_window -= expired_tokens
+
+        if self._paused_until > now:
+            return self._paused_until - now
+
+        if not self._events:
+            return 0.0
+
+        window_free_at = self._events[0][0] + self._window - now
+        if self.requests_per_minute is not None and len(self._events) >= self.requests_per_minute:
+            return window_free_at
+        if (
+            self.tokens_per_minute is not None
+            and self._tokens_in_window + tokens > self.tokens_per_minute
+        ):
+            return window_free_at
+        return 0.0
+
+    def record_success(self) -> None:
+        """Reset the adaptive backoff after a successful call."""
+        self.consecutive_rate_limits = 0
+
+    async def record_rate_limited(self, retry_after: float | None = None) -> None:
+        """
+        Pause all callers after a 429 response, then wait out the pause.
+
+        Args:
+            retry_after: Server-suggested delay in seconds, if provided.
+        """
+        self.consecutive_rate_limits += 1
+        if retry_after is not None and retry_after > 0:
+            delay = min(retry_after, self._max_delay)
+        else:
+            delay = min(
+                self._base_delay * 2 ** (self.consecutive_rate_limits - 1),
+                self._max_delay,
+            )
+            # Full jitter keeps concurrent batches from retrying in lockstep
+            delay = random.uniform(delay / 2, delay)
+
+        self._paused_until = max(self._paused_until, self._clock() + delay)
+        logger.warning(
+            "Embedding API rate limited (%d in a row), pausing %.1fs",
+            self.consecutive_rate_limits,
+            delay,
+        )
+        await asyncio.sleep(max(self._paused_until - self._clock(), 0.0))
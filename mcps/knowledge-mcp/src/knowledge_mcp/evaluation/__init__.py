@@ -3,12 +3,22 @@ Evaluation framework for RAG quality assessment.
 
 This package provides:
 - Golden test set management
+- Retrieval latency, throughput and recall@k benchmarks
 - RAG Triad metrics (context relevance, faithfulness, answer relevance)
 - CLI reporting for evaluation results
 """
 
 from __future__ import annotations
 
+from knowledge_mcp.evaluation.benchmark import (
+    BenchmarkReport,
+    HashingEmbedder,
+    InMemoryStore,
+    LexicalCrossEncoder,
+    RetrievalBenchmark,
+    build_offline_benchmark,
+    compare_reports,
+)
 from knowledge_mcp.evaluation.golden_set import (
     GoldenQuery,
     GoldenTestResult,
@@ -22,6 +32,13 @@ from knowledge_mcp.evaluation.reporter import (
 )
 
 __all__ = [
+    "BenchmarkReport",
+    "HashingEmbedder",
+    "InMemoryStore",
+    "LexicalCrossEncoder",
+    "RetrievalBenchmark",
+    "build_offline_benchmark",
+    "compare_reports",
     "GoldenQuery",
     "GoldenTestResult",
     "GoldenTestSet",
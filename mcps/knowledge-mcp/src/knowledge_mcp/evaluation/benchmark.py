@@ -0,0 +1,873 @@
+# src/knowledge_mcp/evaluation/benchmark.py
+"""
+Retrieval latency and recall benchmark over the golden query set.
+
+Replays golden queries through SemanticSearcher or HybridSearcher (and
+optionally the Reranker) against any embedder and store, and reports:
+
+- p50/p95/p99 latency per stage (embed, store, bm25, rerank) and end to end
+- queries per second with a configurable number of concurrent searches
+- recall@k, overall and per category
+
+Stages are timed by thin proxies around the backends, so the search code
+itself runs unmodified. Reports serialize to JSON; compare_reports() diffs
+two of them (e.g. from two commits) and lists latency, throughput or recall
+regressions.
+
+HashingEmbedder, InMemoryStore and LexicalCrossEncoder are deterministic,
+dependency-free backends; build_offline_benchmark() combines them with a
+synthetic corpus derived from the golden queries so the benchmark runs
+offline and reproducibly.
+
+Example:
+    >>> golden = GoldenTestSet(Path("data/golden_queries.yml"), k=5)
+    >>> benchmark = await build_offline_benchmark(golden, searcher="hybrid", rerank=True)
+    >>> report = await benchmark.run()
+    >>> report.save(Path("benchmark.json"))
+    >>> compare_reports(json.loads(Path("baseline.json").read_text()), report.to_dict())
+    []
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import math
+import random
+import re
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from knowledge_mcp.embed.base import BaseEmbedder
+from knowledge_mcp.models.chunk import KnowledgeChunk
+from knowledge_mcp.store.base import BaseStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from pathlib import Path
+
+    from knowledge_mcp.evaluation.golden_set import GoldenTestResult, GoldenTestSet
+    from knowledge_mcp.search.bm25 import BM25Searcher
+    from knowledge_mcp.search.models import SearchResult
+    from knowledge_mcp.search.reranker import Reranker
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "BenchmarkReport",
+    "HashingEmbedder",
+    "InMemoryStore",
+    "LatencyStats",
+    "LexicalCrossEncoder",
+    "RetrievalBenchmark",
+    "build_offline_benchmark",
+    "compare_reports",
+    "synthetic_corpus",
+]
+
+REPORT_VERSION = 1
+DEFAULT_CONCURRENCY = 4
+DEFAULT_ROUNDS = 3
+DEFAULT_CORPUS_SIZE = 2000
+DEFAULT_LATENCY_TOLERANCE = 0.25
+DEFAULT_RECALL_TOLERANCE = 0.01
+# Latency changes smaller than this are timer noise, whatever their ratio
+MIN_LATENCY_DELTA_MS = 1.0
+# Config keys that must match for two reports to be comparable
+_COMPARABLE_KEYS = ("backend", "searcher", "rerank", "k", "concurrency")
+
+_WORD_PATTERN = re.compile(r"[a-z0-9]+")
+
+SearcherKind = Literal["semantic", "hybrid"]
+
+
+def _words(text: str) -> list[str]:
+    """Lowercase alphanumeric words of a text."""
+    return _WORD_PATTERN.findall(text.lower())
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of a sample.
+
+    Args:
+        samples: Observed values (any order).
+        pct: Percentile in [0, 100].
+
+    Returns:
+        Smallest sample with at least pct percent of samples at or below
+        it; 0.0 for an empty sample.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+@dataclass
+class LatencyStats:
+    """
+    Latency distribution of one stage, in milliseconds.
+
+    Attributes:
+        count: Number of timed calls.
+        mean: Mean latency.
+        p50: Median latency.
+        p95: 95th percentile latency.
+        p99: 99th percentile latency.
+        max: Slowest call.
+    """
+
+    count: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_seconds(cls, samples: Sequence[float]) -> LatencyStats:
+        """Summarize latencies measured in seconds."""
+        ms = [s * 1000 for s in samples]
+        return cls(
+            count=len(ms),
+            mean=sum(ms) / len(ms) if ms else 0.0,
+            p50=percentile(ms, 50),
+            p95=percentile(ms, 95),
+            p99=percentile(ms, 99),
+            max=max(ms, default=0.0),
+        )
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Rounded, JSON-serializable form."""
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "p50": round(self.p50, 3),
+            "p95": round(self.p95, 3),
+            "p99": round(self.p99, 3),
+            "max": round(self.max, 3),
+        }
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Result of a benchmark run.
+
+    Attributes:
+        config: Benchmark settings (backend, searcher, rerank, k,
+            concurrency, rounds, ...).
+        latency: Latency per stage; "total" is one end-to-end search
+            including reranking.
+        requests: Searches timed (queries x rounds).
+        elapsed_seconds: Wall time of the timed rounds.
+        recall: Recall@k summary: avg_recall, pass_rate, passed, total and
+            by_category.
+        results: Per-query recall results.
+    """
+
+    config: dict[str, Any]
+    latency: dict[str, LatencyStats]
+    requests: int
+    elapsed_seconds: float
+    recall: dict[str, Any]
+    results: list[GoldenTestResult] = field(default_factory=lambda: [])
+
+    @property
+    def qps(self) -> float:
+        """Searches completed per second across all concurrent workers."""
+        return self.requests / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form, stable across runs for diffing."""
+        return {
+            "version": REPORT_VERSION,
+            "config": self.config,
+            "latency_ms": {stage: stats.to_dict() for stage, stats in self.latency.items()},
+            "throughput": {
+                "requests": self.requests,
+                "elapsed_seconds": round(self.elapsed_seconds, 3),
+                "qps": round(self.qps, 2),
+            },
+            "recall": self.recall,
+        }
+
+    def save(self, path: Path) -> None:
+        """Write the report as indented JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    latency_tolerance: float = DEFAULT_LATENCY_TOLERANCE,
+    recall_tolerance: float = DEFAULT_RECALL_TOLERANCE,
+) -> list[str]:
+    """
+    List regressions of a report against a baseline report.
+
+    p50 and p95 latencies may grow and QPS may drop by latency_tolerance
+    (a fraction) before counting as regressions; latency growth under
+    MIN_LATENCY_DELTA_MS is ignored. Average recall may drop by
+    recall_tolerance (absolute).
+
+    Args:
+        baseline: Report dict (BenchmarkReport.to_dict() or its JSON).
+        current: Report dict to check.
+        latency_tolerance: Allowed relative latency and QPS change.
+        recall_tolerance: Allowed absolute recall drop.
+
+    Returns:
+        Human-readable regression descriptions; empty if none.
+
+    Raises:
+        ValueError: If the reports were produced with different settings.
+    """
+    for key in _COMPARABLE_KEYS:
+        if baseline["config"].get(key) != current["config"].get(key):
+            msg = (
+                f"Reports are not comparable: {key} is "
+                f"{baseline['config'].get(key)!r} vs {current['config'].get(key)!r}"
+            )
+            raise ValueError(msg)
+
+    regressions: list[str] = []
+    for stage, before in baseline["latency_ms"].items():
+        after = current["latency_ms"].get(stage)
+        if after is None:
+            continue
+        for metric in ("p50", "p95"):
+            old, new = before[metric], after[metric]
+            if new > old * (1 + latency_tolerance) and new - old >= MIN_LATENCY_DELTA_MS:
+                regressions.append(f"{stage} {metric} latency {old:.2f}ms -> {new:.2f}ms")
+
+    old_qps = baseline["throughput"]["qps"]
+    new_qps = current["throughput"]["qps"]
+    if new_qps < old_qps * (1 - latency_tolerance):
+        regressions.append(f"throughput {old_qps:.1f} -> {new_qps:.1f} queries/s")
+
+    old_recall = baseline["recall"]["avg_recall"]
+    new_recall = current["recall"]["avg_recall"]
+    if new_recall < old_recall - recall_tolerance:
+        regressions.append(f"recall@k {old_recall:.3f} -> {new_recall:.3f}")
+
+    return regressions
+
+
+class _Timed:
+    """
+    Proxy that forwards everything to a backend and times selected methods.
+
+    Sync and async methods are both supported; each call's duration in
+    seconds is appended to samples[stage].
+    """
+
+    def __init__(
+        self,
+        target: Any,
+        stage: str,
+        methods: tuple[str, ...],
+        samples: dict[str, list[float]],
+    ) -> None:
+        self._target = target
+        self._stage = stage
+        self._methods = methods
+        self._samples = samples
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if name not in self._methods:
+            return attr
+        samples = self._samples[self._stage]
+
+        if inspect.iscoroutinefunction(attr):
+
+            async def timed_async(*args: Any, **kwargs: Any) -> Any:
+                start = time.perf_counter()
+                try:
+                    return await attr(*args, **kwargs)
+                finally:
+                    samples.append(time.perf_counter() - start)
+
+            return timed_async
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                samples.append(time.perf_counter() - start)
+
+        return timed
+
+
+class RetrievalBenchmark:
+    """
+    Replay golden queries and measure latency, throughput and recall@k.
+
+    The first pass over the queries runs sequentially, computes recall@k
+    and warms up lazily loaded models; it is not timed. The timed rounds
+    then replay every query rounds times with concurrency searches in
+    flight. Searchers are built without result caches so every timed
+    search does the full work; pass a Reranker with cache_size=0 for the
+    same reason.
+
+    Args:
+        golden_set: Golden queries, k and pass threshold.
+        embedder: Query embedder.
+        store: Vector store holding the corpus.
+        searcher: "semantic" or "hybrid" (requires bm25).
+        bm25: BM25 index over the same corpus, for hybrid search.
+        reranker: Optional reranker applied to the retrieved candidates.
+        concurrency: Searches in flight during timed rounds.
+        rounds: Timed passes over the query set.
+        candidates: Results retrieved per query before reranking. Defaults
+            to 4 x k with a reranker, otherwise k.
+        config: Extra settings recorded in the report (e.g. backend).
+
+    Example:
+        >>> benchmark = RetrievalBenchmark(golden, embedder, store, concurrency=8)
+        >>> report = await benchmark.run()
+        >>> report.latency["total"].p95
+        12.4
+    """
+
+    def __init__(
+        self,
+        golden_set: GoldenTestSet,
+        embedder: BaseEmbedder,
+        store: BaseStore,
+        *,
+        searcher: SearcherKind = "semantic",
+        bm25: BM25Searcher | None = None,
+        reranker: Reranker | None = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rounds: int = DEFAULT_ROUNDS,
+        candidates: int | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Initialize the benchmark.
+
+        Raises:
+            ValueError: If searcher is unknown, hybrid search has no BM25
+                index, or concurrency or rounds is less than 1.
+        """
+        if searcher not in ("semantic", "hybrid"):
+            msg = f"Unknown searcher '{searcher}'. Use semantic or hybrid."
+            raise ValueError(msg)
+        if searcher == "hybrid" and bm25 is None:
+            msg = "Hybrid search requires a BM25 index"
+            raise ValueError(msg)
+        if concurrency < 1 or rounds < 1:
+            msg = "concurrency and rounds must be at least 1"
+            raise ValueError(msg)
+
+        self.golden_set = golden_set
+        self.embedder = embedder
+        self.store = store
+        self.searcher = searcher
+        self.bm25 = bm25
+        self.reranker = reranker
+        self.concurrency = concurrency
+        self.rounds = rounds
+        k = golden_set.k
+        self.candidates = candidates or (k * 4 if reranker is not None else k)
+        self.config = config or {}
+
+    async def run(self) -> BenchmarkReport:
+        """
+        Run the recall pass and the timed rounds.
+
+        Returns:
+            BenchmarkReport with per-stage latency, QPS and recall@k.
+        """
+        from knowledge_mcp.search.hybrid import HybridSearcher
+        from knowledge_mcp.search.semantic_search import SemanticSearcher
+
+        samples: dict[str, list[float]] = defaultdict(list)
+        semantic = SemanticSearcher(
+            _Timed(self.embedder, "embed", ("embed", "embed_batch"), samples),  # type: ignore[arg-type]
+            _Timed(self.store, "store", ("search", "search_batch"), samples),  # type: ignore[arg-type]
+        )
+        search: Callable[..., Any] = semantic.search
+        if self.searcher == "hybrid":
+            hybrid = HybridSearcher(
+                semantic,
+                _Timed(self.bm25, "bm25", ("search",), samples),  # type: ignore[arg-type]
+            )
+            search = hybrid.search
+        try:
+            return await self._measure(search, samples)
+        finally:
+            semantic.close()
+
+    async def _measure(
+        self,
+        search: Callable[..., Any],
+        samples: dict[str, list[float]],
+    ) -> BenchmarkReport:
+        """Run the recall pass and timed rounds through a search function."""
+        reranker = (
+            _Timed(self.reranker, "rerank", ("rerank",), samples)
+            if self.reranker is not None
+            else None
+        )
+        k = self.golden_set.k
+
+        async def retrieve(query: str) -> list[SearchResult]:
+            start = time.perf_counter()
+            results: list[SearchResult] = await search(query, n_results=self.candidates)
+            if reranker is not None:
+                results = await reranker.rerank(query, results, top_n=k)
+            samples["total"].append(time.perf_counter() - start)
+            return results[:k]
+
+        queries = self.golden_set.load_queries()
+
+        # Untimed recall pass, which also warms up lazily loaded models
+        recall_results = []
+        for golden in queries:
+            results = await retrieve(golden.query)
+            recall_results.append(
+                self.golden_set.evaluate_single(golden, [r.content for r in results])
+            )
+        samples.clear()
+
+        work = iter([golden.query for _ in range(self.rounds) for golden in queries])
+
+        async def worker() -> None:
+            for query in work:
+                await retrieve(query)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+        elapsed = time.perf_counter() - start
+
+        latency = {
+            stage: LatencyStats.from_seconds(samples[stage])
+            for stage in ("total", "embed", "store", "bm25", "rerank")
+            if samples.get(stage)
+        }
+        report = BenchmarkReport(
+            config={
+                **self.config,
+                "searcher": self.searcher,
+                "rerank": self.reranker is not None,
+                "k": k,
+                "candidates": self.candidates,
+                "concurrency": self.concurrency,
+                "rounds": self.rounds,
+                "queries": len(queries),
+            },
+            latency=latency,
+            requests=len(queries) * self.rounds,
+            elapsed_seconds=elapsed,
+            recall=self._recall_summary(queries, recall_results),
+            results=recall_results,
+        )
+        logger.info(
+            "Benchmark: %d searches in %.2fs (%.1f qps), recall@%d %.3f",
+            report.requests,
+            elapsed,
+            report.qps,
+            k,
+            report.recall["avg_recall"],
+        )
+        return report
+
+    def _recall_summary(
+        self,
+        queries: list[Any],
+        results: list[GoldenTestResult],
+    ) -> dict[str, Any]:
+        """Overall and per-category recall@k of the recall pass."""
+        summary = self.golden_set.get_summary(results)
+        by_category: dict[str, list[float]] = defaultdict(list)
+        for golden, result in zip(queries, results):
+            by_category[golden.category].append(result.recall)
+        return {
+            "k": self.golden_set.k,
+            "avg_recall": round(float(summary["avg_recall"]), 4),
+            "pass_rate": round(float(summary["pass_rate"]), 4),
+            "passed": summary["passed"],
+            "total": summary["total"],
+            "by_category": {
+                category: round(sum(recalls) / len(recalls), 4)
+                for category, recalls in sorted(by_category.items())
+            },
+        }
+
+
+class HashingEmbedder(BaseEmbedder):
+    """
+    Deterministic offline embedder using feature hashing.
+
+    Each word is hashed to a signed dimension and the counts are
+    L2-normalized, so texts sharing words have high cosine similarity.
+    No model or network is involved, and vectors are identical across
+    runs and machines.
+
+    Args:
+        dimensions: Vector size.
+
+    Example:
+        >>> embedder = HashingEmbedder(dimensions=256)
+        >>> vector = await embedder.embed("system verification")
+    """
+
+    def __init__(self, dimensions: int = 256) -> None:
+        """Produce vectors of the given size."""
+        if dimensions < 1:
+            msg = "dimensions must be at least 1"
+            raise ValueError(msg)
+        self._dimensions = dimensions
+
+    @property
+    def dimensions(self) -> int:
+        """Vector size."""
+        return self._dimensions
+
+    @property
+    def model_name(self) -> str:
+        """Identifier including the vector size."""
+        return f"hashing-{self._dimensions}"
+
+    async def embed(self, text: str) -> list[float]:
+        """Embed one text."""
+        return self._vector(text)
+
+    async def embed_batch(
+        self,
+        texts: Sequence[str],
+        *,
+        batch_size: int = 100,  # noqa: ARG002
+    ) -> list[list[float]]:
+        """Embed texts in order (batch_size is ignored)."""
+        return [self._vector(text) for text in texts]
+
+    async def health_check(self) -> bool:
+        """Always healthy."""
+        return True
+
+    def _vector(self, text: str) -> list[float]:
+        vector = [0.0] * self._dimensions
+        for word in _words(text):
+            digest = int.from_bytes(
+                hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "big"
+            )
+            sign = 1.0 if digest & 1 else -1.0
+            vector[(digest >> 1) % self._dimensions] += sign
+        norm = math.sqrt(sum(v * v for v in vector))
+        if norm == 0:
+            return vector
+        return [v / norm for v in vector]
+
+
+class InMemoryStore(BaseStore):
+    """
+    Exact cosine-similarity store held in memory.
+
+    Search is a single matrix-vector product over all stored embeddings,
+    with equality filters on result metadata. Results use the same dict
+    format as QdrantStore.
+
+    Args:
+        collection_name: Name reported to result caches and stats.
+
+    Example:
+        >>> store = InMemoryStore()
+        >>> store.add_chunks(embedded_chunks)
+        >>> store.search(query_vector, n_results=5)
+    """
+
+    def __init__(self, collection_name: str = "benchmark") -> None:
+        """Start with an empty collection."""
+        self._collection_name = collection_name
+        self._chunks: dict[str, KnowledgeChunk] = {}
+        self._ids: list[str] = []
+        self._matrix: np.ndarray | None = None
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of writes made to this store."""
+        return self._generation
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the in-memory collection."""
+        return self._collection_name
+
+    def add_chunks(self, chunks: list[KnowledgeChunk]) -> int:
+        """
+        Add or replace chunks by id.
+
+        Raises:
+            ValueError: When chunks is empty or a chunk has no embedding.
+        """
+        if not chunks:
+            msg = "chunks must not be empty"
+            raise ValueError(msg)
+        for chunk in chunks:
+            if not chunk.embedding:
+                msg = f"Chunk {chunk.id} has no embedding"
+                raise ValueError(msg)
+        for chunk in chunks:
+            self._chunks[chunk.id] = chunk
+        self._matrix = None
+        self._generation += 1
+        return len(chunks)
+
+    def delete_chunks(self, chunk_ids: list[str]) -> int:
+        """Delete chunks by id; unknown ids are ignored."""
+        for chunk_id in chunk_ids:
+            self._chunks.pop(chunk_id, None)
+        self._matrix = None
+        self._generation += 1
+        return len(chunk_ids)
+
+    def search(
+        self,
+        query_embedding: list[float],
+        n_results: int = 10,
+        filter_dict: dict[str, Any] | None = None,
+        score_threshold: float = 0.0,
+        query_text: str | None = None,  # noqa: ARG002
+    ) -> list[dict[str, Any]]:
+        """
+        Return the stored chunks most similar to the query embedding.
+
+        Raises:
+            ValueError: When query_embedding has the wrong dimensions.
+        """
+        if not self._chunks:
+            return []
+        matrix = self._normalized_matrix()
+        query = np.asarray(query_embedding, dtype=np.float32)
+        if query.shape[0] != matrix.shape[1]:
+            msg = f"Expected {matrix.shape[1]} dimensions, got {query.shape[0]}"
+            raise ValueError(msg)
+        norm = float(np.linalg.norm(query))
+        if norm > 0:
+            query = query / norm
+        scores = matrix @ query
+
+        results: list[dict[str, Any]] = []
+        for pos in np.argsort(-scores, kind="stable"):
+            score = float(scores[pos])
+            if score < score_threshold or len(results) >= n_results:
+                break
+            result = self._format(self._chunks[self._ids[pos]], score)
+            if filter_dict and any(
+                result["metadata"].get(key) != value for key, value in filter_dict.items()
+            ):
+                continue
+            results.append(result)
+        return results
+
+    def get_stats(self) -> dict[str, Any]:
+        """Collection name and chunk count."""
+        return {
+            "collection_name": self._collection_name,
+            "total_chunks": len(self._chunks),
+            "vectors_count": len(self._chunks),
+            "config": {"backend": "memory"},
+        }
+
+    def health_check(self) -> bool:
+        """Always healthy."""
+        return True
+
+    def _normalized_matrix(self) -> np.ndarray:
+        """Row-normalized embedding matrix, rebuilt after writes."""
+        if self._matrix is None:
+            self._ids = list(self._chunks)
+            matrix = np.asarray(
+                [self._chunks[chunk_id].embedding for chunk_id in self._ids],
+                dtype=np.float32,
+            )
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._matrix = matrix / np.where(norms == 0, 1.0, norms)
+        return self._matrix
+
+    @staticmethod
+    def _format(chunk: KnowledgeChunk, score: float) -> dict[str, Any]:
+        return {
+            "id": chunk.id,
+            "content": chunk.content,
+            "metadata": {
+                "document_id": chunk.document_id,
+                "document_title": chunk.document_title,
+                "document_type": chunk.document_type,
+                "section_title": chunk.section_title,
+                "section_hierarchy": chunk.section_hierarchy,
+                "chunk_type": chunk.chunk_type,
+                "normative": chunk.normative or False,
+                "clause_number": chunk.clause_number or "",
+                "page_numbers": chunk.page_numbers,
+                "references": chunk.references,
+            },
+            "score": score,
+        }
+
+
+class LexicalCrossEncoder:
+    """
+    Deterministic stand-in for a cross-encoder model.
+
+    Scores a (query, passage) pair by the fraction of query words found
+    in the passage. Pass it to Reranker(provider="local", cross_encoder=...)
+    to benchmark the reranking path offline.
+    """
+
+    max_length = 512
+
+    def predict(self, pairs: Sequence[tuple[str, str]]) -> list[float]:
+        """Score each (query, passage) pair in [0, 1]."""
+        scores = []
+        for query, passage in pairs:
+            query_words = set(_words(query))
+            if not query_words:
+                scores.append(0.0)
+                continue
+            passage_words = set(_words(passage))
+            scores.append(len(query_words & passage_words) / len(query_words))
+        return scores
+
+
+def synthetic_corpus(
+    golden_set: GoldenTestSet,
+    size: int = DEFAULT_CORPUS_SIZE,
+    *,
+    seed: int = 0,
+) -> list[KnowledgeChunk]:
+    """
+    Build a reproducible corpus for the golden queries.
+
+    Each query gets one relevant chunk containing its text and expected
+    terms; the remaining chunks are distractors of random words drawn
+    from all queries, so they compete on the same vocabulary.
+
+    Args:
+        golden_set: Golden queries to cover.
+        size: Total number of chunks (at least one per query).
+        seed: Random seed for the distractor text.
+
+    Returns:
+        Chunks without embeddings, in a stable order.
+    """
+    from knowledge_mcp.utils.hashing import compute_chunk_id, compute_content_hash
+
+    queries = golden_set.load_queries()
+    rng = random.Random(seed)
+    vocabulary = sorted({word for golden in queries for word in _words(golden.query)})
+
+    contents = [
+        f"{golden.query} {' '.join(golden.expected_in_top_k)}. "
+        + " ".join(rng.choices(vocabulary, k=40))
+        for golden in queries
+    ]
+    while len(contents) < size:
+        contents.append(" ".join(rng.choices(vocabulary, k=rng.randint(40, 120))))
+
+    chunks = []
+    for i, content in enumerate(contents):
+        content_hash = compute_content_hash(content)
+        chunks.append(
+            KnowledgeChunk(
+                id=compute_chunk_id("benchmark", str(i), content_hash),
+                document_id="benchmark",
+                document_title="Synthetic benchmark corpus",
+                document_type="guide",
+                content=content,
+                content_hash=content_hash,
+                token_count=len(content.split()),
+                section_title=f"Section {i}",
+            )
+        )
+    return chunks
+
+
+async def build_offline_benchmark(
+    golden_set: GoldenTestSet,
+    *,
+    searcher: SearcherKind = "semantic",
+    rerank: bool = False,
+    corpus_size: int = DEFAULT_CORPUS_SIZE,
+    dimensions: int = 256,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rounds: int = DEFAULT_ROUNDS,
+) -> RetrievalBenchmark:
+    """
+    Build a benchmark that needs no models, services or network.
+
+    Uses HashingEmbedder, InMemoryStore, a BM25 index for hybrid search
+    and LexicalCrossEncoder for reranking, over synthetic_corpus().
+
+    Args:
+        golden_set: Golden queries, k and pass threshold.
+        searcher: "semantic" or "hybrid".
+        rerank: Rerank candidates with the offline cross-encoder.
+        corpus_size: Number of synthetic chunks.
+        dimensions: Embedding size.
+        concurrency: Searches in flight during timed rounds.
+        rounds: Timed passes over the query set.
+
+    Returns:
+        Ready-to-run RetrievalBenchmark.
+    """
+    chunks = synthetic_corpus(golden_set, corpus_size)
+    embedder = HashingEmbedder(dimensions)
+    for chunk, embedding in zip(
+        chunks, await embedder.embed_batch([c.content for c in chunks])
+    ):
+        chunk.embedding = embedding
+    store = InMemoryStore()
+    store.add_chunks(chunks)
+
+    bm25 = None
+    if searcher == "hybrid":
+        from knowledge_mcp.search.bm25 import BM25Searcher
+
+        bm25 = BM25Searcher()
+        bm25.build_index([{"id": c.id, "content": c.content} for c in chunks])
+
+    reranker = None
+    if rerank:
+        from knowledge_mcp.search.reranker import Reranker
+
+        reranker = Reranker(
+            provider="local",
+            cross_encoder=LexicalCrossEncoder(),
+            cache_size=0,
+        )
+
+    return RetrievalBenchmark(
+        golden_set,
+        embedder,
+        store,
+        searcher=searcher,
+        bm25=bm25,
+        reranker=reranker,
+        concurrency=concurrency,
+        rounds=rounds,
+        config={
+            "backend": "offline",
+            "corpus_size": len(chunks),
+            "dimensions": dimensions,
+        },
+    )
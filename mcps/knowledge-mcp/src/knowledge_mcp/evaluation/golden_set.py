@@ -160,8 +160,9 @@ class GoldenTestSet:
 
 def run_golden_tests(
     golden_file: Path,
-    search_fn: callable,
+    search_fn: callable | None = None,
     k: int = 5,
+    batch_search_fn: callable | None = None,
 ) -> tuple[list[GoldenTestResult], dict[str, float | int]]:
     """
     Run golden tests against a search function.
@@ -171,18 +172,32 @@ def run_golden_tests(
         search_fn: Function that takes query string, returns list of result dicts
                    with 'content' key.
         k: Number of results to retrieve.
+        batch_search_fn: Function that takes the list of all query strings and
+                         returns one result list per query, in order. Used
+                         instead of search_fn so the whole set is searched in
+                         one batched call.
 
     Returns:
         Tuple of (results list, summary dict).
+
+    Raises:
+        ValueError: If neither search function is given.
     """
+    if search_fn is None and batch_search_fn is None:
+        msg = "Either search_fn or batch_search_fn is required"
+        raise ValueError(msg)
+
     golden_set = GoldenTestSet(golden_file, k=k)
     queries = golden_set.load_queries()
 
-    results = []
-    for query in queries:
-        # Run search
-        search_results = search_fn(query.query)
+    # Run search
+    if batch_search_fn is not None:
+        all_search_results = batch_search_fn([query.query for query in queries])
+    else:
+        all_search_results = [search_fn(query.query) for query in queries]
 
+    results = []
+    for query, search_results in zip(queries, all_search_results):
         # Extract content from results
         retrieved_content = [
             r.get("content", str(r))
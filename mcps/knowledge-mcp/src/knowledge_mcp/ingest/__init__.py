@@ -12,16 +12,27 @@ Example:
 
 from __future__ import annotations
 
-from knowledge_mcp.ingest.base import BaseIngestor, ParsedDocument, ParsedElement
-from knowledge_mcp.ingest.docx_ingestor import DOCXIngestor
-from knowledge_mcp.ingest.pdf_ingestor import PDFIngestor
-from knowledge_mcp.ingest.pipeline import IngestionPipeline, ingest_document
-from knowledge_mcp.ingest.web_ingestor import (
-    WebIngestionResult,
-    WebIngestor,
-    WebIngestorConfig,
-    check_url_accessible,
-)
+from typing import TYPE_CHECKING
+
+from knowledge_mcp.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from knowledge_mcp.ingest.base import BaseIngestor, ParsedDocument, ParsedElement
+    from knowledge_mcp.ingest.docx_ingestor import DOCXIngestor
+    from knowledge_mcp.ingest.parallel import ParallelParser, ParseOutcome
+    from knowledge_mcp.ingest.pdf_ingestor import PDFIngestor
+    from knowledge_mcp.ingest.pipeline import IngestionPipeline, ingest_document
+    from knowledge_mcp.ingest.streaming import (
+        IngestCheckpoint,
+        StreamingIngestionPipeline,
+        StreamingIngestResult,
+    )
+    from knowledge_mcp.ingest.web_ingestor import (
+        WebIngestionResult,
+        WebIngestor,
+        WebIngestorConfig,
+        check_url_accessible,
+    )
 
 __all__: list[str] = [
     "BaseIngestor",
@@ -31,8 +42,36 @@ __all__: list[str] = [
     "DOCXIngestor",
     "IngestionPipeline",
     "ingest_document",
+    "ParallelParser",
+    "ParseOutcome",
+    "IngestCheckpoint",
+    "StreamingIngestionPipeline",
+    "StreamingIngestResult",
     "WebIngestor",
     "WebIngestionResult",
     "WebIngestorConfig",
     "check_url_accessible",
 ]
+
+# Imported on first access: parsers pull in docling and the web ingestor crawl4ai
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseIngestor": "knowledge_mcp.ingest.base",
+        "ParsedDocument": "knowledge_mcp.ingest.base",
+        "ParsedElement": "knowledge_mcp.ingest.base",
+        "DOCXIngestor": "knowledge_mcp.ingest.docx_ingestor",
+        "ParallelParser": "knowledge_mcp.ingest.parallel",
+        "ParseOutcome": "knowledge_mcp.ingest.parallel",
+        "PDFIngestor": "knowledge_mcp.ingest.pdf_ingestor",
+        "IngestionPipeline": "knowledge_mcp.ingest.pipeline",
+        "ingest_document": "knowledge_mcp.ingest.pipeline",
+        "IngestCheckpoint": "knowledge_mcp.ingest.streaming",
+        "StreamingIngestionPipeline": "knowledge_mcp.ingest.streaming",
+        "StreamingIngestResult": "knowledge_mcp.ingest.streaming",
+        "WebIngestionResult": "knowledge_mcp.ingest.web_ingestor",
+        "WebIngestor": "knowledge_mcp.ingest.web_ingestor",
+        "WebIngestorConfig": "knowledge_mcp.ingest.web_ingestor",
+        "check_url_accessible": "knowledge_mcp.ingest.web_ingestor",
+    },
+)
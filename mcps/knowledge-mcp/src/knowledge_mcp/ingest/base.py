@@ -10,9 +10,9 @@ BaseIngestor and produce ParsedDocument objects.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from knowledge_mcp.models.document import DocumentMetadata
 
@@ -84,6 +84,37 @@ class ParsedDocument:
     metadata: DocumentMetadata
     elements: list[ParsedElement] = field(default_factory=lambda: [])
 
+    def to_compact(self) -> dict[str, Any]:
+        """
+        Pack the document into plain dicts and lists.
+
+        Used to return parse results from worker processes: pickling
+        builtins keyed by field name avoids a class reference per
+        element, which dominates the payload for documents with
+        thousands of elements, while staying readable if fields are
+        added or reordered.
+
+        Returns:
+            Dict accepted by from_compact().
+        """
+        return asdict(self)
+
+    @classmethod
+    def from_compact(cls, packed: dict[str, Any]) -> ParsedDocument:
+        """
+        Rebuild a document packed by to_compact().
+
+        Args:
+            packed: Output of to_compact().
+
+        Returns:
+            Equivalent ParsedDocument.
+        """
+        return cls(
+            metadata=DocumentMetadata(**packed["metadata"]),
+            elements=[ParsedElement(**element) for element in packed["elements"]],
+        )
+
 
 class BaseIngestor(ABC):
     """
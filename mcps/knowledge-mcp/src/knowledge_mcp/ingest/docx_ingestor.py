@@ -38,9 +38,16 @@ class DOCXIngestor(BaseIngestor):
         >>> print(f"Parsed {len(doc.elements)} elements")
     """
 
-    def __init__(self) -> None:
-        """Initialize the DOCX ingestor with Docling converter."""
-        self.converter = DocumentConverter()
+    def __init__(self, converter: Optional[DocumentConverter] = None) -> None:
+        """
+        Initialize the DOCX ingestor with Docling converter.
+
+        Args:
+            converter: Shared DocumentConverter. Docling's converter handles
+                both PDF and DOCX, so ingestors in one process can share a
+                single warmed instance. A new converter is created if None.
+        """
+        self.converter = converter or DocumentConverter()
         logger.debug("DOCXIngestor initialized with DocumentConverter")
 
     def ingest(self, file_path: Path) -> ParsedDocument:
@@ -0,0 +1,148 @@
+# src/knowledge_mcp/ingest/manifest.py
+"""
+Per-document manifests of ingested chunks for incremental re-ingestion.
+
+Chunk ids are derived from document id, clause path and content hash
+(compute_chunk_id), so re-chunking a revised document reproduces the ids
+of every chunk that did not change. A manifest records the ids and hashes
+stored for each document; diffing fresh chunks against it yields the
+chunks to embed and upsert (new or edited) and the ids to delete
+(vanished or edited), so a nightly re-ingest costs in proportion to what
+actually changed.
+
+Example:
+    >>> manifest = ChunkManifest(Path("data/manifests"))
+    >>> diff = manifest.diff("ieee-15288", chunks)
+    >>> await store.add_chunks(embed(diff.added))
+    >>> await store.delete_chunks(diff.removed)
+    >>> manifest.save("ieee-15288", chunks)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    from knowledge_mcp.models.chunk import KnowledgeChunk
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ChunkDiff", "ChunkManifest"]
+
+
+@dataclass
+class ChunkDiff:
+    """
+    Difference between freshly produced chunks and a document's manifest.
+
+    Attributes:
+        added: Chunks not in the manifest (new or edited); need embedding.
+        unchanged: Ids already stored with the same content.
+        removed: Stored ids absent from the fresh chunks; need deleting.
+    """
+
+    added: list[KnowledgeChunk] = field(default_factory=lambda: [])
+    unchanged: list[str] = field(default_factory=lambda: [])
+    removed: list[str] = field(default_factory=lambda: [])
+
+    @property
+    def changed(self) -> bool:
+        """Whether the store needs any writes for this document."""
+        return bool(self.added or self.removed)
+
+
+class ChunkManifest:
+    """
+    Directory of JSON manifests, one per document id.
+
+    Each manifest maps chunk id to content hash for the chunks currently
+    stored for that document. Files are replaced atomically, so a crash
+    leaves either the old or the new manifest.
+
+    Args:
+        directory: Manifest directory (created on first save).
+
+    Example:
+        >>> manifest = ChunkManifest(Path("data/manifests"))
+        >>> manifest.load("ieee-15288")
+        {'0b7c...': '64ec...', ...}
+    """
+
+    def __init__(self, directory: Path) -> None:
+        """Use manifests stored under directory."""
+        self.directory = directory
+
+    def _path(self, document_id: str) -> Path:
+        """Manifest file for a document (id escaped to a safe file name)."""
+        return self.directory / f"{quote(document_id, safe='')}.json"
+
+    def load(self, document_id: str) -> dict[str, str]:
+        """
+        Read the stored chunk ids and hashes for a document.
+
+        Args:
+            document_id: Document identifier.
+
+        Returns:
+            Mapping of chunk id to content hash; empty if the document has
+            never been ingested or its manifest is unreadable.
+        """
+        path = self._path(document_id)
+        try:
+            with path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable manifest {path}: {e}")
+            return {}
+        return dict(data.get("chunks", {}))
+
+    def save(self, document_id: str, chunks: Iterable[KnowledgeChunk]) -> None:
+        """
+        Record the chunks now stored for a document.
+
+        Args:
+            document_id: Document identifier.
+            chunks: Every chunk of the document's current version.
+        """
+        path = self._path(document_id)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "document_id": document_id,
+            "chunks": {chunk.id: chunk.content_hash for chunk in chunks},
+        }
+        tmp_path = path.with_suffix(".json.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        tmp_path.replace(path)
+
+    def diff(self, document_id: str, chunks: list[KnowledgeChunk]) -> ChunkDiff:
+        """
+        Compare fresh chunks with the document's manifest.
+
+        Args:
+            document_id: Document identifier.
+            chunks: Every chunk of the document's new version.
+
+        Returns:
+            ChunkDiff of chunks to add and ids to delete.
+        """
+        stored = self.load(document_id)
+        result = ChunkDiff()
+        fresh_ids: set[str] = set()
+        for chunk in chunks:
+            fresh_ids.add(chunk.id)
+            if stored.get(chunk.id) == chunk.content_hash:
+                result.unchanged.append(chunk.id)
+            else:
+                result.added.append(chunk)
+        result.removed = [chunk_id for chunk_id in stored if chunk_id not in fresh_ids]
+        return result
@@ -0,0 +1,361 @@
+# src/knowledge_mcp/ingest/parallel.py
+"""
+Process-pool document parsing.
+
+Docling conversion is CPU-bound and holds the GIL, so PDFIngestor and
+DOCXIngestor parse one file at a time on one core. ParallelParser spreads
+files across a process pool instead:
+
+- Each worker builds one DocumentConverter at start-up, warms its PDF and
+  DOCX pipelines, and shares it between both ingestors for every file it
+  handles, so model loading is paid once per worker rather than per file.
+- Results travel back as ParsedDocument.to_compact() dicts, which pickle
+  far smaller than the dataclass graph.
+- Failures are isolated per file. A file that exceeds the timeout is
+  reported as failed and the pool is restarted; the pool starts its
+  workers through its own multiprocessing context, so a stuck worker can
+  be terminated. A worker crash (e.g. a segfault in a native parser)
+  breaks the whole pool, so the files that were in flight are retried one
+  at a time; only the file that crashes again on its own is reported as
+  failed.
+
+Example:
+    >>> with ParallelParser(workers=4) as parser:
+    ...     for outcome in parser.parse_many(paths):
+    ...         if outcome.document is not None:
+    ...             chunks = pipeline.process_parsed(outcome.document)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from multiprocessing.context import SpawnContext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from knowledge_mcp.ingest.base import ParsedDocument
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+    from multiprocessing.process import BaseProcess
+
+    from knowledge_mcp.ingest.base import BaseIngestor
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "ParallelParser",
+    "ParseOutcome",
+    "ParsePool",
+    "create_parse_pool",
+    "default_parse_workers",
+]
+
+DEFAULT_PARSE_TIMEOUT = 600.0  # seconds per file; large scanned PDFs are slow
+_POLL_INTERVAL = 0.5
+
+
+def default_parse_workers() -> int:
+    """Worker count matching the usable cores, leaving one for the caller."""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    return max(1, (cpus or 1) - 1)
+
+
+@dataclass
+class ParseOutcome:
+    """
+    Result of parsing one file.
+
+    Attributes:
+        path: Source file.
+        document: Parsed document (None if parsing failed).
+        error: Error message if parsing failed.
+        elapsed_seconds: Wall-clock time from dispatch to result.
+    """
+
+    path: Path
+    document: ParsedDocument | None = None
+    error: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Whether the file was parsed."""
+        return self.error is None
+
+
+# Per-process state, populated by _init_worker in each pool process
+_worker_ingestors: dict[str, BaseIngestor] = {}
+
+
+def _init_worker() -> None:
+    """Build and warm one shared converter for this worker process."""
+    from docling.datamodel.base_models import InputFormat
+    from docling.document_converter import DocumentConverter
+
+    from knowledge_mcp.ingest.docx_ingestor import DOCXIngestor
+    from knowledge_mcp.ingest.pdf_ingestor import PDFIngestor
+
+    converter = DocumentConverter()
+    for input_format in (InputFormat.PDF, InputFormat.DOCX):
+        try:
+            converter.initialize_pipeline(input_format)
+        except Exception as e:
+            # Not fatal: the pipeline is built lazily on first use instead
+            logger.warning(f"Could not warm Docling {input_format} pipeline: {e}")
+
+    _worker_ingestors[".pdf"] = PDFIngestor(converter)
+    _worker_ingestors[".docx"] = DOCXIngestor(converter)
+
+
+def _parse_compact(file_path: str) -> dict[str, Any]:
+    """Parse one file in a worker process and pack the result."""
+    path = Path(file_path)
+    if not _worker_ingestors:
+        _init_worker()  # Executor supplied without our initializer
+    ingestor = _worker_ingestors.get(path.suffix.lower())
+    if ingestor is None:
+        msg = f"Unsupported file extension '{path.suffix}'"
+        raise ValueError(msg)
+    return ingestor.ingest(path).to_compact()
+
+
+class _WorkerContext(SpawnContext):
+    """Spawn context that remembers the worker processes it starts."""
+
+    def __init__(self) -> None:
+        """Initialize with no processes started."""
+        super().__init__()
+        self.processes: list[BaseProcess] = []
+
+    def Process(self, *args: Any, **kwargs: Any) -> BaseProcess:  # noqa: N802
+        """Create a worker process and keep a handle to it."""
+        process = super().Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+
+
+class ParsePool(ProcessPoolExecutor):
+    """
+    Process pool whose workers hold warmed Docling converters.
+
+    Uses the spawn start method: Docling loads torch, which is not
+    fork-safe once threads exist in the parent. The pool starts its
+    workers through its own context, so terminate() can stop a worker
+    stuck on a file, which shutdown() alone cannot.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[[], None] | None = _init_worker,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            workers: Number of worker processes.
+            initializer: Run once in each worker at start-up. Defaults to
+                building the shared Docling converter.
+        """
+        self._worker_context = _WorkerContext()
+        super().__init__(
+            max_workers=workers,
+            mp_context=self._worker_context,
+            initializer=initializer,
+        )
+
+    def terminate(self) -> None:
+        """Stop the pool without waiting for stuck or crashed workers."""
+        for process in self._worker_context.processes:
+            if process.is_alive():
+                process.terminate()
+        self.shutdown(wait=False, cancel_futures=True)
+
+
+def create_parse_pool(workers: int) -> ParsePool:
+    """
+    Create a process pool whose workers hold warmed Docling converters.
+
+    Args:
+        workers: Number of worker processes.
+
+    Returns:
+        Process pool initialized with one converter per worker.
+    """
+    return ParsePool(workers)
+
+
+def _terminate(executor: Executor) -> None:
+    """Stop an executor without waiting for stuck or crashed workers."""
+    if isinstance(executor, ParsePool):
+        executor.terminate()
+    else:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class ParallelParser:
+    """
+    Parse many documents concurrently in worker processes.
+
+    Attributes:
+        workers: Number of worker processes (files parsed at once).
+        timeout: Per-file time limit in seconds.
+
+    Example:
+        >>> with ParallelParser(workers=4, timeout=300) as parser:
+        ...     outcomes = list(parser.parse_many(paths))
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        timeout: float = DEFAULT_PARSE_TIMEOUT,
+        executor_factory: Callable[[int], Executor] | None = None,
+    ) -> None:
+        """
+        Initialize parallel parser.
+
+        The pool is started on first use and kept for later calls so
+        workers stay warm across batches.
+
+        Args:
+            workers: Worker processes. Defaults to default_parse_workers().
+            timeout: Seconds a single file may take before it is abandoned.
+            executor_factory: Builds the executor for a worker count.
+                Defaults to create_parse_pool.
+
+        Raises:
+            ValueError: If workers < 1 or timeout <= 0.
+        """
+        workers = workers if workers is not None else default_parse_workers()
+        if workers < 1:
+            msg = "workers must be at least 1"
+            raise ValueError(msg)
+        if timeout <= 0:
+            msg = "timeout must be positive"
+            raise ValueError(msg)
+
+        self.workers = workers
+        self.timeout = timeout
+        self._executor_factory = executor_factory or create_parse_pool
+        self._executor: Executor | None = None
+
+    def __enter__(self) -> ParallelParser:
+        """Enter context manager."""
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        """Shut the pool down on exit."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> Executor:
+        """Return the live pool, starting one if needed."""
+        if self._executor is None:
+            self._executor = self._executor_factory(self.workers)
+        return self._executor
+
+    def _restart(self) -> None:
+        """Discard the current pool after a crash or timeout."""
+        if self._executor is not None:
+            _terminate(self._executor)
+            self._executor = None
+
+    def _submit(self, path: Path) -> Future[dict[str, Any]]:
+        """Dispatch one file, replacing a pool that broke since the last check."""
+        try:
+            return self._pool().submit(_parse_compact, str(path))
+        except BrokenProcessPool:
+            self._restart()
+            return self._pool().submit(_parse_compact, str(path))
+
+    def parse_many(self, files: Iterable[Path]) -> Iterator[ParseOutcome]:
+        """
+        Parse files, yielding each outcome as soon as it is ready.
+
+        Outcomes arrive in completion order, not input order. At most
+        `workers` files are dispatched at once, so the per-file timeout
+        measures parsing time rather than time spent queued.
+
+        Args:
+            files: Documents to parse.
+
+        Yields:
+            One ParseOutcome per input file.
+        """
+        queue: deque[Path] = deque(files)
+        # Files that were in flight when a worker crashed; retried alone
+        suspects: deque[Path] = deque()
+        in_flight: dict[Future[dict[str, Any]], tuple[Path, float, bool]] = {}
+
+        while queue or suspects or in_flight:
+            if suspects:
+                if not in_flight:
+                    path = suspects.popleft()
+                    in_flight[self._submit(path)] = (path, time.perf_counter(), True)
+            else:
+                while queue and len(in_flight) < self.workers:
+                    path = queue.popleft()
+                    in_flight[self._submit(path)] = (path, time.perf_counter(), False)
+
+            done, _ = wait(in_flight, timeout=_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+
+            crashed = False
+            for future in done:
+                path, started, isolated = in_flight.pop(future)
+                elapsed = time.perf_counter() - started
+                try:
+                    packed = future.result()
+                except BrokenProcessPool:
+                    crashed = True
+                    if isolated:
+                        logger.error(f"Parser worker crashed on {path}")
+                        yield ParseOutcome(
+                            path, error="Parser worker crashed", elapsed_seconds=elapsed
+                        )
+                    else:
+                        suspects.append(path)
+                    continue
+                except Exception as e:
+                    logger.error(f"Failed to parse {path}: {e}")
+                    yield ParseOutcome(path, error=str(e), elapsed_seconds=elapsed)
+                    continue
+                yield ParseOutcome(
+                    path,
+                    document=ParsedDocument.from_compact(packed),
+                    elapsed_seconds=elapsed,
+                )
+
+            now = time.perf_counter()
+            timed_out = [
+                future for future, (_, started, _) in in_flight.items()
+                if now - started > self.timeout
+            ]
+            if crashed or timed_out:
+                for future in timed_out:
+                    path, started, _ = in_flight.pop(future)
+                    logger.error(f"Parsing {path} exceeded {self.timeout:.0f}s")
+                    yield ParseOutcome(
+                        path,
+                        error=f"Parsing timed out after {self.timeout:.0f}s",
+                        elapsed_seconds=now - started,
+                    )
+                # The pool is unusable (crash) or has a stuck worker
+                # (timeout): resubmit innocent in-flight files to a new pool
+                for future, (path, _, isolated) in in_flight.items():
+                    future.cancel()
+                    (suspects if crashed or isolated else queue).appendleft(path)
+                in_flight.clear()
+                self._restart()
@@ -11,19 +11,21 @@ from __future__ import annotations
 
 import logging
 import re
-import uuid
+from collections import Counter
 from pathlib import Path
 from typing import Any
 
+from docling.document_converter import DocumentConverter
+
 from knowledge_mcp.chunk.hierarchical import HierarchicalChunker
 from knowledge_mcp.chunk.base import ChunkConfig, ChunkResult
 from knowledge_mcp.exceptions import IngestionError
-from knowledge_mcp.ingest.base import BaseIngestor
+from knowledge_mcp.ingest.base import BaseIngestor, ParsedDocument
 from knowledge_mcp.ingest.docx_ingestor import DOCXIngestor
 from knowledge_mcp.ingest.pdf_ingestor import PDFIngestor
 from knowledge_mcp.models.chunk import KnowledgeChunk
 from knowledge_mcp.models.document import DocumentMetadata
-from knowledge_mcp.utils.hashing import compute_content_hash
+from knowledge_mcp.utils.hashing import compute_chunk_id, compute_content_hash
 from knowledge_mcp.utils.normative import detect_normative, NormativeIndicator
 
 logger = logging.getLogger(__name__)
@@ -59,10 +61,11 @@ class IngestionPipeline:
         """
         self.chunk_config = chunk_config or ChunkConfig()
 
-        # Create ingestor registry
+        # Create ingestor registry (one Docling converter serves both formats)
+        converter = DocumentConverter()
         self.ingestors: dict[str, BaseIngestor] = {
-            ".pdf": PDFIngestor(),
-            ".docx": DOCXIngestor(),
+            ".pdf": PDFIngestor(converter),
+            ".docx": DOCXIngestor(converter),
         }
 
         # Create chunker
@@ -84,7 +87,7 @@ class IngestionPipeline:
         1. Select ingestor based on file extension
         2. Parse document to extract elements
         3. Chunk elements respecting structure and token limits
-        4. Enrich chunks with metadata (hash, normative, UUID)
+        4. Enrich chunks with metadata (hash, normative, deterministic id)
 
         Args:
             file_path: Path to document file.
@@ -108,7 +111,29 @@ class IngestionPipeline:
 
         logger.info(f"Starting ingestion pipeline for {file_path}")
 
-        # Select ingestor based on file extension
+        parsed = self.parse(file_path)
+        chunks = self.process_parsed(parsed, document_metadata)
+
+        logger.info(
+            f"Successfully processed {file_path.name}: "
+            f"{len(chunks)} chunks generated"
+        )
+
+        return chunks
+
+    def get_ingestor(self, file_path: Path) -> BaseIngestor:
+        """
+        Select the ingestor for a file based on its extension.
+
+        Args:
+            file_path: Path to document file.
+
+        Returns:
+            Registered ingestor for the extension.
+
+        Raises:
+            IngestionError: If file type is unsupported.
+        """
         file_extension = file_path.suffix.lower()
         ingestor = self.ingestors.get(file_extension)
 
@@ -118,12 +143,55 @@ class IngestionPipeline:
                 f"Unsupported file extension '{file_extension}'. "
                 f"Supported extensions: {supported}"
             )
+        return ingestor
+
+    def parse(self, file_path: Path) -> ParsedDocument:
+        """
+        Parse a document with the ingestor matching its extension.
+
+        Args:
+            file_path: Path to document file.
+
+        Returns:
+            ParsedDocument with metadata and elements.
+
+        Raises:
+            IngestionError: If file type is unsupported or parsing fails.
+            FileNotFoundError: If file_path does not exist.
+        """
+        ingestor = self.get_ingestor(file_path)
 
         try:
-            # Parse document
             logger.debug(f"Parsing document with {type(ingestor).__name__}")
-            parsed = ingestor.ingest(file_path)
+            return ingestor.ingest(file_path)
+        except (IngestionError, FileNotFoundError):
+            raise
+        except Exception as e:
+            logger.error(f"Failed to process {file_path}: {e}")
+            raise IngestionError(f"Failed to process document: {e}") from e
+
+    def process_parsed(
+        self,
+        parsed: ParsedDocument,
+        document_metadata: dict[str, Any] | None = None,
+    ) -> list[KnowledgeChunk]:
+        """
+        Chunk and enrich an already parsed document.
+
+        Separated from parsing so parsing can run elsewhere (e.g. in a
+        worker process) while chunking stays in the calling process.
 
+        Args:
+            parsed: Output of an ingestor.
+            document_metadata: Optional metadata to override extracted values.
+
+        Returns:
+            List of KnowledgeChunk objects ready for embedding.
+
+        Raises:
+            IngestionError: If chunking or enrichment fails.
+        """
+        try:
             # Override metadata if provided
             if document_metadata:
                 for key, value in document_metadata.items():
@@ -167,17 +235,12 @@ class IngestionPipeline:
             logger.debug(f"Enriching {len(chunk_results)} chunks")
             chunks = self._enrich_chunks(chunk_results, parsed.metadata)
 
-            logger.info(
-                f"Successfully processed {file_path.name}: "
-                f"{len(chunks)} chunks generated"
-            )
-
             return chunks
 
-        except (IngestionError, FileNotFoundError):
+        except IngestionError:
             raise
         except Exception as e:
-            logger.error(f"Failed to process {file_path}: {e}")
+            logger.error(f"Failed to process {parsed.metadata.source_path}: {e}")
             raise IngestionError(f"Failed to process document: {e}") from e
 
     # RCCA metadata extraction patterns (pre-compiled for performance)
@@ -308,7 +371,7 @@ class IngestionPipeline:
         Enrich chunks with computed metadata.
 
         Adds:
-        - UUID for chunk id
+        - Deterministic chunk id (document id + clause path + content hash)
         - Content hash for deduplication
         - Normative classification
         - Document metadata
@@ -328,16 +391,22 @@ class IngestionPipeline:
         rcca_domain = self._extract_domain(metadata.document_id)
         rcca_version = self._extract_version(metadata.document_id)
         rcca_family = self._classify_family(rcca_domain)
+        seen: Counter[tuple[str, str]] = Counter()
 
         for chunk_result in chunk_results:
-            # Generate UUID
-            chunk_id = str(uuid.uuid4())
-
             # Compute content hash
             content_hash = compute_content_hash(chunk_result.content)
 
-            # Detect normative status (True/False/None for unknown)
+            # Stable id: unchanged chunks keep their id across re-ingests
             section_path = " > ".join(chunk_result.section_hierarchy)
+            clause_path = f"{section_path}#{chunk_result.clause_number or ''}"
+            occurrence = seen[(clause_path, content_hash)]
+            seen[(clause_path, content_hash)] += 1
+            chunk_id = compute_chunk_id(
+                metadata.document_id, clause_path, content_hash, occurrence
+            )
+
+            # Detect normative status (True/False/None for unknown)
             normative_indicator = detect_normative(
                 chunk_result.content,
                 section_path=section_path,
@@ -0,0 +1,645 @@
+# src/knowledge_mcp/ingest/streaming.py
+"""
+Streaming, staged ingestion: parse -> chunk -> embed -> upsert.
+
+IngestionPipeline processes one document at a time and returns all of its
+chunks before anything else can happen. StreamingIngestionPipeline
+connects the four stages with bounded asyncio queues so they overlap:
+Docling parsing runs in a ParallelParser process pool, chunking runs off
+the event loop,
+and embedding and store upserts are issued in batches by concurrent
+workers. A full queue blocks the stage feeding it (backpressure), so
+memory stays bounded however many documents are queued.
+
+Completed documents are appended to a checkpoint file; a re-run with the
+same checkpoint skips files that have not changed since they completed.
+Documents interrupted mid-way are processed again from the start.
+
+With a manifest directory, re-ingesting a changed file is incremental:
+fresh chunks are diffed against the document's ChunkManifest, only new or
+edited chunks are embedded and upserted, and chunks that vanished are
+deleted from the store once the upserts succeed.
+
+With a BM25 index, a document's keyword entries are updated only after its
+upserts (and stale-chunk deletes) succeed: removed chunks are dropped and
+the chunks just upserted are added, so the index never names chunks the
+vector store lacks. All index writes run on one dedicated thread, which
+keeps them off the event loop and serialized.
+
+Example:
+    >>> pipeline = StreamingIngestionPipeline(
+    ...     IngestionPipeline(), embedder, store,
+    ...     checkpoint_file=Path("data/ingest_checkpoint.jsonl"),
+    ... )
+    >>> result = await pipeline.run(paths)
+    >>> print(result.succeeded, result.total_chunks)
+    >>> print(result.stages["embed"].throughput)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from knowledge_mcp.ingest.manifest import ChunkManifest
+from knowledge_mcp.ingest.parallel import ParallelParser
+from knowledge_mcp.store.async_store import AsyncStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from knowledge_mcp.embed.base import BaseEmbedder
+    from knowledge_mcp.ingest.base import ParsedDocument
+    from knowledge_mcp.ingest.parallel import ParseOutcome
+    from knowledge_mcp.ingest.pipeline import IngestionPipeline
+    from knowledge_mcp.models.chunk import KnowledgeChunk
+    from knowledge_mcp.search.bm25 import BM25Searcher
+    from knowledge_mcp.store.base import BaseStore
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "DocumentOutcome",
+    "IngestCheckpoint",
+    "StageMetrics",
+    "StreamingIngestResult",
+    "StreamingIngestionPipeline",
+]
+
+DEFAULT_PARSE_WORKERS = 2
+DEFAULT_EMBED_WORKERS = 2
+DEFAULT_UPSERT_WORKERS = 2
+DEFAULT_BATCH_SIZE = 128
+DEFAULT_QUEUE_SIZE = 4
+
+
+@dataclass
+class StageMetrics:
+    """
+    Throughput counters for one pipeline stage.
+
+    Attributes:
+        name: Stage name (parse, chunk, embed, upsert).
+        items: Items completed (documents for parse/chunk, chunks for
+            embed/upsert).
+        batches: Units of work completed (documents or chunk batches).
+        busy_seconds: Summed time workers spent doing stage work.
+        errors: Units of work that failed.
+    """
+
+    name: str
+    items: int = 0
+    batches: int = 0
+    busy_seconds: float = 0.0
+    errors: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Items per busy second (0.0 before any work completes)."""
+        return self.items / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert metrics to a dictionary for reporting."""
+        return {
+            "name": self.name,
+            "items": self.items,
+            "batches": self.batches,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "errors": self.errors,
+            "throughput": round(self.throughput, 2),
+        }
+
+
+@dataclass
+class DocumentOutcome:
+    """
+    Result for one input file.
+
+    Attributes:
+        path: Source file.
+        chunks: Chunks upserted for the document.
+        error: Error message if any stage failed (None if succeeded).
+        skipped: True if the checkpoint showed the file already ingested.
+        unchanged: Chunks the manifest showed already stored (not re-embedded).
+        removed: Stale chunks deleted from the store.
+    """
+
+    path: Path
+    chunks: int = 0
+    error: str | None = None
+    skipped: bool = False
+    unchanged: int = 0
+    removed: int = 0
+
+    @property
+    def success(self) -> bool:
+        """Whether the document was ingested (or already was)."""
+        return self.error is None
+
+
+@dataclass
+class StreamingIngestResult:
+    """
+    Summary of a streaming ingestion run.
+
+    Attributes:
+        documents: One outcome per input file, in completion order.
+        stages: Metrics keyed by stage name.
+        elapsed_seconds: Wall-clock duration of the run.
+    """
+
+    documents: list[DocumentOutcome] = field(default_factory=lambda: [])
+    stages: dict[str, StageMetrics] = field(default_factory=lambda: {})
+    elapsed_seconds: float = 0.0
+
+    @property
+    def succeeded(self) -> int:
+        """Documents ingested in this run."""
+        return sum(1 for d in self.documents if d.success and not d.skipped)
+
+    @property
+    def skipped(self) -> int:
+        """Documents skipped because the checkpoint had them."""
+        return sum(1 for d in self.documents if d.skipped)
+
+    @property
+    def failed(self) -> list[DocumentOutcome]:
+        """Documents that failed in any stage."""
+        return [d for d in self.documents if not d.success]
+
+    @property
+    def total_chunks(self) -> int:
+        """Chunks upserted in this run."""
+        return sum(d.chunks for d in self.documents if not d.skipped)
+
+
+class IngestCheckpoint:
+    """
+    Append-only record of documents that finished ingesting.
+
+    Each line holds a resolved path plus the file's size and mtime at the
+    time it was parsed, so an edited file is ingested again.
+
+    Args:
+        path: JSONL checkpoint file (created on first write).
+
+    Example:
+        >>> checkpoint = IngestCheckpoint(Path("data/ingest_checkpoint.jsonl"))
+        >>> if not checkpoint.is_done(pdf):
+        ...     ...
+        >>> checkpoint.mark_done(pdf, chunks=42)
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load completed entries from an existing checkpoint file."""
+        self.path = path
+        self._done: dict[str, str] = {}
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn final line after a crash
+                    self._done[entry["path"]] = entry["fingerprint"]
+
+    @staticmethod
+    def fingerprint(file_path: Path) -> str:
+        """Cheap change detector: size and modification time."""
+        stat = file_path.stat()
+        return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+    def is_done(self, file_path: Path) -> bool:
+        """Check whether the file completed unchanged in an earlier run."""
+        key = str(file_path.resolve())
+        try:
+            return self._done.get(key) == self.fingerprint(file_path)
+        except OSError:
+            return False
+
+    def mark_done(self, file_path: Path, chunks: int, fingerprint: str | None = None) -> None:
+        """
+        Record a completed document.
+
+        Args:
+            file_path: Source file.
+            chunks: Chunks upserted for it.
+            fingerprint: Fingerprint taken when the file was read; taken
+                now if None.
+        """
+        key = str(file_path.resolve())
+        fingerprint = fingerprint or self.fingerprint(file_path)
+        self._done[key] = fingerprint
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"path": key, "fingerprint": fingerprint, "chunks": chunks}) + "\n")
+
+
+@dataclass
+class _DocumentState:
+    """Per-document bookkeeping while its batches are in flight."""
+
+    outcome: DocumentOutcome
+    fingerprint: str
+    pending_batches: int = 0
+    # Chunks sent to embed/upsert; added to the BM25 index once stored
+    upserted: list[KnowledgeChunk] = field(default_factory=lambda: [])
+    # Incremental mode: the document's full chunk set and ids to delete
+    document_id: str = ""
+    chunks: list[KnowledgeChunk] = field(default_factory=lambda: [])
+    removed: list[str] = field(default_factory=lambda: [])
+
+
+class StreamingIngestionPipeline:
+    """
+    Overlapped parse -> chunk -> embed -> upsert over many documents.
+
+    Attributes:
+        pipeline: IngestionPipeline providing chunking and enrichment.
+        embedder: Embedder used for batched embed_batch calls.
+        store: Async store facade used for batched add_chunks calls.
+        checkpoint: Completed-document record, if resumability is enabled.
+        manifest: Per-document chunk manifests, if incremental mode is enabled.
+        bm25_index: Keyword index kept in step with the store, if any.
+
+    Example:
+        >>> streaming = StreamingIngestionPipeline(IngestionPipeline(), embedder, store)
+        >>> result = await streaming.run([Path("a.pdf"), Path("b.docx")])
+    """
+
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        embedder: BaseEmbedder,
+        store: BaseStore | AsyncStore,
+        *,
+        parse_workers: int = DEFAULT_PARSE_WORKERS,
+        embed_workers: int = DEFAULT_EMBED_WORKERS,
+        upsert_workers: int = DEFAULT_UPSERT_WORKERS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        checkpoint_file: Path | None = None,
+        manifest_dir: Path | None = None,
+        bm25_index: BM25Searcher | None = None,
+        parser: ParallelParser | None = None,
+        on_document: Callable[[DocumentOutcome], None] | None = None,
+    ) -> None:
+        """
+        Initialize streaming pipeline.
+
+        Args:
+            pipeline: Pipeline used for chunking and enrichment.
+            embedder: Embedder for chunk batches.
+            store: Vector store; plain stores are wrapped in an AsyncStore.
+            parse_workers: Documents parsed concurrently (process pool size).
+            embed_workers: Concurrent embed_batch calls.
+            upsert_workers: Concurrent add_chunks calls.
+            batch_size: Chunks per embed/upsert batch.
+            queue_size: Capacity of each inter-stage queue.
+            checkpoint_file: Enables resumability when set.
+            manifest_dir: Enables incremental re-ingestion when set: only
+                new or changed chunks are embedded and upserted, and
+                vanished chunks are deleted.
+            bm25_index: Keyword index updated with each document's
+                upserted and removed chunks once its writes succeed.
+            parser: Parser for the parse stage. Defaults to a
+                ParallelParser with parse_workers processes, owned (and
+                closed) by the pipeline.
+            on_document: Called with each document's outcome as it finishes.
+
+        Raises:
+            ValueError: If any worker count, batch_size or queue_size < 1.
+        """
+        for name, value in (
+            ("parse_workers", parse_workers),
+            ("embed_workers", embed_workers),
+            ("upsert_workers", upsert_workers),
+            ("batch_size", batch_size),
+            ("queue_size", queue_size),
+        ):
+            if value < 1:
+                msg = f"{name} must be at least 1"
+                raise ValueError(msg)
+
+        self.pipeline = pipeline
+        self.embedder = embedder
+        self._owns_store = not isinstance(store, AsyncStore)
+        self.store = store if isinstance(store, AsyncStore) else AsyncStore(store)
+        self.parse_workers = parse_workers
+        self.embed_workers = embed_workers
+        self.upsert_workers = upsert_workers
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.checkpoint = IngestCheckpoint(checkpoint_file) if checkpoint_file else None
+        self.manifest = ChunkManifest(manifest_dir) if manifest_dir else None
+        self.bm25_index = bm25_index
+        # BM25Searcher is not thread-safe: one writer thread serializes updates
+        self._bm25_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="bm25")
+            if bm25_index is not None
+            else None
+        )
+        self._owns_parser = parser is None
+        self.parser = parser or ParallelParser(workers=parse_workers)
+        self._on_document = on_document
+
+    async def run(self, files: Sequence[Path]) -> StreamingIngestResult:
+        """
+        Ingest files through the staged pipeline.
+
+        Failures are isolated per document: a file that fails to parse,
+        chunk, embed or upsert is reported in the result and the run
+        continues with the rest.
+
+        Args:
+            files: Documents to ingest.
+
+        Returns:
+            Outcomes per document and per-stage metrics.
+        """
+        started = time.perf_counter()
+        result = StreamingIngestResult(
+            stages={name: StageMetrics(name) for name in ("parse", "chunk", "embed", "upsert")}
+        )
+
+        pending: list[_DocumentState] = []
+        for file_path in files:
+            if self.checkpoint is not None and self.checkpoint.is_done(file_path):
+                self._finish(result, DocumentOutcome(file_path, skipped=True))
+                continue
+            state = _DocumentState(outcome=DocumentOutcome(file_path), fingerprint="")
+            try:
+                self.pipeline.get_ingestor(file_path)  # Fail fast on unsupported types
+                state.fingerprint = IngestCheckpoint.fingerprint(file_path)
+            except Exception as e:
+                self._fail(result, state, "parse", e)
+                continue
+            pending.append(state)
+
+        parsed_queue: asyncio.Queue[tuple[_DocumentState, ParsedDocument] | None] = (
+            asyncio.Queue(maxsize=self.queue_size)
+        )
+        embed_queue: asyncio.Queue[tuple[_DocumentState, list[KnowledgeChunk]] | None] = (
+            asyncio.Queue(maxsize=self.queue_size)
+        )
+        upsert_queue: asyncio.Queue[tuple[_DocumentState, list[KnowledgeChunk]] | None] = (
+            asyncio.Queue(maxsize=self.queue_size)
+        )
+
+        stages = [
+            self._run_stage(
+                [self._parse_stage(pending, parsed_queue, result)],
+                parsed_queue,
+                consumers=1,
+            ),
+            self._run_stage(
+                [self._chunk_worker(parsed_queue, embed_queue, result)],
+                embed_queue,
+                consumers=self.embed_workers,
+            ),
+            self._run_stage(
+                [self._embed_worker(embed_queue, upsert_queue, result)
+                 for _ in range(self.embed_workers)],
+                upsert_queue,
+                consumers=self.upsert_workers,
+            ),
+            self._run_stage(
+                [self._upsert_worker(upsert_queue, result) for _ in range(self.upsert_workers)],
+            ),
+        ]
+        tasks = [asyncio.ensure_future(stage) for stage in stages]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+        result.elapsed_seconds = time.perf_counter() - started
+        logger.info(
+            f"Streaming ingest finished in {result.elapsed_seconds:.1f}s: "
+            f"{result.succeeded} ingested, {result.skipped} skipped, "
+            f"{len(result.failed)} failed, {result.total_chunks} chunks"
+        )
+        return result
+
+    def close(self) -> None:
+        """Release the BM25 writer and any parser or store pool this pipeline created."""
+        if self._bm25_executor is not None:
+            self._bm25_executor.shutdown(wait=True)
+        if self._owns_parser:
+            self.parser.close()
+        if self._owns_store:
+            self.store.close()
+
+    @staticmethod
+    async def _run_stage(
+        workers: list[Any],
+        out_queue: asyncio.Queue[Any] | None = None,
+        consumers: int = 0,
+    ) -> None:
+        """Run a stage's workers, then signal end-of-stream downstream."""
+        await asyncio.gather(*workers)
+        if out_queue is not None:
+            for _ in range(consumers):
+                await out_queue.put(None)
+
+    def _finish(self, result: StreamingIngestResult, outcome: DocumentOutcome) -> None:
+        """Record a finished document and notify the callback."""
+        result.documents.append(outcome)
+        if self._on_document is not None:
+            self._on_document(outcome)
+
+    def _fail(
+        self,
+        result: StreamingIngestResult,
+        state: _DocumentState,
+        stage: str,
+        error: BaseException,
+    ) -> None:
+        """Mark a document failed (once) after an error in any stage."""
+        result.stages[stage].errors += 1
+        if state.outcome.error is not None:
+            return
+        logger.error(f"{stage} failed for {state.outcome.path}: {error}")
+        state.outcome.error = str(error)
+        state.outcome.chunks = 0
+        self._finish(result, state.outcome)
+
+    async def _parse_stage(
+        self,
+        pending: list[_DocumentState],
+        parsed_queue: asyncio.Queue[tuple[_DocumentState, ParsedDocument] | None],
+        result: StreamingIngestResult,
+    ) -> None:
+        """Feed parse results into the chunk stage as they complete."""
+        metrics = result.stages["parse"]
+        states = {state.outcome.path: state for state in pending}
+
+        async def deliver(outcome: ParseOutcome) -> None:
+            state = states[outcome.path]
+            metrics.busy_seconds += outcome.elapsed_seconds
+            if outcome.document is None:
+                self._fail(result, state, "parse", RuntimeError(outcome.error))
+                return
+            metrics.items += 1
+            metrics.batches += 1
+            await parsed_queue.put((state, outcome.document))
+
+        # parse_many blocks between results, so only fetching the next one
+        # runs on a thread. Delivery stays on the loop: on cancellation no
+        # thread is left waiting on a full queue, and awaiting each put
+        # before fetching the next result carries backpressure into the parser.
+        outcomes = iter(self.parser.parse_many(states))
+        while (outcome := await asyncio.to_thread(next, outcomes, None)) is not None:
+            await deliver(outcome)
+
+    async def _chunk_worker(
+        self,
+        parsed_queue: asyncio.Queue[tuple[_DocumentState, ParsedDocument] | None],
+        embed_queue: asyncio.Queue[tuple[_DocumentState, list[KnowledgeChunk]] | None],
+        result: StreamingIngestResult,
+    ) -> None:
+        """Chunk parsed documents and split them into embed batches."""
+        metrics = result.stages["chunk"]
+        while (item := await parsed_queue.get()) is not None:
+            state, parsed = item
+            started = time.perf_counter()
+            try:
+                chunks = await asyncio.to_thread(self.pipeline.process_parsed, parsed)
+            except Exception as e:
+                self._fail(result, state, "chunk", e)
+                continue
+            finally:
+                metrics.busy_seconds += time.perf_counter() - started
+
+            metrics.items += 1
+            metrics.batches += 1
+            if self.manifest is not None:
+                state.document_id = parsed.metadata.document_id
+                state.chunks = chunks
+                try:
+                    diff = self.manifest.diff(state.document_id, chunks)
+                except Exception as e:
+                    self._fail(result, state, "chunk", e)
+                    continue
+                state.removed = diff.removed
+                state.outcome.unchanged = len(diff.unchanged)
+                chunks = diff.added
+            state.upserted = chunks
+            if not chunks:
+                await self._complete(result, state)
+                continue
+
+            batches = [
+                chunks[start : start + self.batch_size]
+                for start in range(0, len(chunks), self.batch_size)
+            ]
+            state.pending_batches = len(batches)
+            for batch in batches:
+                await embed_queue.put((state, batch))
+
+    async def _embed_worker(
+        self,
+        embed_queue: asyncio.Queue[tuple[_DocumentState, list[KnowledgeChunk]] | None],
+        upsert_queue: asyncio.Queue[tuple[_DocumentState, list[KnowledgeChunk]] | None],
+        result: StreamingIngestResult,
+    ) -> None:
+        """Embed chunk batches and forward them for upsert."""
+        metrics = result.stages["embed"]
+        while (item := await embed_queue.get()) is not None:
+            state, batch = item
+            if state.outcome.error is not None:
+                continue  # Another batch of this document already failed
+
+            started = time.perf_counter()
+            try:
+                embeddings = await self.embedder.embed_batch([c.content for c in batch])
+            except Exception as e:
+                self._fail(result, state, "embed", e)
+                continue
+            finally:
+                metrics.busy_seconds += time.perf_counter() - started
+
+            for chunk, embedding in zip(batch, embeddings):
+                chunk.embedding = embedding
+            metrics.items += len(batch)
+            metrics.batches += 1
+            await upsert_queue.put((state, batch))
+
+    async def _upsert_worker(
+        self,
+        upsert_queue: asyncio.Queue[tuple[_DocumentState, list[KnowledgeChunk]] | None],
+        result: StreamingIngestResult,
+    ) -> None:
+        """Write embedded batches to the store and complete documents."""
+        metrics = result.stages["upsert"]
+        while (item := await upsert_queue.get()) is not None:
+            state, batch = item
+            if state.outcome.error is not None:
+                continue
+
+            started = time.perf_counter()
+            try:
+                added = await self.store.add_chunks(batch)
+            except Exception as e:
+                self._fail(result, state, "upsert", e)
+                continue
+            finally:
+                metrics.busy_seconds += time.perf_counter() - started
+
+            metrics.items += len(batch)
+            metrics.batches += 1
+            state.outcome.chunks += added
+            state.pending_batches -= 1
+            if state.pending_batches == 0:
+                await self._complete(result, state)
+
+    async def _complete(self, result: StreamingIngestResult, state: _DocumentState) -> None:
+        """Delete stale chunks and update BM25, then checkpoint and report the document."""
+        if self.manifest is not None and state.document_id and state.removed:
+            try:
+                await self.store.delete_chunks(state.removed)
+            except Exception as e:
+                self._fail(result, state, "upsert", e)
+                return
+            state.outcome.removed = len(state.removed)
+
+        if self.bm25_index is not None and self._bm25_executor is not None:
+            try:
+                await asyncio.get_running_loop().run_in_executor(
+                    self._bm25_executor, _update_bm25, self.bm25_index, state
+                )
+            except Exception as e:
+                self._fail(result, state, "upsert", e)
+                return
+
+        if self.manifest is not None and state.document_id:
+            self.manifest.save(state.document_id, state.chunks)
+            logger.debug(
+                f"{state.document_id}: {state.outcome.chunks} upserted, "
+                f"{state.outcome.unchanged} unchanged, {state.outcome.removed} removed"
+            )
+
+        if self.checkpoint is not None:
+            self.checkpoint.mark_done(
+                state.outcome.path, state.outcome.chunks, fingerprint=state.fingerprint
+            )
+        self._finish(result, state.outcome)
+
+
+def _update_bm25(bm25_index: BM25Searcher, state: _DocumentState) -> None:
+    """Apply a stored document's changes to the BM25 index (writer thread only)."""
+    if state.outcome.removed:
+        bm25_index.remove_documents(state.removed)
+    if state.upserted:
+        bm25_index.add_documents(
+            [{"id": chunk.id, "content": chunk.content} for chunk in state.upserted]
+        )
@@ -13,14 +13,26 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
+import urllib.error
+import urllib.request
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
 
 from crawl4ai import AsyncWebCrawler, CrawlerRunConfig
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import AsyncIterator, Sequence
+
+logger = logging.getLogger(__name__)
+
+# robots.txt rules applied when the configured user agent has none
+_DEFAULT_ROBOTS_AGENT = "*"
 
 
 @dataclass
@@ -30,13 +42,16 @@ class WebIngestorConfig:
     Attributes:
         respect_robots_txt: Check robots.txt before crawling (default: True).
         max_concurrent: Maximum concurrent crawls (default: 3).
-        delay_between_requests: Delay between requests in seconds (default: 1.5).
+        max_per_host: Maximum concurrent crawls of one host (default: 1).
+        delay_between_requests: Minimum delay between requests to the same
+            host in seconds; a longer robots.txt Crawl-delay wins (default: 1.5).
         timeout: Request timeout in seconds (default: 30).
         user_agent: Custom user agent string (default: None, uses Crawl4AI default).
     """
 
     respect_robots_txt: bool = True
     max_concurrent: int = 3
+    max_per_host: int = 1
     delay_between_requests: float = 1.5
     timeout: int = 30
     user_agent: str | None = None
@@ -65,13 +80,38 @@ class WebIngestionResult:
     status_code: int = 0
 
 
+@dataclass
+class _HostState:
+    """Politeness state for one host during a batch.
+
+    Attributes:
+        slots: Bounds concurrent crawls of the host.
+        delay: Seconds between request starts (config or Crawl-delay).
+        next_request: Event-loop time the next request may start.
+    """
+
+    slots: asyncio.Semaphore
+    delay: float
+    next_request: float = 0.0
+
+    async def wait_turn(self) -> None:
+        """Reserve the host's next request slot and sleep until it opens."""
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self.next_request)
+        self.next_request = start + self.delay
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
 @dataclass
 class WebIngestor:
     """Web content ingestor using Crawl4AI.
 
     Features:
-    - robots.txt compliance (configurable)
-    - Rate limiting via semaphore
+    - robots.txt compliance, including Crawl-delay (configurable)
+    - One shared browser per batch, with global and per-host concurrency limits
+    - Results streamed as each URL finishes
     - Clean Markdown output
     - Structured error handling
 
@@ -85,6 +125,9 @@ class WebIngestor:
     """
 
     config: WebIngestorConfig = field(default_factory=WebIngestorConfig)
+    _robots: dict[str, RobotFileParser] = field(
+        default_factory=lambda: {}, init=False, repr=False
+    )
 
     async def ingest(self, url: str) -> WebIngestionResult:
         """Ingest content from a single URL.
@@ -100,47 +143,151 @@ class WebIngestor:
             >>> if result.success:
             ...     print(result.markdown)
         """
+        results = await self.ingest_many([url])
+        return results[0]
+
+    async def ingest_many(self, urls: Sequence[str]) -> list[WebIngestionResult]:
+        """Ingest content from multiple URLs concurrently.
+
+        URLs are crawled with one shared browser, at most max_concurrent at
+        a time and max_per_host per host, spaced by the per-host delay.
+
+        Args:
+            urls: List of URLs to crawl.
+
+        Returns:
+            List of WebIngestionResult objects, one per URL, in input order.
+
+        Example:
+            >>> urls = ["https://example.com", "https://example.org"]
+            >>> results = await ingestor.ingest_many(urls)
+            >>> successful = [r for r in results if r.success]
+            >>> print(f"Crawled {len(successful)}/{len(urls)} URLs")
+        """
+        results: list[WebIngestionResult | None] = [None] * len(urls)
+        async for index, result in self._ingest_indexed(urls):
+            results[index] = result
+        return [result for result in results if result is not None]
+
+    async def iter_ingest(self, urls: Sequence[str]) -> AsyncIterator[WebIngestionResult]:
+        """Ingest URLs concurrently, yielding each result as it finishes.
+
+        Same limits as ingest_many. Breaking out of the loop cancels the
+        crawls still pending and closes the browser.
+
+        Args:
+            urls: URLs to crawl.
+
+        Yields:
+            WebIngestionResult for each URL, in completion order.
+
+        Example:
+            >>> async for result in ingestor.iter_ingest(urls):
+            ...     print(result.url, result.success)
+        """
+        async for _, result in self._ingest_indexed(urls):
+            yield result
+
+    async def _ingest_indexed(
+        self, urls: Sequence[str]
+    ) -> AsyncIterator[tuple[int, WebIngestionResult]]:
+        """Crawl URLs with a shared crawler, yielding (input index, result)."""
+        if not urls:
+            return
+
         # Create crawler config
         crawler_config = CrawlerRunConfig(
             bypass_cache=True,
             word_count_threshold=10,  # Minimum words to consider valid
         )
 
+        async with AsyncExitStack() as stack:
+            try:
+                crawler = await stack.enter_async_context(AsyncWebCrawler(verbose=False))
+            except Exception as e:
+                for index, url in enumerate(urls):
+                    yield index, WebIngestionResult(url=url, success=False, error=str(e))
+                return
+
+            crawl_slots = asyncio.Semaphore(self.config.max_concurrent)
+            hosts: dict[str, _HostState] = {}
+            robots_fetches: dict[str, asyncio.Task[RobotFileParser]] = {}
+
+            async def crawl_url(url: str) -> WebIngestionResult:
+                host = urlsplit(url).netloc.lower()
+                robots = await self._get_robots(url, robots_fetches)
+                if robots is not None and not robots.can_fetch(self._robots_agent, url):
+                    return WebIngestionResult(
+                        url=url, success=False, error="Disallowed by robots.txt"
+                    )
+                if host not in hosts:
+                    hosts[host] = _HostState(
+                        slots=asyncio.Semaphore(self.config.max_per_host),
+                        delay=self._host_delay(robots),
+                    )
+                state = hosts[host]
+                async with state.slots:
+                    await state.wait_turn()
+                    async with crawl_slots:
+                        return await self._crawl(crawler, url, crawler_config)
+
+            async def crawl(index: int, url: str) -> tuple[int, WebIngestionResult]:
+                # One URL's failure must not abort the rest of the batch
+                try:
+                    return index, await crawl_url(url)
+                except Exception as e:
+                    logger.warning(f"Failed to ingest {url}: {e}")
+                    return index, WebIngestionResult(url=url, success=False, error=str(e))
+
+            tasks = [asyncio.create_task(crawl(i, url)) for i, url in enumerate(urls)]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+            finally:
+                for task in [*tasks, *robots_fetches.values()]:
+                    task.cancel()
+                await asyncio.gather(*tasks, *robots_fetches.values(), return_exceptions=True)
+
+    async def _crawl(
+        self,
+        crawler: AsyncWebCrawler,
+        url: str,
+        crawler_config: CrawlerRunConfig,
+    ) -> WebIngestionResult:
+        """Crawl one URL with an open crawler and convert the result."""
         try:
-            # Create async crawler
-            async with AsyncWebCrawler(verbose=False) as crawler:
-                # Crawl the URL
-                result = await crawler.arun(
+            # Crawl the URL
+            result = await crawler.arun(
+                url=url,
+                config=crawler_config,
+            )
+
+            # Check if crawl was successful
+            if not result.success:
+                return WebIngestionResult(
                     url=url,
-                    config=crawler_config,
+                    success=False,
+                    error=result.error_message or "Crawl failed",
+                    status_code=result.status_code or 0,
                 )
 
-                # Check if crawl was successful
-                if not result.success:
-                    return WebIngestionResult(
-                        url=url,
-                        success=False,
-                        error=result.error_message or "Crawl failed",
-                        status_code=result.status_code or 0,
-                    )
-
-                # Extract markdown content
-                markdown = result.markdown or ""
+            # Extract markdown content
+            markdown = result.markdown or ""
 
-                # Extract title
-                title = self._extract_title(result.html or "", url)
+            # Extract title
+            title = self._extract_title(result.html or "", url)
 
-                # Count words
-                word_count = len(markdown.split())
+            # Count words
+            word_count = len(markdown.split())
 
-                return WebIngestionResult(
-                    url=url,
-                    success=True,
-                    markdown=markdown,
-                    title=title,
-                    word_count=word_count,
-                    status_code=result.status_code or 200,
-                )
+            return WebIngestionResult(
+                url=url,
+                success=True,
+                markdown=markdown,
+                title=title,
+                word_count=word_count,
+                status_code=result.status_code or 200,
+            )
 
         except Exception as e:
             return WebIngestionResult(
@@ -149,29 +296,72 @@ class WebIngestor:
                 error=str(e),
             )
 
-    async def ingest_many(self, urls: Sequence[str]) -> list[WebIngestionResult]:
-        """Ingest content from multiple URLs with rate limiting.
-
-        Rate limiting is handled internally by Crawl4AI's AsyncWebCrawler
-        when processing multiple URLs sequentially.
+    @property
+    def _robots_agent(self) -> str:
+        """User agent matched against robots.txt rules."""
+        return self.config.user_agent or _DEFAULT_ROBOTS_AGENT
+
+    def _host_delay(self, robots: RobotFileParser | None) -> float:
+        """Seconds between requests to a host: config delay or Crawl-delay."""
+        delay = self.config.delay_between_requests
+        if robots is not None:
+            crawl_delay = robots.crawl_delay(self._robots_agent)
+            if crawl_delay is not None:
+                delay = max(delay, float(crawl_delay))
+        return delay
+
+    async def _get_robots(
+        self,
+        url: str,
+        pending: dict[str, asyncio.Task[RobotFileParser]],
+    ) -> RobotFileParser | None:
+        """Return the host's parsed robots.txt, fetching it once per host.
 
         Args:
-            urls: List of URLs to crawl.
+            url: URL being crawled.
+            pending: In-flight fetches of the current batch, by origin, so
+                concurrent URLs of one host share a single download.
 
         Returns:
-            List of WebIngestionResult objects, one per URL.
+            Parsed rules, or None when robots.txt is not respected.
+        """
+        if not self.config.respect_robots_txt:
+            return None
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+        if origin not in self._robots:
+            if origin not in pending:
+                pending[origin] = asyncio.create_task(
+                    asyncio.to_thread(self._fetch_robots, f"{origin}/robots.txt")
+                )
+            self._robots[origin] = await pending[origin]
+        return self._robots[origin]
 
-        Example:
-            >>> urls = ["https://example.com", "https://example.org"]
-            >>> results = await ingestor.ingest_many(urls)
-            >>> successful = [r for r in results if r.success]
-            >>> print(f"Crawled {len(successful)}/{len(urls)} URLs")
+    def _fetch_robots(self, robots_url: str) -> RobotFileParser:
+        """Download and parse robots.txt (blocking; run in a thread).
+
+        Follows urllib.robotparser semantics: 401/403 disallow everything,
+        other errors (including malformed responses such as
+        http.client.IncompleteRead) allow everything.
         """
-        results = []
-        for url in urls:
-            result = await self.ingest(url)
-            results.append(result)
-        return results
+        parser = RobotFileParser(robots_url)
+        headers = {"User-Agent": self.config.user_agent} if self.config.user_agent else {}
+        request = urllib.request.Request(robots_url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=self.config.timeout) as response:
+                body = response.read().decode("utf-8", errors="replace")
+        except urllib.error.HTTPError as e:
+            if e.code in (401, 403):
+                parser.disallow_all = True
+            else:
+                parser.allow_all = True
+            return parser
+        except Exception as e:
+            logger.warning(f"Could not fetch {robots_url}, assuming allowed: {e}")
+            parser.allow_all = True
+            return parser
+        parser.parse(body.splitlines())
+        return parser
 
     def _extract_title(self, html: str, fallback_url: str) -> str:
         """Extract page title from HTML.
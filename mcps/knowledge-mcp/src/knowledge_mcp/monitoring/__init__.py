@@ -3,13 +3,40 @@ Production monitoring for knowledge-mcp.
 
 This package provides:
 - Token usage tracking for cost visibility
+- Per-stage latency spans and counters for the search path
 - Structured JSON logging
 - Alerting for threshold violations
 """
 
 from __future__ import annotations
 
-from knowledge_mcp.monitoring.logger import setup_json_logger
-from knowledge_mcp.monitoring.token_tracker import TokenTracker
+from typing import TYPE_CHECKING
 
-__all__ = ["TokenTracker", "setup_json_logger"]
+from knowledge_mcp.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from knowledge_mcp.monitoring.logger import setup_json_logger
+    from knowledge_mcp.monitoring.spans import SpanRecorder, get_recorder, span, timed
+    from knowledge_mcp.monitoring.token_tracker import TokenTracker
+
+__all__ = [
+    "SpanRecorder",
+    "TokenTracker",
+    "get_recorder",
+    "setup_json_logger",
+    "span",
+    "timed",
+]
+
+# Imported on first access so tiktoken loads only when tokens are counted
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "setup_json_logger": "knowledge_mcp.monitoring.logger",
+        "SpanRecorder": "knowledge_mcp.monitoring.spans",
+        "get_recorder": "knowledge_mcp.monitoring.spans",
+        "span": "knowledge_mcp.monitoring.spans",
+        "timed": "knowledge_mcp.monitoring.spans",
+        "TokenTracker": "knowledge_mcp.monitoring.token_tracker",
+    },
+)
@@ -0,0 +1,351 @@
+"""
+Per-stage latency instrumentation for the search path.
+
+Named spans (e.g. "embedder.embed", "store.search", "reranker.rerank",
+"tool.knowledge_search") record their duration into in-process histograms
+with fixed, Prometheus-style buckets; named counters track events such as
+embedding cache hits. The aggregate is small and constant in size, so it
+can run for the life of the server and is exposed through knowledge_stats
+as JSON or Prometheus text exposition format (scrapable by Prometheus or
+an OpenTelemetry collector's Prometheus receiver).
+
+Recording is off until enabled (the server enables it from config). While
+disabled, timed() wrappers cost one attribute check per call and span()
+returns a shared no-op context manager.
+
+Example:
+    >>> recorder = get_recorder()
+    >>> recorder.enabled = True
+    >>> @timed("store.search")
+    ... def search(...): ...
+    >>> with span("tool.knowledge_search.format"):
+    ...     payload = json.dumps(results)
+    >>> recorder.snapshot()["spans"]["store.search"]["p95_ms"]
+    4.7
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import threading
+import time
+from bisect import bisect_left
+from contextlib import AbstractContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import TracebackType
+
+__all__ = [
+    "SpanHistogram",
+    "SpanRecorder",
+    "get_recorder",
+    "increment",
+    "span",
+    "timed",
+]
+
+F = TypeVar("F", bound="Callable[..., Any]")
+
+# Upper bucket bounds in seconds (100us to 10s); the +Inf bucket is implicit
+BUCKET_BOUNDS: tuple[float, ...] = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_PROMETHEUS_PREFIX = "knowledge_mcp"
+_NOOP = nullcontext()
+
+
+class SpanHistogram:
+    """
+    Thread-safe latency histogram for one span name.
+
+    Keeps per-bucket counts, total, maximum and error count; quantiles are
+    estimated by linear interpolation within the bucket that holds them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float, *, error: bool = False) -> None:
+        """Record one duration in seconds."""
+        index = bisect_left(BUCKET_BOUNDS, seconds)
+        with self._lock:
+            self.buckets[index] += 1
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+            if error:
+                self.errors += 1
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile in seconds.
+
+        Args:
+            q: Quantile in [0, 1].
+
+        Returns:
+            Interpolated estimate, never above the largest observation;
+            0.0 when nothing was recorded.
+        """
+        buckets, count, _, largest = self.snapshot()
+        if count == 0:
+            return 0.0
+        target = q * count
+        seen = 0
+        for index, in_bucket in enumerate(buckets):
+            if in_bucket and seen + in_bucket >= target:
+                lower = BUCKET_BOUNDS[index - 1] if index > 0 else 0.0
+                upper = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else largest
+                estimate = lower + (upper - lower) * (target - seen) / in_bucket
+                return min(estimate, largest)
+            seen += in_bucket
+        return largest
+
+    def snapshot(self) -> tuple[list[int], int, float, float]:
+        """
+        Read the histogram consistently while observations continue.
+
+        Returns:
+            Tuple of (bucket counts, count, total seconds, max seconds).
+        """
+        with self._lock:
+            return list(self.buckets), self.count, self.total, self.max
+
+    def summary(self) -> dict[str, float | int]:
+        """Count, errors and latency summary in milliseconds."""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": round(self.total * 1000, 3),
+            "mean_ms": round(self.total * 1000 / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.quantile(0.50) * 1000, 3),
+            "p95_ms": round(self.quantile(0.95) * 1000, 3),
+            "p99_ms": round(self.quantile(0.99) * 1000, 3),
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _Span(AbstractContextManager["_Span"]):
+    """Context manager timing one span occurrence."""
+
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: SpanHistogram) -> None:
+        self._histogram = histogram
+        self._start = 0.0
+
+    def __enter__(self) -> _Span:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._histogram.observe(time.perf_counter() - self._start, error=exc_type is not None)
+
+
+class SpanRecorder:
+    """
+    Registry of span histograms and event counters.
+
+    Args:
+        enabled: Whether spans and counters are recorded.
+
+    Example:
+        >>> recorder = SpanRecorder(enabled=True)
+        >>> with recorder.span("embedder.embed"):
+        ...     ...
+        >>> recorder.increment("embedding_cache.hits")
+        >>> print(recorder.to_prometheus())
+    """
+
+    def __init__(self, *, enabled: bool = False) -> None:
+        """Create an empty registry."""
+        self.enabled = enabled
+        self._histograms: dict[str, SpanHistogram] = {}
+        self._counters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def histogram(self, name: str) -> SpanHistogram:
+        """Histogram for a span name, created on first use."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(name, SpanHistogram())
+        return histogram
+
+    def span(self, name: str) -> AbstractContextManager[Any]:
+        """
+        Time a block of code as one occurrence of a span.
+
+        Args:
+            name: Span name, dotted by component (e.g. "store.search").
+
+        Returns:
+            Context manager recording the block's duration, and whether it
+            raised, when enabled; a no-op otherwise.
+        """
+        if not self.enabled:
+            return _NOOP
+        return _Span(self.histogram(name))
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Add value to a named counter when enabled."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        """Drop all recorded spans and counters."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Summarize everything recorded so far.
+
+        Returns:
+            Dict with enabled, spans (name -> count, errors and latency
+            summary in ms) and counters (name -> value).
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+        return {
+            "enabled": self.enabled,
+            "spans": {name: histograms[name].summary() for name in sorted(histograms)},
+            "counters": {name: counters[name] for name in sorted(counters)},
+        }
+
+    def to_prometheus(self) -> str:
+        """
+        Render spans and counters in Prometheus text exposition format.
+
+        Returns:
+            Cumulative duration histograms (seconds) labelled by span,
+            span error counters and event counters.
+        """
+        with self._lock:
+            histograms = dict(self._histograms)
+            counters = dict(self._counters)
+
+        duration = f"{_PROMETHEUS_PREFIX}_span_duration_seconds"
+        errors = f"{_PROMETHEUS_PREFIX}_span_errors_total"
+        events = f"{_PROMETHEUS_PREFIX}_events_total"
+        lines = [
+            f"# HELP {duration} Latency of instrumented operations.",
+            f"# TYPE {duration} histogram",
+        ]
+        for name in sorted(histograms):
+            buckets, count, total, _ = histograms[name].snapshot()
+            label = _escape_label(name)
+            cumulative = 0
+            for bound, in_bucket in zip(BUCKET_BOUNDS, buckets):
+                cumulative += in_bucket
+                lines.append(f'{duration}_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{duration}_bucket{{span="{label}",le="+Inf"}} {count}')
+            lines.append(f'{duration}_sum{{span="{label}"}} {total}')
+            lines.append(f'{duration}_count{{span="{label}"}} {count}')
+
+        lines.append(f"# HELP {errors} Instrumented operations that raised.")
+        lines.append(f"# TYPE {errors} counter")
+        for name in sorted(histograms):
+            lines.append(f'{errors}{{span="{_escape_label(name)}"}} {histograms[name].errors}')
+
+        lines.append(f"# HELP {events} Event counters.")
+        lines.append(f"# TYPE {events} counter")
+        for name in sorted(counters):
+            lines.append(f'{events}{{name="{_escape_label(name)}"}} {counters[name]}')
+        return "\n".join(lines) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    """Escape a Prometheus label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+_recorder = SpanRecorder()
+
+
+def get_recorder() -> SpanRecorder:
+    """Process-wide recorder used by span(), timed() and increment()."""
+    return _recorder
+
+
+def span(name: str) -> AbstractContextManager[Any]:
+    """Time a block of code on the process-wide recorder (see SpanRecorder.span)."""
+    return _recorder.span(name)
+
+
+def increment(name: str, value: int = 1) -> None:
+    """Add to a counter on the process-wide recorder."""
+    _recorder.increment(name, value)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """
+    Decorate a function or coroutine function to record each call as a span.
+
+    Args:
+        name: Span name.
+
+    Returns:
+        Decorator preserving the wrapped function's signature and metadata.
+
+    Example:
+        >>> @timed("reranker.rerank")
+        ... async def rerank(self, query, results): ...
+    """
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _recorder.enabled:
+                    return await func(*args, **kwargs)
+                with _Span(_recorder.histogram(name)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _recorder.enabled:
+                return func(*args, **kwargs)
+            with _Span(_recorder.histogram(name)):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
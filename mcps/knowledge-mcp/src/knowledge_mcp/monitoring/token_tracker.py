@@ -1,35 +1,69 @@
-"""Token usage tracking for cost monitoring."""
+"""
+Token usage tracking for cost monitoring.
+
+Usage is aggregated in memory and persisted in two files:
+
+- ``<log_file>``: JSON snapshot of daily totals (the format read by
+  ``knowledge-mcp token-summary``), rewritten atomically on compaction.
+- ``<log_file>.journal``: append-only log of per-day deltas, one JSON
+  line per day per flush, tagged with an increasing sequence number.
+
+Tracking a call only updates counters; deltas are appended to the journal
+once flush_threshold events are pending, or by a background timer
+flush_interval seconds after the first unflushed event. The snapshot
+records the last journal sequence it includes, so a crash between writing
+the snapshot and truncating the journal never double counts, and a torn
+final journal line is ignored on replay.
+"""
 
 from __future__ import annotations
 
+import atexit
 import json
+import logging
+import os
+import threading
+import weakref
 from datetime import date
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import tiktoken
 
 if TYPE_CHECKING:
-    pass
+    from collections.abc import Sequence
+
+logger = logging.getLogger("knowledge_mcp.monitoring")
+
+# Snapshot key holding the last journal sequence folded into the totals
+_SEQ_KEY = "_journal_seq"
+_COUNTERS = ("embedding_tokens", "embedding_requests", "cache_hits")
 
 
 class TokenTracker:
     """
     Track OpenAI API token usage for cost visibility.
 
-    Aggregates daily totals, logs to JSON file.
+    Aggregates daily totals in memory, journals them to disk in batches.
     Emits warnings when approaching budget threshold.
 
     Args:
         log_file: Path to JSON file for storing usage stats.
         embedding_model: Model name for tokenizer selection.
         daily_warning_threshold: Token count that triggers warning (default 1M).
+        flush_interval: Seconds after which pending usage is journaled, even
+            if nothing else is tracked.
+        flush_threshold: Pending tracked events that trigger a journal flush.
+        compact_threshold: Journal records after which the snapshot is
+            rewritten and the journal truncated.
 
     Example:
         >>> tracker = TokenTracker(Path("data/tokens.json"), "text-embedding-3-small")
         >>> tokens = tracker.track_embedding("Hello world", cache_hit=False)
+        >>> tracker.track_batch(["a", "b"], tokens=12)  # Precomputed count
         >>> summary = tracker.get_daily_summary()
         >>> cost = tracker.estimate_cost()
+        >>> tracker.close()  # Flush and compact
     """
 
     # OpenAI pricing per 1M tokens (text-embedding-3-small)
@@ -40,12 +74,19 @@ class TokenTracker:
         log_file: Path,
         embedding_model: str = "text-embedding-3-small",
         daily_warning_threshold: int = 1_000_000,
+        flush_interval: float = 5.0,
+        flush_threshold: int = 100,
+        compact_threshold: int = 1_000,
     ) -> None:
         """Initialize tracker with log file and tokenizer."""
         self.log_file = log_file
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
+        self.journal_file = log_file.with_name(log_file.name + ".journal")
         self.embedding_model = embedding_model
         self.daily_warning_threshold = daily_warning_threshold
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.compact_threshold = compact_threshold
 
         # Initialize tokenizer
         try:
@@ -54,20 +95,60 @@ class TokenTracker:
             # Fallback for models not in tiktoken registry
             self.encoding = tiktoken.get_encoding("cl100k_base")
 
-        # Load existing stats
+        self._lock = threading.Lock()
+        self._pending: dict[str, dict[str, int]] = {}
+        self._pending_events = 0
+        self._flush_timer: threading.Timer | None = None
+        self._seq = 0
+        self._journal_records = 0
+
+        # Load snapshot and replay journal
         self.stats: dict[str, dict[str, int]] = self._load_stats()
 
+        # Best-effort flush of buffered usage on interpreter exit
+        atexit.register(_flush_at_exit, weakref.ref(self))
+
     def _load_stats(self) -> dict[str, dict[str, int]]:
-        """Load existing token stats from JSON."""
+        """Load the snapshot and fold in journal records newer than it."""
+        snapshot: dict[str, Any] = {}
         if self.log_file.exists() and self.log_file.stat().st_size > 0:
             with open(self.log_file, encoding="utf-8") as f:
-                return json.load(f)
-        return {}
+                snapshot = json.load(f)
+        snapshot_seq = int(snapshot.pop(_SEQ_KEY, 0))
+        stats: dict[str, dict[str, int]] = snapshot
+        self._seq = snapshot_seq
+
+        if not self.journal_file.exists():
+            return stats
+
+        with open(self.journal_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash mid-append
+                    logger.warning("Skipping corrupt token journal line")
+                    continue
+                self._journal_records += 1
+                seq = int(record.get("seq", 0))
+                self._seq = max(self._seq, seq)
+                if seq <= snapshot_seq:
+                    continue
+                day_stats = stats.setdefault(record["day"], _empty_counters())
+                for counter in _COUNTERS:
+                    day_stats[counter] = day_stats.get(counter, 0) + record.get(counter, 0)
+        return stats
 
     def _save_stats(self) -> None:
-        """Persist stats to JSON."""
-        with open(self.log_file, "w", encoding="utf-8") as f:
-            json.dump(self.stats, f, indent=2)
+        """Atomically rewrite the snapshot with all journaled totals."""
+        snapshot: dict[str, object] = dict(self.stats)
+        snapshot[_SEQ_KEY] = self._seq
+        tmp_file = self.log_file.with_name(self.log_file.name + ".tmp")
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.log_file)
 
     def _get_today(self) -> str:
         """Get today's date as string key."""
@@ -77,11 +158,7 @@ class TokenTracker:
         """Ensure today's entry exists and return it."""
         today = self._get_today()
         if today not in self.stats:
-            self.stats[today] = {
-                "embedding_tokens": 0,
-                "embedding_requests": 0,
-                "cache_hits": 0,
-            }
+            self.stats[today] = _empty_counters()
         return self.stats[today]
 
     def count_tokens(self, text: str) -> int:
@@ -96,38 +173,156 @@ class TokenTracker:
         """
         return len(self.encoding.encode(text))
 
-    def track_embedding(self, text: str, cache_hit: bool = False) -> int:
+    def count_tokens_batch(self, texts: Sequence[str]) -> int:
+        """
+        Count total tokens across texts with tiktoken's batch encoder.
+
+        Args:
+            texts: Texts to tokenize.
+
+        Returns:
+            Total number of tokens.
+        """
+        return sum(len(ids) for ids in self.encoding.encode_ordinary_batch(list(texts)))
+
+    def track_embedding(
+        self,
+        text: str,
+        cache_hit: bool = False,
+        tokens: int | None = None,
+    ) -> int:
         """
         Track embedding token usage.
 
         Args:
             text: Text being embedded.
             cache_hit: Whether embedding was served from cache.
+            tokens: Precomputed token count; counted with tiktoken if None.
+                Cache hits are never tokenized.
 
         Returns:
-            Token count for the text.
+            Token count for the text (0 for cache hits).
+        """
+        if cache_hit:
+            self._record(cache_hits=1)
+            return 0
+
+        if tokens is None:
+            tokens = self.count_tokens(text)
+        self._record(tokens=tokens, requests=1)
+        return tokens
+
+    def track_batch(
+        self,
+        texts: Sequence[str],
+        cache_hit: bool = False,
+        tokens: int | None = None,
+    ) -> int:
         """
-        tokens = self.count_tokens(text)
-        today_stats = self._ensure_today_entry()
+        Track usage for a whole batch of texts in one update.
 
+        Args:
+            texts: Texts embedded together (or served from cache).
+            cache_hit: Whether the texts were served from cache.
+            tokens: Precomputed total token count for the batch; counted
+                with tiktoken if None. Cache hits are never tokenized.
+
+        Returns:
+            Total tokens recorded (0 for cache hits).
+        """
+        if not texts:
+            return 0
         if cache_hit:
-            today_stats["cache_hits"] += 1
-        else:
-            today_stats["embedding_tokens"] += tokens
-            today_stats["embedding_requests"] += 1
+            self._record(cache_hits=len(texts))
+            return 0
 
-        self._save_stats()
+        if tokens is None:
+            tokens = self.count_tokens_batch(texts)
+        self._record(tokens=tokens, requests=len(texts))
+        return tokens
+
+    def _record(self, tokens: int = 0, requests: int = 0, cache_hits: int = 0) -> None:
+        """Add usage to today's totals and the pending journal delta."""
+        with self._lock:
+            today_stats = self._ensure_today_entry()
+            pending = self._pending.setdefault(self._get_today(), _empty_counters())
+            for counter, value in (
+                ("embedding_tokens", tokens),
+                ("embedding_requests", requests),
+                ("cache_hits", cache_hits),
+            ):
+                today_stats[counter] += value
+                pending[counter] += value
+            self._pending_events += 1
+            total_tokens = today_stats["embedding_tokens"]
+
+            if self._pending_events >= self.flush_threshold:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self._flush_on_timer)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
 
         # Check warning threshold
-        if today_stats["embedding_tokens"] >= self.daily_warning_threshold:
-            self._emit_warning(today_stats["embedding_tokens"])
+        if tokens and total_tokens >= self.daily_warning_threshold:
+            self._emit_warning(total_tokens)
 
-        return tokens
+    def flush(self) -> None:
+        """Append pending usage to the journal, compacting when it grows large."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_on_timer(self) -> None:
+        """Journal usage left pending for flush_interval seconds."""
+        try:
+            self.flush()
+        except OSError as e:
+            logger.warning(f"Failed to flush token usage: {e}")
+
+    def _flush_locked(self) -> None:
+        """Flush pending deltas; caller holds the lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+
+        self._seq += 1
+        lines = [
+            json.dumps({"seq": self._seq, "day": day, **counters}) + "\n"
+            for day, counters in self._pending.items()
+        ]
+        with open(self.journal_file, "a", encoding="utf-8") as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+        self._journal_records += len(lines)
+        self._pending.clear()
+        self._pending_events = 0
+
+        if self._journal_records >= self.compact_threshold:
+            self._compact_locked()
+
+    def _compact_locked(self) -> None:
+        """Fold the journal into the snapshot, then truncate it."""
+        self._save_stats()
+        # A crash before truncation is harmless: replay skips seq <= snapshot
+        with open(self.journal_file, "w", encoding="utf-8"):
+            pass
+        self._journal_records = 0
+
+    def compact(self) -> None:
+        """Flush pending usage and rewrite the snapshot from all totals."""
+        with self._lock:
+            self._flush_locked()
+            self._compact_locked()
+
+    def close(self) -> None:
+        """Flush and compact; call on shutdown."""
+        self.compact()
 
     def _emit_warning(self, tokens: int) -> None:
         """Emit warning when approaching threshold."""
-        import logging
-        logger = logging.getLogger("knowledge_mcp.monitoring")
         cost = (tokens / 1_000_000) * self.COST_PER_MILLION_TOKENS
         logger.warning(
             f"Daily token usage high: {tokens:,} tokens (${cost:.4f}). "
@@ -164,3 +359,19 @@ class TokenTracker:
     def get_all_days(self) -> list[str]:
         """Get list of all days with recorded usage."""
         return sorted(self.stats.keys(), reverse=True)
+
+
+def _empty_counters() -> dict[str, int]:
+    """Return a fresh zeroed counter dict for one day."""
+    return dict.fromkeys(_COUNTERS, 0)
+
+
+def _flush_at_exit(tracker_ref: weakref.ref[TokenTracker]) -> None:
+    """Flush a still-alive tracker at interpreter exit."""
+    tracker = tracker_ref()
+    if tracker is None:
+        return
+    try:
+        tracker.flush()
+    except OSError:
+        logger.warning("Failed to flush token usage at exit")
@@ -14,7 +14,7 @@ Example:
     >>> searcher = SemanticSearcher(embedder, store)
     >>> results = await searcher.search("system requirements", n_results=10)
 
-For reranking support (requires optional dependencies):
+For reranking support (cohere or sentence-transformers, imported on first use):
     >>> from knowledge_mcp.search import Reranker
     >>> reranker = Reranker(provider="local")
     >>> reranked = await reranker.rerank("query", results, top_n=5)
@@ -22,20 +22,27 @@ For reranking support (requires optional dependencies):
 
 from __future__ import annotations
 
-from knowledge_mcp.search.bm25 import BM25Searcher
-from knowledge_mcp.search.citation import CitationFormatter, format_citation
-from knowledge_mcp.search.coverage import (
-    CoverageAssessor,
-    CoverageConfig,
-    CoverageGap,
-    CoveragePriority,
-    CoverageReport,
-    CoveredArea,
-    assess_knowledge_coverage,
-)
-from knowledge_mcp.search.hybrid import HybridSearcher, reciprocal_rank_fusion
-from knowledge_mcp.search.models import SearchResult
-from knowledge_mcp.search.semantic_search import SemanticSearcher
+from typing import TYPE_CHECKING
+
+from knowledge_mcp.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from knowledge_mcp.search.bm25 import BM25Searcher
+    from knowledge_mcp.search.citation import CitationFormatter, format_citation
+    from knowledge_mcp.search.coverage import (
+        CoverageAssessor,
+        CoverageConfig,
+        CoverageGap,
+        CoveragePriority,
+        CoverageReport,
+        CoveredArea,
+        assess_knowledge_coverage,
+    )
+    from knowledge_mcp.search.hybrid import HybridSearcher, reciprocal_rank_fusion
+    from knowledge_mcp.search.models import SearchResult
+    from knowledge_mcp.search.reranker import Reranker
+    from knowledge_mcp.search.result_cache import SearchResultCache
+    from knowledge_mcp.search.semantic_search import SemanticSearcher
 
 __all__: list[str] = [
     "SearchResult",
@@ -43,6 +50,7 @@ __all__: list[str] = [
     "BM25Searcher",
     "HybridSearcher",
     "reciprocal_rank_fusion",
+    "SearchResultCache",
     "format_citation",
     "CitationFormatter",
     "CoverageAssessor",
@@ -52,13 +60,29 @@ __all__: list[str] = [
     "CoverageReport",
     "CoveredArea",
     "assess_knowledge_coverage",
+    "Reranker",
 ]
 
-# Optional reranker import (requires 'rerank' or 'local' extras)
-try:
-    from knowledge_mcp.search.reranker import Reranker
-
-    __all__.append("Reranker")
-except ImportError:
-    # Reranker not available - cohere or sentence-transformers not installed
-    pass
+# Imported on first access: bm25s and numpy load only when a searcher needs them
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BM25Searcher": "knowledge_mcp.search.bm25",
+        "CitationFormatter": "knowledge_mcp.search.citation",
+        "format_citation": "knowledge_mcp.search.citation",
+        "CoverageAssessor": "knowledge_mcp.search.coverage",
+        "CoverageConfig": "knowledge_mcp.search.coverage",
+        "CoverageGap": "knowledge_mcp.search.coverage",
+        "CoveragePriority": "knowledge_mcp.search.coverage",
+        "CoverageReport": "knowledge_mcp.search.coverage",
+        "CoveredArea": "knowledge_mcp.search.coverage",
+        "assess_knowledge_coverage": "knowledge_mcp.search.coverage",
+        "HybridSearcher": "knowledge_mcp.search.hybrid",
+        "reciprocal_rank_fusion": "knowledge_mcp.search.hybrid",
+        "SearchResult": "knowledge_mcp.search.models",
+        "SearchResultCache": "knowledge_mcp.search.result_cache",
+        "SemanticSearcher": "knowledge_mcp.search.semantic_search",
+        # cohere / sentence-transformers are imported when a Reranker is created
+        "Reranker": "knowledge_mcp.search.reranker",
+    },
+)
@@ -6,6 +6,12 @@ This module provides the BM25Searcher class for keyword-based retrieval
 using the BM25S algorithm. It complements semantic search by finding
 documents with exact keyword matches.
 
+The index can optionally be persisted to disk. A persisted index is split
+into a sealed main segment (memory-mapped on load) and a small append-only
+delta log holding chunks added or tombstoned since the last compaction, so
+server startup never re-tokenizes the corpus and new ingests never force a
+full rebuild.
+
 Example:
     >>> from knowledge_mcp.search import BM25Searcher
     >>>
@@ -19,17 +25,50 @@ Example:
     >>> results = searcher.search("requirements", n_results=5)
     >>> for r in results:
     ...     print(f"{r['score']:.2f}: {r['content']}")
+
+Persistent example:
+    >>> searcher = BM25Searcher.open(Path("data/bm25"), "se_knowledge_base_v1_te3small")
+    >>> searcher.add_documents([{"id": "doc3", "content": "Trade study criteria"}])
+    >>> searcher.remove_documents(["doc1"])
 """
 
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any
+import math
+import os
+import shutil
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import bm25s  # type: ignore[import-untyped]
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
 
 logger = logging.getLogger(__name__)
 
+# On-disk layout of a persisted index directory
+_FORMAT_VERSION = 1
+_MANIFEST_FILE = "manifest.json"
+_DELTA_LOG_FILE = "delta.jsonl"
+_MAIN_DIR = "main"  # Segment directories are named main-<id>; the manifest names the live one
+_IDS_FILE = "ids.json"
+_CORPUS_FILE = "corpus.jsonl"
+
+# BM25 parameters matching bm25s "lucene" scoring, reused for delta documents
+_K1 = 1.5
+_B = 0.75
+
+
+def _tokenize(text: str) -> list[str]:
+    """Tokenize text using simple whitespace split + lowercase (per research)."""
+    return text.lower().split()
+
 
 class BM25Searcher:
     """
@@ -38,9 +77,22 @@ class BM25Searcher:
     Provides fast keyword-based retrieval to complement semantic search.
     Uses simple whitespace tokenization with lowercasing (per 03-RESEARCH.md).
 
+    The index has two segments:
+
+    - main: sealed bm25s index built by build_index() or compact(). When
+      loaded from disk its score matrix and corpus are memory-mapped.
+    - delta: chunks added via add_documents() since the last compaction,
+      kept as in-memory term counts and scored against the combined
+      corpus statistics so their scores are comparable with main.
+
+    Removed chunks are tombstoned (masked out of main, dropped from delta).
+    Once the delta plus tombstones exceed ``compaction_ratio`` of the main
+    segment, the index is compacted back into a single main segment.
+
     Attributes:
         is_indexed: Whether the index has been built.
-        document_count: Number of indexed documents.
+        document_count: Number of live indexed documents.
+        index_dir: Directory the index is persisted to (None if in-memory).
 
     Example:
         >>> searcher = BM25Searcher()
@@ -53,20 +105,93 @@ class BM25Searcher:
         >>> print(f"Found {len(results)} results")
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        index_dir: Path | None = None,
+        *,
+        collection_version: str = "",
+        compaction_ratio: float = 0.1,
+    ) -> None:
         """
         Initialize BM25 searcher with empty index.
 
-        The index must be built using build_index() before searching.
+        The index must be built using build_index() (or loaded using load())
+        before searching.
+
+        Args:
+            index_dir: Directory to persist the index to. None keeps the
+                index in memory only.
+            collection_version: Versioned collection name the index belongs
+                to. Stored in the manifest so a stale index is never loaded
+                for a different embedding model/collection.
+            compaction_ratio: Fraction of the main segment size that the
+                delta plus tombstones may reach before compaction.
         """
+        self._index_dir = index_dir
+        self._collection_version = collection_version
+        self._compaction_ratio = compaction_ratio
+
+        # Sealed main segment
         self._index: bm25s.BM25 | None = None
         self._doc_ids: list[str] = []
-        self._doc_contents: list[str] = []
+        self._doc_contents: Sequence[Any] = []
+        self._id_positions: dict[str, int] = {}
+        self._tombstones: set[str] = set()
+        self._weight_mask: np.ndarray[Any, Any] | None = None
+        self._main_token_count = 0
+
+        # Append-only delta segment (insertion ordered)
+        self._delta_docs: dict[str, str] = {}
+        self._delta_tfs: dict[str, Counter[str]] = {}
+        self._delta_df: Counter[str] = Counter()
+
+        # Bumped whenever indexed content changes; keys search result caches
+        self._generation = 0
+
+    @classmethod
+    def open(
+        cls,
+        index_dir: Path,
+        collection_version: str,
+        *,
+        compaction_ratio: float = 0.1,
+    ) -> BM25Searcher:
+        """
+        Open the persisted index for a collection, or start an empty one.
+
+        Args:
+            index_dir: Base directory holding per-collection BM25 indexes.
+            collection_version: Versioned collection name (subdirectory key).
+            compaction_ratio: Delta size ratio that triggers compaction.
+
+        Returns:
+            BM25Searcher bound to ``index_dir / collection_version``.
+
+        Example:
+            >>> searcher = BM25Searcher.open(config.bm25_index_dir,
+            ...                              config.versioned_collection_name)
+        """
+        path = index_dir / collection_version
+        loaded = cls.load(
+            path,
+            collection_version=collection_version,
+            compaction_ratio=compaction_ratio,
+        )
+        if loaded is not None:
+            return loaded
+        return cls(
+            path,
+            collection_version=collection_version,
+            compaction_ratio=compaction_ratio,
+        )
 
     def build_index(self, documents: list[dict[str, Any]]) -> None:
         """
         Build BM25 index from document corpus.
 
+        Replaces any existing main segment, delta and tombstones. When the
+        searcher is persistent the new index is saved immediately.
+
         Args:
             documents: List of dicts with 'id' and 'content' fields.
                 Each document must have both fields.
@@ -86,24 +211,246 @@ class BM25Searcher:
             msg = "Cannot build index from empty document list"
             raise ValueError(msg)
 
-        # Validate required fields
-        for i, doc in enumerate(documents):
-            if "id" not in doc or "content" not in doc:
-                msg = f"Document at index {i} missing 'id' or 'content' field"
-                raise ValueError(msg)
+        self._validate_documents(documents)
 
-        # Extract IDs and content
-        self._doc_ids = [str(doc["id"]) for doc in documents]
-        self._doc_contents = [str(doc["content"]) for doc in documents]
+        self._build_main(
+            [str(doc["id"]) for doc in documents],
+            [str(doc["content"]) for doc in documents],
+        )
+        self._generation += 1
 
-        # Tokenize using simple whitespace split + lowercase (per research)
-        corpus_tokens = [content.lower().split() for content in self._doc_contents]
+        logger.info("BM25 index built with %d documents", len(documents))
 
-        # Build BM25 index
-        self._index = bm25s.BM25()
-        self._index.index(corpus_tokens)  # type: ignore[reportUnknownMemberType]
+        if self._index_dir is not None:
+            self.save()
 
-        logger.info("BM25 index built with %d documents", len(documents))
+    def add_documents(self, documents: list[dict[str, Any]]) -> int:
+        """
+        Append documents to the index without rebuilding the main segment.
+
+        Documents whose id is already indexed replace the previous version
+        (the old one is tombstoned). Persistent indexes record the change
+        in the delta log before returning.
+
+        Args:
+            documents: List of dicts with 'id' and 'content' fields.
+
+        Returns:
+            Number of documents added.
+
+        Raises:
+            ValueError: If any document is missing required fields.
+
+        Example:
+            >>> searcher.add_documents([{"id": "doc9", "content": "FMEA severity"}])
+            1
+        """
+        if not documents:
+            return 0
+
+        self._validate_documents(documents)
+
+        records: list[dict[str, str]] = []
+        for doc in documents:
+            doc_id = str(doc["id"])
+            content = str(doc["content"])
+            if doc_id in self._id_positions:
+                self._tombstone_main(doc_id)
+            self._add_delta(doc_id, content)
+            records.append({"op": "add", "id": doc_id, "content": content})
+
+        self._append_delta_log(records)
+        self._after_mutation()
+        return len(records)
+
+    def remove_documents(self, doc_ids: Iterable[str]) -> int:
+        """
+        Tombstone documents by id.
+
+        Args:
+            doc_ids: Ids of documents to remove. Unknown ids are ignored.
+
+        Returns:
+            Number of documents removed.
+
+        Example:
+            >>> searcher.remove_documents(["doc1", "doc2"])
+            2
+        """
+        records: list[dict[str, str]] = []
+        for raw_id in doc_ids:
+            doc_id = str(raw_id)
+            removed = self._remove_delta(doc_id)
+            if doc_id in self._id_positions and doc_id not in self._tombstones:
+                self._tombstone_main(doc_id)
+                removed = True
+            if removed:
+                records.append({"op": "delete", "id": doc_id})
+
+        if records:
+            self._append_delta_log(records)
+            self._after_mutation()
+        return len(records)
+
+    def compact(self) -> None:
+        """
+        Merge the delta and drop tombstones into a fresh main segment.
+
+        Persistent indexes are rewritten atomically and the delta log is
+        truncated.
+        """
+        ids: list[str] = []
+        contents: list[str] = []
+        for pos, doc_id in enumerate(self._doc_ids):
+            if doc_id in self._tombstones:
+                continue
+            ids.append(doc_id)
+            contents.append(self._content_at(pos))
+        for doc_id, content in self._delta_docs.items():
+            ids.append(doc_id)
+            contents.append(content)
+
+        if ids:
+            self._build_main(ids, contents)
+        else:
+            self._reset()
+
+        logger.info("BM25 index compacted to %d documents", len(ids))
+
+        if self._index_dir is not None:
+            self.save()
+
+    def save(self, index_dir: Path | None = None) -> None:
+        """
+        Persist the main segment and manifest, truncating the delta log.
+
+        Any pending delta is compacted first so the saved main segment is
+        complete. The new segment is written to its own directory and the
+        manifest, which names the live segment, is replaced atomically, so
+        a crash at any point leaves either the old or the new index intact.
+
+        Args:
+            index_dir: Target directory. Defaults to the searcher's index_dir.
+
+        Raises:
+            ValueError: If no index directory is configured.
+        """
+        target = index_dir or self._index_dir
+        if target is None:
+            msg = "No index directory configured for BM25 index"
+            raise ValueError(msg)
+        self._index_dir = target
+
+        if self._delta_docs or self._tombstones:
+            # compact() calls save() again once the segments are merged
+            self.compact()
+            return
+
+        target.mkdir(parents=True, exist_ok=True)
+
+        segment: str | None = None
+        if self._index is not None:
+            segment = f"{_MAIN_DIR}-{uuid.uuid4().hex[:12]}"
+            segment_dir = target / segment
+            segment_dir.mkdir()
+            self._index.save(str(segment_dir))  # type: ignore[reportUnknownMemberType]
+            with (segment_dir / _IDS_FILE).open("w", encoding="utf-8") as f:
+                json.dump(self._doc_ids, f)
+            with (segment_dir / _CORPUS_FILE).open("w", encoding="utf-8") as f:
+                for pos in range(len(self._doc_ids)):
+                    f.write(json.dumps(self._content_at(pos)) + "\n")
+
+        # Commit point: readers follow the manifest to the live segment
+        self._write_manifest(
+            target,
+            {
+                "format_version": _FORMAT_VERSION,
+                "collection_version": self._collection_version,
+                "document_count": len(self._doc_ids),
+                "token_count": self._main_token_count,
+                "main_segment": segment,
+            },
+        )
+        # A crash before this truncation only replays records the new
+        # segment already contains, which is idempotent
+        (target / _DELTA_LOG_FILE).write_text("", encoding="utf-8")
+
+        if segment is not None:
+            # Reopen against the new files so the corpus stays memory-mapped
+            self._load_main(target / segment)
+        for stale in target.glob(f"{_MAIN_DIR}*"):
+            if stale.name != segment and stale.is_dir():
+                shutil.rmtree(stale, ignore_errors=True)
+
+    @classmethod
+    def load(
+        cls,
+        index_dir: Path,
+        *,
+        collection_version: str = "",
+        compaction_ratio: float = 0.1,
+        mmap: bool = True,
+    ) -> BM25Searcher | None:
+        """
+        Load a persisted index and replay its delta log.
+
+        Args:
+            index_dir: Directory previously written by save().
+            collection_version: Expected collection version. When non-empty
+                and different from the manifest, the index is treated as stale.
+            compaction_ratio: Delta size ratio that triggers compaction.
+            mmap: Memory-map the score matrix and corpus instead of reading
+                them into RAM.
+
+        Returns:
+            Loaded BM25Searcher, or None if no compatible index exists.
+        """
+        manifest_path = index_dir / _MANIFEST_FILE
+        if not manifest_path.exists():
+            return None
+
+        try:
+            with manifest_path.open(encoding="utf-8") as f:
+                manifest: dict[str, Any] = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable BM25 manifest at %s: %s", manifest_path, e)
+            return None
+
+        if manifest.get("format_version") != _FORMAT_VERSION:
+            logger.warning("Ignoring BM25 index at %s: unsupported format", index_dir)
+            return None
+
+        stored_version = str(manifest.get("collection_version", ""))
+        if collection_version and stored_version != collection_version:
+            logger.warning(
+                "Ignoring BM25 index at %s: built for %s, expected %s",
+                index_dir,
+                stored_version,
+                collection_version,
+            )
+            return None
+
+        searcher = cls(
+            index_dir,
+            collection_version=stored_version,
+            compaction_ratio=compaction_ratio,
+        )
+
+        segment = manifest.get("main_segment", _MAIN_DIR)
+        main_dir = index_dir / segment if segment else None
+        if main_dir is not None and main_dir.exists():
+            searcher._load_main(main_dir, mmap=mmap)
+            searcher._main_token_count = int(manifest.get("token_count", 0))
+
+        searcher._replay_delta_log(index_dir / _DELTA_LOG_FILE)
+
+        logger.info(
+            "BM25 index loaded from %s: %d main + %d delta documents",
+            index_dir,
+            len(searcher._doc_ids),
+            len(searcher._delta_docs),
+        )
+        return searcher
 
     def search(self, query: str, n_results: int = 10) -> list[dict[str, Any]]:
         """
@@ -133,38 +480,32 @@ class BM25Searcher:
             return []
 
         # Tokenize query
-        query_tokens = query.lower().split()
-
-        # Cap k at corpus size to avoid bm25s ValueError
-        k = min(n_results, self.document_count)
-
-        # Retrieve top-k results
-        # bm25s.retrieve expects a list of tokenized queries (batch)
-        # Returns (scores, indices) as numpy arrays with shape (batch_size, k)
-        assert self._index is not None  # Already checked via is_indexed
-        scores, indices = self._index.retrieve([query_tokens], k=k)
+        query_tokens = _tokenize(query)
 
-        # Convert to result dicts
         results: list[dict[str, Any]] = []
-        for score, idx in zip(scores[0], indices[0]):
-            # Convert numpy types to Python types
-            score_float = float(score)
-
-            # Skip if score is 0 (no match)
-            if score_float == 0:
-                continue
 
-            idx_int = int(idx)
+        if self._index is not None and self._doc_ids:
+            # Over-fetch by the tombstone count so masked documents cannot
+            # crowd live ones out of the top-k
+            k = min(n_results + len(self._tombstones), len(self._doc_ids))
+            for idx, score in self._retrieve(self._index, query_tokens, k, self._weight_mask):
+                results.append({
+                    "id": self._doc_ids[idx],
+                    "content": self._content_at(idx),
+                    "score": score,
+                })
+
+        for doc_id, score in self._score_delta(query_tokens):
             results.append({
-                "id": self._doc_ids[idx_int],
-                "content": self._doc_contents[idx_int],
-                "score": score_float,
+                "id": doc_id,
+                "content": self._delta_docs[doc_id],
+                "score": score,
             })
 
         # Sort by score descending (bm25s returns sorted by index, not score)
         results.sort(key=lambda x: x["score"], reverse=True)
 
-        return results
+        return results[:n_results]
 
     @property
     def is_indexed(self) -> bool:
@@ -172,9 +513,10 @@ class BM25Searcher:
         Check if index has been built.
 
         Returns:
-            True if build_index() has been called, False otherwise.
+            True if build_index() has been called (or an index was loaded
+            or documents were added), False otherwise.
         """
-        return self._index is not None
+        return self._index is not None or bool(self._delta_docs)
 
     @property
     def document_count(self) -> int:
@@ -182,6 +524,239 @@ class BM25Searcher:
         Get number of indexed documents.
 
         Returns:
-            Number of documents in the index. 0 if not built.
+            Number of live documents in the index. 0 if not built.
         """
-        return len(self._doc_ids)
+        return len(self._doc_ids) - len(self._tombstones) + len(self._delta_docs)
+
+    @property
+    def generation(self) -> int:
+        """Number of index builds and document mutations on this instance."""
+        return self._generation
+
+    @property
+    def index_dir(self) -> Path | None:
+        """Directory the index is persisted to, or None if in-memory only."""
+        return self._index_dir
+
+    @staticmethod
+    def _validate_documents(documents: list[dict[str, Any]]) -> None:
+        """Ensure every document has 'id' and 'content' fields."""
+        for i, doc in enumerate(documents):
+            if "id" not in doc or "content" not in doc:
+                msg = f"Document at index {i} missing 'id' or 'content' field"
+                raise ValueError(msg)
+
+    @staticmethod
+    def _retrieve(
+        index: bm25s.BM25,
+        query_tokens: list[str],
+        k: int,
+        weight_mask: np.ndarray[Any, Any] | None,
+    ) -> list[tuple[int, float]]:
+        """
+        Run a single bm25s query and return (position, score) pairs.
+
+        Zero-score positions (no match or tombstoned) are dropped.
+        """
+        # bm25s.retrieve expects a list of tokenized queries (batch)
+        # Returns (scores, indices) as numpy arrays with shape (batch_size, k)
+        indices, scores = index.retrieve(  # type: ignore[reportUnknownMemberType]
+            [query_tokens],
+            k=k,
+            show_progress=False,
+            weight_mask=weight_mask,
+        )
+
+        pairs: list[tuple[int, float]] = []
+        for idx, score in zip(indices[0], scores[0]):
+            # Convert numpy types to Python types
+            score_float = float(score)
+            # Skip if score is 0 (no match)
+            if score_float == 0:
+                continue
+            pairs.append((int(idx), score_float))
+        return pairs
+
+    def _reset(self) -> None:
+        """Drop all segments and tombstones."""
+        self._index = None
+        self._doc_ids = []
+        self._doc_contents = []
+        self._id_positions = {}
+        self._tombstones = set()
+        self._weight_mask = None
+        self._main_token_count = 0
+        self._delta_docs = {}
+        self._delta_tfs = {}
+        self._delta_df = Counter()
+
+    def _build_main(self, ids: list[str], contents: list[str]) -> None:
+        """Build the main segment in memory and clear delta/tombstones."""
+        self._reset()
+
+        self._doc_ids = ids
+        self._doc_contents = contents
+        self._id_positions = {doc_id: pos for pos, doc_id in enumerate(ids)}
+
+        corpus_tokens = [_tokenize(content) for content in contents]
+        self._main_token_count = sum(len(tokens) for tokens in corpus_tokens)
+        self._index = bm25s.BM25()
+        self._index.index(corpus_tokens, show_progress=False)  # type: ignore[reportUnknownMemberType]
+
+    def _load_main(self, main_dir: Path, *, mmap: bool = True) -> None:
+        """Load (or reload) the main segment from disk."""
+        self._index = bm25s.BM25.load(str(main_dir), mmap=mmap)  # type: ignore[reportUnknownMemberType]
+        with (main_dir / _IDS_FILE).open(encoding="utf-8") as f:
+            self._doc_ids = json.load(f)
+        self._id_positions = {doc_id: pos for pos, doc_id in enumerate(self._doc_ids)}
+
+        corpus_path = main_dir / _CORPUS_FILE
+        if mmap:
+            self._doc_contents = bm25s.utils.corpus.JsonlCorpus(  # type: ignore[reportUnknownMemberType]
+                str(corpus_path),
+                show_progress=False,
+            )
+        else:
+            with corpus_path.open(encoding="utf-8") as f:
+                self._doc_contents = [json.loads(line) for line in f]
+
+        self._tombstones = set()
+        self._weight_mask = None
+
+    def _content_at(self, pos: int) -> str:
+        """Return main segment content at a position (list or mmap corpus)."""
+        return str(self._doc_contents[pos])
+
+    def _tombstone_main(self, doc_id: str) -> None:
+        """Mask a main segment document out of future searches."""
+        if doc_id in self._tombstones:
+            return
+        if self._weight_mask is None:
+            self._weight_mask = np.ones(len(self._doc_ids), dtype=np.float32)
+        self._weight_mask[self._id_positions[doc_id]] = 0.0
+        self._tombstones.add(doc_id)
+
+    def _add_delta(self, doc_id: str, content: str) -> None:
+        """Add (or replace) a document in the delta segment."""
+        self._remove_delta(doc_id)
+        tfs = Counter(_tokenize(content))
+        self._delta_docs[doc_id] = content
+        self._delta_tfs[doc_id] = tfs
+        self._delta_df.update(tfs.keys())
+
+    def _remove_delta(self, doc_id: str) -> bool:
+        """Remove a document from the delta segment if present."""
+        if self._delta_docs.pop(doc_id, None) is None:
+            return False
+        self._delta_df.subtract(self._delta_tfs.pop(doc_id).keys())
+        return True
+
+    def _main_document_frequency(self, token: str) -> int:
+        """Number of main segment documents containing a token."""
+        if self._index is None:
+            return 0
+        token_id = self._index.vocab_dict.get(token)  # type: ignore[reportUnknownMemberType]
+        if token_id is None:
+            return 0
+        indptr = self._index.scores["indptr"]  # type: ignore[reportUnknownMemberType]
+        return int(indptr[token_id + 1] - indptr[token_id])
+
+    def _score_delta(self, query_tokens: list[str]) -> list[tuple[str, float]]:
+        """
+        Score delta documents with BM25 over main + delta corpus statistics.
+
+        The delta is bounded by compaction_ratio, so a plain Python scan is
+        cheaper than maintaining a second sparse index.
+        """
+        if not self._delta_docs:
+            return []
+
+        num_docs = len(self._doc_ids) + len(self._delta_docs)
+        total_tokens = self._main_token_count + sum(
+            sum(tfs.values()) for tfs in self._delta_tfs.values()
+        )
+        avg_len = total_tokens / num_docs if num_docs else 0.0
+
+        idf: dict[str, float] = {}
+        for token in set(query_tokens):
+            df = self._main_document_frequency(token) + self._delta_df[token]
+            if df:
+                idf[token] = math.log(1 + (num_docs - df + 0.5) / (df + 0.5))
+        if not idf:
+            return []
+
+        scored: list[tuple[str, float]] = []
+        for doc_id, tfs in self._delta_tfs.items():
+            doc_len = sum(tfs.values())
+            norm = _K1 * (1 - _B + _B * doc_len / avg_len) if avg_len else _K1
+            score = 0.0
+            for token, token_idf in idf.items():
+                tf = tfs.get(token, 0)
+                if tf:
+                    score += token_idf * tf / (tf + norm)
+            if score > 0:
+                scored.append((doc_id, score))
+        return scored
+
+    def _after_mutation(self) -> None:
+        """Compact once the delta and tombstones grow too large."""
+        self._generation += 1
+        pending = len(self._delta_docs) + len(self._tombstones)
+        if pending > len(self._doc_ids) * self._compaction_ratio:
+            self.compact()
+
+    def _append_delta_log(self, records: list[dict[str, str]]) -> None:
+        """Append mutation records to the on-disk delta log."""
+        if self._index_dir is None or not records:
+            return
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        with (self._index_dir / _DELTA_LOG_FILE).open("a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        if not (self._index_dir / _MANIFEST_FILE).exists():
+            # First write to an empty persistent index: mark it loadable
+            self._write_manifest(
+                self._index_dir,
+                {
+                    "format_version": _FORMAT_VERSION,
+                    "collection_version": self._collection_version,
+                    "document_count": 0,
+                    "main_segment": None,
+                },
+            )
+
+    @staticmethod
+    def _write_manifest(index_dir: Path, manifest: dict[str, Any]) -> None:
+        """Atomically replace the manifest (write a temp file, then os.replace)."""
+        tmp_path = index_dir / f"{_MANIFEST_FILE}.tmp"
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, index_dir / _MANIFEST_FILE)
+
+    def _replay_delta_log(self, log_path: Path) -> None:
+        """Apply delta log records written since the last save."""
+        if not log_path.exists():
+            return
+
+        with log_path.open(encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    record: dict[str, str] = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-append is skipped
+                    logger.warning("Skipping corrupt BM25 delta record at line %d", line_no)
+                    continue
+
+                doc_id = record.get("id", "")
+                if record.get("op") == "add":
+                    if doc_id in self._id_positions:
+                        self._tombstone_main(doc_id)
+                    self._add_delta(doc_id, record.get("content", ""))
+                elif record.get("op") == "delete":
+                    self._remove_delta(doc_id)
+                    if doc_id in self._id_positions:
+                        self._tombstone_main(doc_id)
@@ -8,22 +8,33 @@ Based on semantic entropy approach from research:
 - High entropy among results suggests uncertainty
 - Combines both signals for confidence scoring
 
+Areas are searched concurrently (bounded by CoverageConfig.max_concurrency)
+or, with CoverageConfig.batch_search, in one batched embed and store call.
+Similarity and entropy statistics are computed for all areas at once.
+
 Example:
     >>> assessor = CoverageAssessor(searcher)
     >>> report = await assessor.assess(["system requirements", "trade studies"])
     >>> for gap in report.gaps:
     ...     print(f"{gap.area}: {gap.confidence:.2f}")
+    >>> async for partial in assessor.assess_iter(areas):
+    ...     print(f"{partial.total_areas - partial.pending_areas}/{partial.total_areas}")
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import math
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from knowledge_mcp.search.models import SearchResult
     from knowledge_mcp.search.semantic_search import SemanticSearcher
 
 logger = logging.getLogger(__name__)
@@ -78,6 +89,7 @@ class CoverageReport:
     total_areas: int = 0
     coverage_ratio: float = 0.0
     overall_priority: CoveragePriority = CoveragePriority.SUFFICIENT
+    pending_areas: int = 0  # Areas not yet assessed (partial reports only)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -109,6 +121,7 @@ class CoverageReport:
                 "gaps_count": len(self.gaps),
                 "covered_count": len(self.covered),
                 "overall_priority": self.overall_priority.value,
+                "pending_areas": self.pending_areas,
             },
         }
 
@@ -122,6 +135,51 @@ class CoverageConfig:
     min_results_for_coverage: int = 3  # Need at least this many results
     n_results: int = 10  # Results to fetch per area
     entropy_weight: float = 0.3  # Weight of entropy in confidence
+    max_concurrency: int = 8  # Areas searched at once
+    batch_search: bool = False  # One search_many call instead of per-area searches
+
+
+def _score_statistics(
+    score_lists: Sequence[Sequence[float]],
+) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """Compute max, mean and normalized entropy of each score list at once.
+
+    Lists are padded into one matrix with a validity mask, so every area's
+    statistics come from the same few array operations.
+
+    Args:
+        score_lists: Similarity scores per area (may be ragged or empty).
+
+    Returns:
+        Tuple of (max, mean, entropy) arrays, one entry per list. Empty
+        lists get 0.0 for all three. Entropy is Shannon entropy of the
+        scores normalized to probabilities, divided by log2(n) so it lies
+        in 0-1; lists with fewer than 2 scores get 0.0, and lists whose
+        scores sum to 0 get 1.0 (no signal).
+    """
+    n_lists = len(score_lists)
+    counts = np.array([len(scores) for scores in score_lists], dtype=np.int64)
+    width = int(counts.max()) if n_lists else 0
+
+    scores = np.zeros((n_lists, width), dtype=np.float64)
+    mask = np.arange(width) < counts[:, None]
+    scores[mask] = [score for row in score_lists for score in row]
+
+    safe_counts = np.maximum(counts, 1)
+    row_max = np.where(mask, scores, -np.inf).max(axis=1, initial=-np.inf)
+    max_sims = np.where(counts > 0, row_max, 0.0)
+    avg_sims = scores.sum(axis=1) / safe_counts
+
+    totals = scores.sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        probs = scores / np.where(totals == 0, 1.0, totals)[:, None]
+        terms = np.where(probs > 0, -probs * np.log2(np.where(probs > 0, probs, 1.0)), 0.0)
+        max_entropy = np.log2(np.maximum(counts, 2))
+        entropies = terms.sum(axis=1) / max_entropy
+    entropies = np.where(totals == 0, 1.0, entropies)
+    entropies = np.where(counts < 2, 0.0, entropies)
+
+    return max_sims, avg_sims, entropies
 
 
 class CoverageAssessor:
@@ -157,27 +215,93 @@ class CoverageAssessor:
             knowledge_areas: List of topics/areas to check.
 
         Returns:
-            CoverageReport with gaps and covered areas.
+            CoverageReport with gaps and covered areas, in input order.
+        """
+        outcomes: list[list[SearchResult] | Exception] = [[] for _ in knowledge_areas]
+        async for indices, results in self._search_areas(knowledge_areas):
+            for i, result in zip(indices, results):
+                outcomes[i] = result
+
+        assessed = self._assess_results(knowledge_areas, outcomes)
+        return self._build_report(assessed, total=len(knowledge_areas))
+
+    async def assess_iter(self, knowledge_areas: list[str]) -> AsyncIterator[CoverageReport]:
+        """Assess coverage, yielding a partial report as areas complete.
+
+        Each report covers every area finished so far, with pending_areas
+        counting the rest. The last report is complete and matches what
+        assess() returns.
+
+        Args:
+            knowledge_areas: List of topics/areas to check.
+
+        Yields:
+            Cumulative CoverageReport after each completed search.
+        """
+        assessed: dict[int, tuple[CoverageGap | None, CoveredArea | None]] = {}
+        async for indices, results in self._search_areas(knowledge_areas):
+            areas = [knowledge_areas[i] for i in indices]
+            assessed.update(zip(indices, self._assess_results(areas, results)))
+            yield self._build_report(
+                [assessed[i] for i in sorted(assessed)], total=len(knowledge_areas)
+            )
+
+    async def _search_areas(
+        self, knowledge_areas: list[str]
+    ) -> AsyncIterator[tuple[list[int], list[list[SearchResult] | Exception]]]:
+        """Search every area, yielding (area indices, results) as they arrive.
+
+        A failed search is yielded as its exception so the area can be
+        reported as an assessment error.
         """
-        gaps: list[CoverageGap] = []
-        covered: list[CoveredArea] = []
-
-        for area in knowledge_areas:
-            gap: CoverageGap | None
-            covered_area: CoveredArea | None
-            gap, covered_area = await self._assess_area(area)
-            if gap:
-                gaps.append(gap)
-            if covered_area:
-                covered.append(covered_area)
+        if not knowledge_areas:
+            return
+
+        if self.config.batch_search:
+            try:
+                batches = await self.searcher.search_many(
+                    knowledge_areas, n_results=self.config.n_results
+                )
+                results: list[list[SearchResult] | Exception] = list(batches)
+            except Exception as e:
+                results = [e] * len(knowledge_areas)
+            yield list(range(len(knowledge_areas))), results
+            return
+
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def search(index: int) -> tuple[int, list[SearchResult] | Exception]:
+            async with semaphore:
+                try:
+                    return index, await self.searcher.search(
+                        query=knowledge_areas[index],
+                        n_results=self.config.n_results,
+                    )
+                except Exception as e:
+                    return index, e
+
+        for next_done in asyncio.as_completed(
+            [search(i) for i in range(len(knowledge_areas))]
+        ):
+            index, result = await next_done
+            yield [index], [result]
+
+    def _build_report(
+        self,
+        assessed: list[tuple[CoverageGap | None, CoveredArea | None]],
+        total: int,
+    ) -> CoverageReport:
+        """Summarize assessed areas into a report."""
+        gaps = [gap for gap, _ in assessed if gap]
+        covered = [covered_area for _, covered_area in assessed if covered_area]
 
         # Calculate overall stats
-        total = len(knowledge_areas)
-        coverage_ratio = len(covered) / total if total > 0 else 0.0
+        done = len(assessed)
+        coverage_ratio = len(covered) / done if done > 0 else 0.0
 
         # Determine overall priority
         high_priority_gaps = sum(1 for g in gaps if g.priority == CoveragePriority.HIGH)
-        if high_priority_gaps > total * 0.5:
+        if high_priority_gaps > done * 0.5:
             overall_priority = CoveragePriority.HIGH
         elif len(gaps) > len(covered):
             overall_priority = CoveragePriority.MEDIUM
@@ -192,25 +316,47 @@ class CoverageAssessor:
             total_areas=total,
             coverage_ratio=coverage_ratio,
             overall_priority=overall_priority,
+            pending_areas=total - done,
         )
 
-    async def _assess_area(
-        self, area: str
-    ) -> tuple[CoverageGap | None, CoveredArea | None]:
-        """Assess a single knowledge area.
+    def _assess_results(
+        self,
+        areas: list[str],
+        outcomes: Sequence[list[SearchResult] | Exception],
+    ) -> list[tuple[CoverageGap | None, CoveredArea | None]]:
+        """Classify searched areas as gaps or covered.
+
+        Score statistics for all areas are computed in one pass.
 
-        Returns tuple of (gap, covered_area) - one will be None.
+        Returns one (gap, covered_area) tuple per area - one will be None.
         """
-        try:
-            # Search for content in this area
-            results = await self.searcher.search(
-                query=area,
-                n_results=self.config.n_results,
-            )
+        score_lists = [
+            [r.score for r in outcome] if not isinstance(outcome, Exception) else []
+            for outcome in outcomes
+        ]
+        max_sims, avg_sims, entropies = _score_statistics(score_lists)
+
+        assessed: list[tuple[CoverageGap | None, CoveredArea | None]] = []
+        for i, (area, outcome) in enumerate(zip(areas, outcomes)):
+            if isinstance(outcome, Exception):
+                logger.warning("Error assessing area '%s': %s", area, outcome)
+                # Return as gap with error reason
+                assessed.append((
+                    CoverageGap(
+                        area=area,
+                        priority=CoveragePriority.MEDIUM,
+                        confidence=0.5,
+                        reason=f"Assessment error: {outcome!s}",
+                        max_similarity=0.0,
+                        result_count=0,
+                    ),
+                    None,
+                ))
+                continue
 
             # No results = definite gap
-            if not results:
-                return (
+            if not outcome:
+                assessed.append((
                     CoverageGap(
                         area=area,
                         priority=CoveragePriority.HIGH,
@@ -221,86 +367,52 @@ class CoverageAssessor:
                         suggested_query=f"'{area}' documentation OR tutorial OR guide",
                     ),
                     None,
-                )
-
-            # Extract similarity scores
-            similarities = [r.score for r in results]
-            max_sim = max(similarities)
-            avg_sim = sum(similarities) / len(similarities)
+                ))
+                continue
 
-            # Calculate entropy (uncertainty)
-            entropy = self._calculate_entropy(similarities)
+            max_sim = float(max_sims[i])
 
             # Determine if this is a gap
             if max_sim < self.config.similarity_threshold:
                 # Low similarity = gap
-                confidence = self._calculate_gap_confidence(max_sim, entropy, len(results))
+                confidence = self._calculate_gap_confidence(
+                    max_sim, float(entropies[i]), len(outcome)
+                )
                 priority = self._determine_priority(max_sim, confidence)
 
-                return (
+                assessed.append((
                     CoverageGap(
                         area=area,
                         priority=priority,
                         confidence=confidence,
                         reason=f"Low relevance scores (max: {max_sim:.2f})",
                         max_similarity=max_sim,
-                        result_count=len(results),
+                        result_count=len(outcome),
                         suggested_query=f"'{area}' best practices OR standards",
                     ),
                     None,
-                )
+                ))
+                continue
 
             # Adequate coverage
-            best_match = results[0]
-            return (
+            assessed.append((
                 None,
                 CoveredArea(
                     area=area,
-                    chunk_count=len(results),
-                    avg_similarity=avg_sim,
-                    best_match_title=best_match.document_title,
+                    chunk_count=len(outcome),
+                    avg_similarity=float(avg_sims[i]),
+                    best_match_title=outcome[0].document_title,
                 ),
-            )
+            ))
 
-        except Exception as e:
-            logger.warning("Error assessing area '%s': %s", area, e)
-            # Return as gap with error reason
-            return (
-                CoverageGap(
-                    area=area,
-                    priority=CoveragePriority.MEDIUM,
-                    confidence=0.5,
-                    reason=f"Assessment error: {e!s}",
-                    max_similarity=0.0,
-                    result_count=0,
-                ),
-                None,
-            )
+        return assessed
 
     def _calculate_entropy(self, similarities: list[float]) -> float:
         """Calculate Shannon entropy of similarity distribution.
 
         Higher entropy = more uncertainty = likely gap.
         """
-        if not similarities or len(similarities) < 2:
-            return 0.0
-
-        # Normalize to probabilities
-        total = sum(similarities)
-        if total == 0:
-            return 1.0  # Max entropy if no signal
-
-        probs = [s / total for s in similarities]
-
-        # Shannon entropy
-        entropy = 0.0
-        for p in probs:
-            if p > 0:
-                entropy -= p * math.log2(p)
-
-        # Normalize to 0-1 (max entropy for n items is log2(n))
-        max_entropy = math.log2(len(similarities))
-        return entropy / max_entropy if max_entropy > 0 else 0.0
+        return float(_score_statistics([similarities])[2][0])
 
     def _calculate_gap_confidence(
         self, max_sim: float, entropy: float, result_count: int
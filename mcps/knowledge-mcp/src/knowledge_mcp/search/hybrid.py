@@ -22,13 +22,19 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from collections import defaultdict
 from typing import TYPE_CHECKING, Any
 
+from knowledge_mcp.exceptions import TimeoutError as SearchTimeoutError
+from knowledge_mcp.monitoring.spans import timed
 from knowledge_mcp.search.models import SearchResult
+from knowledge_mcp.search.result_cache import SearchResultCache
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+
     from knowledge_mcp.search.bm25 import BM25Searcher
     from knowledge_mcp.search.semantic_search import SemanticSearcher
 
@@ -90,16 +96,23 @@ class HybridSearcher:
     Hybrid search combining semantic and BM25 retrieval via RRF fusion.
 
     Implements FR-3.2 hybrid retrieval by:
-    1. Running semantic search (embedding similarity)
-    2. Running BM25 search (keyword matching)
+    1. Running semantic search (embedding similarity) on the event loop
+    2. Running BM25 search (keyword matching) concurrently in a worker thread
     3. Merging results with Reciprocal Rank Fusion (k=60)
     4. Converting to SearchResult objects
 
     Falls back gracefully to semantic-only search if BM25 index not built.
+    If one leg fails or exceeds its timeout, results from the other leg are
+    returned (degraded mode) instead of failing the whole search. If both
+    legs fail, the search raises rather than returning no results.
 
     Attributes:
         semantic_searcher: SemanticSearcher instance for vector search.
         bm25_searcher: BM25Searcher instance for keyword search.
+        semantic_timeout: Seconds to wait for the semantic leg (None = no limit).
+        bm25_timeout: Seconds to wait for the BM25 leg (None = no limit).
+        result_cache: Optional cache of fused results, invalidated by writes
+            to the vector store or the BM25 index.
 
     Example:
         >>> hybrid = HybridSearcher(semantic_searcher, bm25_searcher)
@@ -112,6 +125,10 @@ class HybridSearcher:
         self,
         semantic_searcher: SemanticSearcher,
         bm25_searcher: BM25Searcher,
+        *,
+        semantic_timeout: float | None = None,
+        bm25_timeout: float | None = None,
+        result_cache: SearchResultCache | None = None,
     ) -> None:
         """
         Initialize hybrid searcher.
@@ -119,6 +136,12 @@ class HybridSearcher:
         Args:
             semantic_searcher: SemanticSearcher for vector-based retrieval.
             bm25_searcher: BM25Searcher for keyword-based retrieval.
+            semantic_timeout: Seconds to wait for semantic results before
+                continuing with BM25 results only. None disables the limit.
+            bm25_timeout: Seconds to wait for BM25 results before continuing
+                with semantic results only. None disables the limit.
+            result_cache: Serve repeated searches from this cache. Degraded
+                results (a leg failed or timed out) are never cached.
 
         Example:
             >>> from knowledge_mcp.search import SemanticSearcher, BM25Searcher
@@ -129,7 +152,11 @@ class HybridSearcher:
         """
         self._semantic = semantic_searcher
         self._bm25 = bm25_searcher
+        self.semantic_timeout = semantic_timeout
+        self.bm25_timeout = bm25_timeout
+        self.result_cache = result_cache
 
+    @timed("hybrid.search")
     async def search(
         self,
         query: str,
@@ -139,8 +166,10 @@ class HybridSearcher:
         """
         Perform hybrid search combining semantic and BM25 results.
 
-        Retrieves 2x n_results from each searcher, merges via RRF, and returns
-        top n_results. If BM25 index not built, falls back to semantic only.
+        Retrieves 2x n_results from each searcher concurrently, merges via
+        RRF, and returns top n_results. If BM25 index not built, falls back
+        to semantic only. A leg that raises or times out contributes no
+        results and is logged; degraded results are not cached.
 
         Args:
             query: Natural language search query.
@@ -152,6 +181,11 @@ class HybridSearcher:
             List of SearchResult objects ordered by RRF score (highest first).
             Empty list if query is empty or no results found.
 
+        Raises:
+            Exception: The semantic leg's error (or the BM25 leg's, if the
+                semantic leg timed out) when both legs fail. A leg timeout
+                is raised as knowledge_mcp.exceptions.TimeoutError.
+
         Example:
             >>> results = await hybrid.search(
             ...     query="system requirements review",
@@ -176,18 +210,55 @@ class HybridSearcher:
                 filter_dict=filter_dict,
             )
 
+        cache_key: str | None = None
+        if self.result_cache is not None:
+            store = self._semantic.store
+            cache_key = SearchResultCache.make_key(
+                query,
+                strategy="hybrid",
+                collection=store.collection_name,
+                generation=(store.generation, self._bm25.generation),
+                n_results=n_results,
+                filter_dict=filter_dict,
+            )
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Run both searches with 2x n_results for better fusion
         retrieval_count = n_results * 2
 
-        # Semantic search (async)
-        semantic_results = await self._semantic.search(
-            query=query,
-            n_results=retrieval_count,
-            filter_dict=filter_dict,
+        # Per-search, so concurrent searches cannot clear each other's errors
+        errors: dict[str, Exception] = {}
+
+        # Semantic search stays on the loop; BM25 scoring is CPU-bound and
+        # runs in a worker thread so it neither waits on nor blocks the loop
+        semantic_leg, bm25_leg = await asyncio.gather(
+            self._run_leg(
+                "semantic",
+                self._semantic.search(
+                    query=query,
+                    n_results=retrieval_count,
+                    filter_dict=filter_dict,
+                ),
+                self.semantic_timeout,
+                errors,
+            ),
+            self._run_leg(
+                "bm25",
+                asyncio.to_thread(self._bm25.search, query, n_results=retrieval_count),
+                self.bm25_timeout,
+                errors,
+            ),
         )
+        if len(errors) == 2:
+            # Nothing to fuse; an empty list would read as "no matches"
+            if isinstance(errors["semantic"], SearchTimeoutError):
+                raise errors["bm25"]
+            raise errors["semantic"]
 
-        # BM25 search (sync)
-        bm25_results = self._bm25.search(query, n_results=retrieval_count)
+        semantic_results: list[SearchResult] = semantic_leg or []
+        bm25_results: list[dict[str, Any]] = bm25_leg or []
 
         # Convert SearchResult objects to dicts for RRF
         semantic_dicts = [
@@ -225,8 +296,51 @@ class HybridSearcher:
             len(search_results),
         )
 
+        # Degraded results are missing a leg; let the next search retry it
+        if cache_key is not None and self.result_cache is not None and not errors:
+            self.result_cache.set(cache_key, search_results)
+
         return search_results
 
+    async def _run_leg(
+        self,
+        name: str,
+        leg: Awaitable[Any],
+        timeout: float | None,
+        errors: dict[str, Exception],
+    ) -> Any | None:
+        """
+        Await one retrieval leg, degrading to None on timeout or error.
+
+        A timed-out BM25 thread cannot be interrupted; it finishes in the
+        background and its result is discarded.
+
+        Args:
+            name: Leg name the error is recorded under.
+            leg: Awaitable producing the leg's results.
+            timeout: Seconds to wait, or None to wait indefinitely.
+            errors: The calling search's errors by leg name. A timeout is
+                recorded as knowledge_mcp.exceptions.TimeoutError.
+
+        Returns:
+            Leg results, or None if the leg timed out or raised.
+        """
+        try:
+            return await asyncio.wait_for(leg, timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "Hybrid search %s leg exceeded %.2fs timeout, continuing degraded",
+                name,
+                timeout,
+            )
+            errors[name] = SearchTimeoutError(
+                f"Hybrid search {name} leg exceeded {timeout:.2f}s timeout"
+            )
+        except Exception as e:
+            logger.warning("Hybrid search %s leg failed, continuing degraded: %s", name, e)
+            errors[name] = e
+        return None
+
     def _to_search_result(self, result: dict[str, Any]) -> SearchResult:
         """
         Convert fused result dict to SearchResult object.
@@ -4,6 +4,11 @@
 Provides relevance-based reranking to improve search result quality.
 Uses Cohere Rerank API when available, falls back to local cross-encoder.
 
+Workflow searches replay the same queries over largely the same chunks, so
+scores are cached per (query, chunk id). Only the top first-stage
+candidates are scored, and passages are truncated to what the model can
+read before they are sent.
+
 Example:
     >>> reranker = Reranker(provider="cohere", api_key="...")
     >>> reranked = await reranker.rerank(query, results, top_n=5)
@@ -12,15 +17,84 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import replace
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+from knowledge_mcp.monitoring.spans import timed
+from knowledge_mcp.search.result_cache import normalize_query
 
 if TYPE_CHECKING:
     from knowledge_mcp.search.models import SearchResult
+    from knowledge_mcp.utils.config import KnowledgeConfig
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SCORE_CACHE_SIZE = 10_000
+DEFAULT_MAX_CANDIDATES = 50
+# Passage limits when the model does not report its own
+DEFAULT_LOCAL_MAX_TOKENS = 512
+DEFAULT_COHERE_MAX_TOKENS = 4096
+
+
+def truncate_passage(text: str, max_tokens: int) -> str:
+    """Truncate a passage to at most max_tokens whitespace-separated words.
+
+    Every word is at least one subword token, so this never drops text the
+    model would have read, while sparing the tokenizer (or the network) the
+    tail of very long chunks.
+
+    Args:
+        text: Passage text.
+        max_tokens: Model input limit in tokens.
+
+    Returns:
+        The passage, cut after max_tokens words if longer.
+    """
+    # A text with no more characters than the limit cannot exceed it in words
+    if len(text) <= max_tokens:
+        return text
+    words = text.split(maxsplit=max_tokens)
+    if len(words) <= max_tokens:
+        return text
+    return " ".join(words[:max_tokens])
+
+
+class _ScoreCache:
+    """Entry-bounded, thread-safe LRU of (query hash, chunk id) -> score."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], float] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[str, str]) -> float | None:
+        with self._lock:
+            score = self._entries.get(key)
+            if score is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return score
+
+    def set(self, key: tuple[str, str], score: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = score
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
 
 class Reranker:
     """Rerank search results using Cohere or local cross-encoder.
@@ -40,6 +114,14 @@ class Reranker:
         >>> # Using local cross-encoder (no API key needed)
         >>> reranker = Reranker(provider="local")
         >>> reranked = await reranker.rerank("query", results)
+        >>>
+        >>> # Using a quantized ONNX export of the cross-encoder on CPU
+        >>> reranker = Reranker(
+        ...     provider="local",
+        ...     model="models/ms-marco-onnx",
+        ...     backend="onnx",
+        ...     onnx_file_name="onnx/model_qint8_avx2.onnx",
+        ... )
     """
 
     def __init__(
@@ -47,6 +129,13 @@ class Reranker:
         provider: str = "cohere",
         api_key: str | None = None,
         model: str | None = None,
+        backend: Literal["torch", "onnx"] = "torch",
+        onnx_file_name: str | None = None,
+        *,
+        max_candidates: int | None = DEFAULT_MAX_CANDIDATES,
+        max_passage_tokens: int | None = None,
+        cache_size: int = DEFAULT_SCORE_CACHE_SIZE,
+        cross_encoder: Any = None,
     ) -> None:
         """Initialize reranker.
 
@@ -55,14 +144,35 @@ class Reranker:
             api_key: Cohere API key (required if provider="cohere").
             model: Model name. Defaults to rerank-english-v3.0 for Cohere,
                    cross-encoder/ms-marco-MiniLM-L6-v2 for local.
+            backend: Runtime for the local cross-encoder, "torch" or "onnx"
+                (ONNX Runtime on CPU).
+            onnx_file_name: ONNX file inside the local model directory, e.g.
+                "onnx/model_qint8_avx2.onnx". None uses the unquantized model.
+            max_candidates: Score only this many results with the highest
+                first-stage scores; the rest follow them unscored (see
+                rerank()). None scores all.
+            max_passage_tokens: Truncate passages to this many tokens before
+                scoring. None uses the cross-encoder's max_length (512 if
+                unknown) or 4096 for Cohere.
+            cache_size: Maximum cached (query, chunk) scores. 0 disables.
+            cross_encoder: Already-loaded local model with a
+                predict(pairs) method, used instead of loading one (e.g. the
+                offline scorer in knowledge_mcp.evaluation.benchmark).
 
         Raises:
-            ValueError: When provider="cohere" but no api_key provided.
+            ValueError: When provider="cohere" but no api_key provided, or
+                max_candidates is less than 1.
         """
+        if max_candidates is not None and max_candidates < 1:
+            msg = "max_candidates must be at least 1"
+            raise ValueError(msg)
+
         self._provider = provider
         self._client: Any = None
         self._model: Any = None
         self._model_name: str = ""
+        self._max_candidates = max_candidates
+        self._scores = _ScoreCache(cache_size)
 
         if provider == "cohere":
             import cohere
@@ -71,12 +181,63 @@ class Reranker:
                 raise ValueError("api_key required for Cohere provider")
             self._client = cohere.ClientV2(api_key=api_key)
             self._model_name = model or "rerank-english-v3.0"
+        elif cross_encoder is not None:
+            self._model = cross_encoder
+            self._model_name = model or type(cross_encoder).__name__
         else:  # local
             from sentence_transformers import CrossEncoder
 
             self._model_name = model or "cross-encoder/ms-marco-MiniLM-L6-v2"
-            self._model = CrossEncoder(self._model_name)
+            if backend == "onnx":
+                from knowledge_mcp.embed.onnx_export import onnx_model_kwargs
+
+                self._model = CrossEncoder(
+                    self._model_name,
+                    backend="onnx",
+                    model_kwargs=onnx_model_kwargs(onnx_file_name),
+                )
+            else:
+                self._model = CrossEncoder(self._model_name)
+
+        if max_passage_tokens is None:
+            model_max = getattr(self._model, "max_length", None)
+            if provider == "cohere":
+                max_passage_tokens = DEFAULT_COHERE_MAX_TOKENS
+            elif isinstance(model_max, int) and model_max > 0:
+                max_passage_tokens = model_max
+            else:
+                max_passage_tokens = DEFAULT_LOCAL_MAX_TOKENS
+        self._max_passage_tokens = max_passage_tokens
+
+    @classmethod
+    def from_config(
+        cls,
+        config: KnowledgeConfig,
+        provider: str = "local",
+        api_key: str | None = None,
+        model: str | None = None,
+    ) -> Reranker:
+        """Create a reranker using the configured local inference backend.
 
+        Args:
+            config: Knowledge MCP configuration (local_backend and
+                local_onnx_file_name apply to the local provider).
+            provider: Backend provider, either "cohere" or "local".
+            api_key: Cohere API key (required if provider="cohere").
+            model: Model name override.
+
+        Returns:
+            Configured Reranker.
+        """
+        return cls(
+            provider=provider,
+            api_key=api_key,
+            model=model,
+            backend=config.local_backend,
+            onnx_file_name=config.local_onnx_file_name or None,
+        )
+
+    @timed("reranker.rerank")
     async def rerank(
         self,
         query: str,
@@ -87,6 +248,14 @@ class Reranker:
 
         Takes a list of search results and reorders them based on
         query-document relevance scores computed by the backend model.
+        Only the max_candidates results with the highest first-stage
+        scores are scored; cached (query, chunk) scores are reused and
+        only the remaining passages are sent to the model. Results beyond
+        max_candidates are not dropped: they follow the reranked head in
+        first-stage order. Their first-stage scores are on a different
+        scale, so they are replaced with scores stepping down by 1.0 from
+        the lowest reranked score; sorting or thresholding on score never
+        ranks them above a reranked result.
 
         Args:
             query: Search query to score documents against.
@@ -95,35 +264,80 @@ class Reranker:
                    If None, returns all results reranked.
 
         Returns:
-            Reranked results with updated scores, sorted by relevance.
-            Original SearchResult fields are preserved except for score.
+            Reranked results with updated scores, sorted by relevance,
+            followed by any unscored tail. Original SearchResult fields are
+            preserved except for score.
         """
         if not results:
             return results
 
-        if self._provider == "cohere":
-            return await self._rerank_cohere(query, results, top_n)
-        else:
-            return await self._rerank_local(query, results, top_n)
+        candidates = results
+        tail: list[SearchResult] = []
+        if self._max_candidates is not None and len(results) > self._max_candidates:
+            ranked = sorted(results, key=lambda r: r.score, reverse=True)
+            candidates = ranked[: self._max_candidates]
+            tail = ranked[self._max_candidates :]
+
+        query_key = hashlib.sha256(normalize_query(query).encode("utf-8")).hexdigest()
+        scores: list[float | None] = [self._scores.get((query_key, r.id)) for r in candidates]
+        missing = [i for i, score in enumerate(scores) if score is None]
+
+        if missing:
+            passages = [
+                truncate_passage(candidates[i].content, self._max_passage_tokens)
+                for i in missing
+            ]
+            if self._provider == "cohere":
+                fresh = await self._score_cohere(query, passages)
+            else:
+                fresh = await self._score_local(query, passages)
+            for i, score in zip(missing, fresh):
+                scores[i] = score
+                self._scores.set((query_key, candidates[i].id), score)
 
-    async def _rerank_cohere(
-        self,
-        query: str,
-        results: list[SearchResult],
-        top_n: int | None,
-    ) -> list[SearchResult]:
-        """Rerank using Cohere API.
+        # Create new results with updated scores using dataclasses.replace and sort
+        scored_results = [
+            replace(result, score=cast(float, score))
+            for result, score in zip(candidates, scores)
+        ]
+        scored_results.sort(key=lambda r: r.score, reverse=True)
+        if tail:
+            floor = scored_results[-1].score
+            scored_results.extend(
+                replace(result, score=floor - rank)
+                for rank, result in enumerate(tail, start=1)
+            )
+
+        if top_n:
+            return scored_results[:top_n]
+        return scored_results
+
+    def cache_stats(self) -> dict[str, Any]:
+        """Summarize score cache effectiveness.
+
+        Returns:
+            Dict with entries, max_entries, hits, misses and hit_rate.
+        """
+        lookups = self._scores.hits + self._scores.misses
+        return {
+            "entries": len(self._scores),
+            "max_entries": self._scores.max_entries,
+            "hits": self._scores.hits,
+            "misses": self._scores.misses,
+            "hit_rate": round(self._scores.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    @timed("reranker.score")
+    async def _score_cohere(self, query: str, passages: list[str]) -> list[float]:
+        """Score passages using Cohere API.
 
         Args:
             query: Search query.
-            results: Results to rerank.
-            top_n: Number of results to return.
+            passages: Passages to score.
 
         Returns:
-            Reranked results with Cohere relevance scores.
+            Cohere relevance score for each passage, in input order.
         """
-        documents = [r.content for r in results]
-
         # Cohere client is sync, run in executor
         loop = asyncio.get_running_loop()
         response = await loop.run_in_executor(
@@ -131,39 +345,29 @@ class Reranker:
             lambda: self._client.rerank(
                 model=self._model_name,
                 query=query,
-                documents=documents,
-                top_n=top_n or len(documents),
+                documents=passages,
+                top_n=len(passages),
             ),
         )
 
-        # Map back to SearchResult objects with updated scores using dataclasses.replace
-        reranked: list[SearchResult] = []
+        # Results come back sorted by relevance; map them to input positions
+        scores = [0.0] * len(passages)
         for item in response.results:
-            idx = cast(int, item.index)
-            relevance = cast(float, item.relevance_score)
-            original = results[idx]
-            # Use dataclasses.replace for immutable update - only change score
-            reranked.append(replace(original, score=relevance))
-
-        return reranked
+            scores[cast(int, item.index)] = cast(float, item.relevance_score)
+        return scores
 
-    async def _rerank_local(
-        self,
-        query: str,
-        results: list[SearchResult],
-        top_n: int | None,
-    ) -> list[SearchResult]:
-        """Rerank using local cross-encoder.
+    @timed("reranker.score")
+    async def _score_local(self, query: str, passages: list[str]) -> list[float]:
+        """Score passages using local cross-encoder.
 
         Args:
             query: Search query.
-            results: Results to rerank.
-            top_n: Number of results to return.
+            passages: Passages to score.
 
         Returns:
-            Reranked results with cross-encoder scores.
+            Cross-encoder score for each passage, in input order.
         """
-        pairs = [(query, r.content) for r in results]
+        pairs = [(query, passage) for passage in passages]
 
         # CrossEncoder.predict is sync, run in executor
         loop = asyncio.get_running_loop()
@@ -172,15 +376,4 @@ class Reranker:
             self._model.predict,
             pairs,
         )
-
-        # Create new results with updated scores using dataclasses.replace and sort
-        scored_results = [
-            replace(result, score=float(score)) for result, score in zip(results, scores)
-        ]
-
-        # Sort by score descending
-        scored_results.sort(key=lambda r: r.score, reverse=True)
-
-        if top_n:
-            return scored_results[:top_n]
-        return scored_results
+        return [float(score) for score in scores]
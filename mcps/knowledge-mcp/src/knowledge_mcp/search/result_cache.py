@@ -0,0 +1,273 @@
+# src/knowledge_mcp/search/result_cache.py
+"""
+In-process cache of search results, invalidated by collection writes.
+
+Agents replay the same standards lookups across sessions, and each repeat
+costs an embedding request plus a vector store round-trip. The cache keys
+results by the normalized query, filters, result count, score threshold,
+search strategy, collection name and the store's write generation.
+
+The generation only counts writes made through the same store instance,
+so it invalidates entries immediately when this process writes. Writes
+from other processes, such as a ``knowledge ingest`` run against the
+collection the MCP server is serving, are invisible to it. Every entry
+therefore expires after a TTL, which bounds how long such writes can go
+unseen; the TTL is required to be positive. Total size is bounded in
+bytes with LRU eviction.
+
+Example:
+    >>> cache = SearchResultCache(max_bytes=32 * 1024 * 1024, ttl_seconds=300)
+    >>> searcher = SemanticSearcher(embedder, store, result_cache=cache)
+    >>> await searcher.search("SRR entry criteria")  # miss: embed + search
+    >>> await searcher.search("SRR  entry criteria")  # hit
+    >>> cache.stats()["hits"]
+    1
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from knowledge_mcp.search.models import SearchResult
+
+# Approximate per-result overhead (dataclass instance, field objects, list slot)
+_RESULT_OVERHEAD_BYTES = 600
+# Approximate per-entry overhead (key string, OrderedDict node, expiry tuple)
+_ENTRY_OVERHEAD_BYTES = 200
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a query for cache lookup.
+
+    Collapses runs of whitespace and strips the ends. Case is preserved:
+    embeddings and keyword scoring are case-sensitive, so "SRR" and "srr"
+    may legitimately return different results.
+
+    Args:
+        query: Raw query text.
+
+    Returns:
+        Normalized query text.
+    """
+    return " ".join(query.split())
+
+
+def _result_size(result: SearchResult) -> int:
+    """Approximate memory held by one cached result."""
+    return (
+        _RESULT_OVERHEAD_BYTES
+        + len(result.content)
+        + len(result.document_title)
+        + len(result.section_title)
+        + len(repr(result.metadata))
+    )
+
+
+class SearchResultCache:
+    """
+    Byte-bounded LRU cache of search results with a TTL.
+
+    Results are copied on the way in and on the way out, because workflow
+    strategies adjust result scores in place.
+
+    Args:
+        max_bytes: Memory budget. Least recently used entries are evicted
+            once the budget is exceeded. 0 disables the cache.
+        ttl_seconds: Seconds an entry stays valid. Must be positive: it is
+            the only bound on staleness after writes from other processes.
+        clock: Monotonic time source (injectable for tests).
+
+    Attributes:
+        hits: Lookups served from the cache.
+        misses: Lookups that found no live entry.
+        evictions: Entries dropped to stay within max_bytes.
+        expirations: Entries dropped because their TTL elapsed.
+
+    Example:
+        >>> cache = SearchResultCache(max_bytes=16 * 1024 * 1024)
+        >>> key = SearchResultCache.make_key(
+        ...     "verification methods", strategy="semantic", collection="knowledge_v1"
+        ... )
+        >>> cache.set(key, results)
+        >>> cache.get(key)
+        [SearchResult(...), ...]
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize an empty cache with the given byte budget and TTL.
+
+        Raises:
+            ValueError: If ttl_seconds is not positive.
+        """
+        if ttl_seconds <= 0:
+            msg = "ttl_seconds must be positive"
+            raise ValueError(msg)
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        # key -> (expires_at, size_bytes, results)
+        self._entries: OrderedDict[str, tuple[float, int, tuple[SearchResult, ...]]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        *,
+        strategy: str,
+        collection: str,
+        generation: int | tuple[int, ...] = 0,
+        n_results: int = 10,
+        filter_dict: dict[str, Any] | None = None,
+        score_threshold: float = 0.0,
+    ) -> str:
+        """
+        Build the cache key for one search.
+
+        Args:
+            query: Query text (normalized here).
+            strategy: Search path producing the results (e.g. "semantic",
+                "hybrid"), so different rankings never share an entry.
+            collection: Collection the search runs against.
+            generation: Collection write generation (BaseStore.generation),
+                or a tuple of generations when results depend on several
+                indexes.
+            n_results: Maximum number of results requested.
+            filter_dict: Metadata filters.
+            score_threshold: Minimum similarity score.
+
+        Returns:
+            Hex digest identifying the search.
+        """
+        payload = json.dumps(
+            [
+                normalize_query(query),
+                strategy,
+                collection,
+                generation,
+                n_results,
+                filter_dict or {},
+                score_threshold,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> list[SearchResult] | None:
+        """
+        Look up results and mark the entry most recently used.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            Copies of the cached results, or None if absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, size, results = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._bytes -= size
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return [copy.copy(r) for r in results]
+
+    def set(self, key: str, results: list[SearchResult]) -> None:
+        """
+        Store results, evicting least recently used entries as needed.
+
+        Result sets larger than the whole budget are not cached.
+
+        Args:
+            key: Key from make_key().
+            results: Search results to cache.
+        """
+        if self.max_bytes <= 0:
+            return
+
+        size = _ENTRY_OVERHEAD_BYTES + sum(_result_size(r) for r in results)
+        if size > self.max_bytes:
+            return
+
+        expires_at = self._clock() + self.ttl_seconds
+        frozen = tuple(copy.copy(r) for r in results)
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (expires_at, size, frozen)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def __len__(self) -> int:
+        """Return the number of cached entries (including not yet purged expired ones)."""
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Approximate memory held by cached results."""
+        return self._bytes
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Summarize cache effectiveness.
+
+        Returns:
+            Dict with entries, size_bytes, max_bytes, ttl_seconds, hits,
+            misses, hit_rate, evictions and expirations.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
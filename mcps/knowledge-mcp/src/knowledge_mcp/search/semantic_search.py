@@ -27,7 +27,10 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
+from knowledge_mcp.monitoring.spans import timed
 from knowledge_mcp.search.models import SearchResult
+from knowledge_mcp.search.result_cache import SearchResultCache
+from knowledge_mcp.store.async_store import AsyncStore
 
 if TYPE_CHECKING:
     from knowledge_mcp.embed.base import BaseEmbedder
@@ -45,9 +48,15 @@ class SemanticSearcher:
     2. Searching vector store for similar chunks
     3. Returning formatted results with metadata
 
+    Store calls run on a bounded thread pool (AsyncStore) so a slow vector
+    store never blocks the event loop.
+
     Attributes:
         embedder: Embedding provider for query vectorization.
         store: Vector store backend for similarity search.
+        native_hybrid: Whether the query text is passed to the store for
+            server-side hybrid (dense + sparse) retrieval.
+        result_cache: Optional cache of results, invalidated by store writes.
 
     Example:
         >>> from knowledge_mcp.embed import OpenAIEmbedder
@@ -65,14 +74,28 @@ class SemanticSearcher:
     def __init__(
         self,
         embedder: BaseEmbedder,
-        store: BaseStore,
+        store: BaseStore | AsyncStore,
+        *,
+        native_hybrid: bool = False,
+        result_cache: SearchResultCache | None = None,
     ) -> None:
         """
         Initialize semantic searcher.
 
         Args:
             embedder: Embedding provider (e.g., OpenAIEmbedder).
-            store: Vector store implementing BaseStore (QdrantStore or ChromaDBStore).
+            store: Vector store implementing BaseStore (QdrantStore or ChromaDBStore),
+                or an AsyncStore sharing its concurrency limit with other callers.
+                A plain store is wrapped in a default AsyncStore, which
+                close() shuts down.
+            native_hybrid: Pass the query text to the store so backends with
+                sparse vectors (Qdrant) fuse keyword and vector results in a
+                single round-trip. Stores without support ignore it.
+            result_cache: Serve repeated searches from this cache instead of
+                embedding and querying the store again. Entries are keyed by
+                the store's write generation, so chunks written through this
+                store invalidate them; writes from other processes show up
+                once the cache TTL expires.
 
         Example:
             >>> searcher = SemanticSearcher(
@@ -81,8 +104,45 @@ class SemanticSearcher:
             ... )
         """
         self._embedder: BaseEmbedder = embedder
-        self._store: BaseStore = store
+        # A store wrapped here is ours to close; a shared AsyncStore is not
+        self._owns_async_store = not isinstance(store, AsyncStore)
+        if isinstance(store, AsyncStore):
+            self._async_store = store
+        else:
+            self._async_store = AsyncStore(store)
+        self._store: BaseStore = self._async_store.store
+        self._native_hybrid = native_hybrid
+        self.result_cache = result_cache
+
+    @property
+    def store(self) -> BaseStore:
+        """Underlying synchronous vector store."""
+        return self._store
+
+    def close(self) -> None:
+        """Shut down the store thread pool if this searcher created it."""
+        if self._owns_async_store:
+            self._async_store.close()
 
+    def _cache_key(
+        self,
+        query: str,
+        n_results: int,
+        filter_dict: dict[str, Any] | None,
+        score_threshold: float,
+    ) -> str:
+        """Build the result cache key for a search against the current store state."""
+        return SearchResultCache.make_key(
+            query,
+            strategy="semantic+native_hybrid" if self._native_hybrid else "semantic",
+            collection=self._store.collection_name,
+            generation=self._store.generation,
+            n_results=n_results,
+            filter_dict=filter_dict,
+            score_threshold=score_threshold,
+        )
+
+    @timed("semantic.search")
     async def search(
         self,
         query: str,
@@ -120,26 +180,110 @@ class SemanticSearcher:
         if not query or not query.strip():
             return []
 
+        cache_key: str | None = None
+        if self.result_cache is not None:
+            cache_key = self._cache_key(query, n_results, filter_dict, score_threshold)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         try:
             # Generate query embedding
             query_embedding = await self._embedder.embed(query)
 
             # Search vector store
-            raw_results: list[dict[str, Any]] = self._store.search(
+            store_kwargs: dict[str, Any] = {}
+            if self._native_hybrid:
+                store_kwargs["query_text"] = query
+            raw_results: list[dict[str, Any]] = await self._async_store.search(
                 query_embedding=query_embedding,
                 n_results=n_results,
                 filter_dict=filter_dict,
                 score_threshold=score_threshold,
+                **store_kwargs,
             )
 
             # Transform to SearchResult objects
-            return [self._to_search_result(r) for r in raw_results]
+            results = [self._to_search_result(r) for r in raw_results]
+            if cache_key is not None and self.result_cache is not None:
+                self.result_cache.set(cache_key, results)
+            return results
 
         except Exception as e:
             logger.error("Search failed for query '%s': %s", query[:50], e)
             # Return empty list for graceful degradation
             return []
 
+    @timed("semantic.search_many")
+    async def search_many(
+        self,
+        queries: list[str],
+        n_results: int = 10,
+        filter_dict: dict[str, Any] | None = None,
+        score_threshold: float = 0.0,
+    ) -> list[list[SearchResult]]:
+        """
+        Search for several queries with one embedding call and one store call.
+
+        All non-empty queries are embedded with a single embed_batch request
+        and looked up with a single batched store request (search_batch), so
+        N queries cost roughly one query's round-trips.
+
+        Args:
+            queries: Natural language search queries.
+            n_results: Maximum number of results per query. Defaults to 10.
+            filter_dict: Metadata filters applied to every query.
+            score_threshold: Minimum similarity score (0-1). Defaults to 0.0.
+
+        Returns:
+            One result list per query, in input order. Empty queries get an
+            empty list; if the batch fails, every query not served from the
+            result cache gets an empty list.
+
+        Example:
+            >>> srr, pdr = await searcher.search_many(["SRR entry criteria", "PDR exit criteria"])
+        """
+        results: list[list[SearchResult]] = [[] for _ in queries]
+        indexed = [(i, q) for i, q in enumerate(queries) if q and q.strip()]
+
+        # Only cache misses are embedded and sent to the store
+        cache_keys: dict[int, str] = {}
+        if self.result_cache is not None:
+            misses: list[tuple[int, str]] = []
+            for i, q in indexed:
+                cache_keys[i] = self._cache_key(q, n_results, filter_dict, score_threshold)
+                cached = self.result_cache.get(cache_keys[i])
+                if cached is not None:
+                    results[i] = cached
+                else:
+                    misses.append((i, q))
+            indexed = misses
+
+        if not indexed:
+            return results
+
+        texts = [q for _, q in indexed]
+        try:
+            embeddings = await self._embedder.embed_batch(texts)
+
+            raw_batches: list[list[dict[str, Any]]] = await self._async_store.search_batch(
+                embeddings,
+                n_results=n_results,
+                filter_dict=filter_dict,
+                score_threshold=score_threshold,
+                query_texts=texts if self._native_hybrid else None,
+            )
+
+            for (i, _), raw_results in zip(indexed, raw_batches):
+                results[i] = [self._to_search_result(r) for r in raw_results]
+                if self.result_cache is not None:
+                    self.result_cache.set(cache_keys[i], results[i])
+
+        except Exception as e:
+            logger.error("Batch search failed for %d queries: %s", len(texts), e)
+
+        return results
+
     def _to_search_result(self, raw: dict[str, Any]) -> SearchResult:
         """
         Transform raw store result to SearchResult dataclass.
@@ -9,6 +9,11 @@ The template method pattern defines the search algorithm structure:
 3. Adjust ranking (strategy)
 4. Format output (strategy)
 
+In fan-out mode, step 2 searches the original query plus one sub-query
+per facet and expansion. All sub-queries are embedded in one batch and
+looked up in one batched store request, then merged with Reciprocal Rank
+Fusion, so multi-aspect recall costs about as much as a single query.
+
 Example:
     >>> from knowledge_mcp.search import SemanticSearcher
     >>> from knowledge_mcp.search.workflow_search import WorkflowSearcher
@@ -20,15 +25,23 @@ Example:
 
 from __future__ import annotations
 
+import dataclasses
 import logging
 from typing import TYPE_CHECKING, Any
 
+from knowledge_mcp.monitoring.spans import span, timed
+from knowledge_mcp.search.hybrid import reciprocal_rank_fusion
+
 if TYPE_CHECKING:
+    from knowledge_mcp.search.models import SearchResult
     from knowledge_mcp.search.semantic_search import SemanticSearcher
-    from knowledge_mcp.search.strategies.base import SearchStrategy
+    from knowledge_mcp.search.strategies.base import SearchQuery, SearchStrategy
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_FAN_OUT = 8
+_RRF_K = 60
+
 
 class WorkflowSearcher:
     """Orchestrates workflow-specific searches using strategy pattern.
@@ -39,6 +52,9 @@ class WorkflowSearcher:
     Attributes:
         searcher: The underlying semantic search implementation.
         strategy: The workflow-specific search strategy.
+        fan_out: Whether facets and expansions are searched as extra
+            sub-queries and fused with the original query.
+        max_fan_out: Maximum sub-queries per search, original included.
 
     Example:
         >>> from knowledge_mcp.search.strategies.trade import TradeStudyStrategy
@@ -54,15 +70,30 @@ class WorkflowSearcher:
         self,
         searcher: SemanticSearcher,
         strategy: SearchStrategy,
+        *,
+        fan_out: bool = False,
+        max_fan_out: int = DEFAULT_MAX_FAN_OUT,
     ) -> None:
         """Initialize workflow searcher.
 
         Args:
             searcher: Semantic search implementation for vector similarity.
             strategy: Workflow-specific strategy for customization.
+            fan_out: Search facets and expanded terms as sub-queries
+                (batched, RRF-fused). Defaults to False (original only).
+            max_fan_out: Cap on sub-queries per search, original included.
+
+        Raises:
+            ValueError: If max_fan_out is less than 1.
         """
+        if max_fan_out < 1:
+            msg = "max_fan_out must be at least 1"
+            raise ValueError(msg)
+
         self._searcher = searcher
         self._strategy = strategy
+        self.fan_out = fan_out
+        self.max_fan_out = max_fan_out
 
     @property
     def strategy(self) -> SearchStrategy:
@@ -80,6 +111,7 @@ class WorkflowSearcher:
         """
         self._strategy = strategy
 
+    @timed("workflow.search")
     async def search(
         self,
         query: str,
@@ -125,19 +157,37 @@ class WorkflowSearcher:
             )
 
             # 2. Execute semantic search (shared core)
-            results = await self._searcher.search(
-                query=search_query.original,
-                n_results=n_results,
-                filter_dict=search_query.filters if search_query.filters else None,
-                score_threshold=score_threshold,
-            )
-            logger.debug("Semantic search returned %d results", len(results))
+            filter_dict = search_query.filters if search_query.filters else None
+            sub_queries = self._sub_queries(search_query) if self.fan_out else []
+            if len(sub_queries) > 1:
+                batches = await self._searcher.search_many(
+                    sub_queries,
+                    n_results=n_results,
+                    filter_dict=filter_dict,
+                    score_threshold=score_threshold,
+                )
+                results = fuse_results(batches)[:n_results]
+                logger.debug(
+                    "Fan-out search over %d sub-queries returned %d results",
+                    len(sub_queries),
+                    len(results),
+                )
+            else:
+                results = await self._searcher.search(
+                    query=search_query.original,
+                    n_results=n_results,
+                    filter_dict=filter_dict,
+                    score_threshold=score_threshold,
+                )
+                logger.debug("Semantic search returned %d results", len(results))
 
             # 3. Adjust ranking (strategy-specific)
-            ranked_results = self._strategy.adjust_ranking(results)
+            with span("workflow.adjust_ranking"):
+                ranked_results = self._strategy.adjust_ranking(results)
 
             # 4. Format output (strategy-specific)
-            output = self._strategy.format_output(ranked_results, params)
+            with span("workflow.format_output"):
+                output = self._strategy.format_output(ranked_results, params)
 
             # Ensure standard fields
             if "total_results" not in output:
@@ -152,3 +202,61 @@ class WorkflowSearcher:
                 "result_type": "error",
                 "total_results": 0,
             }
+
+    def _sub_queries(self, search_query: SearchQuery) -> list[str]:
+        """Build the original query plus one sub-query per facet/expansion.
+
+        Facets are appended to the original query individually; expanded
+        terms are appended together as one broader sub-query. Duplicates
+        are dropped and the list is capped at max_fan_out.
+
+        Args:
+            search_query: Preprocessed query from the strategy.
+
+        Returns:
+            Sub-queries, original first.
+        """
+        original = search_query.original
+        candidates = [original]
+        candidates.extend(f"{original} {facet}" for facet in search_query.facets)
+        if search_query.expanded_terms:
+            candidates.append(f"{original} {' '.join(search_query.expanded_terms)}")
+
+        # dict.fromkeys de-duplicates while keeping order
+        return list(dict.fromkeys(candidates))[: self.max_fan_out]
+
+
+def fuse_results(batches: list[list[SearchResult]]) -> list[SearchResult]:
+    """Merge per-sub-query result lists with Reciprocal Rank Fusion.
+
+    RRF only decides the order. Each result keeps its best similarity
+    across the sub-queries as its score, which is what strategies'
+    adjust_ranking boosts and thresholds expect.
+
+    Args:
+        batches: Ranked results, one list per sub-query.
+
+    Returns:
+        Unique results ordered by fused RRF score (highest first).
+
+    Example:
+        >>> fused = fuse_results([[a, b], [b, c]])
+        >>> fused[0].id == b.id
+        True
+    """
+    lists = [batch for batch in batches if batch]
+    if not lists:
+        return []
+
+    fused = reciprocal_rank_fusion(
+        [[{"id": r.id, "result": r} for r in batch] for batch in lists],
+        k=_RRF_K,
+    )
+    best_score: dict[str, float] = {}
+    for batch in lists:
+        for r in batch:
+            best_score[r.id] = max(best_score.get(r.id, r.score), r.score)
+    return [
+        dataclasses.replace(item["result"], score=best_score[item["result"].id])
+        for item in fused
+    ]
@@ -22,7 +22,6 @@ Example:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
 import signal
@@ -33,35 +32,42 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import TextContent, Tool
 
-from knowledge_mcp.db.engine import create_engine_and_session_factory, get_session
-from knowledge_mcp.embed import BaseEmbedder, OpenAIEmbedder
-from knowledge_mcp.embed.cache import EmbeddingCache
-from knowledge_mcp.monitoring.token_tracker import TokenTracker
-from knowledge_mcp.search import SemanticSearcher
-from knowledge_mcp.store import BaseStore, create_store
-from knowledge_mcp.tools.acquisition import (
-    handle_acquire,
-    handle_assess,
-    handle_ingest,
-    handle_preflight,
-    handle_request,
-    handle_sources,
-)
-from knowledge_mcp.tools.workflows import (
-    handle_explore,
-    handle_plan,
-    handle_rcca,
-    handle_trade,
-)
+from knowledge_mcp.embed.base import BaseEmbedder
+from knowledge_mcp.monitoring.spans import get_recorder, span
+from knowledge_mcp.search.result_cache import SearchResultCache
+from knowledge_mcp.search.semantic_search import SemanticSearcher
+from knowledge_mcp.store import AsyncStore, BaseStore, create_store
 from knowledge_mcp.utils.config import load_config
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
 
+    from knowledge_mcp.embed.cache import EmbeddingCache
+    from knowledge_mcp.monitoring.token_tracker import TokenTracker
+    from knowledge_mcp.search.models import SearchResult
     from knowledge_mcp.utils.config import KnowledgeConfig
 
 logger = logging.getLogger(__name__)
 
+# Tools routed by _dispatch_tool; other names share one latency span so
+# arbitrary client input cannot grow the span registry
+_TOOL_NAMES: frozenset[str] = frozenset({
+    "knowledge_search",
+    "knowledge_search_batch",
+    "knowledge_stats",
+    "knowledge_ingest",
+    "knowledge_sources",
+    "knowledge_assess",
+    "knowledge_preflight",
+    "knowledge_acquire",
+    "knowledge_request",
+    "knowledge_rcca",
+    "knowledge_trade",
+    "knowledge_explore",
+    "knowledge_plan",
+    "list_collections",
+})
+
 
 class KnowledgeMCPServer:
     """
@@ -100,7 +106,10 @@ class KnowledgeMCPServer:
         self._config: KnowledgeConfig | None = None
         self._embedder = embedder
         self._store = store
+        self._async_store: AsyncStore | None = None
+        self._token_tracker: TokenTracker | None = None
         self._searcher: SemanticSearcher | None = None
+        self._result_cache: SearchResultCache | None = None
         self._engine: AsyncEngine | None = None
         self._session_factory: async_sessionmaker | None = None
 
@@ -115,25 +124,36 @@ class KnowledgeMCPServer:
         if self._config is None:
             self._config = load_config()
 
+        get_recorder().enabled = self._config.latency_metrics_enabled
+
         # Create database engine and session factory if not in offline mode
         if (
             self._engine is None
             and not self._config.offline_mode
             and self._config.database_url
         ):
+            from knowledge_mcp.db.engine import create_engine_and_session_factory
+
             self._engine, self._session_factory = create_engine_and_session_factory(
                 self._config
             )
 
         # Create embedder if not provided
         if self._embedder is None:
+            from knowledge_mcp.embed.cache import EmbeddingCache
+            from knowledge_mcp.embed.openai_embedder import OpenAIEmbedder
+            from knowledge_mcp.monitoring.token_tracker import TokenTracker
+
             # Create cache if enabled
             cache: EmbeddingCache | None = None
             if self._config.cache_enabled:
+                # Shortened embeddings get their own namespace
                 cache = EmbeddingCache(
                     self._config.cache_dir,
-                    self._config.embedding_model,
+                    self._config.embedding_cache_model,
                     size_limit=self._config.cache_size_limit,
+                    memory_size_limit=self._config.cache_memory_size_limit,
+                    dtype=self._config.cache_dtype,
                 )
 
             # Create tracker if enabled
@@ -144,6 +164,7 @@ class KnowledgeMCPServer:
                     self._config.embedding_model,
                     daily_warning_threshold=self._config.daily_token_warning_threshold,
                 )
+                self._token_tracker = tracker
 
             # Create embedder with cache and tracker
             self._embedder = OpenAIEmbedder(
@@ -152,14 +173,56 @@ class KnowledgeMCPServer:
                 dimensions=self._config.embedding_dimensions,
                 cache=cache,
                 token_tracker=tracker,
+                max_concurrency=self._config.embedding_max_concurrency,
+                requests_per_minute=self._config.embedding_requests_per_minute or None,
+                tokens_per_minute=self._config.embedding_tokens_per_minute or None,
             )
 
         # Create store if not provided
         if self._store is None:
             self._store = create_store(self._config)
 
+        # Bounded thread pool shared by all async store access
+        self._async_store = AsyncStore(
+            self._store,
+            max_concurrency=self._config.store_max_concurrency,
+        )
+
+        # Shared across agents: repeated lookups skip embedding and the store
+        if self._result_cache is None and self._config.search_cache_max_bytes:
+            self._result_cache = SearchResultCache(
+                max_bytes=self._config.search_cache_max_bytes,
+                ttl_seconds=self._config.search_cache_ttl_seconds,
+            )
+
         # Create searcher
-        self._searcher = SemanticSearcher(self._embedder, self._store)
+        self._searcher = SemanticSearcher(
+            self._embedder,
+            self._async_store,
+            native_hybrid=self._config.qdrant_hybrid_search,
+            result_cache=self._result_cache,
+        )
+
+    def _get_async_store(self) -> AsyncStore:
+        """
+        Return the shared async store facade, creating it if needed.
+
+        Covers stores injected directly (e.g. in tests) without going
+        through _ensure_dependencies.
+
+        Returns:
+            AsyncStore wrapping the configured store.
+        """
+        assert self._store is not None
+        if self._async_store is None or self._async_store.store is not self._store:
+            if self._config is not None:
+                self._async_store = AsyncStore(
+                    self._store,
+                    max_concurrency=self._config.store_max_concurrency,
+                )
+            else:
+                self._async_store = AsyncStore(self._store)
+        return self._async_store
 
     def _setup_handlers(self) -> None:
         """
@@ -217,6 +280,48 @@ Backend: Vector search with OpenAI embeddings (text-embedding-3-small).""",
                         "required": ["query"]
                     }
                 ),
+                Tool(
+                    name="knowledge_search_batch",
+                    description="""Run several knowledge base searches in one call.
+
+Use this instead of repeated knowledge_search calls when you have many independent
+queries (e.g. checking coverage of a list of topics or requirements). All queries are
+embedded in one request and looked up in one batched vector store call.
+
+Returns one result list per query, in the same order as the queries.""",
+                    inputSchema={
+                        "type": "object",
+                        "properties": {
+                            "queries": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "Natural language search queries",
+                                "minItems": 1,
+                                "maxItems": 50
+                            },
+                            "n_results": {
+                                "type": "integer",
+                                "description": "Maximum number of results per query (1-100)",
+                                "default": 10,
+                                "minimum": 1,
+                                "maximum": 100
+                            },
+                            "filter_dict": {  # noqa: E501
+                                "type": "object",
+                                "description": "Optional metadata filters applied to every query (e.g., {'document_type': 'standard'})",
+                                "additionalProperties": True
+                            },
+                            "score_threshold": {
+                                "type": "number",
+                                "description": "Minimum similarity score (0-1) for results",
+                                "default": 0.0,
+                                "minimum": 0.0,
+                                "maximum": 1.0
+                            }
+                        },
+                        "required": ["queries"]
+                    }
+                ),
                 Tool(
                     name="knowledge_stats",
                     description="""Get statistics about the knowledge base collection.
@@ -226,11 +331,24 @@ Returns information about:
 - Collection name
 - Vector store configuration
 - Document count (if available)
+- Search result cache hits, misses and size (if enabled)
+- Per-stage latency (embedding, cache, vector store, reranking, tools)
+  as p50/p95/p99 milliseconds, plus event counters
+
+Set format to "prometheus" to get the latency histograms and counters in
+Prometheus text exposition format instead.
 
 Use this to verify the knowledge base is populated and accessible.""",
                     inputSchema={
                         "type": "object",
-                        "properties": {},
+                        "properties": {
+                            "format": {
+                                "type": "string",
+                                "enum": ["json", "prometheus"],
+                                "description": "json (default) or prometheus metrics text",
+                                "default": "json"
+                            }
+                        },
                         "required": []
                     }
                 ),
@@ -386,14 +504,18 @@ Complete workflow for adding web content. Checks accessibility,
 creates source record, and ingests content.
 
 This is a convenience tool that combines preflight + ingest.
+Pass urls to acquire many pages at once: they are crawled concurrently
+with per-host rate limits and robots.txt compliance.
 
 Parameters:
-- url (required): URL to acquire
+- url: URL to acquire (required unless urls is given)
+- urls: List of URLs to acquire in one batch
 - authority_tier: Authority level (default: tier3)
-- title: Optional title override
+- title: Optional title override (single URL only)
 - reason: Why this content is needed
 
-Returns acquisition result with source_id and ingestion details.""",
+Returns acquisition result with source_id and ingestion details
+(a per-URL results list for urls).""",
                     inputSchema={
                         "type": "object",
                         "properties": {
@@ -401,6 +523,11 @@ Returns acquisition result with source_id and ingestion details.""",
                                 "type": "string",
                                 "description": "URL to acquire"
                             },
+                            "urls": {
+                                "type": "array",
+                                "items": {"type": "string"},
+                                "description": "URLs to acquire concurrently"
+                            },
                             "authority_tier": {
                                 "type": "string",
                                 "description": "Authority tier for ranking",
@@ -415,8 +542,7 @@ Returns acquisition result with source_id and ingestion details.""",
                                 "type": "string",
                                 "description": "Why this content is needed"
                             }
-                        },
-                        "required": ["url"]
+                        }
                     }
                 ),
                 Tool(
@@ -690,7 +816,7 @@ Use this to discover what content is available before searching.""",
             ]
 
         @self.server.call_tool()
-        async def handle_call_tool(  # noqa: PLR0911  # pyright: ignore[reportUnusedFunction]
+        async def handle_call_tool(  # pyright: ignore[reportUnusedFunction]
             name: str,
             arguments: dict[str, Any],
         ) -> list[TextContent]:
@@ -708,43 +834,8 @@ Use this to discover what content is available before searching.""",
                 # Ensure dependencies are initialized
                 self._ensure_dependencies()
 
-                if name == "knowledge_search":
-                    return await self._handle_knowledge_search(arguments)
-                elif name == "knowledge_stats":
-                    return await self._handle_knowledge_stats(arguments)
-                elif name == "knowledge_ingest":
-                    return await self._handle_knowledge_ingest(arguments)
-                elif name == "knowledge_sources":
-                    return await self._handle_knowledge_sources(arguments)
-                elif name == "knowledge_assess":
-                    return await self._handle_knowledge_assess(arguments)
-                elif name == "knowledge_preflight":
-                    return await self._handle_knowledge_preflight(arguments)
-                elif name == "knowledge_acquire":
-                    return await self._handle_knowledge_acquire(arguments)
-                elif name == "knowledge_request":
-                    return await self._handle_knowledge_request(arguments)
-                elif name == "knowledge_rcca":
-                    return await self._handle_knowledge_rcca(arguments)
-                elif name == "knowledge_trade":
-                    return await self._handle_knowledge_trade(arguments)
-                elif name == "knowledge_explore":
-                    return await self._handle_knowledge_explore(arguments)
-                elif name == "knowledge_plan":
-                    return await self._handle_knowledge_plan(arguments)
-                elif name == "list_collections":
-                    return await self._handle_list_collections(arguments)
-                else:
-                    # Unknown tool - return error response
-                    return [
-                        TextContent(
-                            type="text",
-                            text=json.dumps({
-                                "error": f"Unknown tool: {name}",
-                                "isError": True
-                            }, indent=2)
-                        )
-                    ]
+                with span(f"tool.{name}" if name in _TOOL_NAMES else "tool.unknown"):
+                    return await self._dispatch_tool(name, arguments)
             except Exception as e:
                 # Catch all exceptions and return structured error
                 return [
@@ -757,6 +848,61 @@ Use this to discover what content is available before searching.""",
                     )
                 ]
 
+    async def _dispatch_tool(  # noqa: PLR0911
+        self,
+        name: str,
+        arguments: dict[str, Any],
+    ) -> list[TextContent]:
+        """
+        Route a tool invocation to its handler.
+
+        Args:
+            name: Name of the tool to invoke.
+            arguments: Tool arguments as a dictionary.
+
+        Returns:
+            List of content items from the handler.
+        """
+        if name == "knowledge_search":
+            return await self._handle_knowledge_search(arguments)
+        elif name == "knowledge_search_batch":
+            return await self._handle_knowledge_search_batch(arguments)
+        elif name == "knowledge_stats":
+            return await self._handle_knowledge_stats(arguments)
+        elif name == "knowledge_ingest":
+            return await self._handle_knowledge_ingest(arguments)
+        elif name == "knowledge_sources":
+            return await self._handle_knowledge_sources(arguments)
+        elif name == "knowledge_assess":
+            return await self._handle_knowledge_assess(arguments)
+        elif name == "knowledge_preflight":
+            return await self._handle_knowledge_preflight(arguments)
+        elif name == "knowledge_acquire":
+            return await self._handle_knowledge_acquire(arguments)
+        elif name == "knowledge_request":
+            return await self._handle_knowledge_request(arguments)
+        elif name == "knowledge_rcca":
+            return await self._handle_knowledge_rcca(arguments)
+        elif name == "knowledge_trade":
+            return await self._handle_knowledge_trade(arguments)
+        elif name == "knowledge_explore":
+            return await self._handle_knowledge_explore(arguments)
+        elif name == "knowledge_plan":
+            return await self._handle_knowledge_plan(arguments)
+        elif name == "list_collections":
+            return await self._handle_list_collections(arguments)
+        else:
+            # Unknown tool - return error response
+            return [
+                TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "error": f"Unknown tool: {name}",
+                        "isError": True
+                    }, indent=2)
+                )
+            ]
+
     async def _handle_knowledge_search(self, arguments: dict[str, Any]) -> list[TextContent]:
         """
         Handle knowledge_search tool invocation.
@@ -784,31 +930,15 @@ Use this to discover what content is available before searching.""",
             )
 
             # Format results with citations (FR-3.4, FR-4.4)
-            formatted_results: list[dict[str, Any]] = []
-            for result in results:
-                result_dict: dict[str, Any] = {
-                    "citation": result.citation,  # Use citation property (FR-3.4)
-                    "content": result.content,
-                    "relevance": f"{int(result.score * 100)}%",  # Display as percentage
-                    "metadata": {
-                        "document_id": result.document_id,
-                        "clause_number": result.clause_number,
-                        "normative": result.normative,
-                        "page_numbers": result.page_numbers,
-                    }
-                }
-                formatted_results.append(result_dict)
+            with span("tool.knowledge_search.format"):
+                formatted_results = [self._format_search_result(r) for r in results]
+                text = json.dumps({
+                    "query": query,
+                    "results": formatted_results,
+                    "count": len(formatted_results),
+                }, indent=2)
 
-            return [
-                TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "query": query,
-                        "results": formatted_results,
-                        "count": len(formatted_results),
-                    }, indent=2)
-                )
-            ]
+            return [TextContent(type="text", text=text)]
 
         except ConnectionError as e:
             logger.error(f"Vector store connection failed: {e}")
@@ -837,21 +967,107 @@ Use this to discover what content is available before searching.""",
                 )
             ]
 
+    async def _handle_knowledge_search_batch(
+        self, arguments: dict[str, Any]
+    ) -> list[TextContent]:
+        """
+        Handle knowledge_search_batch tool invocation.
+
+        Args:
+            arguments: Tool arguments with queries, n_results, filter_dict, score_threshold.
+
+        Returns:
+            List containing per-query formatted results as TextContent.
+        """
+        # The tool schema's minItems rejects an empty list before this runs
+        queries: list[str] = [str(q) for q in arguments["queries"]]
+
+        try:
+            assert self._searcher is not None
+            batches = await self._searcher.search_many(
+                queries,
+                n_results=arguments.get("n_results", 10),
+                filter_dict=arguments.get("filter_dict"),
+                score_threshold=arguments.get("score_threshold", 0.0),
+            )
+
+            with span("tool.knowledge_search_batch.format"):
+                formatted = [
+                    {
+                        "query": query,
+                        "results": [self._format_search_result(r) for r in results],
+                        "count": len(results),
+                    }
+                    for query, results in zip(queries, batches)
+                ]
+                text = json.dumps({
+                    "results": formatted,
+                    "count": len(formatted),
+                }, indent=2)
+
+            return [TextContent(type="text", text=text)]
+
+        except Exception as e:
+            logger.exception("Unexpected batch search error")
+            return [
+                TextContent(
+                    type="text",
+                    text=json.dumps({
+                        "error": "Batch search failed",
+                        "message": str(e),
+                        "retryable": False,
+                        "results": []  # Explicit empty results - no hallucination
+                    }, indent=2)
+                )
+            ]
+
+    @staticmethod
+    def _format_search_result(result: SearchResult) -> dict[str, Any]:
+        """
+        Format a search result with its citation for tool output.
+
+        Args:
+            result: Search result to format.
+
+        Returns:
+            JSON-serializable dict with citation, content, relevance and metadata.
+        """
+        return {
+            "citation": result.citation,  # Use citation property (FR-3.4)
+            "content": result.content,
+            "relevance": f"{int(result.score * 100)}%",  # Display as percentage
+            "metadata": {
+                "document_id": result.document_id,
+                "clause_number": result.clause_number,
+                "normative": result.normative,
+                "page_numbers": result.page_numbers,
+            }
+        }
+
     async def _handle_knowledge_stats(
-        self, arguments: dict[str, Any]  # noqa: ARG002
+        self, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """
         Handle knowledge_stats tool invocation.
 
         Args:
-            arguments: Tool arguments (currently none required).
+            arguments: Tool arguments with optional format ("json" or
+                "prometheus").
 
         Returns:
-            List containing collection statistics as TextContent.
+            List containing collection statistics as TextContent, or the
+            latency metrics as Prometheus text.
         """
-        # Call store.get_stats() in thread pool (sync method)
-        assert self._store is not None
-        stats = await asyncio.to_thread(self._store.get_stats)
+        recorder = get_recorder()
+        if arguments.get("format") == "prometheus":
+            return [TextContent(type="text", text=recorder.to_prometheus())]
+
+        # Call store.get_stats() on the bounded store pool (sync method)
+        stats = await self._get_async_store().get_stats()
+        if self._result_cache is not None:
+            stats = {**stats, "search_cache": self._result_cache.stats()}
+        if recorder.enabled:
+            stats = {**stats, "latency": recorder.snapshot()}
 
         return [
             TextContent(
@@ -869,6 +1085,9 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing ingestion result as TextContent.
         """
+        from knowledge_mcp.db.engine import get_session
+        from knowledge_mcp.tools.acquisition import handle_ingest
+
         if self._session_factory is None:
             return [
                 TextContent(
@@ -900,6 +1119,9 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing sources list as TextContent.
         """
+        from knowledge_mcp.db.engine import get_session
+        from knowledge_mcp.tools.acquisition import handle_sources
+
         if self._session_factory is None:
             return [
                 TextContent(
@@ -931,6 +1153,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing coverage report as TextContent.
         """
+        from knowledge_mcp.tools.acquisition import handle_assess
+
         assert self._searcher is not None
         result = await handle_assess(
             searcher=self._searcher,
@@ -949,6 +1173,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing preflight result as TextContent.
         """
+        from knowledge_mcp.tools.acquisition import handle_preflight
+
         result = await handle_preflight(
             url=arguments.get("url", ""),
             check_robots=arguments.get("check_robots", True),
@@ -960,11 +1186,15 @@ Use this to discover what content is available before searching.""",
         """Handle knowledge_acquire tool invocation.
 
         Args:
-            arguments: Tool arguments with url, authority_tier, title, reason.
+            arguments: Tool arguments with url or urls, authority_tier,
+                title, reason.
 
         Returns:
             List containing acquisition result as TextContent.
         """
+        from knowledge_mcp.db.engine import get_session
+        from knowledge_mcp.tools.acquisition import handle_acquire, handle_acquire_many
+
         if self._session_factory is None:
             return [
                 TextContent(
@@ -976,6 +1206,17 @@ Use this to discover what content is available before searching.""",
                 )
             ]
 
+        urls = arguments.get("urls")
+        if urls:
+            async with get_session(self._session_factory) as session:
+                result = await handle_acquire_many(
+                    session=session,
+                    urls=list(urls),
+                    authority_tier=arguments.get("authority_tier", "tier3"),
+                    reason=arguments.get("reason"),
+                )
+            return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
         async with get_session(self._session_factory) as session:
             result = await handle_acquire(
                 session=session,
@@ -996,6 +1237,9 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing request details as TextContent.
         """
+        from knowledge_mcp.db.engine import get_session
+        from knowledge_mcp.tools.acquisition import handle_request
+
         if self._session_factory is None:
             return [
                 TextContent(
@@ -1026,6 +1270,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing RCCA-structured results as TextContent.
         """
+        from knowledge_mcp.tools.workflows import handle_rcca
+
         assert self._searcher is not None
         result = await handle_rcca(
             searcher=self._searcher,
@@ -1046,6 +1292,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing trade study results as TextContent.
         """
+        from knowledge_mcp.tools.workflows import handle_trade
+
         assert self._searcher is not None
         result = await handle_trade(
             searcher=self._searcher,
@@ -1068,6 +1316,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing exploration results as TextContent.
         """
+        from knowledge_mcp.tools.workflows import handle_explore
+
         assert self._searcher is not None
         result = await handle_explore(
             searcher=self._searcher,
@@ -1089,6 +1339,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             List containing planning results as TextContent.
         """
+        from knowledge_mcp.tools.workflows import handle_plan
+
         assert self._searcher is not None
         result = await handle_plan(
             searcher=self._searcher,
@@ -1134,10 +1386,8 @@ Use this to discover what content is available before searching.""",
         Returns:
             Dict with collection metadata including names, counts, and embedding model.
         """
-        assert self._store is not None
-
-        # Get stats from store (runs in thread pool since get_stats is sync)
-        stats = await asyncio.to_thread(self._store.get_stats)
+        # Get stats from store (runs on the store pool since get_stats is sync)
+        stats = await self._get_async_store().get_stats()
 
         # Format collections info
         collections_info: dict[str, Any] = {
@@ -1182,12 +1432,19 @@ Use this to discover what content is available before searching.""",
             for sig in (signal.SIGINT, signal.SIGTERM):
                 loop.add_signal_handler(sig, self._handle_shutdown)
 
-        async with stdio_server() as (read_stream, write_stream):
-            await self.server.run(
-                read_stream,
-                write_stream,
-                self.server.create_initialization_options(),
-            )
+        try:
+            async with stdio_server() as (read_stream, write_stream):
+                await self.server.run(
+                    read_stream,
+                    write_stream,
+                    self.server.create_initialization_options(),
+                )
+        finally:
+            # Persist buffered token usage
+            if self._token_tracker is not None:
+                self._token_tracker.close()
+            if self._async_store is not None:
+                self._async_store.close()
 
     def _handle_shutdown(self) -> None:
         """Handle graceful shutdown on SIGINT/SIGTERM."""
@@ -9,6 +9,13 @@ Example:
     >>> from knowledge_mcp.store import create_store
     >>> store = create_store(config)
     >>> store.add_chunks(chunks)
+    >>>
+    >>> # Large loads: streamed, concurrent batched upserts
+    >>> stats = store.bulk_load(iter_embedded_chunks(corpus))
+    >>>
+    >>> # Non-blocking access from async code
+    >>> async_store = AsyncStore(store, max_concurrency=config.store_max_concurrency)
+    >>> results = await async_store.search(query_embedding)
 """
 
 from __future__ import annotations
@@ -16,11 +23,14 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Union
 
+from knowledge_mcp.store.async_store import AsyncStore
 from knowledge_mcp.store.base import BaseStore
-from knowledge_mcp.store.qdrant_store import QdrantStore
+from knowledge_mcp.store.bulk import UploadStats
+from knowledge_mcp.utils.lazy import lazy_exports
 
 if TYPE_CHECKING:
     from knowledge_mcp.store.chromadb_store import ChromaDBStore
+    from knowledge_mcp.store.qdrant_store import QdrantStore
     from knowledge_mcp.utils.config import KnowledgeConfig
 
 logger = logging.getLogger(__name__)
@@ -58,6 +68,8 @@ def create_store(config: KnowledgeConfig) -> BaseStore:
 
     # Default: try Qdrant first, fallback to ChromaDB
     try:
+        from knowledge_mcp.store.qdrant_store import QdrantStore
+
         store = QdrantStore(config)
         if store.health_check():
             logger.info("Connected to Qdrant Cloud: %s", config.qdrant_url)
@@ -84,4 +96,10 @@ def create_store(config: KnowledgeConfig) -> BaseStore:
     )
 
 
-__all__: list[str] = ["BaseStore", "QdrantStore", "create_store"]
+__all__: list[str] = ["AsyncStore", "BaseStore", "QdrantStore", "UploadStats", "create_store"]
+
+# Imported on first access so qdrant-client loads only when a store is created
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {"QdrantStore": "knowledge_mcp.store.qdrant_store"},
+)
@@ -0,0 +1,251 @@
+# src/knowledge_mcp/store/async_store.py
+"""
+Async facade over synchronous vector store backends.
+
+QdrantStore and ChromaDBStore use blocking clients. Calling them directly
+from the MCP server's event loop stalls every concurrent tool call while a
+single request waits on the network. AsyncStore runs store calls on a
+dedicated, bounded thread pool so the loop stays responsive and the number
+of in-flight store requests is capped.
+
+Example:
+    >>> from knowledge_mcp.store import AsyncStore, create_store
+    >>>
+    >>> store = AsyncStore(create_store(config), max_concurrency=8)
+    >>> results = await store.search(query_embedding, n_results=5)
+    >>> stats = await store.get_stats()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from knowledge_mcp.monitoring.spans import timed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+    from knowledge_mcp.models.chunk import KnowledgeChunk
+    from knowledge_mcp.store.base import BaseStore
+    from knowledge_mcp.store.bulk import UploadStats
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class AsyncStore:
+    """
+    Run a synchronous store's methods on a bounded thread pool.
+
+    Calls beyond max_concurrency queue in the executor without blocking
+    the event loop.
+
+    Attributes:
+        store: Wrapped synchronous store.
+        max_concurrency: Maximum number of concurrent store calls.
+
+    Example:
+        >>> async_store = AsyncStore(QdrantStore(config))
+        >>> results = await async_store.search([0.1] * 1536, n_results=5)
+    """
+
+    def __init__(
+        self,
+        store: BaseStore,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """
+        Initialize async store facade.
+
+        Args:
+            store: Synchronous store (QdrantStore or ChromaDBStore).
+            max_concurrency: Worker threads, i.e. the maximum number of
+                store calls in flight at once.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            msg = "max_concurrency must be at least 1"
+            raise ValueError(msg)
+
+        self.store = store
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency,
+            thread_name_prefix="knowledge-store",
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking store call on the store executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(func, *args, **kwargs),
+        )
+
+    async def add_chunks(self, chunks: list[KnowledgeChunk]) -> int:
+        """
+        Add chunks without blocking the event loop.
+
+        Args:
+            chunks: KnowledgeChunk objects with embeddings.
+
+        Returns:
+            Number of chunks added.
+        """
+        return await self._run(self.store.add_chunks, chunks)
+
+    async def bulk_load(self, chunks: Iterable[KnowledgeChunk], **kwargs: Any) -> UploadStats:
+        """
+        Stream chunks into the store without blocking the event loop.
+
+        The load runs on one store worker; backends parallelize their own
+        upserts (see QdrantStore.bulk_load).
+
+        Args:
+            chunks: Embedded chunks, consumed on the worker thread.
+            **kwargs: Backend options such as batch_size or parallelism.
+
+        Returns:
+            Chunks written, batches sent and throughput.
+        """
+        return await self._run(self.store.bulk_load, chunks, **kwargs)
+
+    async def delete_chunks(self, chunk_ids: list[str]) -> int:
+        """
+        Delete chunks by id without blocking the event loop.
+
+        Args:
+            chunk_ids: Ids of chunks to delete.
+
+        Returns:
+            Number of ids submitted for deletion.
+        """
+        return await self._run(self.store.delete_chunks, chunk_ids)
+
+    @timed("store.search")
+    async def search(
+        self,
+        query_embedding: list[float],
+        n_results: int = 10,
+        filter_dict: dict[str, Any] | None = None,
+        score_threshold: float = 0.0,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Search the store without blocking the event loop.
+
+        Args:
+            query_embedding: Dense vector embedding of the query.
+            n_results: Maximum number of results to return.
+            filter_dict: Optional metadata filters.
+            score_threshold: Minimum similarity score.
+            **kwargs: Extra store-specific arguments (e.g. query_text).
+
+        Returns:
+            Matching chunks as returned by the wrapped store.
+        """
+        return await self._run(
+            self.store.search,
+            query_embedding=query_embedding,
+            n_results=n_results,
+            filter_dict=filter_dict,
+            score_threshold=score_threshold,
+            **kwargs,
+        )
+
+    @timed("store.search_batch")
+    async def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        filter_dict: dict[str, Any] | None = None,
+        score_threshold: float = 0.0,
+        query_texts: list[str] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several searches without blocking the event loop.
+
+        Uses the wrapped store's search_batch (one round-trip) when it has
+        one; otherwise the queries run concurrently on the store executor.
+
+        Args:
+            query_embeddings: Dense query vectors.
+            n_results: Maximum results per query.
+            filter_dict: Metadata filters applied to every query.
+            score_threshold: Minimum similarity score.
+            query_texts: Optional raw texts aligned with query_embeddings.
+
+        Returns:
+            One result list per query embedding, in input order.
+        """
+        search_batch: Callable[..., list[list[dict[str, Any]]]] | None = getattr(
+            self.store, "search_batch", None
+        )
+        if search_batch is not None:
+            return await self._run(
+                search_batch,
+                query_embeddings,
+                n_results=n_results,
+                filter_dict=filter_dict,
+                score_threshold=score_threshold,
+                query_texts=query_texts,
+            )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self.search(
+                        embedding,
+                        n_results=n_results,
+                        filter_dict=filter_dict,
+                        score_threshold=score_threshold,
+                        **({"query_text": query_texts[i]} if query_texts is not None else {}),
+                    )
+                    for i, embedding in enumerate(query_embeddings)
+                )
+            )
+        )
+
+    async def get_stats(self) -> dict[str, Any]:
+        """
+        Get collection statistics without blocking the event loop.
+
+        Returns:
+            Statistics dictionary from the wrapped store.
+        """
+        return await self._run(self.store.get_stats)
+
+    async def health_check(self) -> bool:
+        """
+        Check store health without blocking the event loop.
+
+        Returns:
+            True if the wrapped store is healthy, False otherwise.
+        """
+        return await self._run(self.store.health_check)
+
+    async def validate_embedding_model(self, expected_model: str) -> bool:
+        """
+        Validate the collection's embedding model without blocking.
+
+        Args:
+            expected_model: Embedding model name to validate against.
+
+        Returns:
+            Result of the wrapped store's validate_embedding_model.
+
+        Raises:
+            ValueError: If the collection uses a different model.
+        """
+        validate: Callable[[str], bool] = getattr(self.store, "validate_embedding_model")
+        return await self._run(validate, expected_model)
+
+    def close(self) -> None:
+        """Shut down the executor, waiting for in-flight calls."""
+        self._executor.shutdown(wait=True)
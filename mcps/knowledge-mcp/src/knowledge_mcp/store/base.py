@@ -18,9 +18,15 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from knowledge_mcp.store.bulk import UploadStats, iter_batches, upload_batches
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from knowledge_mcp.models.chunk import KnowledgeChunk
 
+DEFAULT_BULK_BATCH_SIZE = 256
+
 
 class BaseStore(ABC):
     """
@@ -45,6 +51,25 @@ class BaseStore(ABC):
         ...         pass
     """
 
+    @property
+    def generation(self) -> int:
+        """
+        Number of writes made through this store instance.
+
+        Search result caches include it in their keys, so an add_chunks
+        call on this instance invalidates results computed before it. The
+        count is per process: writes made elsewhere (e.g. by the ingest
+        CLI) do not change it, and only the cache TTL bounds how long
+        those go unseen. Backends that write override this; the default
+        never changes.
+        """
+        return 0
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the collection this store reads and writes."""
+        return ""
+
     @abstractmethod
     def add_chunks(self, chunks: list[KnowledgeChunk]) -> int:
         """
@@ -55,7 +80,8 @@ class BaseStore(ABC):
                 Each chunk must have a valid embedding.
 
         Returns:
-            Number of chunks successfully added.
+                Number of chunks successfully added. Implementations
+            increment generation after writing so cached searches expire.
 
         Raises:
             ValueError: When chunks list is empty or contains
@@ -68,6 +94,52 @@ class BaseStore(ABC):
             >>> print(f"Added {added} chunks")
         """
 
+    def bulk_load(
+        self,
+        chunks: Iterable[KnowledgeChunk],
+        *,
+        batch_size: int = DEFAULT_BULK_BATCH_SIZE,
+    ) -> UploadStats:
+        """
+        Stream a large number of embedded chunks into the store.
+
+        The default implementation calls add_chunks() once per batch, in
+        order. Backends override it with concurrent or size-capped uploads.
+
+        Args:
+            chunks: Embedded chunks; consumed lazily, so a generator over a
+                corpus is never materialized.
+            batch_size: Chunks per add_chunks() call.
+
+        Returns:
+            Chunks written, batches sent and throughput.
+
+        Example:
+            >>> stats = store.bulk_load(iter_embedded_chunks(corpus))
+            >>> print(f"{stats.points_per_second:.0f} chunks/s")
+        """
+        return upload_batches(iter_batches(chunks, batch_size), self.add_chunks)
+
+    def delete_chunks(self, chunk_ids: list[str]) -> int:
+        """
+        Delete chunks by id.
+
+        Used by incremental re-ingestion to drop chunks that vanished from
+        a revised document. Implementations increment generation after
+        deleting.
+
+        Args:
+            chunk_ids: Ids of chunks to delete. Unknown ids are ignored.
+
+        Returns:
+            Number of ids submitted for deletion.
+
+        Raises:
+            NotImplementedError: When the backend does not support deletes.
+        """
+        msg = f"{type(self).__name__} does not support deleting chunks"
+        raise NotImplementedError(msg)
+
     @abstractmethod
     def search(
         self,
@@ -75,6 +147,7 @@ class BaseStore(ABC):
         n_results: int = 10,
         filter_dict: dict[str, Any] | None = None,
         score_threshold: float = 0.0,
+        query_text: str | None = None,
     ) -> list[dict[str, Any]]:
         """
         Search for similar chunks using vector similarity.
@@ -89,6 +162,9 @@ class BaseStore(ABC):
                 Example: {"chunk_type": "requirement", "normative": True}
             score_threshold: Minimum similarity score (0-1) for results.
                 Results below this threshold are excluded.
+            query_text: Optional raw query text. Backends with native
+                hybrid retrieval use it for a keyword (sparse) leg;
+                others ignore it.
 
         Returns:
             List of matching chunks as dictionaries with:
@@ -111,6 +187,48 @@ class BaseStore(ABC):
             ...     print(f"{r['score']:.2f}: {r['content'][:50]}...")
         """
 
+    def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        filter_dict: dict[str, Any] | None = None,
+        score_threshold: float = 0.0,
+        query_texts: list[str] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Search for several query embeddings at once.
+
+        The default implementation calls search() once per query.
+        Backends with a native multi-query API override it to answer all
+        queries in a single round-trip.
+
+        Args:
+            query_embeddings: Dense query vectors.
+            n_results: Maximum results per query.
+            filter_dict: Metadata filters applied to every query.
+            score_threshold: Minimum similarity score (0-1).
+            query_texts: Optional raw texts aligned with query_embeddings,
+                used by backends with native hybrid retrieval.
+
+        Returns:
+            One result list per query embedding, in input order, each
+            formatted like search().
+
+        Example:
+            >>> vectors = await embedder.embed_batch(["SRR", "PDR"])
+            >>> srr_results, pdr_results = store.search_batch(vectors)
+        """
+        return [
+            self.search(
+                query_embedding=embedding,
+                n_results=n_results,
+                filter_dict=filter_dict,
+                score_threshold=score_threshold,
+                query_text=query_texts[i] if query_texts is not None else None,
+            )
+            for i, embedding in enumerate(query_embeddings)
+        ]
+
     @abstractmethod
     def get_stats(self) -> dict[str, Any]:
         """
@@ -0,0 +1,151 @@
+# src/knowledge_mcp/store/bulk.py
+"""
+Batched, concurrent uploads for vector store bulk loads.
+
+Stores turn a stream of chunks into batches of backend records and hand
+each batch to a send callable. upload_batches keeps at most parallelism
+batches in flight on a thread pool and pulls the next batch from the
+stream only when a slot frees up, so memory stays bounded by the
+in-flight batches rather than the size of the corpus.
+
+Example:
+    >>> batches = iter_batches((to_point(c) for c in chunks), 256)
+    >>> stats = upload_batches(batches, send_batch, parallelism=4)
+    >>> print(f"{stats.points} points at {stats.points_per_second:.0f}/s")
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from itertools import islice
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+T = TypeVar("T")
+
+
+@dataclass
+class UploadStats:
+    """
+    Outcome of a bulk upload.
+
+    Attributes:
+        points: Records written.
+        batches: Upsert requests sent.
+        elapsed_seconds: Wall time from first request to last response.
+    """
+
+    points: int = 0
+    batches: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def points_per_second(self) -> float:
+        """Upload throughput; 0.0 when nothing was written."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.points / self.elapsed_seconds
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for logs and CLI output."""
+        return {
+            "points": self.points,
+            "batches": self.batches,
+            "elapsed_seconds": round(self.elapsed_seconds, 3),
+            "points_per_second": round(self.points_per_second, 1),
+        }
+
+
+def iter_batches(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    """
+    Group a stream into lists of at most size items.
+
+    Args:
+        items: Any iterable; consumed lazily.
+        size: Maximum batch length.
+
+    Yields:
+        Consecutive batches; only the last may be shorter.
+
+    Raises:
+        ValueError: If size < 1.
+    """
+    if size < 1:
+        msg = "batch size must be at least 1"
+        raise ValueError(msg)
+    iterator = iter(items)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def upload_batches(
+    batches: Iterable[list[T]],
+    send: Callable[[list[T]], object],
+    *,
+    parallelism: int = 1,
+) -> UploadStats:
+    """
+    Send batches with bounded concurrency.
+
+    With parallelism 1 batches are sent in order on the calling thread.
+    Otherwise up to parallelism sends run on a thread pool; the first
+    failure stops new sends and is re-raised once in-flight sends finish.
+
+    Args:
+        batches: Batches to send; consumed lazily.
+        send: Writes one batch (e.g. a single upsert request).
+        parallelism: Maximum sends in flight.
+
+    Returns:
+        Points, batches and elapsed time for the upload.
+
+    Raises:
+        ValueError: If parallelism < 1.
+    """
+    if parallelism < 1:
+        msg = "parallelism must be at least 1"
+        raise ValueError(msg)
+
+    stats = UploadStats()
+    started = time.perf_counter()
+
+    if parallelism == 1:
+        for batch in batches:
+            send(batch)
+            stats.points += len(batch)
+            stats.batches += 1
+        stats.elapsed_seconds = time.perf_counter() - started
+        return stats
+
+    in_flight: dict[Future[object], int] = {}
+    with ThreadPoolExecutor(max_workers=parallelism, thread_name_prefix="store-upload") as pool:
+        try:
+            for batch in batches:
+                if len(in_flight) >= parallelism:
+                    _collect(in_flight, stats, wait(in_flight, return_when=FIRST_COMPLETED).done)
+                in_flight[pool.submit(send, batch)] = len(batch)
+            _collect(in_flight, stats, wait(in_flight).done)
+        except BaseException:
+            for future in in_flight:
+                future.cancel()
+            raise
+
+    stats.elapsed_seconds = time.perf_counter() - started
+    return stats
+
+
+def _collect(
+    in_flight: dict[Future[object], int],
+    stats: UploadStats,
+    done: set[Future[object]],
+) -> None:
+    """Account finished sends, raising the first failure."""
+    for future in done:
+        size = in_flight.pop(future)
+        future.result()
+        stats.points += size
+        stats.batches += 1
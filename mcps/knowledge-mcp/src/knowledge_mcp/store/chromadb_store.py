@@ -17,7 +17,11 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any, Optional
 
+from knowledge_mcp.store.bulk import UploadStats, iter_batches, upload_batches
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from knowledge_mcp.models.chunk import KnowledgeChunk
     from knowledge_mcp.utils.config import KnowledgeConfig
 
@@ -35,6 +39,7 @@ class ChromaDBStore:
         config: Knowledge MCP configuration.
         client: ChromaDB PersistentClient instance.
         collection: ChromaDB collection.
+        max_batch_size: Largest upsert the client accepts.
 
     Example:
         >>> config = load_config()
@@ -76,6 +81,26 @@ class ChromaDBStore:
             metadata={"hnsw:space": "cosine"},
         )
         self._collection_name = collection_name
+        self._generation = 0  # Bumped by add_chunks; keys search result caches
+        self.max_batch_size = self._client_max_batch_size() or config.store_upload_batch_size
+
+    def _client_max_batch_size(self) -> int:
+        """Largest upsert the client accepts, or 0 if it does not say."""
+        try:
+            return int(self.client.get_max_batch_size())
+        except AttributeError:
+            # chromadb < 0.5 exposes the limit as a property
+            return int(getattr(self.client, "max_batch_size", 0) or 0)
+
+    @property
+    def generation(self) -> int:
+        """Number of add_chunks calls made through this instance."""
+        return self._generation
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the versioned ChromaDB collection."""
+        return self._collection_name
 
     def add_chunks(self, chunks: list[KnowledgeChunk]) -> int:
         """
@@ -93,42 +118,102 @@ class ChromaDBStore:
         if not chunks:
             return 0
 
-        ids = []
-        embeddings = []
-        documents = []
-        metadatas = []
-
         for chunk in chunks:
             if chunk.embedding is None:
                 msg = f"Chunk {chunk.id} missing embedding"
                 raise ValueError(msg)
 
-            ids.append(chunk.id)
-            embeddings.append(chunk.embedding)
-            documents.append(chunk.content)
-            metadatas.append({
-                "document_id": chunk.document_id,
-                "document_title": chunk.document_title,
-                "document_type": chunk.document_type,
-                "section_title": chunk.section_title,
-                "chunk_type": chunk.chunk_type,
-                "normative": chunk.normative,
-                "clause_number": chunk.clause_number or "",
-                "token_count": chunk.token_count,
-                "content_hash": chunk.content_hash,
-                "embedding_model": chunk.embedding_model,
-                "embedding_dimensions": len(chunk.embedding),
-                "created_at": chunk.created_at,
-            })
-
-        self.collection.upsert(
-            ids=ids,
-            embeddings=embeddings,
-            documents=documents,
-            metadatas=metadatas,
+        return self.bulk_load(chunks).points
+
+    def bulk_load(
+        self,
+        chunks: Iterable[KnowledgeChunk],
+        *,
+        batch_size: int | None = None,
+    ) -> UploadStats:
+        """
+        Stream chunks into the collection in batches Chroma accepts.
+
+        Batches are capped at the client's maximum batch size (larger
+        upserts are rejected) and written one at a time: the embedded
+        SQLite writer serializes them anyway.
+
+        Args:
+            chunks: Embedded chunks, e.g. a generator over a corpus.
+            batch_size: Records per upsert (default and ceiling: the
+                client's maximum batch size).
+
+        Returns:
+            Records, batches and throughput of the load.
+
+        Raises:
+            ValueError: When a chunk is missing its embedding. Batches
+                written before the bad chunk remain written.
+        """
+        batch_size = min(batch_size or self.max_batch_size, self.max_batch_size)
+
+        def send(batch: list[KnowledgeChunk]) -> None:
+            self.collection.upsert(
+                ids=[chunk.id for chunk in batch],
+                embeddings=[chunk.embedding for chunk in batch],
+                documents=[chunk.content for chunk in batch],
+                metadatas=[self._metadata(chunk) for chunk in batch],
+            )
+
+        try:
+            stats = upload_batches(iter_batches(chunks, batch_size), send)
+        finally:
+            self._generation += 1
+
+        logger.info(
+            "Upserted %d records into %s in %d batches (%.0f records/s)",
+            stats.points,
+            self._collection_name,
+            stats.batches,
+            stats.points_per_second,
         )
+        return stats
+
+    @staticmethod
+    def _metadata(chunk: KnowledgeChunk) -> dict[str, Any]:
+        """Build the Chroma metadata record for an embedded chunk."""
+        if chunk.embedding is None:
+            msg = f"Chunk {chunk.id} missing embedding"
+            raise ValueError(msg)
+
+        return {
+            "document_id": chunk.document_id,
+            "document_title": chunk.document_title,
+            "document_type": chunk.document_type,
+            "section_title": chunk.section_title,
+            "chunk_type": chunk.chunk_type,
+            "normative": chunk.normative,
+            "clause_number": chunk.clause_number or "",
+            "token_count": chunk.token_count,
+            "content_hash": chunk.content_hash,
+            "embedding_model": chunk.embedding_model,
+            "embedding_dimensions": len(chunk.embedding),
+            "created_at": chunk.created_at,
+        }
+
+    def delete_chunks(self, chunk_ids: list[str]) -> int:
+        """
+        Delete chunks by id.
+
+        Args:
+            chunk_ids: Ids of chunks to delete. Unknown ids are ignored.
+
+        Returns:
+            Number of ids submitted for deletion.
+        """
+        if not chunk_ids:
+            return 0
 
-        return len(ids)
+        for batch in iter_batches(chunk_ids, self.max_batch_size):
+            self.collection.delete(ids=batch)
+        self._generation += 1
+
+        return len(chunk_ids)
 
     def search(
         self,
@@ -136,6 +221,7 @@ class ChromaDBStore:
         n_results: int = 10,
         filter_dict: Optional[dict[str, Any]] = None,
         score_threshold: float = 0.0,
+        query_text: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """
         Search for similar chunks.
@@ -145,10 +231,42 @@ class ChromaDBStore:
             n_results: Number of results to return.
             filter_dict: Metadata filters.
             score_threshold: Minimum similarity score (0-1).
+            query_text: Ignored; ChromaDB has no native hybrid retrieval.
 
         Returns:
             List of matching chunks with scores and metadata.
         """
+        return self.search_batch(
+            [query_embedding],
+            n_results=n_results,
+            filter_dict=filter_dict,
+            score_threshold=score_threshold,
+        )[0]
+
+    def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        filter_dict: Optional[dict[str, Any]] = None,
+        score_threshold: float = 0.0,
+        query_texts: Optional[list[str]] = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Run several searches in one ChromaDB query call.
+
+        Args:
+            query_embeddings: Dense query vectors.
+            n_results: Number of results per query.
+            filter_dict: Metadata filters applied to every query.
+            score_threshold: Minimum similarity score (0-1).
+            query_texts: Ignored; ChromaDB has no native hybrid retrieval.
+
+        Returns:
+            One result list per query embedding, in input order.
+        """
+        if not query_embeddings:
+            return []
+
         where_filter = None
         if filter_dict:
             # ChromaDB uses $eq for equality
@@ -160,17 +278,19 @@ class ChromaDBStore:
             }
 
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=where_filter,
             include=["documents", "metadatas", "distances"],
         )
 
-        formatted_results = []
-        if results["ids"] and results["ids"][0]:
-            for i, chunk_id in enumerate(results["ids"][0]):
+        batches: list[list[dict[str, Any]]] = []
+        for q in range(len(query_embeddings)):
+            formatted_results = []
+            ids = results["ids"][q] if results["ids"] and q < len(results["ids"]) else []
+            for i, chunk_id in enumerate(ids):
                 # ChromaDB returns distance, convert to similarity score
-                distance = results["distances"][0][i] if results["distances"] else 0
+                distance = results["distances"][q][i] if results["distances"] else 0
                 score = 1 - distance  # Cosine distance to similarity
 
                 if score < score_threshold:
@@ -178,12 +298,13 @@ class ChromaDBStore:
 
                 formatted_results.append({
                     "id": chunk_id,
-                    "content": results["documents"][0][i] if results["documents"] else "",
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
+                    "content": results["documents"][q][i] if results["documents"] else "",
+                    "metadata": results["metadatas"][q][i] if results["metadatas"] else {},
                     "score": score,
                 })
+            batches.append(formatted_results)
 
-        return formatted_results
+        return batches
 
     def get_stats(self) -> dict[str, Any]:
         """
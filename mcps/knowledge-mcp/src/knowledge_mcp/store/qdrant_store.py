@@ -7,38 +7,67 @@ Supports dense vector search, hybrid search, and full-text search.
 
 Features:
     - Dense vector search (OpenAI embeddings)
-    - Sparse vector search (BM25 for hybrid)
+    - Sparse vector search (BM25 for hybrid, IDF applied server-side)
+    - Server-side hybrid fusion (prefetch + RRF in one query)
     - Rich metadata filtering
     - Payload indexing for fast queries
+    - Optional scalar (int8) or binary quantization of dense vectors, with
+      oversampling and full-precision rescoring at query time
 """
 
 from __future__ import annotations
 
+import logging
+import math
 from typing import TYPE_CHECKING, Optional
 
 from qdrant_client import QdrantClient
 from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    Disabled,
     Distance,
     FieldCondition,
     Filter,
+    Fusion,
+    FusionQuery,
     MatchAny,
     MatchValue,
+    Modifier,
     NamedVector,
     OptimizersConfigDiff,
     PayloadSchemaType,
+    PointIdsList,
     PointStruct,
+    Prefetch,
+    QuantizationConfig,
+    QuantizationSearchParams,
+    QueryRequest,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    SearchParams,
     SparseIndexParams,
+    SparseVector,
     SparseVectorParams,
     TextIndexParams,
     TokenizerType,
     VectorParams,
+    VectorParamsDiff,
 )
 
+from knowledge_mcp.store.bulk import UploadStats, iter_batches, upload_batches
+from knowledge_mcp.store.sparse import encode_document, encode_query
+
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from knowledge_mcp.models.chunk import KnowledgeChunk
     from knowledge_mcp.utils.config import KnowledgeConfig
 
+logger = logging.getLogger(__name__)
+
 
 class QdrantStore:
     """
@@ -52,6 +81,7 @@ class QdrantStore:
         client: Qdrant client instance.
         collection: Collection name.
         hybrid_enabled: Whether hybrid search is enabled.
+        quantization: Dense vector quantization (none, scalar or binary).
 
     Example:
         >>> config = load_config()
@@ -81,19 +111,38 @@ class QdrantStore:
         # Use versioned collection name to prevent model mixing (Pitfall #7)
         self.collection = config.versioned_collection_name
         self.hybrid_enabled = config.qdrant_hybrid_search
+        self.quantization = config.qdrant_quantization
+        self._generation = 0  # Bumped by add_chunks; keys search result caches
+
+        # Quantized search: score oversampled candidates on the compressed
+        # vectors, then rescore them with the originals
+        self._search_params: Optional[SearchParams] = None
+        if self.quantization != "none":
+            self._search_params = SearchParams(
+                quantization=QuantizationSearchParams(
+                    rescore=config.qdrant_quantization_rescore,
+                    oversampling=config.qdrant_quantization_oversampling,
+                )
+            )
 
         self._ensure_collection()
 
     def _ensure_collection(self) -> None:
-        """Create collection if it doesn't exist."""
+        """Create collection if it doesn't exist; apply configured quantization."""
         collections = self.client.get_collections().collections
         exists = any(c.name == self.collection for c in collections)
+        quantization_config = self._quantization_config()
+
+        if exists:
+            self._sync_quantization(quantization_config)
 
         if not exists:
             vectors_config = {
                 "dense": VectorParams(
                     size=self.config.embedding_dimensions,
                     distance=Distance.COSINE,
+                    # Quantized vectors stay in RAM; originals are only read to rescore
+                    on_disk=True if quantization_config is not None else None,
                 )
             }
 
@@ -102,6 +151,8 @@ class QdrantStore:
                 sparse_vectors_config = {
                     "sparse": SparseVectorParams(
                         index=SparseIndexParams(on_disk=False),
+                        # Sparse vectors carry BM25 term weights; Qdrant applies IDF
+                        modifier=Modifier.IDF,
                     )
                 }
 
@@ -110,10 +161,81 @@ class QdrantStore:
                 vectors_config=vectors_config,
                 sparse_vectors_config=sparse_vectors_config,
                 optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+                quantization_config=quantization_config,
             )
 
             self._create_payload_indexes()
 
+    def _quantization_config(self) -> Optional[QuantizationConfig]:
+        """
+        Build the dense vector quantization config.
+
+        Returns:
+            Scalar int8 (4x smaller) or binary (32x smaller) quantization
+            kept in RAM, or None when quantization is off.
+        """
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8,
+                    quantile=0.99,  # Clip outliers so int8 buckets cover typical values
+                    always_ram=True,
+                )
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def _sync_quantization(self, desired: Optional[QuantizationConfig]) -> None:
+        """
+        Bring an existing collection's quantization in line with the config.
+
+        Nothing is sent when the collection already matches. Otherwise the
+        quantization is replaced (or disabled for "none") and the original
+        vectors move to disk (or back to RAM); Qdrant rebuilds the
+        quantized copy in the background.
+
+        Args:
+            desired: Quantization config to apply, or None to disable it.
+        """
+        current = self.client.get_collection(self.collection).config.quantization_config
+        if self._quantization_matches(current, desired):
+            return
+
+        logger.info("Setting quantization of %s to %s", self.collection, self.quantization)
+        self.client.update_collection(
+            collection_name=self.collection,
+            vectors_config={"dense": VectorParamsDiff(on_disk=desired is not None)},
+            quantization_config=desired if desired is not None else Disabled.DISABLED,
+        )
+
+    def _quantization_matches(
+        self,
+        current: Optional[QuantizationConfig],
+        desired: Optional[QuantizationConfig],
+    ) -> bool:
+        """
+        Check whether a collection's quantization already matches the config.
+
+        Only the settings this store chooses are compared, so defaults the
+        server fills in do not trigger an update on every start.
+
+        Args:
+            current: Quantization reported by the collection.
+            desired: Quantization built from the config.
+
+        Returns:
+            True if no update is needed.
+        """
+        if desired is None:
+            return current is None
+        actual = getattr(current, self.quantization, None)
+        if actual is None:
+            return False
+        wanted = getattr(desired, self.quantization).model_dump(exclude_none=True)
+        reported = actual.model_dump()
+        return all(reported.get(key) == value for key, value in wanted.items())
+
     def _create_payload_indexes(self) -> None:
         """Create indexes on frequently filtered fields."""
         index_fields = [
@@ -150,10 +272,24 @@ class QdrantStore:
         except UnexpectedResponse:
             pass
 
+    @property
+    def generation(self) -> int:
+        """Number of add_chunks calls made through this instance."""
+        return self._generation
+
+    @property
+    def collection_name(self) -> str:
+        """Name of the versioned Qdrant collection."""
+        return self.collection
+
     def add_chunks(self, chunks: list[KnowledgeChunk]) -> int:
         """
         Add chunks to the collection.
 
+        Batches are upserted concurrently (store_upload_parallelism) and
+        each waits for Qdrant to apply it, so the chunks are searchable
+        when this returns.
+
         Args:
             chunks: List of KnowledgeChunk objects with embeddings.
 
@@ -166,50 +302,136 @@ class QdrantStore:
         if not chunks:
             return 0
 
-        points = []
         for chunk in chunks:
             if chunk.embedding is None:
                 msg = f"Chunk {chunk.id} missing embedding"
                 raise ValueError(msg)
 
-            vectors: dict = {"dense": chunk.embedding}
-
-            point = PointStruct(
-                id=chunk.id,
-                vector=vectors if self.hybrid_enabled else chunk.embedding,
-                payload={
-                    "content": chunk.content,
-                    "document_id": chunk.document_id,
-                    "document_title": chunk.document_title,
-                    "document_type": chunk.document_type,
-                    "section_title": chunk.section_title,
-                    "section_hierarchy": chunk.section_hierarchy,
-                    "chunk_type": chunk.chunk_type,
-                    "normative": chunk.normative,
-                    "clause_number": chunk.clause_number or "",
-                    "page_numbers": chunk.page_numbers,
-                    "references": chunk.references,
-                    "token_count": chunk.token_count,
-                    "content_hash": chunk.content_hash,
-                    "parent_chunk_id": chunk.parent_chunk_id or "",
-                    "created_at": chunk.created_at,
-                    # Embedding model metadata (FR-2.4)
-                    "embedding_model": chunk.embedding_model,
-                    "embedding_dimensions": len(chunk.embedding) if chunk.embedding else 0,
-                },
-            )
-            points.append(point)
+        return self.bulk_load(chunks, wait=True).points
+
+    def bulk_load(
+        self,
+        chunks: Iterable[KnowledgeChunk],
+        *,
+        batch_size: int | None = None,
+        parallelism: int | None = None,
+        wait: bool = False,
+    ) -> UploadStats:
+        """
+        Stream chunks into the collection with concurrent batched upserts.
+
+        Points are built per batch as the stream is consumed, so loading a
+        large corpus never holds more than parallelism batches in memory.
+        With wait=False Qdrant acknowledges each batch once it is queued
+        for indexing (as upload_points does), which is what makes large
+        loads fast. The last batch is then re-sent with wait=True as a
+        barrier: updates are applied in order, so once it returns every
+        point is searchable, and only then is the write generation bumped
+        (otherwise result caches would store pre-load results under the
+        new generation).
+
+        Args:
+            chunks: Embedded chunks, e.g. a generator over a corpus.
+            batch_size: Points per upsert (default: store_upload_batch_size).
+            parallelism: Upserts in flight (default: store_upload_parallelism).
+            wait: Wait for each batch to be applied before acknowledging.
+
+        Returns:
+            Points, batches and throughput of the load.
+
+        Raises:
+            ValueError: When a chunk is missing its embedding. Batches sent
+                before the bad chunk remain written.
+
+        Example:
+            >>> stats = store.bulk_load(iter_embedded_chunks(corpus))
+            >>> print(f"{stats.points_per_second:.0f} points/s")
+        """
+        batch_size = batch_size or self.config.store_upload_batch_size
+        parallelism = parallelism or self.config.store_upload_parallelism
 
-        # Upsert in batches
-        batch_size = 100
-        for i in range(0, len(points), batch_size):
-            batch = points[i : i + batch_size]
-            self.client.upsert(
+        last_batch: list[PointStruct] = []
+
+        def send(batch: list[PointStruct]) -> None:
+            self.client.upsert(collection_name=self.collection, points=batch, wait=wait)
+            last_batch[:] = batch
+
+        points = (self._to_point(chunk) for chunk in chunks)
+        try:
+            stats = upload_batches(iter_batches(points, batch_size), send, parallelism=parallelism)
+            if not wait and last_batch:
+                # Idempotent re-upsert that returns once all queued batches are applied
+                self.client.upsert(collection_name=self.collection, points=last_batch, wait=True)
+        finally:
+            self._generation += 1
+
+        logger.info(
+            "Upserted %d points into %s in %d batches (%.0f points/s)",
+            stats.points,
+            self.collection,
+            stats.batches,
+            stats.points_per_second,
+        )
+        return stats
+
+    def _to_point(self, chunk: KnowledgeChunk) -> PointStruct:
+        """Build the Qdrant point (dense, optional sparse, payload) for a chunk."""
+        if chunk.embedding is None:
+            msg = f"Chunk {chunk.id} missing embedding"
+            raise ValueError(msg)
+
+        vectors: dict = {"dense": chunk.embedding}
+        if self.hybrid_enabled:
+            indices, values = encode_document(chunk.content)
+            vectors["sparse"] = SparseVector(indices=indices, values=values)
+
+        return PointStruct(
+            id=chunk.id,
+            vector=vectors if self.hybrid_enabled else chunk.embedding,
+            payload={
+                "content": chunk.content,
+                "document_id": chunk.document_id,
+                "document_title": chunk.document_title,
+                "document_type": chunk.document_type,
+                "section_title": chunk.section_title,
+                "section_hierarchy": chunk.section_hierarchy,
+                "chunk_type": chunk.chunk_type,
+                "normative": chunk.normative,
+                "clause_number": chunk.clause_number or "",
+                "page_numbers": chunk.page_numbers,
+                "references": chunk.references,
+                "token_count": chunk.token_count,
+                "content_hash": chunk.content_hash,
+                "parent_chunk_id": chunk.parent_chunk_id or "",
+                "created_at": chunk.created_at,
+                # Embedding model metadata (FR-2.4)
+                "embedding_model": chunk.embedding_model,
+                "embedding_dimensions": len(chunk.embedding) if chunk.embedding else 0,
+            },
+        )
+
+    def delete_chunks(self, chunk_ids: list[str]) -> int:
+        """
+        Delete chunks by id.
+
+        Args:
+            chunk_ids: Ids of chunks to delete. Unknown ids are ignored.
+
+        Returns:
+            Number of ids submitted for deletion.
+        """
+        if not chunk_ids:
+            return 0
+
+        batch_size = 1000
+        for i in range(0, len(chunk_ids), batch_size):
+            self.client.delete(
                 collection_name=self.collection,
-                points=batch,
+                points_selector=PointIdsList(points=chunk_ids[i : i + batch_size]),
             )
+        self._generation += 1
 
-        return len(points)
+        return len(chunk_ids)
 
     def search(
         self,
@@ -217,15 +439,23 @@ class QdrantStore:
         n_results: int = 10,
         filter_dict: Optional[dict[str, object]] = None,
         score_threshold: float = 0.0,
+        query_text: Optional[str] = None,
     ) -> list[dict]:
         """
         Search for similar chunks.
 
+        When hybrid search is enabled and query_text is given, dense and
+        sparse (BM25) candidates are fetched and fused with RRF by Qdrant
+        in a single query. Fusion only decides the order: every hit is
+        scored with its dense cosine similarity, like a plain search.
+
         Args:
             query_embedding: Dense vector embedding of the query.
             n_results: Number of results to return.
             filter_dict: Metadata filters (e.g., {"chunk_type": "requirement"}).
-            score_threshold: Minimum similarity score (0-1).
+            score_threshold: Minimum similarity score (0-1). For hybrid
+                queries it also drops keyword-only hits below it.
+            query_text: Raw query text for the sparse leg of hybrid search.
 
         Returns:
             List of matching chunks with scores and metadata.
@@ -237,18 +467,17 @@ class QdrantStore:
             ...     filter_dict={"chunk_type": "requirement"},
             ... )
         """
-        query_filter = None
-        if filter_dict:
-            conditions = []
-            for key, value in filter_dict.items():
-                if isinstance(value, bool):
-                    conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-                elif isinstance(value, list):
-                    conditions.append(FieldCondition(key=key, match=MatchAny(any=value)))
-                else:
-                    conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
-            query_filter = Filter(must=conditions)
+        query_filter = self._build_filter(filter_dict)
 
+        if self.hybrid_enabled and query_text:
+            points = self._hybrid_query(
+                query_embedding,
+                query_text,
+                n_results=n_results,
+                query_filter=query_filter,
+                score_threshold=score_threshold,
+            )
+            return self._format_fused_results(points, query_embedding, score_threshold)
         if self.hybrid_enabled:
             results = self.client.search(
                 collection_name=self.collection,
@@ -257,6 +486,7 @@ class QdrantStore:
                 query_filter=query_filter,
                 score_threshold=score_threshold,
                 with_payload=True,
+                search_params=self._search_params,
             )
         else:
             results = self.client.search(
@@ -266,8 +496,134 @@ class QdrantStore:
                 query_filter=query_filter,
                 score_threshold=score_threshold,
                 with_payload=True,
+                search_params=self._search_params,
             )
 
+        return self._format_results(results)
+
+    def search_batch(
+        self,
+        query_embeddings: list[list[float]],
+        n_results: int = 10,
+        filter_dict: Optional[dict[str, object]] = None,
+        score_threshold: float = 0.0,
+        query_texts: Optional[list[str]] = None,
+    ) -> list[list[dict]]:
+        """
+        Run several searches in one Qdrant request.
+
+        All queries share the filter, limit and threshold and are sent as a
+        single query_batch_points call, so N lookups cost one round-trip.
+        Hybrid (prefetch + RRF) requests are used per query when hybrid
+        search is enabled and query_texts is given; their hits are scored
+        as in search().
+
+        Args:
+            query_embeddings: Dense query vectors.
+            n_results: Number of results per query.
+            filter_dict: Metadata filters applied to every query.
+            score_threshold: Minimum similarity score (0-1).
+            query_texts: Raw query texts, aligned with query_embeddings,
+                for the sparse leg of hybrid search.
+
+        Returns:
+            One result list per query embedding, in input order, each
+            formatted like search().
+
+        Raises:
+            ValueError: If query_texts does not align with query_embeddings.
+
+        Example:
+            >>> vectors = await embedder.embed_batch(["SRR", "PDR"])
+            >>> srr_results, pdr_results = store.search_batch(vectors, n_results=5)
+        """
+        if not query_embeddings:
+            return []
+        if query_texts is not None and len(query_texts) != len(query_embeddings):
+            msg = "query_texts must have one entry per query embedding"
+            raise ValueError(msg)
+
+        query_filter = self._build_filter(filter_dict)
+        requests: list[QueryRequest] = []
+        fused: list[bool] = []
+        for i, embedding in enumerate(query_embeddings):
+            query_text = query_texts[i] if query_texts is not None else None
+            fused.append(bool(self.hybrid_enabled and query_text))
+            if fused[-1]:
+                requests.append(
+                    QueryRequest(
+                        prefetch=self._hybrid_prefetch(
+                            embedding,
+                            query_text,
+                            n_results,
+                            query_filter,
+                            score_threshold,
+                            params=self._search_params,
+                        ),
+                        query=FusionQuery(fusion=Fusion.RRF),
+                        limit=n_results,
+                        with_payload=True,
+                        with_vector=["dense"],
+                    )
+                )
+            else:
+                requests.append(
+                    QueryRequest(
+                        query=embedding,
+                        using="dense" if self.hybrid_enabled else None,
+                        filter=query_filter,
+                        score_threshold=score_threshold or None,
+                        limit=n_results,
+                        with_payload=True,
+                        params=self._search_params,
+                    )
+                )
+
+        responses = self.client.query_batch_points(
+            collection_name=self.collection,
+            requests=requests,
+        )
+        return [
+            self._format_fused_results(response.points, embedding, score_threshold)
+            if is_fused
+            else self._format_results(response.points)
+            for response, embedding, is_fused in zip(responses, query_embeddings, fused)
+        ]
+
+    @staticmethod
+    def _build_filter(filter_dict: Optional[dict[str, object]]) -> Optional[Filter]:
+        """
+        Convert a metadata filter dict to a Qdrant filter.
+
+        Args:
+            filter_dict: Field/value conditions; list values match any.
+
+        Returns:
+            Filter requiring every condition, or None if no filters.
+        """
+        if not filter_dict:
+            return None
+        conditions = []
+        for key, value in filter_dict.items():
+            if isinstance(value, bool):
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
+            elif isinstance(value, list):
+                conditions.append(FieldCondition(key=key, match=MatchAny(any=value)))
+            else:
+                conditions.append(FieldCondition(key=key, match=MatchValue(value=value)))
+        return Filter(must=conditions)
+
+    @staticmethod
+    def _format_results(results: list) -> list[dict]:
+        """
+        Convert scored points to the store's result dict format.
+
+        Args:
+            results: Scored points returned by Qdrant.
+
+        Returns:
+            Result dicts with id, content, metadata and score.
+        """
         return [
             {
                 "id": str(r.id),
@@ -289,6 +645,132 @@ class QdrantStore:
             for r in results
         ]
 
+    @classmethod
+    def _format_fused_results(
+        cls,
+        points: list,
+        query_embedding: list[float],
+        score_threshold: float,
+    ) -> list[dict]:
+        """
+        Format RRF-ordered hits with their dense cosine similarity as score.
+
+        RRF scores depend only on ranks (at most about 0.03), while callers
+        compare scores against similarity thresholds, so each hit is scored
+        against its returned dense vector instead. Fused order is kept.
+
+        Args:
+            points: Fused points returned with their dense vectors.
+            query_embedding: Dense vector embedding of the query.
+            score_threshold: Minimum similarity; hits below it are dropped.
+
+        Returns:
+            Result dicts formatted like _format_results.
+        """
+        query_norm = math.sqrt(math.fsum(x * x for x in query_embedding))
+        results = []
+        for point, result in zip(points, cls._format_results(points)):
+            vector = point.vector.get("dense") if isinstance(point.vector, dict) else None
+            vector_norm = math.sqrt(math.fsum(x * x for x in vector)) if vector else 0.0
+            if not vector_norm or not query_norm:
+                score = 0.0
+            else:
+                dot = math.fsum(a * b for a, b in zip(query_embedding, vector))
+                score = dot / (query_norm * vector_norm)
+            if score < score_threshold:
+                continue
+            result["score"] = score
+            results.append(result)
+        return results
+
+    def _hybrid_query(
+        self,
+        query_embedding: list[float],
+        query_text: str,
+        n_results: int,
+        query_filter: Optional[Filter],
+        score_threshold: float,
+    ) -> list:
+        """
+        Run a server-side fused dense + sparse query.
+
+        Each leg prefetches 2x n_results candidates (matching HybridSearcher)
+        and Qdrant merges them with Reciprocal Rank Fusion.
+
+        Args:
+            query_embedding: Dense vector embedding of the query.
+            query_text: Raw query text encoded as a sparse vector.
+            n_results: Number of fused results to return.
+            query_filter: Qdrant filter applied to both legs.
+            score_threshold: Minimum dense similarity for dense candidates.
+
+        Returns:
+            Points ordered by fused RRF score, with their dense vectors.
+        """
+        response = self.client.query_points(
+            collection_name=self.collection,
+            prefetch=self._hybrid_prefetch(
+                query_embedding,
+                query_text,
+                n_results,
+                query_filter,
+                score_threshold,
+                params=self._search_params,
+            ),
+            query=FusionQuery(fusion=Fusion.RRF),
+            limit=n_results,
+            with_payload=True,
+            with_vectors=["dense"],
+        )
+        return response.points
+
+    @staticmethod
+    def _hybrid_prefetch(
+        query_embedding: list[float],
+        query_text: str,
+        n_results: int,
+        query_filter: Optional[Filter],
+        score_threshold: float,
+        params: Optional[SearchParams] = None,
+    ) -> list[Prefetch]:
+        """
+        Build the dense and sparse prefetch legs for a fused query.
+
+        Args:
+            query_embedding: Dense vector embedding of the query.
+            query_text: Raw query text encoded as a sparse vector.
+            n_results: Number of fused results wanted.
+            query_filter: Qdrant filter applied to both legs.
+            score_threshold: Minimum dense similarity for dense candidates.
+            params: Search params for the dense leg (quantized search).
+
+        Returns:
+            Dense prefetch, plus a sparse one if the text has any tokens.
+        """
+        prefetch_limit = n_results * 2
+        prefetch = [
+            Prefetch(
+                query=query_embedding,
+                using="dense",
+                limit=prefetch_limit,
+                filter=query_filter,
+                score_threshold=score_threshold or None,
+                params=params,
+            )
+        ]
+
+        indices, values = encode_query(query_text)
+        if indices:
+            prefetch.append(
+                Prefetch(
+                    query=SparseVector(indices=indices, values=values),
+                    using="sparse",
+                    limit=prefetch_limit,
+                    filter=query_filter,
+                )
+            )
+        return prefetch
+
     def get_stats(self) -> dict:
         """
         Get collection statistics.
@@ -306,6 +788,7 @@ class QdrantStore:
             "config": {
                 "vector_size": self.config.embedding_dimensions,
                 "hybrid_enabled": self.hybrid_enabled,
+                "quantization": self.quantization,
             },
         }
 
@@ -321,10 +804,6 @@ class QdrantStore:
         Raises:
             ValueError: If collection has data with different embedding model.
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         try:
             # Sample one point to check metadata
             results = self.client.scroll(
@@ -355,10 +834,6 @@ class QdrantStore:
         Returns:
             True if the store is accessible, False otherwise.
         """
-        import logging
-
-        logger = logging.getLogger(__name__)
-
         try:
             # Try to get collection info to verify connectivity
             self.client.get_collection(self.collection)
@@ -0,0 +1,118 @@
+# src/knowledge_mcp/store/sparse.py
+"""
+BM25-style sparse vector encoding for native store-side hybrid search.
+
+Documents are encoded as saturated term frequencies and queries as binary
+term presence, keyed by a stable 32-bit hash of each token. The IDF part
+of BM25 is applied by the vector store (Qdrant ``Modifier.IDF``), so no
+corpus statistics have to be held in process.
+
+Example:
+    >>> from knowledge_mcp.store.sparse import encode_document, encode_query
+    >>>
+    >>> indices, values = encode_document("The system shall verify requirements")
+    >>> q_indices, q_values = encode_query("verify requirements")
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import Counter
+
+# BM25 term-frequency saturation parameters
+DEFAULT_K1 = 1.2
+DEFAULT_B = 0.75
+# Typical chunk length in word tokens (chunks target 200-800 model tokens)
+DEFAULT_AVG_LEN = 256.0
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        List of lowercase alphanumeric tokens (punctuation dropped).
+    """
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def token_index(token: str) -> int:
+    """
+    Map a token to a stable sparse vector dimension.
+
+    Uses CRC32, which is deterministic across processes (unlike ``hash()``)
+    and fits Qdrant's unsigned 32-bit sparse indices.
+
+    Args:
+        token: Lowercase token.
+
+    Returns:
+        Sparse dimension index in [0, 2**32).
+    """
+    return zlib.crc32(token.encode("utf-8"))
+
+
+def encode_document(
+    text: str,
+    *,
+    k1: float = DEFAULT_K1,
+    b: float = DEFAULT_B,
+    avg_len: float = DEFAULT_AVG_LEN,
+) -> tuple[list[int], list[float]]:
+    """
+    Encode document text as a BM25 term-frequency sparse vector.
+
+    Each dimension holds ``tf * (k1 + 1) / (tf + k1 * (1 - b + b * len / avg_len))``.
+    Multiplied by a store-side IDF this yields the BM25 score of a query.
+
+    Args:
+        text: Document (chunk) text.
+        k1: Term frequency saturation.
+        b: Document length normalization strength.
+        avg_len: Assumed average document length in tokens.
+
+    Returns:
+        Tuple of (indices, values). Empty lists if text has no tokens.
+
+    Example:
+        >>> indices, values = encode_document("requirements review requirements")
+        >>> len(indices)
+        2
+    """
+    tokens = tokenize(text)
+    if not tokens:
+        return [], []
+
+    norm = k1 * (1 - b + b * len(tokens) / avg_len)
+    weights: dict[int, float] = {}
+    for token, tf in Counter(tokens).items():
+        idx = token_index(token)
+        # Hash collisions merge into one dimension
+        weights[idx] = weights.get(idx, 0.0) + tf * (k1 + 1) / (tf + norm)
+
+    indices = sorted(weights)
+    return indices, [weights[i] for i in indices]
+
+
+def encode_query(text: str) -> tuple[list[int], list[float]]:
+    """
+    Encode query text as a binary sparse vector.
+
+    Args:
+        text: Query text.
+
+    Returns:
+        Tuple of (indices, values) with a weight of 1.0 per unique token.
+
+    Example:
+        >>> encode_query("system requirements system")[1]
+        [1.0, 1.0]
+    """
+    indices = sorted({token_index(token) for token in tokenize(text)})
+    return indices, [1.0] * len(indices)
@@ -1,13 +1,19 @@
 """MCP tool implementations for Knowledge MCP."""
 
-from knowledge_mcp.tools.acquisition import (
-    handle_acquire,
-    handle_assess,
-    handle_ingest,
-    handle_preflight,
-    handle_request,
-    handle_sources,
-)
+from typing import TYPE_CHECKING
+
+from knowledge_mcp.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from knowledge_mcp.tools.acquisition import (
+        handle_acquire,
+        handle_acquire_many,
+        handle_assess,
+        handle_ingest,
+        handle_preflight,
+        handle_request,
+        handle_sources,
+    )
 
 __all__ = [
     "handle_ingest",
@@ -15,5 +21,20 @@ __all__ = [
     "handle_assess",
     "handle_preflight",
     "handle_acquire",
+    "handle_acquire_many",
     "handle_request",
 ]
+
+# Imported on first access so SQLAlchemy, crawl4ai and the searchers load only when a tool is called
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "handle_acquire": "knowledge_mcp.tools.acquisition",
+        "handle_acquire_many": "knowledge_mcp.tools.acquisition",
+        "handle_assess": "knowledge_mcp.tools.acquisition",
+        "handle_ingest": "knowledge_mcp.tools.acquisition",
+        "handle_preflight": "knowledge_mcp.tools.acquisition",
+        "handle_request": "knowledge_mcp.tools.acquisition",
+        "handle_sources": "knowledge_mcp.tools.acquisition",
+    },
+)
@@ -5,7 +5,7 @@ Implements handlers for:
 - knowledge_sources: List/filter knowledge sources
 - knowledge_assess: Assess coverage gaps
 - knowledge_preflight: Check URL accessibility
-- knowledge_acquire: Acquire web content
+- knowledge_acquire: Acquire web content (one URL or a list)
 - knowledge_request: Create acquisition request
 
 All handlers are async and return dict suitable for JSON serialization.
@@ -18,12 +18,13 @@ from typing import TYPE_CHECKING, Any
 
 from knowledge_mcp.db.models import AuthorityTier, SourceStatus, SourceType
 from knowledge_mcp.db.repositories import AcquisitionRequestRepository, SourceRepository
-from knowledge_mcp.ingest import WebIngestor, check_url_accessible
-from knowledge_mcp.search import CoverageAssessor, SemanticSearcher
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from knowledge_mcp.ingest.web_ingestor import WebIngestor
+    from knowledge_mcp.search.semantic_search import SemanticSearcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -86,6 +87,8 @@ async def handle_ingest(  # noqa: PLR0911
         if st == SourceType.WEB:
             await repo.update_status(source.id, SourceStatus.INGESTING)
 
+            from knowledge_mcp.ingest.web_ingestor import WebIngestor
+
             ingestor = WebIngestor()
             result = await ingestor.ingest(url)
 
@@ -220,9 +223,10 @@ async def handle_assess(
         Dict with coverage report.
     """
     try:
-        from knowledge_mcp.search.coverage import CoverageConfig
+        from knowledge_mcp.search.coverage import CoverageAssessor, CoverageConfig
 
-        config = CoverageConfig(similarity_threshold=threshold)
+        # All areas share one embedding request and one store round-trip
+        config = CoverageConfig(similarity_threshold=threshold, batch_search=True)
         assessor = CoverageAssessor(searcher, config)
         report = await assessor.assess(areas)
 
@@ -249,6 +253,8 @@ async def handle_preflight(
         Dict with accessibility status.
     """
     try:
+        from knowledge_mcp.ingest.web_ingestor import check_url_accessible
+
         # Note: check_url_accessible is sync, so we call it directly
         # It only does basic URL validation, not actual network checks
         accessible, error = check_url_accessible(url)
@@ -287,6 +293,8 @@ async def handle_acquire(
         Dict with acquisition result.
     """
     try:
+        from knowledge_mcp.ingest.web_ingestor import check_url_accessible
+
         # Preflight check first
         accessible, error = check_url_accessible(url)
         if not accessible:
@@ -329,6 +337,103 @@ async def handle_acquire(
         return {"error": str(e), "isError": True, "acquired": False}
 
 
+async def handle_acquire_many(
+    session: AsyncSession,
+    urls: list[str],
+    authority_tier: str = "tier3",
+    reason: str | None = None,
+    ingestor: WebIngestor | None = None,
+) -> dict[str, Any]:
+    """Handle knowledge_acquire for a list of URLs.
+
+    Runs preflight on every URL, creates source records, then crawls all
+    new sources concurrently with one shared crawler (per-host politeness
+    and robots.txt via WebIngestor), recording each result as it finishes.
+
+    Args:
+        session: Database session.
+        urls: URLs to acquire.
+        authority_tier: Authority level for every source.
+        reason: Why this content is needed.
+        ingestor: Web ingestor to crawl with (default: WebIngestor()).
+
+    Returns:
+        Dict with per-URL results (in input order) and acquired/failed counts.
+    """
+    try:
+        from knowledge_mcp.ingest.web_ingestor import WebIngestor, check_url_accessible
+
+        try:
+            at = AuthorityTier(authority_tier)
+        except ValueError:
+            return {"error": f"Invalid authority_tier: {authority_tier}", "isError": True}
+
+        repo = SourceRepository(session)
+        results: dict[str, dict[str, Any]] = {}
+        source_ids: dict[str, int] = {}
+
+        for url in dict.fromkeys(urls):
+            accessible, error = check_url_accessible(url)
+            if not accessible:
+                results[url] = {"url": url, "acquired": False, "error": f"Preflight failed: {error}"}
+                continue
+
+            existing = await repo.get_by_url(url)
+            if existing:
+                results[url] = {
+                    "url": url,
+                    "acquired": False,
+                    "source_id": existing.id,
+                    "status": existing.status.value,
+                    "already_exists": True,
+                }
+                continue
+
+            source = await repo.create(
+                url=url,
+                title=url,
+                source_type=SourceType.WEB,
+                authority_tier=at.value,
+            )
+            await repo.update_status(source.id, SourceStatus.INGESTING)
+            source_ids[url] = source.id
+
+        ingestor = ingestor or WebIngestor()
+        async for result in ingestor.iter_ingest(list(source_ids)):
+            source_id = source_ids[result.url]
+            if result.success:
+                await repo.update_status(source_id, SourceStatus.COMPLETE)
+                results[result.url] = {
+                    "url": result.url,
+                    "acquired": True,
+                    "source_id": source_id,
+                    "title": result.title,
+                    "word_count": result.word_count,
+                    "reason": reason,
+                }
+            else:
+                await repo.update_status(source_id, SourceStatus.FAILED)
+                results[result.url] = {
+                    "url": result.url,
+                    "acquired": False,
+                    "source_id": source_id,
+                    "error": result.error,
+                }
+
+        ordered = [results[url] for url in dict.fromkeys(urls)]
+        acquired = sum(1 for r in ordered if r["acquired"])
+        return {
+            "results": ordered,
+            "acquired": acquired,
+            "failed": sum(1 for r in ordered if not r["acquired"] and not r.get("already_exists")),
+            "total": len(ordered),
+        }
+
+    except Exception as e:
+        logger.exception("Acquire error: %s", e)
+        return {"error": str(e), "isError": True, "acquired": 0}
+
+
 async def handle_request(
     session: AsyncSession,
     url: str,
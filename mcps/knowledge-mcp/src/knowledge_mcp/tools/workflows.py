@@ -51,7 +51,7 @@ async def handle_rcca(
     """
     try:
         strategy = RCCAStrategy()
-        workflow = WorkflowSearcher(searcher, strategy)
+        workflow = WorkflowSearcher(searcher, strategy, fan_out=True)
 
         results = await workflow.search(
             query=query,
@@ -99,7 +99,7 @@ async def handle_trade(
     """
     try:
         strategy = TradeStudyStrategy()
-        workflow = WorkflowSearcher(searcher, strategy)
+        workflow = WorkflowSearcher(searcher, strategy, fan_out=True)
 
         params: dict[str, Any] = {}
         if alternatives:
@@ -153,7 +153,7 @@ async def handle_explore(
     """
     try:
         strategy = ExploreStrategy()
-        workflow = WorkflowSearcher(searcher, strategy)
+        workflow = WorkflowSearcher(searcher, strategy, fan_out=True)
 
         params: dict[str, Any] = {}
         if facets:
@@ -205,7 +205,7 @@ async def handle_plan(
     """
     try:
         strategy = PlanStrategy()
-        workflow = WorkflowSearcher(searcher, strategy)
+        workflow = WorkflowSearcher(searcher, strategy, fan_out=True)
 
         params: dict[str, Any] = {}
         if categories:
@@ -12,11 +12,23 @@ Example:
 
 from __future__ import annotations
 
-from knowledge_mcp.utils.config import KnowledgeConfig, load_config
-from knowledge_mcp.utils.hashing import compute_content_hash
-from knowledge_mcp.utils.logging import get_logger, setup_logging
-from knowledge_mcp.utils.normative import NormativeIndicator, detect_normative
-from knowledge_mcp.utils.tokenizer import TokenizerConfig, count_tokens, truncate_to_tokens
+from typing import TYPE_CHECKING
+
+from knowledge_mcp.utils.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from knowledge_mcp.utils.config import KnowledgeConfig, load_config
+    from knowledge_mcp.utils.hashing import compute_content_hash
+    from knowledge_mcp.utils.logging import get_logger, setup_logging
+    from knowledge_mcp.utils.normative import NormativeIndicator, detect_normative
+    from knowledge_mcp.utils.tokenizer import (
+        TokenizerConfig,
+        count_tokens,
+        encode_batch,
+        get_encoding,
+        token_offsets,
+        truncate_to_tokens,
+    )
 
 __all__: list[str] = [
     "KnowledgeConfig",
@@ -28,5 +40,28 @@ __all__: list[str] = [
     "detect_normative",
     "TokenizerConfig",
     "count_tokens",
+    "encode_batch",
+    "get_encoding",
+    "token_offsets",
     "truncate_to_tokens",
 ]
+
+# Imported on first access so tiktoken loads only when tokens are counted
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "KnowledgeConfig": "knowledge_mcp.utils.config",
+        "load_config": "knowledge_mcp.utils.config",
+        "setup_logging": "knowledge_mcp.utils.logging",
+        "get_logger": "knowledge_mcp.utils.logging",
+        "compute_content_hash": "knowledge_mcp.utils.hashing",
+        "NormativeIndicator": "knowledge_mcp.utils.normative",
+        "detect_normative": "knowledge_mcp.utils.normative",
+        "TokenizerConfig": "knowledge_mcp.utils.tokenizer",
+        "count_tokens": "knowledge_mcp.utils.tokenizer",
+        "encode_batch": "knowledge_mcp.utils.tokenizer",
+        "get_encoding": "knowledge_mcp.utils.tokenizer",
+        "token_offsets": "knowledge_mcp.utils.tokenizer",
+        "truncate_to_tokens": "knowledge_mcp.utils.tokenizer",
+    },
+)
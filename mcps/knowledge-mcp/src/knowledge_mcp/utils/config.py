@@ -19,6 +19,14 @@ from typing import Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+# Full output size of OpenAI embedding models; text-embedding-3 models are
+# Matryoshka-trained and can return fewer dimensions
+OPENAI_MODEL_DIMENSIONS: dict[str, int] = {
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+}
+
 
 class KnowledgeConfig(BaseModel):
     """
@@ -31,19 +39,42 @@ class KnowledgeConfig(BaseModel):
         openai_api_key: OpenAI API key for embeddings.
         embedding_model: OpenAI embedding model name.
         embedding_dimensions: Vector dimensions for embeddings.
+        embedding_max_concurrency: Concurrent OpenAI batch requests.
+        embedding_requests_per_minute: OpenAI request budget (0 = unlimited).
+        embedding_tokens_per_minute: OpenAI token budget (0 = unlimited).
+        local_embedding_batch_window_ms: Micro-batch window for local embeds (0 disables).
+        local_embedding_max_batch_size: Queued local embeds that trigger an encode.
+        local_embedding_threads: Intra-op threads for local embeds (0 = default).
+        local_backend: Runtime for local models (torch or onnx).
+        local_onnx_file_name: ONNX file inside the local model directory.
         vector_store: Vector store backend (qdrant or chromadb).
         qdrant_url: Qdrant Cloud cluster URL.
         qdrant_api_key: Qdrant Cloud API key.
         qdrant_collection: Collection name in Qdrant.
         qdrant_hybrid_search: Enable hybrid search.
+        qdrant_quantization: Dense vector quantization (none, scalar or binary).
+        qdrant_quantization_oversampling: Candidate multiplier for quantized search.
+        qdrant_quantization_rescore: Rescore quantized candidates with full vectors.
         chromadb_path: Path to local ChromaDB storage.
         chromadb_collection: Collection name in ChromaDB.
+        bm25_index_dir: Directory for persisted BM25 keyword indexes.
+        store_max_concurrency: Maximum concurrent vector store calls.
+        store_upload_batch_size: Points per upsert request in bulk loads.
+        store_upload_parallelism: Upsert requests in flight during bulk loads.
         cache_dir: Directory for embedding cache storage.
         cache_enabled: Enable embedding cache.
         cache_size_limit: Cache size limit in bytes.
+        cache_memory_size_limit: In-memory LRU cache tier size in bytes.
+        cache_dtype: On-disk precision of cached vectors (float32/float16/int8).
+        search_cache_max_bytes: Search result cache size in bytes (0 disables).
+        search_cache_ttl_seconds: Seconds a cached search result stays valid;
+            bounds staleness after ingests from another process (must be > 0).
+        ingest_checkpoint_file: Completed-document record for resumable ingests.
+        ingest_manifest_dir: Per-document chunk manifests for incremental re-ingests.
         token_log_file: Token usage log file path.
         token_tracking_enabled: Enable token usage tracking.
         daily_token_warning_threshold: Daily token warning threshold.
+        latency_metrics_enabled: Record per-stage search latency spans.
         chunk_size_min: Minimum chunk size in tokens.
         chunk_size_max: Maximum chunk size in tokens.
         chunk_overlap: Overlap between chunks in tokens.
@@ -66,6 +97,22 @@ class KnowledgeConfig(BaseModel):
         le=3072,
         description="Vector dimensions",
     )
+    embedding_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum concurrent embedding batch requests",
+    )
+    embedding_requests_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Embedding API requests per minute budget (0 = unlimited)",
+    )
+    embedding_tokens_per_minute: int = Field(
+        default=0,
+        ge=0,
+        description="Embedding API tokens per minute budget (0 = unlimited)",
+    )
 
     # Embedding Provider Selection
     embedding_provider: Literal["openai", "local"] = Field(
@@ -76,6 +123,30 @@ class KnowledgeConfig(BaseModel):
         default="all-MiniLM-L6-v2",
         description="Local embedding model (sentence-transformers)",
     )
+    local_embedding_batch_window_ms: float = Field(
+        default=2.0,
+        ge=0.0,
+        description="Milliseconds concurrent local embeds wait to share a batch (0 disables)",
+    )
+    local_embedding_max_batch_size: int = Field(
+        default=32,
+        ge=1,
+        description="Queued local embeds that trigger an encode without waiting",
+    )
+    local_embedding_threads: int = Field(
+        default=0,
+        ge=0,
+        description="Intra-op threads for local embeddings (0 = runtime default)",
+    )
+    local_backend: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description="Runtime for local embedder/reranker models: torch or onnx (CPU)",
+    )
+    local_onnx_file_name: str = Field(
+        default="",
+        description="ONNX file in the model directory, e.g. onnx/model_qint8_avx2.onnx "
+        "(empty = unquantized onnx/model.onnx)",
+    )
 
     # Vector Store Selection
     vector_store: Literal["qdrant", "chromadb"] = Field(
@@ -94,6 +165,21 @@ class KnowledgeConfig(BaseModel):
         default=True,
         description="Enable hybrid search",
     )
+    qdrant_quantization: Literal["none", "scalar", "binary"] = Field(
+        default="none",
+        description="Dense vector quantization: scalar (int8, 4x smaller) or binary "
+        "(1 bit, 32x smaller); quantized vectors stay in RAM, originals move to disk",
+    )
+    qdrant_quantization_oversampling: float = Field(
+        default=2.0,
+        ge=1.0,
+        le=16.0,
+        description="Fetch limit x oversampling quantized candidates before rescoring",
+    )
+    qdrant_quantization_rescore: bool = Field(
+        default=True,
+        description="Rescore quantized candidates with the full-precision vectors",
+    )
 
     # ChromaDB (Fallback)
     chromadb_path: Path = Field(
@@ -105,6 +191,32 @@ class KnowledgeConfig(BaseModel):
         description="ChromaDB collection name",
     )
 
+    # BM25 Keyword Index
+    bm25_index_dir: Path = Field(
+        default=Path("./data/bm25"),
+        description="Directory for persisted BM25 indexes (one per versioned collection)",
+    )
+
+    # Vector Store Access
+    store_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum concurrent vector store calls from the async server",
+    )
+    store_upload_batch_size: int = Field(
+        default=256,
+        ge=1,
+        le=10000,
+        description="Points per upsert request when loading chunks (capped by ChromaDB's limit)",
+    )
+    store_upload_parallelism: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Concurrent upsert requests when loading chunks into Qdrant",
+    )
+
     # Embedding Cache Configuration
     cache_dir: Path = Field(
         default=Path("./data/embeddings/cache"),
@@ -119,6 +231,38 @@ class KnowledgeConfig(BaseModel):
         ge=100 * 1024 * 1024,  # Min 100MB
         description="Cache size limit in bytes",
     )
+    cache_memory_size_limit: int = Field(
+        default=64 * 1024 * 1024,  # 64MB
+        ge=0,
+        description="In-memory LRU tier ahead of the disk cache, in bytes (0 disables)",
+    )
+    cache_dtype: Literal["float32", "float16", "int8"] = Field(
+        default="float32",
+        description="On-disk precision of cached vectors (float16/int8 trade accuracy for space)",
+    )
+
+    # Search Result Cache Configuration
+    search_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,  # 32MB
+        ge=0,
+        description="In-memory search result cache size in bytes (0 disables)",
+    )
+    search_cache_ttl_seconds: float = Field(
+        default=300.0,
+        gt=0.0,
+        description="Seconds a cached search result stays valid (bounds staleness "
+        "after ingests from other processes)",
+    )
+
+    # Ingestion Configuration
+    ingest_checkpoint_file: Path = Field(
+        default=Path("./data/ingest_checkpoint.jsonl"),
+        description="Completed-document record used to resume streaming ingests",
+    )
+    ingest_manifest_dir: Path = Field(
+        default=Path("./data/manifests"),
+        description="Per-document chunk manifests used for incremental re-ingestion",
+    )
 
     # Token Tracking Configuration
     token_log_file: Path = Field(
@@ -135,6 +279,12 @@ class KnowledgeConfig(BaseModel):
         description="Daily token warning threshold",
     )
 
+    # Latency Instrumentation Configuration
+    latency_metrics_enabled: bool = Field(
+        default=True,
+        description="Record per-stage search latency spans reported by knowledge_stats",
+    )
+
     # Chunking Configuration
     chunk_size_min: int = Field(
         default=200,
@@ -197,14 +347,15 @@ class KnowledgeConfig(BaseModel):
         Embeds the model identifier in the collection name to prevent
         mixing vectors from different embedding models (Pitfall #7).
 
-        Format: {base_name}_v1_{model_short}
+        Format: {base_name}_v1_{model_short}[_d{dimensions}]
         Example: se_knowledge_base_v1_te3small
+        Example: se_knowledge_base_v1_te3small_d512 (shortened embeddings)
 
         Returns:
             Versioned collection name string.
         """
         model_short = self.embedding_model.replace("text-embedding-", "te").replace("-", "")
-        return f"{self.qdrant_collection}_v1_{model_short}"
+        return f"{self.qdrant_collection}_v1_{model_short}{_dimensions_suffix(self)}"
 
     @property
     def versioned_chromadb_collection_name(self) -> str:
@@ -216,7 +367,28 @@ class KnowledgeConfig(BaseModel):
             Versioned collection name string.
         """
         model_short = self.embedding_model.replace("text-embedding-", "te").replace("-", "")
-        return f"{self.chromadb_collection}_v1_{model_short}"
+        return f"{self.chromadb_collection}_v1_{model_short}{_dimensions_suffix(self)}"
+
+    @property
+    def reduced_dimensions(self) -> bool:
+        """Whether OpenAI embeddings are shortened below the model's full size."""
+        native = OPENAI_MODEL_DIMENSIONS.get(self.embedding_model)
+        return (
+            self.embedding_provider == "openai"
+            and native is not None
+            and self.embedding_dimensions < native
+        )
+
+    @property
+    def embedding_cache_model(self) -> str:
+        """Embedding cache namespace: the model, plus the size when shortened.
+
+        Vectors of different sizes from the same model must not share a
+        cache, so shortened embeddings get their own namespace.
+        """
+        if self.reduced_dimensions:
+            return f"{self.embedding_model}-d{self.embedding_dimensions}"
+        return self.embedding_model
 
     def validate(self) -> list[str]:
         """
@@ -234,6 +406,20 @@ class KnowledgeConfig(BaseModel):
         if self.embedding_provider == "openai" and not self.openai_api_key:
             errors.append("OPENAI_API_KEY is required when embedding_provider=openai")
 
+        native = OPENAI_MODEL_DIMENSIONS.get(self.embedding_model)
+        if self.embedding_provider == "openai" and native is not None:
+            if self.embedding_dimensions > native:
+                errors.append(
+                    f"EMBEDDING_DIMENSIONS must be at most {native} for {self.embedding_model}"
+                )
+            elif self.reduced_dimensions and not self.embedding_model.startswith(
+                "text-embedding-3"
+            ):
+                errors.append(
+                    f"{self.embedding_model} does not support shortened embeddings; "
+                    f"use EMBEDDING_DIMENSIONS={native}"
+                )
+
         if self.vector_store == "qdrant":
             if not self.qdrant_url:
                 errors.append("QDRANT_URL is required when using Qdrant")
@@ -252,6 +438,11 @@ class KnowledgeConfig(BaseModel):
         return errors
 
 
+def _dimensions_suffix(config: KnowledgeConfig) -> str:
+    """Collection name suffix for shortened embeddings ("" at full size)."""
+    return f"_d{config.embedding_dimensions}" if config.reduced_dimensions else ""
+
+
 def load_config() -> KnowledgeConfig:
     """
     Load configuration from environment variables.
@@ -287,23 +478,55 @@ def load_config() -> KnowledgeConfig:
         openai_api_key=os.getenv("OPENAI_API_KEY", ""),
         embedding_model=os.getenv("EMBEDDING_MODEL", "text-embedding-3-small"),
         embedding_dimensions=int(os.getenv("EMBEDDING_DIMENSIONS", "1536")),
+        embedding_max_concurrency=int(os.getenv("EMBEDDING_MAX_CONCURRENCY", "4")),
+        embedding_requests_per_minute=int(os.getenv("EMBEDDING_REQUESTS_PER_MINUTE", "0")),
+        embedding_tokens_per_minute=int(os.getenv("EMBEDDING_TOKENS_PER_MINUTE", "0")),
         embedding_provider=os.getenv("EMBEDDING_PROVIDER", "openai"),  # type: ignore[arg-type]
         local_embedding_model=os.getenv("LOCAL_EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
+        local_embedding_batch_window_ms=float(
+            os.getenv("LOCAL_EMBEDDING_BATCH_WINDOW_MS", "2.0")
+        ),
+        local_embedding_max_batch_size=int(os.getenv("LOCAL_EMBEDDING_MAX_BATCH_SIZE", "32")),
+        local_embedding_threads=int(os.getenv("LOCAL_EMBEDDING_THREADS", "0")),
+        local_backend=os.getenv("LOCAL_BACKEND", "torch"),  # type: ignore[arg-type]
+        local_onnx_file_name=os.getenv("LOCAL_ONNX_FILE_NAME", ""),
         vector_store=os.getenv("VECTOR_STORE", "qdrant"),  # type: ignore[arg-type]
         qdrant_url=os.getenv("QDRANT_URL", ""),
         qdrant_api_key=os.getenv("QDRANT_API_KEY", ""),
         qdrant_collection=os.getenv("QDRANT_COLLECTION", "se_knowledge_base"),
         qdrant_hybrid_search=os.getenv("QDRANT_HYBRID_SEARCH", "true").lower() == "true",
+        qdrant_quantization=os.getenv("QDRANT_QUANTIZATION", "none"),  # type: ignore[arg-type]
+        qdrant_quantization_oversampling=float(
+            os.getenv("QDRANT_QUANTIZATION_OVERSAMPLING", "2.0")
+        ),
+        qdrant_quantization_rescore=os.getenv("QDRANT_QUANTIZATION_RESCORE", "true").lower()
+        == "true",
         chromadb_path=Path(os.getenv("CHROMADB_PATH", "./collections/chromadb")),
         chromadb_collection=os.getenv("CHROMADB_COLLECTION", "se_knowledge_base"),
+        bm25_index_dir=Path(os.getenv("BM25_INDEX_DIR", "./data/bm25")),
+        store_max_concurrency=int(os.getenv("STORE_MAX_CONCURRENCY", "8")),
+        store_upload_batch_size=int(os.getenv("STORE_UPLOAD_BATCH_SIZE", "256")),
+        store_upload_parallelism=int(os.getenv("STORE_UPLOAD_PARALLELISM", "4")),
         # Cache configuration
         cache_dir=Path(os.getenv("CACHE_DIR", "./data/embeddings/cache")),
         cache_enabled=os.getenv("CACHE_ENABLED", "true").lower() == "true",
         cache_size_limit=int(os.getenv("CACHE_SIZE_LIMIT", str(10 * 1024**3))),
+        cache_memory_size_limit=int(os.getenv("CACHE_MEMORY_SIZE_LIMIT", str(64 * 1024**2))),
+        cache_dtype=os.getenv("CACHE_DTYPE", "float32"),  # type: ignore[arg-type]
+        # Search result cache configuration
+        search_cache_max_bytes=int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(32 * 1024**2))),
+        search_cache_ttl_seconds=float(os.getenv("SEARCH_CACHE_TTL_SECONDS", "300")),
+        # Ingestion configuration
+        ingest_checkpoint_file=Path(
+            os.getenv("INGEST_CHECKPOINT_FILE", "./data/ingest_checkpoint.jsonl")
+        ),
+        ingest_manifest_dir=Path(os.getenv("INGEST_MANIFEST_DIR", "./data/manifests")),
         # Token tracking configuration
         token_log_file=Path(os.getenv("TOKEN_LOG_FILE", "./data/token_usage.json")),
         token_tracking_enabled=os.getenv("TOKEN_TRACKING_ENABLED", "true").lower() == "true",
         daily_token_warning_threshold=int(os.getenv("DAILY_TOKEN_WARNING_THRESHOLD", "1000000")),
+        # Latency instrumentation configuration
+        latency_metrics_enabled=os.getenv("LATENCY_METRICS_ENABLED", "true").lower() == "true",
         # Chunking configuration
         chunk_size_min=int(os.getenv("CHUNK_SIZE_MIN", "200")),
         chunk_size_max=int(os.getenv("CHUNK_SIZE_MAX", "800")),
@@ -2,7 +2,8 @@
 Content hashing utilities for deduplication.
 
 Provides deterministic SHA-256 hashing with text normalization.
-Used to detect duplicate chunks across documents.
+Used to detect duplicate chunks across documents, and to derive stable
+chunk ids so re-ingesting an unchanged chunk maps to the same point.
 
 Example:
     >>> hash1 = compute_content_hash("Hello world")
@@ -14,8 +15,12 @@ Example:
 from __future__ import annotations
 
 import hashlib
+import uuid
 
-__all__ = ["compute_content_hash"]
+__all__ = ["CHUNK_ID_NAMESPACE", "compute_chunk_id", "compute_content_hash"]
+
+# Namespace for uuid5 chunk ids (fixed: changing it re-keys every chunk)
+CHUNK_ID_NAMESPACE = uuid.UUID("6f1c2d4e-8a3b-5c7d-9e0f-1a2b3c4d5e6f")
 
 
 def compute_content_hash(text: str) -> str:
@@ -55,3 +60,35 @@ def compute_content_hash(text: str) -> str:
     # Compute SHA-256 hash
     hash_obj = hashlib.sha256(normalized.encode("utf-8"))
     return hash_obj.hexdigest()
+
+
+def compute_chunk_id(
+    document_id: str,
+    clause_path: str,
+    content_hash: str,
+    occurrence: int = 0,
+) -> str:
+    """
+    Derive a deterministic chunk id.
+
+    The same document, clause path and content always produce the same id,
+    so re-ingesting a revised document leaves unchanged chunks in place and
+    only new or edited content gets new ids. The id is a UUID string (uuid5)
+    because Qdrant point ids must be UUIDs or integers.
+
+    Args:
+        document_id: Source document identifier.
+        clause_path: Section hierarchy and clause locating the chunk.
+        content_hash: Hash from compute_content_hash().
+        occurrence: Index among chunks of the same document that share
+            clause_path and content_hash (repeated boilerplate).
+
+    Returns:
+        UUID string.
+
+    Example:
+        >>> compute_chunk_id("ieee-15288", "6 > 6.4.7", "64ec88ca...")
+        '0b7c...'
+    """
+    name = f"{document_id}\x1f{clause_path}\x1f{content_hash}\x1f{occurrence}"
+    return str(uuid.uuid5(CHUNK_ID_NAMESPACE, name))
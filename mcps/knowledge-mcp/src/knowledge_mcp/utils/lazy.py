@@ -0,0 +1,58 @@
+# src/knowledge_mcp/utils/lazy.py
+"""
+Lazy re-exports for package __init__ modules.
+
+The MCP client launches the server on every session and waits for
+list_tools before the first call, so importing a package must not pull in
+heavy dependencies (bm25s, docling, crawl4ai, qdrant-client, openai,
+sentence-transformers, SQLAlchemy) that only some tools need. Packages
+list their public names with the submodule that defines each; the
+submodule is imported on first attribute access (PEP 562) and the value is
+cached on the package.
+
+Example:
+    >>> # in knowledge_mcp/search/__init__.py
+    >>> __getattr__, __dir__ = lazy_exports(__name__, {
+    ...     "BM25Searcher": "knowledge_mcp.search.bm25",
+    ... })
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for lazily imported names.
+
+    Args:
+        package: Name of the package module (pass __name__).
+        exports: Public name -> fully qualified submodule defining it.
+
+    Returns:
+        (__getattr__, __dir__) to assign in the package module.
+    """
+    module = sys.modules[package]
+
+    def __getattr__(name: str) -> Any:
+        submodule = exports.get(name)
+        if submodule is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(submodule), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(module)) | set(exports))
+
+    return __getattr__, __dir__
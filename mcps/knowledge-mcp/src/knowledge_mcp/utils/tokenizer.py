@@ -11,16 +11,34 @@ Example:
 
     >>> truncated = truncate_to_tokens("Long text...", max_tokens=100)
     >>> print(f"Truncated to {count_tokens(truncated)} tokens")
+
+    >>> token_ids = encode_batch(["First text", "Second text"])
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
 from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING
 
 import tiktoken
 
-__all__ = ["TokenizerConfig", "count_tokens", "truncate_to_tokens"]
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+__all__ = [
+    "TokenizerConfig",
+    "count_tokens",
+    "encode_batch",
+    "get_encoding",
+    "token_offsets",
+    "truncate_to_tokens",
+]
+
+# Below this many characters, encode_batch encodes sequentially: starting
+# tiktoken's thread pool costs more than it saves on small batches.
+_PARALLEL_ENCODE_MIN_CHARS = 100_000
 
 
 @dataclass
@@ -54,6 +72,22 @@ def _get_encoding(model: str) -> tiktoken.Encoding:
     return tiktoken.encoding_for_model(model)
 
 
+def get_encoding(model: str = "text-embedding-3-small") -> tiktoken.Encoding:
+    """
+    Get the shared tiktoken encoding for a model.
+
+    Use this when token ids are needed rather than counts, e.g. to place
+    chunk boundaries with decode_with_offsets instead of re-encoding.
+
+    Args:
+        model: OpenAI model name (default: text-embedding-3-small).
+
+    Returns:
+        Cached tiktoken.Encoding instance.
+    """
+    return _get_encoding(model)
+
+
 def count_tokens(text: str, model: str = "text-embedding-3-small") -> int:
     """
     Count tokens in text using tiktoken.
@@ -83,6 +117,96 @@ def count_tokens(text: str, model: str = "text-embedding-3-small") -> int:
     return len(encoding.encode(text))
 
 
+def encode_batch(
+    texts: Sequence[str],
+    model: str = "text-embedding-3-small",
+) -> list[list[int]]:
+    """
+    Encode many texts to token ids in one call.
+
+    tiktoken encodes the batch on a native thread pool, which is much
+    faster than calling count_tokens per text for large documents.
+
+    Args:
+        texts: Texts to encode.
+        model: OpenAI model name (default: text-embedding-3-small).
+
+    Returns:
+        Token ids for each text, in input order.
+
+    Example:
+        >>> [len(ids) for ids in encode_batch(["Hello world", ""])]
+        [2, 0]
+    """
+    if not texts:
+        return []
+
+    encoding = _get_encoding(model)
+    if sum(len(text) for text in texts) < _PARALLEL_ENCODE_MIN_CHARS:
+        return [encoding.encode(text) for text in texts]
+    return encoding.encode_batch(list(texts))
+
+
+@lru_cache(maxsize=4)
+def _token_char_tables(model: str) -> tuple[list[int], list[int]]:
+    """
+    Per-token-id character tables for a model's encoding.
+
+    A token's decoded length is the number of UTF-8 lead bytes it holds;
+    a token beginning with a continuation byte starts inside the previous
+    character.
+
+    Args:
+        model: OpenAI model name.
+
+    Returns:
+        Tuple of (characters started by each token id, 1 where the token
+        begins mid-character), indexed by token id.
+    """
+    encoding = _get_encoding(model)
+    lengths = [0] * encoding.n_vocab
+    continues = [0] * encoding.n_vocab
+    for token in range(encoding.n_vocab):
+        try:
+            token_bytes = encoding.decode_single_token_bytes(token)
+        except KeyError:
+            continue
+        lengths[token] = sum(1 for byte in token_bytes if not 0x80 <= byte < 0xC0)
+        continues[token] = int(0x80 <= token_bytes[0] < 0xC0)
+    return lengths, continues
+
+
+def token_offsets(
+    token_ids: Sequence[int],
+    model: str = "text-embedding-3-small",
+) -> list[int]:
+    """
+    Character offset at which each token starts in the decoded text.
+
+    Equivalent to tiktoken's decode_with_offsets, but uses per-model
+    lookup tables so it stays cheap for documents of many thousand tokens.
+
+    Args:
+        token_ids: Token ids, e.g. from encode_batch.
+        model: OpenAI model name (default: text-embedding-3-small).
+
+    Returns:
+        One offset per token, non-decreasing.
+
+    Example:
+        >>> token_offsets(encode_batch(["Hello world"])[0])
+        [0, 5]
+    """
+    if not token_ids:
+        return []
+
+    lengths, continues = _token_char_tables(model)
+    starts = accumulate((lengths[token] for token in token_ids[:-1]), initial=0)
+    offsets = [start - continues[token] for start, token in zip(starts, token_ids)]
+    offsets[0] = 0  # a leading continuation byte has no previous character
+    return offsets
+
+
 def truncate_to_tokens(
     text: str,
     max_tokens: int,
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from knowledge_mcp.models.chunk import KnowledgeChunk
@@ -37,6 +37,18 @@ class SearcherProtocol(Protocol):
     ) -> list[KnowledgeChunk]: ...
 
 
+@runtime_checkable
+class BatchSearcherProtocol(SearcherProtocol, Protocol):
+    """Searcher that can also answer several queries in one round-trip."""
+
+    async def search_many(
+        self,
+        queries: list[str],
+        collection: str,
+        n_results: int = 10,
+    ) -> list[list[KnowledgeChunk]]: ...
+
+
 class TableValidator:
     """Validates critical RCCA lookup tables after ingestion.
 
@@ -213,31 +225,51 @@ class TableValidator:
     async def _run_queries(self, queries: list[str]) -> list[KnowledgeChunk]:
         """Run multiple queries in parallel and deduplicate results.
 
+        Searchers implementing BatchSearcherProtocol answer all queries in
+        one batched call; others get one concurrent search per query.
+
         Args:
             queries: List of query strings to search for.
 
         Returns:
             Deduplicated list of KnowledgeChunk results.
         """
-        # Run queries in parallel
-        tasks = [
-            self.searcher.search(query, collection=self.collection, n_results=10)
-            for query in queries
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Collect successful results, log failures
         all_chunks: list[KnowledgeChunk] = []
-        for i, result in enumerate(results):
-            if isinstance(result, BaseException):
+
+        if isinstance(self.searcher, BatchSearcherProtocol):
+            # One embedding request and one store call for every query
+            try:
+                batches = await self.searcher.search_many(
+                    queries, collection=self.collection, n_results=10
+                )
+            except Exception as e:
                 logger.warning(
-                    "Validation query failed: %s - %s",
-                    queries[i][:50],
-                    type(result).__name__,
+                    "Validation batch query failed: %d queries - %s",
+                    len(queries),
+                    type(e).__name__,
                 )
-            else:
-                # result is list[KnowledgeChunk] here
-                all_chunks.extend(result)
+                batches = []
+            for batch in batches:
+                all_chunks.extend(batch)
+        else:
+            # Run queries in parallel
+            tasks = [
+                self.searcher.search(query, collection=self.collection, n_results=10)
+                for query in queries
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Collect successful results, log failures
+            for i, result in enumerate(results):
+                if isinstance(result, BaseException):
+                    logger.warning(
+                        "Validation query failed: %s - %s",
+                        queries[i][:50],
+                        type(result).__name__,
+                    )
+                else:
+                    # result is list[KnowledgeChunk] here
+                    all_chunks.extend(result)
 
         # Deduplicate by chunk ID
         seen_ids: set[str] = set()
@@ -0,0 +1,299 @@
+"""Tests for the retrieval benchmark harness."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from knowledge_mcp.evaluation.benchmark import (
+    BenchmarkReport,
+    HashingEmbedder,
+    InMemoryStore,
+    LatencyStats,
+    LexicalCrossEncoder,
+    RetrievalBenchmark,
+    build_offline_benchmark,
+    compare_reports,
+    percentile,
+    synthetic_corpus,
+)
+from knowledge_mcp.evaluation.golden_set import GoldenTestSet
+from knowledge_mcp.models.chunk import KnowledgeChunk
+
+GOLDEN_QUERIES = Path(__file__).parents[2] / "data" / "golden_queries.yml"
+
+
+@pytest.fixture
+def golden_set(tmp_path: Path) -> GoldenTestSet:
+    """Small golden set with two categories."""
+    queries_file = tmp_path / "golden.yml"
+    queries_file.write_text(
+        yaml.dump(
+            {
+                "queries": [
+                    {
+                        "query": "What is system verification?",
+                        "expected_in_top_k": ["verification"],
+                        "category": "verification",
+                    },
+                    {
+                        "query": "How are stakeholder requirements elicited?",
+                        "expected_in_top_k": ["stakeholder", "elicited"],
+                        "category": "requirements",
+                    },
+                ]
+            }
+        )
+    )
+    return GoldenTestSet(queries_file, k=3)
+
+
+def make_chunk(chunk_id: str, content: str, embedding: list[float], **kwargs: object) -> KnowledgeChunk:
+    """Create an embedded chunk for store tests."""
+    return KnowledgeChunk(
+        id=chunk_id,
+        document_id="doc",
+        document_title="Doc",
+        document_type="standard",
+        content=content,
+        content_hash=chunk_id,
+        token_count=len(content.split()),
+        embedding=embedding,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def report_dict(p50: float = 10.0, qps: float = 100.0, recall: float = 0.9) -> dict:
+    """Minimal serialized report."""
+    return {
+        "config": {"backend": "offline", "searcher": "semantic", "rerank": False, "k": 5, "concurrency": 4},
+        "latency_ms": {"total": {"p50": p50, "p95": p50 * 2}},
+        "throughput": {"qps": qps},
+        "recall": {"avg_recall": recall},
+    }
+
+
+class TestLatencyStats:
+    """Tests for percentile summaries."""
+
+    def test_nearest_rank_percentiles(self) -> None:
+        """Test percentiles pick observed samples by nearest rank."""
+        # Arrange
+        samples = [float(i) for i in range(1, 101)]
+
+        # Act / Assert
+        assert percentile(samples, 50) == 50.0
+        assert percentile(samples, 95) == 95.0
+        assert percentile(samples, 99) == 99.0
+        assert percentile([], 50) == 0.0
+
+    def test_from_seconds_converts_to_ms(self) -> None:
+        """Test stats are reported in milliseconds."""
+        # Act
+        stats = LatencyStats.from_seconds([0.001, 0.002, 0.003])
+
+        # Assert
+        assert stats.count == 3
+        assert stats.p50 == pytest.approx(2.0)
+        assert stats.max == pytest.approx(3.0)
+
+
+class TestOfflineBackends:
+    """Tests for the deterministic embedder, store and cross-encoder."""
+
+    async def test_hashing_embedder_is_deterministic(self) -> None:
+        """Test equal texts embed identically and vectors are normalized."""
+        # Arrange
+        embedder = HashingEmbedder(dimensions=64)
+
+        # Act
+        first = await embedder.embed("system verification")
+        second, _ = await embedder.embed_batch(["system verification", "other"])
+
+        # Assert
+        assert first == second
+        assert len(first) == 64
+        assert sum(v * v for v in first) == pytest.approx(1.0)
+
+    async def test_in_memory_store_ranks_by_cosine(self) -> None:
+        """Test search returns the most similar chunks first."""
+        # Arrange
+        embedder = HashingEmbedder(dimensions=128)
+        texts = ["verification of the system", "stakeholder requirements", "risk management"]
+        store = InMemoryStore()
+        store.add_chunks(
+            [
+                make_chunk(f"c{i}", text, embedding)
+                for i, (text, embedding) in enumerate(zip(texts, await embedder.embed_batch(texts)))
+            ]
+        )
+
+        # Act
+        results = store.search(await embedder.embed("stakeholder requirements"), n_results=2)
+
+        # Assert
+        assert [r["id"] for r in results][0] == "c1"
+        assert len(results) == 2
+        assert results[0]["metadata"]["document_type"] == "standard"
+
+    def test_in_memory_store_filters_and_deletes(self) -> None:
+        """Test metadata filters apply and deleted chunks disappear."""
+        # Arrange
+        store = InMemoryStore()
+        store.add_chunks(
+            [
+                make_chunk("a", "alpha", [1.0, 0.0], chunk_type="requirement"),
+                make_chunk("b", "beta", [0.9, 0.1], chunk_type="guidance"),
+            ]
+        )
+        generation = store.generation
+
+        # Act
+        filtered = store.search([1.0, 0.0], filter_dict={"chunk_type": "guidance"})
+        store.delete_chunks(["a"])
+        remaining = store.search([1.0, 0.0])
+
+        # Assert
+        assert [r["id"] for r in filtered] == ["b"]
+        assert [r["id"] for r in remaining] == ["b"]
+        assert store.generation > generation
+
+    def test_in_memory_store_rejects_unembedded_chunks(self) -> None:
+        """Test chunks without embeddings are rejected."""
+        with pytest.raises(ValueError, match="no embedding"):
+            InMemoryStore().add_chunks([make_chunk("a", "alpha", [])])
+
+    def test_lexical_cross_encoder_scores_overlap(self) -> None:
+        """Test scores reflect the share of query words in the passage."""
+        scores = LexicalCrossEncoder().predict(
+            [("system verification", "verification of the system"), ("system verification", "risk")]
+        )
+        assert scores == [1.0, 0.0]
+
+    def test_synthetic_corpus_is_reproducible(self, golden_set: GoldenTestSet) -> None:
+        """Test the corpus has one relevant chunk per query and stable ids."""
+        # Act
+        first = synthetic_corpus(golden_set, size=20)
+        second = synthetic_corpus(golden_set, size=20)
+
+        # Assert
+        assert len(first) == 20
+        assert [c.id for c in first] == [c.id for c in second]
+        assert "stakeholder elicited" in first[1].content
+
+
+class TestRetrievalBenchmark:
+    """Tests for benchmark runs."""
+
+    def test_hybrid_requires_bm25(self, golden_set: GoldenTestSet) -> None:
+        """Test hybrid search without a BM25 index is rejected."""
+        with pytest.raises(ValueError, match="BM25"):
+            RetrievalBenchmark(golden_set, HashingEmbedder(), InMemoryStore(), searcher="hybrid")
+
+    async def test_semantic_run_reports_stages(self, golden_set: GoldenTestSet) -> None:
+        """Test a run times each stage and every timed search."""
+        # Arrange
+        benchmark = await build_offline_benchmark(
+            golden_set, corpus_size=50, concurrency=2, rounds=3
+        )
+
+        # Act
+        report = await benchmark.run()
+
+        # Assert
+        assert report.requests == 6
+        assert report.latency["total"].count == 6
+        assert report.latency["embed"].count == 6
+        assert report.latency["store"].count == 6
+        assert "bm25" not in report.latency
+        assert report.qps > 0
+        assert report.recall["avg_recall"] == pytest.approx(1.0)
+        assert set(report.recall["by_category"]) == {"requirements", "verification"}
+
+    async def test_hybrid_rerank_run(self, golden_set: GoldenTestSet) -> None:
+        """Test hybrid search with reranking times the BM25 and rerank stages."""
+        # Arrange
+        benchmark = await build_offline_benchmark(
+            golden_set, searcher="hybrid", rerank=True, corpus_size=50, rounds=1
+        )
+
+        # Act
+        report = await benchmark.run()
+
+        # Assert
+        assert report.latency["bm25"].count == 2
+        assert report.latency["rerank"].count == 2
+        assert report.config["rerank"] is True
+        assert report.config["candidates"] == 12
+
+    async def test_report_round_trips_through_json(
+        self, golden_set: GoldenTestSet, tmp_path: Path
+    ) -> None:
+        """Test a saved report compares cleanly against itself."""
+        # Arrange
+        report = await (await build_offline_benchmark(golden_set, corpus_size=20, rounds=1)).run()
+        path = tmp_path / "out" / "report.json"
+
+        # Act
+        report.save(path)
+        loaded = json.loads(path.read_text())
+
+        # Assert
+        assert loaded["version"] == 1
+        assert set(loaded) == {"version", "config", "latency_ms", "throughput", "recall"}
+        assert compare_reports(loaded, report.to_dict()) == []
+
+    async def test_golden_queries_offline(self) -> None:
+        """Benchmark the shipped golden queries offline (pytest-benchmark style smoke run)."""
+        # Arrange
+        golden = GoldenTestSet(GOLDEN_QUERIES, k=5)
+        benchmark = await build_offline_benchmark(
+            golden, searcher="hybrid", rerank=True, corpus_size=500, rounds=1
+        )
+
+        # Act
+        report = await benchmark.run()
+
+        # Assert
+        assert report.requests == len(golden.load_queries())
+        assert report.recall["avg_recall"] >= 0.9
+        assert report.latency["total"].p99 >= report.latency["total"].p50
+
+
+class TestCompareReports:
+    """Tests for regression detection between reports."""
+
+    def test_within_tolerance(self) -> None:
+        """Test small changes are not regressions."""
+        assert compare_reports(report_dict(), report_dict(p50=11.0, qps=90.0)) == []
+
+    def test_latency_throughput_and_recall_regressions(self) -> None:
+        """Test slower, lower-throughput, less accurate runs are flagged."""
+        # Act
+        regressions = compare_reports(report_dict(), report_dict(p50=20.0, qps=50.0, recall=0.8))
+
+        # Assert
+        assert len(regressions) == 4
+        assert any(r.startswith("total p50") for r in regressions)
+        assert any(r.startswith("throughput") for r in regressions)
+        assert any(r.startswith("recall@k") for r in regressions)
+
+    def test_sub_millisecond_noise_ignored(self) -> None:
+        """Test tiny absolute latency changes are ignored."""
+        assert compare_reports(report_dict(p50=0.1), report_dict(p50=0.3)) == []
+
+    def test_different_settings_rejected(self) -> None:
+        """Test reports from different configurations are not compared."""
+        other = report_dict()
+        other["config"]["searcher"] = "hybrid"
+        with pytest.raises(ValueError, match="not comparable"):
+            compare_reports(report_dict(), other)
+
+
+def test_benchmark_report_qps() -> None:
+    """Test QPS divides timed searches by wall time."""
+    report = BenchmarkReport(config={}, latency={}, requests=50, elapsed_seconds=2.0, recall={})
+    assert report.qps == 25.0
@@ -155,3 +155,26 @@ class TestRunGoldenTests:
         assert len(results) == 1
         assert results[0].passed is True
         assert summary["pass_rate"] == 1.0
+
+    def test_run_golden_tests_batch(self, sample_queries_file: Path) -> None:
+        """Test a batch search function is called once with every query."""
+        calls: list[list[str]] = []
+
+        def mock_batch_search(queries: list[str]) -> list[list[dict[str, str]]]:
+            calls.append(queries)
+            return [[{"content": "This contains expected content"}] for _ in queries]
+
+        results, summary = run_golden_tests(
+            sample_queries_file,
+            k=5,
+            batch_search_fn=mock_batch_search,
+        )
+
+        assert calls == [["Test query"]]
+        assert results[0].passed is True
+        assert summary["pass_rate"] == 1.0
+
+    def test_run_golden_tests_requires_search_fn(self, sample_queries_file: Path) -> None:
+        """Test a search function is required."""
+        with pytest.raises(ValueError, match="search_fn"):
+            run_golden_tests(sample_queries_file)
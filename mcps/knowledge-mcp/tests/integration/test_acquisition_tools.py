@@ -136,3 +136,65 @@ class TestToolHandlersWithoutDatabase:
         # Should succeed (just URL validation)
         assert "accessible" in response
         assert response["accessible"] is True
+
+
+class TestAcquireMany:
+    """Test batch acquisition through handle_acquire_many."""
+
+    @pytest.mark.asyncio
+    async def test_batch_records_each_result(self) -> None:
+        """Test preflight, existing sources and crawl outcomes per URL."""
+        from knowledge_mcp.ingest.web_ingestor import WebIngestionResult
+        from knowledge_mcp.tools.acquisition import handle_acquire_many
+
+        # Arrange
+        existing = MagicMock(id=7)
+        existing.status.value = "complete"
+        repo = MagicMock()
+        repo.get_by_url = AsyncMock(
+            side_effect=lambda url: existing if url.endswith("/old") else None
+        )
+        repo.create = AsyncMock(side_effect=[MagicMock(id=1), MagicMock(id=2)])
+        repo.update_status = AsyncMock()
+
+        async def iter_ingest(urls: list[str]):  # noqa: ANN202
+            assert urls == ["https://a.example.com/ok", "https://b.example.com/bad"]
+            yield WebIngestionResult(url=urls[1], success=False, error="HTTP 404")
+            yield WebIngestionResult(url=urls[0], success=True, title="OK", word_count=42)
+
+        ingestor = MagicMock()
+        ingestor.iter_ingest = iter_ingest
+        urls = [
+            "https://a.example.com/ok",
+            "not-a-url",
+            "https://a.example.com/old",
+            "https://b.example.com/bad",
+        ]
+
+        # Act
+        with patch("knowledge_mcp.tools.acquisition.SourceRepository", return_value=repo):
+            response = await handle_acquire_many(MagicMock(), urls, ingestor=ingestor)
+
+        # Assert
+        results = response["results"]
+        assert [r["url"] for r in results] == urls
+        assert results[0]["acquired"] is True
+        assert results[0]["word_count"] == 42
+        assert "Preflight failed" in results[1]["error"]
+        assert results[2]["already_exists"] is True
+        assert results[3]["error"] == "HTTP 404"
+        assert response["acquired"] == 1
+        assert response["failed"] == 2
+        assert repo.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_without_database(self) -> None:
+        """Test knowledge_acquire with urls returns error when database unavailable."""
+        import json
+
+        server = KnowledgeMCPServer()
+
+        result = await server._handle_knowledge_acquire({"urls": ["https://example.com"]})
+
+        response = json.loads(result[0].text)
+        assert response.get("isError") is True
@@ -86,7 +86,8 @@ class TestEmbedderCacheIntegration:
         embedding1 = await embedder_with_real_deps.embed("test text")
         embedding2 = await embedder_with_real_deps.embed("test text")
 
-        assert embedding1 == embedding2
+        # Cached vectors are held as float32
+        assert embedding2 == pytest.approx(embedding1)
 
     @pytest.mark.asyncio
     async def test_tracker_records_cache_hit(
@@ -149,7 +150,7 @@ class TestEmbedderCacheIntegration:
         result = await embedder2.embed("persistent text")
 
         # Result should be from cache (0.1), not new API call (0.2)
-        assert result[0] == 0.1
+        assert result[0] == pytest.approx(0.1)
         embedder2._client.embeddings.create.assert_not_called()
         cache2.close()
 
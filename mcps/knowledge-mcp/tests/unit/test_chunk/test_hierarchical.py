@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 
 from knowledge_mcp.chunk import (
@@ -11,6 +13,7 @@ from knowledge_mcp.chunk import (
     HierarchicalChunker,
     ParsedElement,
 )
+from knowledge_mcp.utils.tokenizer import count_tokens, encode_batch
 
 
 class TestChunkConfig:
@@ -290,6 +293,83 @@ class TestHierarchicalChunker:
                 # Should contain separator
                 assert "---" in results[i].content
 
+    def test_elements_encoded_in_one_batch(
+        self, custom_chunker: HierarchicalChunker, metadata: DocumentMetadata
+    ) -> None:
+        """Test every element is tokenized by a single batched encode."""
+        elements = [
+            ParsedElement(element_type="text", content=f"Paragraph {i} of the handbook.")
+            for i in range(10)
+        ]
+
+        with patch(
+            "knowledge_mcp.chunk.hierarchical.encode_batch", wraps=encode_batch
+        ) as mock_encode:
+            custom_chunker.chunk(elements, metadata)
+
+        # One batch for the elements, one for the overlap tails
+        assert mock_encode.call_count == 2
+        encoded = mock_encode.call_args_list[0].args[0]
+        assert encoded[:10] == [e.content for e in elements]
+
+    def test_split_token_counts_match_encoding(self) -> None:
+        """Test counts derived from token offsets equal re-encoding the chunk."""
+        config = ChunkConfig(target_tokens=50, max_tokens=100, merge_small_chunks=False)
+        chunker = HierarchicalChunker(config)
+        paragraphs = [
+            f"Clause 5.{i}: The system shall verify requirement {i}, per ISO 15288."
+            for i in range(20)
+        ]
+        element = ParsedElement(element_type="text", content="\n\n".join(paragraphs))
+
+        results = chunker._chunk_element(element, encode_batch([element.content])[0])
+
+        assert len(results) > 1
+        assert "\n\n".join(r.content for r in results) == element.content
+        for result in results:
+            assert result.token_count == count_tokens(result.content)
+
+    def test_overlap_is_word_aligned_suffix(
+        self, custom_chunker: HierarchicalChunker, metadata: DocumentMetadata
+    ) -> None:
+        """Test the overlap is the end of the previous chunk, on a word boundary."""
+        words = [f"term{i}" for i in range(60)]
+        elements = [
+            ParsedElement(element_type="text", content=" ".join(words[:30])),
+            ParsedElement(element_type="text", content=" ".join(words[30:])),
+        ]
+        custom_chunker.config.merge_small_chunks = False
+
+        results = custom_chunker.chunk(elements, metadata)
+
+        overlap, _, rest = results[1].content.partition("\n\n---\n\n")
+        assert rest == elements[1].content
+        assert overlap
+        assert (" " + results[0].content).endswith(" " + overlap)
+        assert count_tokens(overlap) <= custom_chunker.config.overlap_tokens
+
+    def test_large_table_chunks_within_max_tokens(
+        self, custom_chunker: HierarchicalChunker, metadata: DocumentMetadata
+    ) -> None:
+        """Test table chunk budgets include captions and row separators."""
+        rows = ["| Process | Output |"]
+        rows += [f"| Process {i} | Work product {i} |" for i in range(80)]
+        elements = [
+            ParsedElement(
+                element_type="table",
+                content="\n".join(rows),
+                metadata={"caption": "Table 3: Outputs"},
+            )
+        ]
+        custom_chunker.config.merge_small_chunks = False
+
+        results = custom_chunker._chunk_table(elements[0])
+
+        assert len(results) > 1
+        for result in results:
+            assert count_tokens(result.content) <= result.token_count
+            assert result.token_count <= custom_chunker.config.max_tokens
+
     def test_section_hierarchy_preserved(
         self, chunker: HierarchicalChunker, metadata: DocumentMetadata
     ) -> None:
@@ -417,6 +497,25 @@ class TestHierarchicalChunker:
         # (depends on token counts, but at least shouldn't error)
         assert len(results) >= 1
 
+    def test_merged_chunk_token_count_is_exact(self) -> None:
+        """Test merged chunks report the token count of their joined text."""
+        # Arrange
+        config = ChunkConfig(target_tokens=50, max_tokens=100, merge_small_chunks=True)
+        chunker = HierarchicalChunker(config)
+        metadata = DocumentMetadata("test", "Test", "guide")
+        # Trailing and leading whitespace tokenize differently once joined
+        elements = [
+            ParsedElement(element_type="text", content="Short paragraph.  \n"),
+            ParsedElement(element_type="text", content="\n  Another short one."),
+        ]
+
+        # Act
+        results = chunker.chunk(elements, metadata)
+
+        # Assert
+        assert len(results) == 1
+        assert results[0].token_count == count_tokens(results[0].content)
+
     def test_page_numbers_preserved(
         self, chunker: HierarchicalChunker, metadata: DocumentMetadata
     ) -> None:
@@ -0,0 +1,61 @@
+# tests/unit/test_cli/test_benchmark.py
+"""Unit tests for the benchmark CLI command."""
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from knowledge_mcp.cli.main import app
+
+runner = CliRunner()
+
+GOLDEN_QUERIES = Path(__file__).parents[3] / "data" / "golden_queries.yml"
+
+
+class TestBenchmark:
+    """Tests for knowledge benchmark command."""
+
+    def test_help(self) -> None:
+        """Test help message displays."""
+        result = runner.invoke(app, ["benchmark", "--help"])
+        assert result.exit_code == 0
+        assert "recall@k" in result.stdout
+
+    def test_invalid_searcher(self) -> None:
+        """Test unknown searchers are rejected."""
+        result = runner.invoke(app, ["benchmark", "-g", str(GOLDEN_QUERIES), "-s", "fuzzy"])
+        assert result.exit_code == 1
+        assert "Unknown searcher" in result.stdout
+
+    def test_offline_run_writes_report(self, tmp_path: Path) -> None:
+        """Test an offline run prints stage latencies and writes JSON."""
+        output = tmp_path / "bench.json"
+
+        result = runner.invoke(
+            app,
+            ["benchmark", "-g", str(GOLDEN_QUERIES), "--corpus-size", "100", "-r", "1", "-o", str(output)],
+        )
+
+        assert result.exit_code == 0, result.stdout
+        assert "Throughput" in result.stdout
+        assert json.loads(output.read_text())["config"]["backend"] == "offline"
+
+    def test_baseline_regression_exits_nonzero(self, tmp_path: Path) -> None:
+        """Test a run worse than the baseline fails the command."""
+        baseline = tmp_path / "baseline.json"
+        runner.invoke(
+            app,
+            ["benchmark", "-g", str(GOLDEN_QUERIES), "--corpus-size", "100", "-r", "1", "-o", str(baseline)],
+        )
+        report = json.loads(baseline.read_text())
+        report["recall"]["avg_recall"] = 2.0
+        baseline.write_text(json.dumps(report))
+
+        result = runner.invoke(
+            app,
+            ["benchmark", "-g", str(GOLDEN_QUERIES), "--corpus-size", "100", "-r", "1", "--baseline", str(baseline)],
+        )
+
+        assert result.exit_code == 1
+        assert "recall@k" in result.stdout
@@ -0,0 +1,74 @@
+# tests/unit/test_cli/test_export_onnx.py
+"""Unit tests for the export-onnx CLI command."""
+
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from knowledge_mcp.cli.main import app
+from knowledge_mcp.embed.onnx_export import ParityReport
+
+runner = CliRunner()
+
+
+class TestExportOnnx:
+    """Tests for knowledge export-onnx command."""
+
+    def test_help(self) -> None:
+        """Test help message displays."""
+        result = runner.invoke(app, ["export-onnx", "--help"])
+        assert result.exit_code == 0
+        assert "quantized ONNX" in result.stdout
+
+    def test_invalid_kind(self, tmp_path: Path) -> None:
+        """Test unknown model kinds are rejected."""
+        result = runner.invoke(app, ["export-onnx", "m", str(tmp_path), "--kind", "llm"])
+        assert result.exit_code == 1
+        assert "Unknown kind" in result.stdout
+
+    @patch("knowledge_mcp.embed.onnx_export.load_model")
+    @patch("knowledge_mcp.embed.onnx_export.embedding_parity")
+    @patch("knowledge_mcp.embed.onnx_export.export_onnx_model")
+    def test_export_with_parity_check(
+        self,
+        mock_export: MagicMock,
+        mock_parity: MagicMock,
+        mock_load: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test export prints the settings to use after a passing parity check."""
+        mock_export.return_value = "onnx/model_qint8_avx2.onnx"
+        mock_parity.return_value = ParityReport(
+            kind="embedder", samples=8, worst=0.995, mean=0.998, threshold=0.99
+        )
+
+        result = runner.invoke(app, ["export-onnx", "all-MiniLM-L6-v2", str(tmp_path)])
+
+        assert result.exit_code == 0, result.stdout
+        assert mock_load.call_count == 2
+        assert "Parity check passed" in result.stdout
+        assert "LOCAL_ONNX_FILE_NAME=onnx/model_qint8_avx2.onnx" in result.stdout
+
+    @patch("knowledge_mcp.embed.onnx_export.load_model")
+    @patch("knowledge_mcp.embed.onnx_export.rerank_parity")
+    @patch("knowledge_mcp.embed.onnx_export.export_onnx_model")
+    def test_failed_parity_exits_nonzero(
+        self,
+        mock_export: MagicMock,
+        mock_parity: MagicMock,
+        mock_load: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test a diverging export fails the command."""
+        mock_export.return_value = "onnx/model_qint8_avx2.onnx"
+        mock_parity.return_value = ParityReport(
+            kind="reranker", samples=4, worst=0.5, mean=0.8, threshold=0.95
+        )
+
+        result = runner.invoke(
+            app, ["export-onnx", "cross-encoder/ms-marco-MiniLM-L6-v2", str(tmp_path), "-k", "reranker"]
+        )
+
+        assert result.exit_code == 1
+        assert "diverges" in result.stdout
@@ -13,6 +13,13 @@ from knowledge_mcp.exceptions import IngestionError
 runner = CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def mock_bm25_index():
+    """Keep ingest runs from touching the configured BM25 index directory."""
+    with patch("knowledge_mcp.cli.ingest._open_bm25_index") as mock_open:
+        yield mock_open.return_value
+
+
 class TestIngestDocs:
     """Tests for knowledge ingest docs command."""
 
@@ -73,6 +80,26 @@ class TestIngestDocs:
         assert "Processed: 1/1" in result.stdout
         assert "Ingestion complete" in result.stdout
 
+    @patch("knowledge_mcp.cli.ingest.IngestionPipeline")
+    def test_ingest_docs_without_store_leaves_bm25_index_alone(
+        self,
+        mock_pipeline_cls: MagicMock,
+        mock_bm25_index: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test parse/chunk-only runs do not index chunks the store never gets."""
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.touch()
+        mock_pipeline_cls.return_value.ingest.return_value = [MagicMock()]
+
+        with patch("knowledge_mcp.cli.ingest._open_bm25_index") as mock_open:
+            result = runner.invoke(app, ["ingest", "docs", str(test_pdf)])
+
+        assert result.exit_code == 0
+        mock_pipeline_cls.assert_called_once_with()
+        mock_open.assert_not_called()
+        mock_bm25_index.save.assert_not_called()
+
     @patch("knowledge_mcp.cli.ingest.IngestionPipeline")
     def test_ingest_docs_directory_success(
         self,
@@ -197,6 +224,92 @@ class TestIngestDocs:
         assert result.exit_code == 0
         assert "No PDF or DOCX files" in result.stdout
 
+    @patch("knowledge_mcp.cli.ingest.IngestionPipeline")
+    @patch("knowledge_mcp.store.create_store")
+    @patch("knowledge_mcp.embed.create_embedder")
+    @patch("knowledge_mcp.utils.config.load_config")
+    def test_ingest_docs_store_uses_streaming_pipeline(
+        self,
+        mock_load_config: MagicMock,
+        mock_create_embedder: MagicMock,
+        mock_create_store: MagicMock,
+        mock_pipeline_cls: MagicMock,
+        mock_bm25_index: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test --store embeds and upserts via the streaming pipeline."""
+        from knowledge_mcp.ingest.streaming import (
+            DocumentOutcome,
+            StageMetrics,
+            StreamingIngestResult,
+        )
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.touch()
+        mock_load_config.return_value.ingest_checkpoint_file = tmp_path / "ckpt.jsonl"
+
+        async def fake_run(files: list[Path]) -> StreamingIngestResult:
+            return StreamingIngestResult(
+                documents=[DocumentOutcome(files[0], chunks=7)],
+                stages={"embed": StageMetrics("embed", items=7, busy_seconds=1.0)},
+            )
+
+        with patch(
+            "knowledge_mcp.ingest.streaming.StreamingIngestionPipeline"
+        ) as mock_streaming_cls:
+            mock_streaming = mock_streaming_cls.return_value
+            mock_streaming.run.side_effect = fake_run
+
+            result = runner.invoke(
+                app, ["ingest", "docs", str(test_pdf), "--store", "--no-resume"]
+            )
+
+        assert result.exit_code == 0, result.stdout
+        kwargs = mock_streaming_cls.call_args.kwargs
+        assert kwargs["checkpoint_file"] is None
+        assert kwargs["parse_workers"] == 1
+        assert "Total chunks: 7" in result.stdout
+        assert "Stage throughput" in result.stdout
+        mock_streaming.close.assert_called_once()
+        mock_pipeline_cls.return_value.ingest.assert_not_called()
+        assert kwargs["bm25_index"] is mock_bm25_index
+        mock_pipeline_cls.assert_called_once_with()
+        mock_bm25_index.save.assert_called_once()
+
+    @patch("knowledge_mcp.cli.ingest.IngestionPipeline")
+    def test_ingest_docs_parse_workers_uses_parallel_parser(
+        self,
+        mock_pipeline_cls: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test --parse-workers > 1 parses in a pool and chunks parsed output."""
+        from knowledge_mcp.ingest.parallel import ParseOutcome
+
+        good = tmp_path / "good.pdf"
+        bad = tmp_path / "bad.pdf"
+        good.touch()
+        bad.touch()
+        mock_pipeline = mock_pipeline_cls.return_value
+        mock_pipeline.process_parsed.return_value = [MagicMock(), MagicMock()]
+
+        with patch("knowledge_mcp.ingest.parallel.ParallelParser") as mock_parser_cls:
+            mock_parser = mock_parser_cls.return_value.__enter__.return_value
+            mock_parser.parse_many.return_value = iter([
+                ParseOutcome(good, document=MagicMock()),
+                ParseOutcome(bad, error="Parsing timed out after 600s"),
+            ])
+
+            result = runner.invoke(
+                app, ["ingest", "docs", str(tmp_path), "--parse-workers", "3"]
+            )
+
+        assert result.exit_code == 1
+        mock_parser_cls.assert_called_once_with(workers=3)
+        mock_pipeline.ingest.assert_not_called()
+        assert "Processed: 1/2" in result.stdout
+        assert "Total chunks: 2" in result.stdout
+        assert "timed out" in result.stdout
+
 
 class TestIngestApp:
     """Tests for the ingest app group."""
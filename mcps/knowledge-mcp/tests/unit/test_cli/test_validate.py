@@ -346,10 +346,10 @@ class TestSearcherAdapter:
     """Tests for _SearcherAdapter class."""
 
     @patch("knowledge_mcp.store.create_store")
-    @patch("knowledge_mcp.embed.OpenAIEmbedder")
+    @patch("knowledge_mcp.embed.create_embedder")
     def test_adapter_stores_collection(
         self,
-        mock_embedder_cls: MagicMock,
+        mock_create_embedder: MagicMock,
         mock_create_store: MagicMock,
     ) -> None:
         """Test adapter stores collection name."""
@@ -361,13 +361,15 @@ class TestSearcherAdapter:
         adapter = _SearcherAdapter(mock_config, "my_collection")
 
         assert adapter._collection == "my_collection"
+        mock_create_embedder.assert_called_once_with(mock_config)
+        mock_create_store.assert_called_once_with(mock_config)
 
     @patch("knowledge_mcp.store.create_store")
-    @patch("knowledge_mcp.embed.OpenAIEmbedder")
+    @patch("knowledge_mcp.embed.create_embedder")
     @pytest.mark.asyncio
     async def test_adapter_search_returns_chunks(
         self,
-        mock_embedder_cls: MagicMock,
+        mock_create_embedder: MagicMock,
         mock_create_store: MagicMock,
     ) -> None:
         """Test adapter search converts store results to KnowledgeChunks."""
@@ -376,7 +378,7 @@ class TestSearcherAdapter:
         # Setup mocks
         mock_embedder = MagicMock()
         mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_embedder_cls.return_value = mock_embedder
+        mock_create_embedder.return_value = mock_embedder
 
         mock_store = MagicMock()
         mock_store.search.return_value = [
@@ -404,11 +406,11 @@ class TestSearcherAdapter:
         assert results[0].document_id == "doc-1"
 
     @patch("knowledge_mcp.store.create_store")
-    @patch("knowledge_mcp.embed.OpenAIEmbedder")
+    @patch("knowledge_mcp.embed.create_embedder")
     @pytest.mark.asyncio
     async def test_adapter_warns_on_collection_mismatch(
         self,
-        mock_embedder_cls: MagicMock,
+        mock_create_embedder: MagicMock,
         mock_create_store: MagicMock,
         caplog: pytest.LogCaptureFixture,
     ) -> None:
@@ -419,7 +421,7 @@ class TestSearcherAdapter:
 
         mock_embedder = MagicMock()
         mock_embedder.embed = AsyncMock(return_value=[0.1] * 1536)
-        mock_embedder_cls.return_value = mock_embedder
+        mock_create_embedder.return_value = mock_embedder
 
         mock_store = MagicMock()
         mock_store.search.return_value = []
@@ -108,6 +108,7 @@ class TestVersionedCollectionName:
         config = KnowledgeConfig(
             openai_api_key=TEST_OPENAI_API_KEY,
             embedding_model="text-embedding-3-large",
+            embedding_dimensions=3072,
         )
         assert config.versioned_collection_name == "se_knowledge_base_v1_te3large"
 
@@ -116,6 +117,34 @@ class TestVersionedCollectionName:
         config = KnowledgeConfig(openai_api_key=TEST_OPENAI_API_KEY)
         assert config.versioned_chromadb_collection_name == "se_knowledge_base_v1_te3small"
 
+    def test_versioned_collection_name_shortened_embeddings(self) -> None:
+        """Test shortened embeddings get their own collections and cache namespace."""
+        config = KnowledgeConfig(openai_api_key=TEST_OPENAI_API_KEY, embedding_dimensions=512)
+
+        assert config.reduced_dimensions is True
+        assert config.versioned_collection_name == "se_knowledge_base_v1_te3small_d512"
+        assert config.versioned_chromadb_collection_name == "se_knowledge_base_v1_te3small_d512"
+        assert config.embedding_cache_model == "text-embedding-3-small-d512"
+
+    def test_local_provider_dimensions_do_not_rename_collection(self) -> None:
+        """Test local model sizes are not treated as shortened OpenAI embeddings."""
+        config = KnowledgeConfig(embedding_provider="local", embedding_dimensions=384)
+
+        assert config.reduced_dimensions is False
+        assert config.embedding_cache_model == "text-embedding-3-small"
+
+    def test_validate_rejects_unsupported_dimensions(self) -> None:
+        """Test dimensions above the model size or shortened ada-002 are rejected."""
+        too_large = KnowledgeConfig(openai_api_key=TEST_OPENAI_API_KEY, embedding_dimensions=2048)
+        ada = KnowledgeConfig(
+            openai_api_key=TEST_OPENAI_API_KEY,
+            embedding_model="text-embedding-ada-002",
+            embedding_dimensions=512,
+        )
+
+        assert any("at most 1536" in e for e in too_large.validate())
+        assert any("does not support shortened" in e for e in ada.validate())
+
 
 class TestCacheConfiguration:
     """Tests for cache configuration fields."""
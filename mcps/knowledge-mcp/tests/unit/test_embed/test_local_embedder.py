@@ -7,6 +7,7 @@ using sentence-transformers, with proper async wrapping and normalization.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -165,6 +166,162 @@ class TestLocalEmbedder:
 
         mock_st_cls.assert_called_once_with("custom-model", device=None)
 
+    @patch("sentence_transformers.SentenceTransformer")
+    def test_onnx_backend_passed_to_model(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test the ONNX backend loads the quantized file on CPU."""
+        mock_st_cls.return_value = mock_model
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        LocalEmbedder(
+            "models/minilm-onnx",
+            backend="onnx",
+            onnx_file_name="onnx/model_qint8_avx2.onnx",
+        )
+
+        mock_st_cls.assert_called_once_with(
+            "models/minilm-onnx",
+            device=None,
+            backend="onnx",
+            model_kwargs={
+                "provider": "CPUExecutionProvider",
+                "file_name": "onnx/model_qint8_avx2.onnx",
+            },
+        )
+
+
+class TestLocalEmbedderMicroBatching:
+    """Tests for micro-batching of concurrent embed() calls."""
+
+    @pytest.fixture
+    def mock_model(self) -> MagicMock:
+        """Create mock SentenceTransformer encoding each text to its length."""
+        model = MagicMock()
+        model.get_sentence_embedding_dimension.return_value = 4
+
+        def encode(texts: str | list[str], **_: object) -> np.ndarray:
+            if isinstance(texts, str):
+                return np.array([float(len(texts))] * 4)
+            return np.array([[float(len(t))] * 4 for t in texts])
+
+        model.encode.side_effect = encode
+        return model
+
+    @patch("sentence_transformers.SentenceTransformer")
+    @pytest.mark.asyncio
+    async def test_concurrent_embeds_share_one_encode(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test concurrent embed calls run one encode and get their own vectors."""
+        mock_st_cls.return_value = mock_model
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        embedder = LocalEmbedder(batch_window_ms=20)
+        results = await asyncio.gather(
+            embedder.embed("a"), embedder.embed("bb"), embedder.embed("ccc")
+        )
+
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0]
+        mock_model.encode.assert_called_once()
+        assert mock_model.encode.call_args[0][0] == ["a", "bb", "ccc"]
+
+    @patch("sentence_transformers.SentenceTransformer")
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test max_batch_size splits a burst into full batches."""
+        mock_st_cls.return_value = mock_model
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        embedder = LocalEmbedder(batch_window_ms=10_000, max_batch_size=2)
+        results = await asyncio.wait_for(
+            asyncio.gather(*(embedder.embed("x" * n) for n in range(1, 5))), timeout=5
+        )
+
+        assert [r[0] for r in results] == [1.0, 2.0, 3.0, 4.0]
+        assert mock_model.encode.call_count == 2
+
+    @patch("sentence_transformers.SentenceTransformer")
+    @pytest.mark.asyncio
+    async def test_encode_tasks_are_tracked_until_done(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test in-flight batch tasks are referenced and released when done."""
+        mock_st_cls.return_value = mock_model
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        embedder = LocalEmbedder(batch_window_ms=10_000, max_batch_size=1)
+        pending = asyncio.ensure_future(embedder.embed("a"))
+        await asyncio.sleep(0)
+
+        assert len(embedder._encode_tasks) == 1
+        await pending
+        await asyncio.sleep(0)
+        assert not embedder._encode_tasks
+
+    @patch("sentence_transformers.SentenceTransformer")
+    @pytest.mark.asyncio
+    async def test_encode_error_reaches_every_caller(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test a failed batch raises in each waiting embed call."""
+        mock_st_cls.return_value = mock_model
+        mock_model.encode.side_effect = RuntimeError("out of memory")
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        embedder = LocalEmbedder(batch_window_ms=20)
+        results = await asyncio.gather(
+            embedder.embed("a"), embedder.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @patch("sentence_transformers.SentenceTransformer")
+    @pytest.mark.asyncio
+    async def test_zero_window_disables_batching(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test batch_window_ms=0 encodes each call on its own."""
+        mock_st_cls.return_value = mock_model
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        embedder = LocalEmbedder(batch_window_ms=0)
+        await asyncio.gather(embedder.embed("a"), embedder.embed("b"))
+
+        assert mock_model.encode.call_count == 2
+        assert all(isinstance(c[0][0], str) for c in mock_model.encode.call_args_list)
+
+    @patch("sentence_transformers.SentenceTransformer")
+    def test_intra_op_threads_sets_torch_threads(
+        self, mock_st_cls: MagicMock, mock_model: MagicMock
+    ) -> None:
+        """Test intra_op_threads is applied to torch."""
+        mock_st_cls.return_value = mock_model
+        mock_torch = MagicMock()
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        with patch.dict("sys.modules", {"torch": mock_torch}):
+            LocalEmbedder(intra_op_threads=4)
+
+        mock_torch.set_num_threads.assert_called_once_with(4)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"batch_window_ms": -1}, "batch_window_ms"),
+            ({"max_batch_size": 0}, "max_batch_size"),
+            ({"intra_op_threads": 0}, "intra_op_threads"),
+        ],
+    )
+    def test_invalid_settings_raise(self, kwargs: dict[str, int], match: str) -> None:
+        """Test out-of-range batching settings are rejected."""
+        from knowledge_mcp.embed.local_embedder import LocalEmbedder
+
+        with pytest.raises(ValueError, match=match):
+            LocalEmbedder(**kwargs)  # type: ignore[arg-type]
+
 
 class TestCreateEmbedder:
     """Tests for create_embedder factory function."""
@@ -226,3 +383,23 @@ class TestCreateEmbedder:
         embedder = create_embedder(config)
 
         assert embedder.model_name == "all-mpnet-base-v2"
+
+    @patch("sentence_transformers.SentenceTransformer")
+    def test_create_local_passes_batching_settings(self, mock_st_cls: MagicMock) -> None:
+        """Test create_embedder passes micro-batching settings from config."""
+        mock_model = MagicMock()
+        mock_model.get_sentence_embedding_dimension.return_value = 384
+        mock_st_cls.return_value = mock_model
+
+        from knowledge_mcp.embed import create_embedder
+        from knowledge_mcp.utils.config import KnowledgeConfig
+
+        config = KnowledgeConfig(
+            embedding_provider="local",
+            local_embedding_batch_window_ms=5.0,
+            local_embedding_max_batch_size=16,
+        )
+        embedder = create_embedder(config)
+
+        assert embedder.batch_window_ms == 5.0  # type: ignore[attr-defined]
+        assert embedder.max_batch_size == 16  # type: ignore[attr-defined]
@@ -0,0 +1,74 @@
+"""Unit tests for MemoryLRUCache."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from knowledge_mcp.embed.memory_cache import MemoryLRUCache
+
+
+class TestMemoryLRUCache:
+    """Tests for MemoryLRUCache class."""
+
+    def test_set_and_get(self) -> None:
+        """Test vectors round-trip as float32-precision lists."""
+        cache = MemoryLRUCache(max_bytes=1024 * 1024)
+
+        cache.set("k", [0.1, 0.2, 0.3])
+
+        assert cache.get("k") == pytest.approx([0.1, 0.2, 0.3])
+        assert cache.hits == 1
+
+    def test_miss_counted(self) -> None:
+        """Test missing keys return None and count a miss."""
+        cache = MemoryLRUCache(max_bytes=1024)
+
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_stores_float32(self) -> None:
+        """Test vectors are held as float32 arrays."""
+        cache = MemoryLRUCache(max_bytes=1024 * 1024)
+
+        cache.set("k", [0.5] * 1536)
+
+        assert cache._entries["k"].dtype == np.float32
+        assert cache.size_bytes >= 1536 * 4
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test the byte budget evicts the least recently used entry."""
+        # Arrange: room for two 256-dim vectors but not three
+        entry_size = MemoryLRUCache._entry_size(np.zeros(256, dtype=np.float32))
+        cache = MemoryLRUCache(max_bytes=entry_size * 2)
+        cache.set("a", [0.0] * 256)
+        cache.set("b", [0.0] * 256)
+        cache.get("a")  # "b" is now least recently used
+
+        # Act
+        cache.set("c", [0.0] * 256)
+
+        # Assert
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_oversized_vector_not_cached(self) -> None:
+        """Test a vector larger than the budget is skipped."""
+        cache = MemoryLRUCache(max_bytes=100)
+
+        cache.set("k", [0.0] * 1536)
+
+        assert len(cache) == 0
+
+    def test_replace_updates_size(self) -> None:
+        """Test re-setting a key does not double count its bytes."""
+        cache = MemoryLRUCache(max_bytes=1024 * 1024)
+
+        cache.set("k", [0.0] * 10)
+        size = cache.size_bytes
+        cache.set("k", [1.0] * 10)
+
+        assert cache.size_bytes == size
+        assert len(cache) == 1
@@ -0,0 +1,122 @@
+# tests/unit/test_embed/test_onnx_export.py
+"""Unit tests for ONNX export and parity checks.
+
+sentence-transformers is replaced with a mock module, so these tests run
+without PyTorch or ONNX Runtime installed.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from knowledge_mcp.embed.onnx_export import (
+    embedding_parity,
+    export_onnx_model,
+    onnx_model_kwargs,
+    quantized_file_name,
+    rerank_parity,
+)
+
+
+class TestOnnxHelpers:
+    """Tests for file name and model_kwargs helpers."""
+
+    def test_quantized_file_name(self) -> None:
+        """Test presets map to the file sentence-transformers writes."""
+        assert quantized_file_name("avx2") == "onnx/model_qint8_avx2.onnx"
+
+    def test_quantized_file_name_unknown_preset(self) -> None:
+        """Test an unknown preset is rejected."""
+        with pytest.raises(ValueError, match="Unknown quantization"):
+            quantized_file_name("int4")
+
+    def test_model_kwargs_default_file(self) -> None:
+        """Test no file name leaves the default unquantized model."""
+        assert onnx_model_kwargs() == {"provider": "CPUExecutionProvider"}
+
+
+class TestExportOnnxModel:
+    """Tests for export_onnx_model."""
+
+    def test_exports_and_quantizes(self, tmp_path: Path) -> None:
+        """Test the model is saved and quantized into the output directory."""
+        mock_st = MagicMock()
+        output_dir = tmp_path / "minilm-onnx"
+
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            file_name = export_onnx_model("all-MiniLM-L6-v2", output_dir, quantization="avx2")
+
+        model = mock_st.SentenceTransformer.return_value
+        mock_st.SentenceTransformer.assert_called_once_with(
+            "all-MiniLM-L6-v2",
+            backend="onnx",
+            model_kwargs={"provider": "CPUExecutionProvider"},
+        )
+        model.save_pretrained.assert_called_once_with(str(output_dir))
+        mock_st.export_dynamic_quantized_onnx_model.assert_called_once_with(
+            model, "avx2", str(output_dir)
+        )
+        assert file_name == "onnx/model_qint8_avx2.onnx"
+        assert output_dir.is_dir()
+
+    def test_reranker_without_quantization(self, tmp_path: Path) -> None:
+        """Test rerankers export through CrossEncoder and may skip quantization."""
+        mock_st = MagicMock()
+
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            file_name = export_onnx_model(
+                "cross-encoder/ms-marco-MiniLM-L6-v2",
+                tmp_path,
+                kind="reranker",
+                quantization=None,
+            )
+
+        mock_st.CrossEncoder.return_value.save_pretrained.assert_called_once()
+        mock_st.export_dynamic_quantized_onnx_model.assert_not_called()
+        assert file_name is None
+
+
+class TestParity:
+    """Tests for embedding_parity and rerank_parity."""
+
+    def test_embedding_parity_identical(self) -> None:
+        """Test identical vectors pass with cosine 1."""
+        vectors = np.eye(3)
+        model = MagicMock()
+        model.encode.return_value = vectors
+
+        report = embedding_parity(model, model, ["a", "b", "c"])
+
+        assert report.worst == pytest.approx(1.0)
+        assert report.passed
+
+    def test_embedding_parity_divergent(self) -> None:
+        """Test one rotated vector fails the check."""
+        reference = MagicMock()
+        reference.encode.return_value = np.eye(2)
+        candidate = MagicMock()
+        candidate.encode.return_value = np.array([[1.0, 0.0], [1.0, 0.0]])
+
+        report = embedding_parity(reference, candidate, ["a", "b"])
+
+        assert report.worst == pytest.approx(0.0)
+        assert report.mean == pytest.approx(0.5)
+        assert not report.passed
+
+    def test_rerank_parity_counts_swapped_pairs(self) -> None:
+        """Test swapped passage orderings lower the agreement."""
+        reference = MagicMock()
+        reference.predict.return_value = [3.0, 2.0, 1.0]
+        candidate = MagicMock()
+        candidate.predict.return_value = [2.0, 3.0, 1.0]
+
+        report = rerank_parity(reference, candidate, ["q"], ["a", "b", "c"])
+
+        assert report.samples == 1
+        assert report.worst == pytest.approx(2 / 3)
+        assert not report.passed
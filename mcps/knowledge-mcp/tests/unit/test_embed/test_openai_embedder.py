@@ -15,11 +15,13 @@ Uses AAA pattern (Arrange-Act-Assert) per testing.md §5.1.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import numpy as np
 import pytest
-from openai import APIConnectionError, APITimeoutError, RateLimitError
+from openai import NOT_GIVEN, APIConnectionError, APITimeoutError, RateLimitError
 
 from knowledge_mcp.embed.openai_embedder import OpenAIEmbedder
 from knowledge_mcp.exceptions import (
@@ -68,6 +70,64 @@ class TestOpenAIEmbedderInit:
 
         assert "API key is required" in str(exc_info.value)
 
+    def test_init_rejects_dimensions_above_model_size(self) -> None:
+        """Test that dimensions beyond the model's output raise ValidationError."""
+        # Arrange, Act & Assert
+        with pytest.raises(ValidationError, match="at most 1536"):
+            OpenAIEmbedder(api_key=TEST_SK_API_KEY, dimensions=3072)
+
+    def test_init_rejects_shortening_ada(self) -> None:
+        """Test that ada-002 cannot be shortened."""
+        # Arrange, Act & Assert
+        with pytest.raises(ValidationError, match="shortened"):
+            OpenAIEmbedder(
+                api_key=TEST_SK_API_KEY,
+                model="text-embedding-ada-002",
+                dimensions=512,
+            )
+
+
+class TestOpenAIEmbedderDimensions:
+    """Tests for shortened text-embedding-3 embeddings."""
+
+    @pytest.mark.asyncio
+    async def test_shortened_dimensions_sent_to_api(self) -> None:
+        """Test that reduced dimensions are requested from the API."""
+        # Arrange
+        with patch("knowledge_mcp.embed.openai_embedder.AsyncOpenAI"):
+            embedder = OpenAIEmbedder(
+                api_key=TEST_SK_API_KEY,
+                model="text-embedding-3-large",
+                dimensions=1024,
+            )
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.1] * 1024)]
+        embedder._client.embeddings.create = AsyncMock(return_value=mock_response)
+
+        # Act
+        result = await embedder.embed("verification")
+
+        # Assert
+        assert len(result) == 1024
+        call_kwargs = embedder._client.embeddings.create.call_args[1]
+        assert call_kwargs["dimensions"] == 1024
+
+    @pytest.mark.asyncio
+    async def test_full_dimensions_not_sent_to_api(self) -> None:
+        """Test that full-size requests omit the dimensions parameter."""
+        # Arrange
+        with patch("knowledge_mcp.embed.openai_embedder.AsyncOpenAI"):
+            embedder = OpenAIEmbedder(api_key=TEST_SK_API_KEY)
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.1] * 1536)]
+        embedder._client.embeddings.create = AsyncMock(return_value=mock_response)
+
+        # Act
+        await embedder.embed("verification")
+
+        # Assert
+        assert embedder._client.embeddings.create.call_args[1]["dimensions"] is NOT_GIVEN
+
 
 class TestOpenAIEmbedderEmbed:
     """Tests for single text embedding."""
@@ -192,6 +252,39 @@ class TestOpenAIEmbedderEmbedBatch:
         assert len(result) == 150
         assert call_count == 2  # Should split into 2 API calls
 
+    @pytest.mark.asyncio
+    async def test_embed_batch_concurrent_preserves_order(self) -> None:
+        """Test batches run concurrently and results keep input order."""
+        # Arrange
+        with patch("knowledge_mcp.embed.openai_embedder.AsyncOpenAI"):
+            embedder = OpenAIEmbedder(api_key=TEST_SK_API_KEY, max_concurrency=2)
+        texts = [f"text {i}" for i in range(5)]
+        active = 0
+        peak = 0
+
+        async def mock_create(*args, **kwargs):  # noqa: ARG001
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            batch = kwargs["input"]
+            # Later batches finish first
+            await asyncio.sleep(0.01 * (10 - int(batch[0].split()[1])))
+            active -= 1
+            response = MagicMock()
+            response.data = [
+                MagicMock(embedding=[float(t.split()[1])] * 1536) for t in batch
+            ]
+            return response
+
+        embedder._client.embeddings.create = mock_create
+
+        # Act
+        result = await embedder.embed_batch(texts, batch_size=1)
+
+        # Assert
+        assert [v[0] for v in result] == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_embed_batch_empty_list(self, mock_embedder: OpenAIEmbedder) -> None:
         """Test that empty text list returns empty result."""
@@ -461,12 +554,51 @@ class TestOpenAIEmbedderBatchErrorHandling:
             )
 
         mock_embedder._client.embeddings.create = mock_create
+        backoff = AsyncMock()
+        mock_embedder._rate_limiter.record_rate_limited = backoff
 
         # Act & Assert
         with pytest.raises(KMCPRateLimitError) as exc_info:
             await mock_embedder.embed_batch(["text 1", "text 2"])
 
         assert "rate limit" in str(exc_info.value).lower()
+        # Backs off between attempts before giving up
+        assert backoff.await_count == 5
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_recovers_after_rate_limit(
+        self, mock_embedder: OpenAIEmbedder
+    ) -> None:
+        """Test that a 429 is retried after backoff instead of failing."""
+        # Arrange
+        mock_response = MagicMock()
+        mock_response.status_code = 429
+        mock_response.headers = {"retry-after": "2"}
+        calls = 0
+
+        async def mock_create(*args, **kwargs):  # noqa: ARG001
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RateLimitError(
+                    message="Rate limit exceeded",
+                    response=mock_response,
+                    body=None,
+                )
+            result = MagicMock()
+            result.data = [MagicMock(embedding=[0.1] * 1536) for _ in kwargs["input"]]
+            return result
+
+        mock_embedder._client.embeddings.create = mock_create
+        backoff = AsyncMock()
+        mock_embedder._rate_limiter.record_rate_limited = backoff
+
+        # Act
+        vectors = await mock_embedder.embed_batch(["text 1", "text 2"])
+
+        # Assert
+        assert len(vectors) == 2
+        backoff.assert_awaited_once_with(2.0)
 
     @pytest.mark.asyncio
     async def test_embed_batch_connection_error(
@@ -585,6 +717,7 @@ class TestOpenAIEmbedderCacheIntegration:
         """Create mock EmbeddingCache."""
         cache = MagicMock()
         cache.get.return_value = None  # Default: cache miss
+        cache.get_many.side_effect = lambda texts: [None] * len(texts)
         return cache
 
     @pytest.fixture
@@ -708,7 +841,7 @@ class TestOpenAIEmbedderCacheIntegration:
         embedder_with_cache: OpenAIEmbedder,
         mock_cache: MagicMock,
     ) -> None:
-        """Verify embed_batch checks cache for each text individually."""
+        """Verify embed_batch looks up all texts in one bulk cache call."""
         texts = ["text 1", "text 2", "text 3"]
 
         # Mock API to return embeddings for all texts
@@ -721,11 +854,9 @@ class TestOpenAIEmbedderCacheIntegration:
 
         await embedder_with_cache.embed_batch(texts)
 
-        # Should check cache for each text
-        assert mock_cache.get.call_count == 3
-        mock_cache.get.assert_any_call("text 1")
-        mock_cache.get.assert_any_call("text 2")
-        mock_cache.get.assert_any_call("text 3")
+        # Should check the cache once for all texts
+        mock_cache.get_many.assert_called_once_with(texts)
+        mock_cache.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_embed_batch_skips_api_for_cached_texts(
@@ -737,14 +868,12 @@ class TestOpenAIEmbedderCacheIntegration:
         texts = ["cached 1", "new text", "cached 2"]
 
         # Set up cache to return values for texts 1 and 3
-        def cache_get_side_effect(text: str) -> list[float] | None:
-            if text == "cached 1":
-                return [0.1] * 1536
-            elif text == "cached 2":
-                return [0.3] * 1536
-            return None
-
-        mock_cache.get.side_effect = cache_get_side_effect
+        mock_cache.get_many.side_effect = None
+        mock_cache.get_many.return_value = [
+            np.full(1536, 0.1, dtype=np.float32),
+            None,
+            np.full(1536, 0.3, dtype=np.float32),
+        ]
 
         # Mock API to return embedding for the single uncached text
         mock_response = MagicMock()
@@ -757,8 +886,9 @@ class TestOpenAIEmbedderCacheIntegration:
 
         # Should return 3 embeddings
         assert len(result) == 3
-        assert result[0] == [0.1] * 1536  # From cache
-        assert result[2] == [0.3] * 1536  # From cache
+        assert result[0] == pytest.approx([0.1] * 1536)  # From cache
+        assert result[2] == pytest.approx([0.3] * 1536)  # From cache
+        assert isinstance(result[0], list)
 
         # API should only be called once for the uncached text
         embedder_with_cache._client.embeddings.create.assert_called_once()
@@ -782,5 +912,93 @@ class TestOpenAIEmbedderCacheIntegration:
 
         await embedder_with_cache.embed_batch(texts)
 
-        # Should store both new embeddings
-        assert mock_cache.set.call_count == 2
+        # Should store both new embeddings in one bulk write
+        mock_cache.set_many.assert_called_once_with(texts, embeddings)
+        mock_cache.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_tracks_usage_per_batch(
+        self,
+        embedder_with_cache: OpenAIEmbedder,
+        mock_cache: MagicMock,
+        mock_tracker: MagicMock,
+    ) -> None:
+        """Verify embed_batch records hits and API usage in bulk calls."""
+        texts = ["cached", "new 1", "new 2"]
+        mock_cache.get_many.side_effect = None
+        mock_cache.get_many.return_value = [np.zeros(1536, dtype=np.float32), None, None]
+        mock_response = MagicMock()
+        mock_response.data = [MagicMock(embedding=[0.1] * 1536)] * 2
+        embedder_with_cache._client.embeddings.create = AsyncMock(
+            return_value=mock_response
+        )
+
+        await embedder_with_cache.embed_batch(texts)
+
+        mock_tracker.track_embedding.assert_not_called()
+        mock_tracker.track_batch.assert_any_call(["cached"], cache_hit=True)
+        mock_tracker.track_batch.assert_any_call(["new 1", "new 2"], tokens=None)
+
+
+class TestOpenAIEmbedderCoalescing:
+    """Tests for single-flight coalescing of identical embed calls."""
+
+    @pytest.fixture
+    def mock_embedder(self) -> OpenAIEmbedder:
+        """Create an embedder with mocked OpenAI client."""
+        with patch("knowledge_mcp.embed.openai_embedder.AsyncOpenAI"):
+            return OpenAIEmbedder(api_key=TEST_SK_API_KEY)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_queries_share_one_call(
+        self, mock_embedder: OpenAIEmbedder
+    ) -> None:
+        """Test identical in-flight queries trigger a single API request."""
+        # Arrange
+        calls = 0
+
+        async def mock_create(*args, **kwargs):  # noqa: ARG001
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            response = MagicMock()
+            response.data = [MagicMock(embedding=[0.1] * 1536)]
+            return response
+
+        mock_embedder._client.embeddings.create = mock_create
+
+        # Act
+        results = await asyncio.gather(
+            mock_embedder.embed("system requirements"),
+            mock_embedder.embed("system  requirements"),
+            mock_embedder.embed(" system requirements "),
+        )
+
+        # Assert
+        assert calls == 1
+        assert all(r == [0.1] * 1536 for r in results)
+        assert results[0] is not results[1]
+        assert mock_embedder._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_callers_share_errors(
+        self, mock_embedder: OpenAIEmbedder
+    ) -> None:
+        """Test a failed in-flight request fails all waiters, then clears."""
+        # Arrange
+        async def mock_create(*args, **kwargs):  # noqa: ARG001
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        mock_embedder._client.embeddings.create = mock_create
+
+        # Act
+        results = await asyncio.gather(
+            mock_embedder.embed("query"),
+            mock_embedder.embed("query"),
+            return_exceptions=True,
+        )
+
+        # Assert
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert mock_embedder._inflight == {}
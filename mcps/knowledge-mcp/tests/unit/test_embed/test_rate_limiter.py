@@ -0,0 +1,148 @@
+# tests/unit/test_embed/test_rate_limiter.py
+"""
+Unit tests for RateLimiter.
+
+Uses a fake clock and patched sleep so budgets can be verified without
+waiting in real time.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from knowledge_mcp.embed.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a fake clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def sleeps(clock: FakeClock):
+    """Patch asyncio.sleep in the limiter to advance the fake clock."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+        clock.now += delay
+
+    with patch("knowledge_mcp.embed.rate_limiter.asyncio.sleep", fake_sleep):
+        yield recorded
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter class."""
+
+    @pytest.mark.asyncio
+    async def test_unlimited_never_waits(self, clock: FakeClock, sleeps: list[float]) -> None:
+        """Test no budgets means no waiting."""
+        limiter = RateLimiter(clock=clock)
+
+        for _ in range(100):
+            await limiter.acquire(tokens=10_000)
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_budget(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Test the request after the RPM budget waits for the window."""
+        # Arrange
+        limiter = RateLimiter(requests_per_minute=2, clock=clock)
+
+        # Act
+        await limiter.acquire()
+        clock.now += 10
+        await limiter.acquire()
+        await limiter.acquire()
+
+        # Assert
+        assert sleeps == [pytest.approx(50.0)]
+
+    @pytest.mark.asyncio
+    async def test_tokens_per_minute_budget(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Test a request exceeding the remaining TPM budget waits."""
+        # Arrange
+        limiter = RateLimiter(tokens_per_minute=1000, clock=clock)
+
+        # Act
+        await limiter.acquire(tokens=800)
+        await limiter.acquire(tokens=300)
+
+        # Assert
+        assert sleeps == [pytest.approx(60.0)]
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_admitted_when_window_empty(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Test a single request above the TPM budget does not deadlock."""
+        limiter = RateLimiter(tokens_per_minute=100, clock=clock)
+
+        await limiter.acquire(tokens=500)
+
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_uses_retry_after(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Test a 429 with Retry-After pauses for exactly that long."""
+        # Arrange
+        limiter = RateLimiter(clock=clock)
+
+        # Act
+        await limiter.record_rate_limited(retry_after=3.0)
+
+        # Assert
+        assert sleeps == [pytest.approx(3.0)]
+        assert limiter.consecutive_rate_limits == 1
+
+    @pytest.mark.asyncio
+    async def test_backoff_grows_and_resets(self, clock: FakeClock, sleeps: list[float]) -> None:
+        """Test consecutive 429s grow the delay and success resets it."""
+        # Arrange
+        limiter = RateLimiter(base_delay=1.0, max_delay=8.0, clock=clock)
+
+        # Act
+        for _ in range(5):
+            await limiter.record_rate_limited()
+        limiter.record_success()
+
+        # Assert
+        assert 0.5 <= sleeps[0] <= 1.0
+        assert 2.0 <= sleeps[2] <= 4.0
+        assert 4.0 <= sleeps[4] <= 8.0
+        assert limiter.consecutive_rate_limits == 0
+
+    @pytest.mark.asyncio
+    async def test_pause_blocks_other_callers(
+        self, clock: FakeClock, sleeps: list[float]
+    ) -> None:
+        """Test acquire waits out a pause set by another caller's 429."""
+        # Arrange
+        limiter = RateLimiter(clock=clock)
+        limiter._paused_until = clock.now + 5.0
+
+        # Act
+        await limiter.acquire()
+
+        # Assert
+        assert sleeps == [pytest.approx(5.0)]
@@ -5,9 +5,10 @@ from __future__ import annotations
 import tempfile
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from knowledge_mcp.embed.cache import EmbeddingCache
+from knowledge_mcp.embed.cache import EmbeddingCache, decode_vector, encode_vector
 
 
 class TestEmbeddingCache:
@@ -32,13 +33,34 @@ class TestEmbeddingCache:
         cache.set(text, embedding)
         result = cache.get(text)
 
-        assert result == embedding
+        # Vectors are held as float32
+        assert result == pytest.approx(embedding)
 
     def test_get_missing_returns_none(self, cache: EmbeddingCache) -> None:
         """Test that missing text returns None."""
         result = cache.get("nonexistent text")
         assert result is None
 
+    def test_lookups_counted_when_recording(self, cache: EmbeddingCache) -> None:
+        """Test hits and misses are counted and timed by the span recorder."""
+        from knowledge_mcp.monitoring.spans import get_recorder
+
+        recorder = get_recorder()
+        recorder.reset()
+        recorder.enabled = True
+        try:
+            cache.set("cached", [0.1, 0.2])
+            cache.get("cached")
+            cache.get_many(["cached", "missing"])
+            snapshot = recorder.snapshot()
+        finally:
+            recorder.enabled = False
+            recorder.reset()
+
+        assert snapshot["counters"] == {"embedding_cache.hits": 2, "embedding_cache.misses": 1}
+        assert snapshot["spans"]["embedding_cache.get"]["count"] == 1
+        assert snapshot["spans"]["embedding_cache.get_many"]["count"] == 1
+
     def test_normalized_text_matches(self, cache: EmbeddingCache) -> None:
         """Test that whitespace variations map to same cache entry."""
         embedding = [0.1, 0.2, 0.3]
@@ -46,17 +68,17 @@ class TestEmbeddingCache:
         cache.set("Hello world", embedding)
 
         # Extra spaces should still hit cache
-        assert cache.get("Hello  world") == embedding
-        assert cache.get("  Hello world  ") == embedding
-        assert cache.get("Hello\n\tworld") == embedding
+        assert cache.get("Hello  world") == pytest.approx(embedding)
+        assert cache.get("  Hello world  ") == pytest.approx(embedding)
+        assert cache.get("Hello\n\tworld") == pytest.approx(embedding)
 
     def test_different_text_different_keys(self, cache: EmbeddingCache) -> None:
         """Test that different text produces different cache keys."""
         cache.set("Hello world", [0.1])
         cache.set("Hello universe", [0.2])
 
-        assert cache.get("Hello world") == [0.1]
-        assert cache.get("Hello universe") == [0.2]
+        assert cache.get("Hello world") == pytest.approx([0.1])
+        assert cache.get("Hello universe") == pytest.approx([0.2])
 
     def test_contains_check(self, cache: EmbeddingCache) -> None:
         """Test contains() method."""
@@ -95,7 +117,7 @@ class TestEmbeddingCache:
         cache1.set("text", [0.1])
 
         # Different model should NOT see cache from other model
-        assert cache1.get("text") == [0.1]
+        assert cache1.get("text") == pytest.approx([0.1])
         assert cache2.get("text") is None
 
     def test_persistence_across_instances(self, cache_dir: Path) -> None:
@@ -111,4 +133,156 @@ class TestEmbeddingCache:
         cache2 = EmbeddingCache(cache_dir, model)
         result = cache2.get("persistent text")
 
-        assert result == [0.1, 0.2]
+        assert result == pytest.approx([0.1, 0.2])
+
+
+class TestEmbeddingCacheMemoryTier:
+    """Tests for the in-memory LRU tier of EmbeddingCache."""
+
+    @pytest.fixture
+    def cache_dir(self) -> Path:
+        """Create temporary cache directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def test_repeat_get_served_from_memory(self, cache_dir: Path) -> None:
+        """Test that a second lookup does not touch the disk cache."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small")
+        cache.set("hot query", [0.5, 0.25])
+        cache.cache.clear()  # Drop disk copy; memory tier still has it
+
+        assert cache.get("hot query") == [0.5, 0.25]
+        assert cache.stats()["memory_hits"] == 1
+
+    def test_disk_hit_promoted_to_memory(self, cache_dir: Path) -> None:
+        """Test that disk hits are promoted into the memory tier."""
+        cache1 = EmbeddingCache(cache_dir, "text-embedding-3-small")
+        cache1.set("persistent text", [0.5])
+        cache1.close()
+
+        cache2 = EmbeddingCache(cache_dir, "text-embedding-3-small")
+        assert len(cache2.memory) == 0
+        cache2.get("persistent text")
+
+        assert len(cache2.memory) == 1
+
+    def test_memory_tier_disabled(self, cache_dir: Path) -> None:
+        """Test that memory_size_limit=0 disables the tier."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small", memory_size_limit=0)
+        cache.set("text", [0.5])
+
+        assert len(cache.memory) == 0
+        assert cache.get("text") == [0.5]
+
+
+class TestEmbeddingCacheBinaryStorage:
+    """Tests for packed vector storage and bulk operations."""
+
+    @pytest.fixture
+    def cache_dir(self) -> Path:
+        """Create temporary cache directory."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            yield Path(tmpdir)
+
+    def test_float32_round_trip_is_zero_copy(self) -> None:
+        """Test float32 entries decode to a read-only view of the bytes."""
+        vector = np.linspace(-1, 1, 1536, dtype=np.float32)
+
+        packed = encode_vector(vector)
+        decoded = decode_vector(packed)
+
+        assert len(packed) == 4 + 1536 * 4
+        assert decoded.dtype == np.float32
+        assert not decoded.flags.writeable
+        np.testing.assert_array_equal(decoded, vector)
+
+    def test_float16_round_trip(self) -> None:
+        """Test float16 entries are half the size and close to the input."""
+        vector = np.linspace(-1, 1, 1536, dtype=np.float32)
+
+        packed = encode_vector(vector, "float16")
+
+        assert len(packed) == 4 + 1536 * 2
+        np.testing.assert_allclose(decode_vector(packed), vector, atol=1e-3)
+
+    def test_int8_round_trip_with_scale(self) -> None:
+        """Test int8 entries carry a scale and dequantize within one step."""
+        vector = np.linspace(-0.2, 0.2, 1536, dtype=np.float32)
+
+        packed = encode_vector(vector, "int8")
+        decoded = decode_vector(packed)
+
+        assert len(packed) == 4 + 4 + 1536
+        assert decoded.dtype == np.float32
+        np.testing.assert_allclose(decoded, vector, atol=0.2 / 127)
+
+    def test_legacy_list_value_decodes(self) -> None:
+        """Test entries pickled by older versions still load."""
+        decoded = decode_vector([0.5, 0.25])
+
+        np.testing.assert_array_equal(decoded, np.array([0.5, 0.25], dtype=np.float32))
+
+    def test_disk_stores_packed_bytes(self, cache_dir: Path) -> None:
+        """Test values on disk are raw bytes, not pickled lists."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small")
+        cache.set("text", [0.5] * 1536)
+
+        key = cache._hash_content("text")
+
+        assert isinstance(cache.cache.get(key), bytes)
+
+    def test_invalid_dtype_raises(self, cache_dir: Path) -> None:
+        """Test an unknown dtype is rejected."""
+        with pytest.raises(ValueError, match="Unsupported cache dtype"):
+            EmbeddingCache(cache_dir, "text-embedding-3-small", dtype="float64")  # type: ignore[arg-type]
+
+    def test_get_vector_returns_array(self, cache_dir: Path) -> None:
+        """Test get_vector returns a float32 array."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small", memory_size_limit=0)
+        cache.set("text", [0.5, 0.25])
+
+        vector = cache.get_vector("text")
+
+        assert isinstance(vector, np.ndarray)
+        np.testing.assert_array_equal(vector, [0.5, 0.25])
+
+    def test_set_many_and_get_many(self, cache_dir: Path) -> None:
+        """Test bulk operations round-trip and report misses in order."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small", memory_size_limit=0)
+        cache.set_many(["a", "b"], [[0.5, 0.5], [0.25, 0.25]])
+
+        results = cache.get_many(["b", "missing", "a"])
+
+        np.testing.assert_array_equal(results[0], [0.25, 0.25])
+        assert results[1] is None
+        np.testing.assert_array_equal(results[2], [0.5, 0.5])
+
+    def test_get_many_uses_memory_tier(self, cache_dir: Path) -> None:
+        """Test bulk lookups are served from memory and promote disk hits."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small")
+        cache.set_many(["a", "b"], [[0.5], [0.25]])
+        cache.memory.clear()
+
+        cache.get_many(["a", "b"])
+        cache.cache.clear()
+        results = cache.get_many(["a", "b"])
+
+        np.testing.assert_array_equal(results[0], [0.5])
+        np.testing.assert_array_equal(results[1], [0.25])
+
+    def test_set_many_length_mismatch_raises(self, cache_dir: Path) -> None:
+        """Test set_many rejects misaligned inputs."""
+        cache = EmbeddingCache(cache_dir, "text-embedding-3-small")
+
+        with pytest.raises(ValueError, match="same length"):
+            cache.set_many(["a", "b"], [[0.5]])
+
+    def test_int8_cache_dtype(self, cache_dir: Path) -> None:
+        """Test a cache configured for int8 returns approximate vectors."""
+        cache = EmbeddingCache(
+            cache_dir, "text-embedding-3-small", memory_size_limit=0, dtype="int8"
+        )
+        cache.set("text", [0.5, -0.25, 0.1])
+
+        assert cache.get("text") == pytest.approx([0.5, -0.25, 0.1], abs=0.5 / 127)
+        assert cache.stats()["dtype"] == "int8"
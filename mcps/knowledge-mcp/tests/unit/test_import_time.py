@@ -0,0 +1,103 @@
+# tests/unit/test_import_time.py
+"""
+Import-time budget for the MCP server.
+
+The client starts the server for every session and waits for list_tools
+before the first call, so importing knowledge_mcp.server and building the
+tool list must not load the heavy dependencies that only some tools use.
+Each check runs in a fresh interpreter under ``python -X importtime``.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+# Cumulative import time allowed for knowledge_mcp.server (includes mcp itself)
+IMPORT_TIME_BUDGET_SECONDS = 1.5
+
+# Loaded only by the tool (or backend) that needs them
+HEAVY_MODULES = [
+    "bm25s",
+    "chromadb",
+    "cohere",
+    "crawl4ai",
+    "diskcache",
+    "docling",
+    "numpy",
+    "openai",
+    "qdrant_client",
+    "sentence_transformers",
+    "sqlalchemy",
+    "tiktoken",
+]
+
+STARTUP_SCRIPT = """
+import asyncio, json, sys
+from mcp.types import ListToolsRequest
+from knowledge_mcp.server import KnowledgeMCPServer
+
+server = KnowledgeMCPServer()
+handler = server.server.request_handlers[ListToolsRequest]
+result = asyncio.run(handler(ListToolsRequest()))
+heavy = [m for m in json.loads(sys.argv[1]) if m in sys.modules]
+print(json.dumps({"tools": len(result.root.tools), "heavy": heavy}))
+"""
+
+
+def run_startup() -> tuple[dict[str, object], str]:
+    """Import the server and list its tools in a fresh interpreter."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT, json.dumps(HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def cumulative_seconds(importtime_log: str, module: str) -> float:
+    """Cumulative import time of a module from ``-X importtime`` output."""
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1_000_000
+    msg = f"{module} not found in importtime output"
+    raise AssertionError(msg)
+
+
+class TestStartupImports:
+    """Tests for time to first list_tools."""
+
+    def test_list_tools_does_not_load_heavy_dependencies(self) -> None:
+        """Test importing the server and listing tools skips heavy dependencies."""
+        # Act
+        result, _ = run_startup()
+
+        # Assert
+        assert result["tools"] > 0
+        assert result["heavy"] == []
+
+    def test_server_import_within_budget(self) -> None:
+        """Test the server module imports within the fixed budget."""
+        # Act
+        _, importtime_log = run_startup()
+
+        # Assert
+        elapsed = cumulative_seconds(importtime_log, "knowledge_mcp.server")
+        assert elapsed < IMPORT_TIME_BUDGET_SECONDS, (
+            f"knowledge_mcp.server imported in {elapsed:.3f}s "
+            f"(budget {IMPORT_TIME_BUDGET_SECONDS}s)"
+        )
+
+    def test_package_exports_resolve_lazily(self) -> None:
+        """Test lazily exported names still resolve on first access."""
+        # Arrange
+        import knowledge_mcp.search as search
+
+        # Act / Assert
+        assert search.SearchResult.__module__ == "knowledge_mcp.search.models"
+        assert "HybridSearcher" in dir(search)
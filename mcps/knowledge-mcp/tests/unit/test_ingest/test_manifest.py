@@ -0,0 +1,81 @@
+"""Unit tests for per-document chunk manifests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from knowledge_mcp.ingest.manifest import ChunkManifest
+from knowledge_mcp.models.chunk import KnowledgeChunk
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _chunk(chunk_id: str, content_hash: str) -> KnowledgeChunk:
+    """Build a minimal chunk with an id and hash."""
+    return KnowledgeChunk(
+        id=chunk_id,
+        document_id="ieee-15288",
+        document_title="ISO/IEC/IEEE 15288",
+        document_type="standard",
+        content=f"content {chunk_id}",
+        content_hash=content_hash,
+        token_count=2,
+    )
+
+
+class TestChunkManifest:
+    """Tests for ChunkManifest."""
+
+    def test_unknown_document_is_all_added(self, tmp_path: Path) -> None:
+        """Test a document without a manifest needs every chunk."""
+        manifest = ChunkManifest(tmp_path)
+        chunks = [_chunk("a", "h1"), _chunk("b", "h2")]
+
+        diff = manifest.diff("ieee-15288", chunks)
+
+        assert diff.added == chunks
+        assert diff.unchanged == []
+        assert diff.removed == []
+        assert diff.changed
+
+    def test_diff_against_saved_manifest(self, tmp_path: Path) -> None:
+        """Test edited, unchanged and vanished chunks are classified."""
+        # Arrange
+        manifest = ChunkManifest(tmp_path)
+        manifest.save("ieee-15288", [_chunk("a", "h1"), _chunk("b", "h2"), _chunk("c", "h3")])
+
+        # Act
+        diff = manifest.diff(
+            "ieee-15288", [_chunk("a", "h1"), _chunk("b", "edited"), _chunk("d", "h4")]
+        )
+
+        # Assert
+        assert [c.id for c in diff.added] == ["b", "d"]
+        assert diff.unchanged == ["a"]
+        assert diff.removed == ["c"]
+
+    def test_identical_content_is_unchanged(self, tmp_path: Path) -> None:
+        """Test re-saving the same chunks produces an empty diff."""
+        manifest = ChunkManifest(tmp_path)
+        chunks = [_chunk("a", "h1")]
+        manifest.save("ieee-15288", chunks)
+
+        diff = manifest.diff("ieee-15288", chunks)
+
+        assert not diff.changed
+
+    def test_document_id_escaped_in_file_name(self, tmp_path: Path) -> None:
+        """Test ids with path separators stay inside the manifest directory."""
+        manifest = ChunkManifest(tmp_path)
+
+        manifest.save("iso/iec 15288", [_chunk("a", "h1")])
+
+        assert [p.name for p in tmp_path.iterdir()] == ["iso%2Fiec%2015288.json"]
+        assert manifest.load("iso/iec 15288") == {"a": "h1"}
+
+    def test_unreadable_manifest_loads_empty(self, tmp_path: Path) -> None:
+        """Test a corrupt manifest falls back to a full re-ingest."""
+        (tmp_path / "ieee-15288.json").write_text("{not json", encoding="utf-8")
+
+        assert ChunkManifest(tmp_path).load("ieee-15288") == {}
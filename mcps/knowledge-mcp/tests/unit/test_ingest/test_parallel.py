@@ -0,0 +1,186 @@
+"""Unit tests for process-pool document parsing."""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from knowledge_mcp.exceptions import IngestionError
+from knowledge_mcp.ingest.base import ParsedDocument, ParsedElement
+from knowledge_mcp.ingest.parallel import ParallelParser, ParsePool
+from knowledge_mcp.models.document import DocumentMetadata
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from unittest.mock import MagicMock
+
+
+def _parsed(path: str) -> ParsedDocument:
+    """Build a small ParsedDocument for a file path."""
+    stem = Path(path).stem
+    return ParsedDocument(
+        metadata=DocumentMetadata(
+            document_id=stem,
+            title=stem,
+            document_type="standard",
+            source_path=path,
+            version="2014",
+        ),
+        elements=[
+            ParsedElement(element_type="heading", content="Scope", heading_level=1),
+            ParsedElement(
+                element_type="table",
+                content="| a | b |",
+                page_number=3,
+                section_hierarchy=["Scope"],
+                table_data=[["a", "b"]],
+                caption="Table 1",
+            ),
+        ],
+    )
+
+
+class TestParsedDocumentCompact:
+    """Tests for ParsedDocument compact serialization."""
+
+    def test_round_trip(self) -> None:
+        """Test to_compact/from_compact preserve every field."""
+        doc = _parsed("/data/ieee-15288.pdf")
+
+        assert ParsedDocument.from_compact(doc.to_compact()) == doc
+
+    def test_fields_are_named(self) -> None:
+        """Test the packed form is keyed by field name, not position."""
+        packed = _parsed("/data/ieee-15288.pdf").to_compact()
+
+        assert packed["metadata"]["version"] == "2014"
+        assert packed["elements"][1]["caption"] == "Table 1"
+
+
+class TestParsePool:
+    """Tests for ParsePool worker management."""
+
+    def test_terminate_stops_busy_worker(self) -> None:
+        """Test terminate() kills a worker stuck on a task."""
+        # Arrange
+        pool = ParsePool(1, initializer=None)
+        future = pool.submit(time.sleep, 60)
+        while not pool._worker_context.processes:
+            time.sleep(0.01)
+        worker = pool._worker_context.processes[0]
+
+        # Act
+        pool.terminate()
+
+        # Assert
+        worker.join(timeout=10)
+        assert not worker.is_alive()
+        with pytest.raises(BrokenProcessPool):
+            future.result(timeout=10)
+
+
+class TestParallelParser:
+    """Tests for ParallelParser."""
+
+    @pytest.fixture
+    def parse(self) -> Iterator[MagicMock]:
+        """Replace the worker parse function (no Docling, no processes)."""
+        with patch(
+            "knowledge_mcp.ingest.parallel._parse_compact",
+            side_effect=lambda path: _parsed(path).to_compact(),
+        ) as mock_parse:
+            yield mock_parse
+
+    @pytest.fixture
+    def make_parser(self) -> Iterator[Callable[..., ParallelParser]]:
+        """Build thread-backed parsers and close them after the test."""
+        parsers: list[ParallelParser] = []
+
+        def make(**kwargs: object) -> ParallelParser:
+            parser = ParallelParser(
+                workers=2, executor_factory=ThreadPoolExecutor, **kwargs  # type: ignore[arg-type]
+            )
+            parsers.append(parser)
+            return parser
+
+        yield make
+        for parser in parsers:
+            parser.close()
+
+    def test_parses_all_files(
+        self, parse: MagicMock, make_parser: Callable[..., ParallelParser]
+    ) -> None:
+        """Test every file yields a parsed document."""
+        files = [Path(f"/tmp/doc{i}.pdf") for i in range(5)]
+
+        outcomes = list(make_parser().parse_many(files))
+
+        assert {o.path for o in outcomes} == set(files)
+        assert all(o.success for o in outcomes)
+        assert outcomes[0].document is not None
+        assert outcomes[0].document.elements[1].table_data == [["a", "b"]]
+
+    def test_error_isolated_to_file(
+        self, parse: MagicMock, make_parser: Callable[..., ParallelParser]
+    ) -> None:
+        """Test a parse error fails only that file."""
+        def side_effect(path: str) -> tuple[object, ...]:
+            if path.endswith("bad.pdf"):
+                raise IngestionError("Corrupt file")
+            return _parsed(path).to_compact()
+
+        parse.side_effect = side_effect
+        files = [Path("/tmp/good.pdf"), Path("/tmp/bad.pdf")]
+
+        outcomes = {o.path.name: o for o in make_parser().parse_many(files)}
+
+        assert outcomes["good.pdf"].success
+        assert outcomes["bad.pdf"].error == "Corrupt file"
+
+    def test_crash_retries_innocent_files(
+        self, parse: MagicMock, make_parser: Callable[..., ParallelParser]
+    ) -> None:
+        """Test a worker crash fails only the file that crashes alone."""
+        def side_effect(path: str) -> tuple[object, ...]:
+            if path.endswith("crash.pdf"):
+                raise BrokenProcessPool("worker died")
+            return _parsed(path).to_compact()
+
+        parse.side_effect = side_effect
+        files = [Path("/tmp/crash.pdf"), Path("/tmp/ok1.pdf"), Path("/tmp/ok2.pdf")]
+
+        outcomes = {o.path.name: o for o in make_parser().parse_many(files)}
+
+        assert len(outcomes) == 3
+        assert outcomes["crash.pdf"].error == "Parser worker crashed"
+        assert outcomes["ok1.pdf"].success
+        assert outcomes["ok2.pdf"].success
+
+    def test_timeout_fails_slow_file(
+        self, parse: MagicMock, make_parser: Callable[..., ParallelParser]
+    ) -> None:
+        """Test a file over the time limit is abandoned, others complete."""
+        def side_effect(path: str) -> tuple[object, ...]:
+            if path.endswith("slow.pdf"):
+                time.sleep(1.5)
+            return _parsed(path).to_compact()
+
+        parse.side_effect = side_effect
+        files = [Path("/tmp/slow.pdf"), Path("/tmp/fast.pdf")]
+
+        outcomes = {o.path.name: o for o in make_parser(timeout=0.2).parse_many(files)}
+
+        assert outcomes["fast.pdf"].success
+        assert outcomes["slow.pdf"].error is not None
+        assert "timed out" in outcomes["slow.pdf"].error
+
+    def test_invalid_workers_raises(self) -> None:
+        """Test non-positive worker counts are rejected."""
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            ParallelParser(workers=0)
@@ -0,0 +1,511 @@
+"""Unit tests for the streaming ingestion pipeline."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from knowledge_mcp.exceptions import IngestionError
+from knowledge_mcp.ingest.base import ParsedDocument
+from knowledge_mcp.ingest.parallel import ParallelParser
+from knowledge_mcp.ingest.streaming import (
+    IngestCheckpoint,
+    StreamingIngestionPipeline,
+)
+from knowledge_mcp.models.chunk import KnowledgeChunk
+from knowledge_mcp.models.document import DocumentMetadata
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _parsed(path: str) -> ParsedDocument:
+    """Build a minimal ParsedDocument for a file path."""
+    stem = Path(path).stem
+    return ParsedDocument(
+        metadata=DocumentMetadata(
+            document_id=stem,
+            title=stem,
+            document_type="standard",
+            source_path=path,
+        )
+    )
+
+
+def _chunks(parsed: ParsedDocument, count: int) -> list[KnowledgeChunk]:
+    """Build chunks for a parsed document."""
+    doc_id = parsed.metadata.document_id
+    return [
+        KnowledgeChunk(
+            id=f"{doc_id}-{i}",
+            document_id=doc_id,
+            document_title=doc_id,
+            document_type="standard",
+            content=f"{doc_id} chunk {i}",
+            content_hash=f"hash-{doc_id}-{i}",
+            token_count=3,
+        )
+        for i in range(count)
+    ]
+
+
+class TestStreamingIngestionPipeline:
+    """Tests for StreamingIngestionPipeline."""
+
+    @pytest.fixture
+    def files(self, tmp_path: Path) -> list[Path]:
+        """Three input documents."""
+        paths = [tmp_path / name for name in ("a.pdf", "b.pdf", "c.docx")]
+        for path in paths:
+            path.write_bytes(b"%PDF")
+        return paths
+
+    @pytest.fixture
+    def pipeline(self) -> MagicMock:
+        """IngestionPipeline producing 5 chunks per document."""
+        pipeline = MagicMock()
+        pipeline.process_parsed.side_effect = lambda parsed: _chunks(parsed, 5)
+        return pipeline
+
+    @pytest.fixture
+    def embedder(self) -> MagicMock:
+        """Embedder returning one vector per text."""
+        embedder = MagicMock()
+        embedder.embed_batch = AsyncMock(side_effect=lambda texts: [[0.1] * 4 for _ in texts])
+        return embedder
+
+    @pytest.fixture
+    def store(self) -> MagicMock:
+        """Synchronous store accepting every chunk."""
+        store = MagicMock()
+        store.add_chunks.side_effect = lambda chunks: len(chunks)
+        return store
+
+    @pytest.fixture(autouse=True)
+    def parse_in_thread(self) -> Iterator[MagicMock]:
+        """Parse without Docling or a process pool."""
+        with patch(
+            "knowledge_mcp.ingest.parallel._parse_compact",
+            side_effect=lambda path: _parsed(path).to_compact(),
+        ) as mock_parse:
+            yield mock_parse
+
+    def _streaming(
+        self,
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+        **kwargs: object,
+    ) -> StreamingIngestionPipeline:
+        return StreamingIngestionPipeline(
+            pipeline,
+            embedder,
+            store,
+            parser=ParallelParser(workers=2, executor_factory=ThreadPoolExecutor),
+            **kwargs,  # type: ignore[arg-type]
+        )
+
+    async def test_all_documents_flow_through_stages(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test every chunk is embedded and upserted in batches."""
+        # Arrange
+        streaming = self._streaming(pipeline, embedder, store, batch_size=2)
+
+        # Act
+        result = await streaming.run(files)
+
+        # Assert
+        assert result.succeeded == 3
+        assert result.total_chunks == 15
+        assert {d.path for d in result.documents} == set(files)
+        # 5 chunks per document in batches of 2 -> 3 batches each
+        assert embedder.embed_batch.await_count == 9
+        assert store.add_chunks.call_count == 9
+        upserted = [c for call in store.add_chunks.call_args_list for c in call.args[0]]
+        assert all(c.embedding == [0.1] * 4 for c in upserted)
+
+    async def test_stage_metrics_recorded(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test per-stage item counts are reported."""
+        streaming = self._streaming(pipeline, embedder, store)
+
+        result = await streaming.run(files)
+
+        assert result.stages["parse"].items == 3
+        assert result.stages["chunk"].items == 3
+        assert result.stages["embed"].items == 15
+        assert result.stages["upsert"].items == 15
+        assert result.stages["upsert"].to_dict()["errors"] == 0
+
+    async def test_parse_failure_is_isolated(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+        parse_in_thread: MagicMock,
+    ) -> None:
+        """Test a document that fails to parse does not stop the others."""
+        def parse(path: str) -> tuple[object, ...]:
+            if path.endswith("b.pdf"):
+                raise IngestionError("Corrupt file")
+            return _parsed(path).to_compact()
+
+        parse_in_thread.side_effect = parse
+        streaming = self._streaming(pipeline, embedder, store)
+
+        result = await streaming.run(files)
+
+        assert result.succeeded == 2
+        assert [d.path.name for d in result.failed] == ["b.pdf"]
+        assert result.failed[0].error == "Corrupt file"
+        assert result.stages["parse"].errors == 1
+
+    async def test_embed_failure_fails_only_that_document(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test an embedding error marks its document failed once."""
+        async def embed_batch(texts: list[str]) -> list[list[float]]:
+            if texts[0].startswith("b "):
+                raise ConnectionError("API down")
+            return [[0.1] * 4 for _ in texts]
+
+        embedder.embed_batch = AsyncMock(side_effect=embed_batch)
+        streaming = self._streaming(pipeline, embedder, store, batch_size=2)
+
+        result = await streaming.run(files)
+
+        assert [d.path.name for d in result.failed] == ["b.pdf"]
+        assert result.succeeded == 2
+        assert len(result.documents) == 3
+
+    async def test_document_without_chunks_completes(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test documents that produce no chunks are reported as done."""
+        pipeline.process_parsed.side_effect = lambda parsed: []
+        streaming = self._streaming(pipeline, embedder, store)
+
+        result = await streaming.run(files)
+
+        assert result.succeeded == 3
+        embedder.embed_batch.assert_not_awaited()
+
+    async def test_backpressure_bounds_in_flight_batches(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test a slow embed stage holds back chunking via bounded queues."""
+        # Arrange
+        pipeline.process_parsed.side_effect = lambda parsed: _chunks(parsed, 20)
+        release = asyncio.Event()
+
+        async def slow_embed(texts: list[str]) -> list[list[float]]:
+            await release.wait()
+            return [[0.1] * 4 for _ in texts]
+
+        embedder.embed_batch = AsyncMock(side_effect=slow_embed)
+        streaming = self._streaming(
+            pipeline, embedder, store, batch_size=1, queue_size=2, embed_workers=1
+        )
+
+        # Act
+        task = asyncio.ensure_future(streaming.run(files))
+        await asyncio.sleep(0.2)
+        chunked_while_blocked = pipeline.process_parsed.call_count
+        release.set()
+        result = await task
+
+        # Assert: one batch embedding + two queued; chunking stalled early
+        assert chunked_while_blocked == 1
+        assert result.total_chunks == 60
+
+    async def test_checkpoint_skips_completed_documents(
+        self,
+        tmp_path: Path,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test a re-run skips documents completed by the previous run."""
+        checkpoint_file = tmp_path / "checkpoint.jsonl"
+        first = self._streaming(pipeline, embedder, store, checkpoint_file=checkpoint_file)
+        await first.run(files[:2])
+        store.add_chunks.reset_mock()
+
+        second = self._streaming(pipeline, embedder, store, checkpoint_file=checkpoint_file)
+        result = await second.run(files)
+
+        assert result.skipped == 2
+        assert result.succeeded == 1
+        assert store.add_chunks.call_count == 1
+
+    async def test_on_document_callback(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test the callback receives each outcome as it finishes."""
+        seen: list[str] = []
+        streaming = self._streaming(
+            pipeline, embedder, store, on_document=lambda d: seen.append(d.path.name)
+        )
+
+        await streaming.run(files)
+
+        assert sorted(seen) == ["a.pdf", "b.pdf", "c.docx"]
+
+    async def test_incremental_reingest_embeds_only_changes(
+        self,
+        tmp_path: Path,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test a re-run embeds edited chunks and deletes vanished ones."""
+        # Arrange
+        store.delete_chunks.side_effect = lambda ids: len(ids)
+        manifest_dir = tmp_path / "manifests"
+        first = self._streaming(pipeline, embedder, store, manifest_dir=manifest_dir)
+        await first.run(files[:1])
+        embedder.embed_batch.reset_mock()
+        store.add_chunks.reset_mock()
+
+        def revised(parsed: ParsedDocument) -> list[KnowledgeChunk]:
+            chunks = _chunks(parsed, 4)  # last chunk removed
+            chunks[0].content_hash = "edited"
+            return chunks
+
+        pipeline.process_parsed.side_effect = revised
+
+        # Act
+        second = self._streaming(pipeline, embedder, store, manifest_dir=manifest_dir)
+        result = await second.run(files[:1])
+
+        # Assert
+        outcome = result.documents[0]
+        assert outcome.chunks == 1
+        assert outcome.unchanged == 3
+        assert outcome.removed == 1
+        embedder.embed_batch.assert_awaited_once_with(["a chunk 0"])
+        store.delete_chunks.assert_called_once_with(["a-4"])
+
+    async def test_bm25_updated_with_upserted_changes_only(
+        self,
+        tmp_path: Path,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test BM25 gets only stored, changed chunks, on one writer thread."""
+        # Arrange
+        store.delete_chunks.side_effect = lambda ids: len(ids)
+        manifest_dir = tmp_path / "manifests"
+        bm25_index = MagicMock()
+        writer_threads: set[str] = set()
+        bm25_index.add_documents.side_effect = (
+            lambda docs: writer_threads.add(threading.current_thread().name)
+        )
+        first = self._streaming(
+            pipeline, embedder, store, manifest_dir=manifest_dir, bm25_index=bm25_index
+        )
+        await first.run(files[:1])
+        first.close()
+        bm25_index.reset_mock()
+
+        def revised(parsed: ParsedDocument) -> list[KnowledgeChunk]:
+            chunks = _chunks(parsed, 4)  # last chunk removed
+            chunks[0].content_hash = "edited"
+            return chunks
+
+        pipeline.process_parsed.side_effect = revised
+
+        # Act
+        second = self._streaming(
+            pipeline, embedder, store, manifest_dir=manifest_dir, bm25_index=bm25_index
+        )
+        await second.run(files[:1])
+        second.close()
+
+        # Assert
+        bm25_index.remove_documents.assert_called_once_with(["a-4"])
+        bm25_index.add_documents.assert_called_once_with([{"id": "a-0", "content": "a chunk 0"}])
+        assert len(writer_threads) == 1
+        assert threading.current_thread().name not in writer_threads
+
+    async def test_failed_upsert_not_indexed_in_bm25(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test a document whose upsert fails never reaches BM25."""
+        store.add_chunks.side_effect = RuntimeError("store down")
+        bm25_index = MagicMock()
+
+        result = await self._streaming(pipeline, embedder, store, bm25_index=bm25_index).run(
+            files[:1]
+        )
+
+        assert len(result.failed) == 1
+        bm25_index.add_documents.assert_not_called()
+
+    async def test_bm25_failure_fails_document(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test a BM25 update error is reported instead of stopping the run."""
+        bm25_index = MagicMock()
+        bm25_index.add_documents.side_effect = OSError("disk full")
+
+        result = await self._streaming(pipeline, embedder, store, bm25_index=bm25_index).run(
+            files
+        )
+
+        assert len(result.failed) == 3
+        assert result.failed[0].error == "disk full"
+        assert result.stages["upsert"].errors == 3
+
+    async def test_unchanged_document_skips_embedding(
+        self,
+        tmp_path: Path,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test re-ingesting identical content writes nothing."""
+        manifest_dir = tmp_path / "manifests"
+        await self._streaming(pipeline, embedder, store, manifest_dir=manifest_dir).run(files)
+        embedder.embed_batch.reset_mock()
+        store.add_chunks.reset_mock()
+
+        result = await self._streaming(
+            pipeline, embedder, store, manifest_dir=manifest_dir
+        ).run(files)
+
+        assert result.succeeded == 3
+        assert all(d.unchanged == 5 for d in result.documents)
+        embedder.embed_batch.assert_not_awaited()
+        store.add_chunks.assert_not_called()
+        store.delete_chunks.assert_not_called()
+
+    def test_cancel_with_full_queues_shuts_down(
+        self,
+        files: list[Path],
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test cancelling a stalled run leaves no thread blocking loop shutdown."""
+        # Arrange
+        async def stalled_embed(texts: list[str]) -> list[list[float]]:
+            await asyncio.Event().wait()
+            return []
+
+        embedder.embed_batch = AsyncMock(side_effect=stalled_embed)
+        streaming = self._streaming(
+            pipeline, embedder, store, batch_size=1, queue_size=1, embed_workers=1
+        )
+
+        async def cancel_stalled_run() -> None:
+            task = asyncio.ensure_future(streaming.run(files))
+            await asyncio.sleep(0.2)  # Every queue is full and parsing is blocked
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # The loop keeps running, as in a long-lived server: every
+            # worker thread must still be able to finish
+            await asyncio.wait_for(
+                asyncio.get_running_loop().shutdown_default_executor(), timeout=2
+            )
+
+        # Act
+        outcome: list[BaseException | None] = []
+
+        def run_loop() -> None:
+            try:
+                asyncio.run(cancel_stalled_run())
+                outcome.append(None)
+            except BaseException as e:
+                outcome.append(e)
+
+        runner = threading.Thread(target=run_loop, daemon=True)
+        runner.start()
+        runner.join(timeout=10)
+        streaming.close()
+
+        # Assert
+        assert outcome == [None]
+
+    def test_invalid_worker_count_raises(
+        self,
+        pipeline: MagicMock,
+        embedder: MagicMock,
+        store: MagicMock,
+    ) -> None:
+        """Test non-positive sizes are rejected."""
+        with pytest.raises(ValueError, match="embed_workers must be at least 1"):
+            StreamingIngestionPipeline(pipeline, embedder, store, embed_workers=0)
+
+
+class TestIngestCheckpoint:
+    """Tests for IngestCheckpoint."""
+
+    def test_changed_file_is_not_done(self, tmp_path: Path) -> None:
+        """Test editing a file invalidates its checkpoint entry."""
+        doc = tmp_path / "doc.pdf"
+        doc.write_bytes(b"v1")
+        checkpoint = IngestCheckpoint(tmp_path / "checkpoint.jsonl")
+        checkpoint.mark_done(doc, chunks=3)
+
+        doc.write_bytes(b"version 2")
+
+        assert not IngestCheckpoint(tmp_path / "checkpoint.jsonl").is_done(doc)
+
+    def test_torn_line_ignored(self, tmp_path: Path) -> None:
+        """Test a partially written final line does not break loading."""
+        doc = tmp_path / "doc.pdf"
+        doc.write_bytes(b"v1")
+        checkpoint_file = tmp_path / "checkpoint.jsonl"
+        IngestCheckpoint(checkpoint_file).mark_done(doc, chunks=3)
+        with open(checkpoint_file, "a", encoding="utf-8") as f:
+            f.write('{"path": "/x')
+
+        assert IngestCheckpoint(checkpoint_file).is_done(doc)
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import http.client
+import urllib.error
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.robotparser import RobotFileParser
 
 import pytest
 
@@ -13,6 +18,34 @@ from knowledge_mcp.ingest.web_ingestor import (
     check_url_accessible,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def _allow_all() -> RobotFileParser:
+    """robots.txt rules allowing every URL."""
+    parser = RobotFileParser()
+    parser.allow_all = True
+    return parser
+
+
+def _robots(text: str) -> RobotFileParser:
+    """Parse robots.txt content."""
+    parser = RobotFileParser()
+    parser.parse(text.splitlines())
+    return parser
+
+
+def _page(url: str) -> MagicMock:
+    """Successful crawl result for a URL."""
+    result = MagicMock()
+    result.success = True
+    result.markdown = f"Content of {url}"
+    result.html = f"<html><head><title>{url}</title></head></html>"
+    result.status_code = 200
+    result.error_message = None
+    return result
+
 
 class TestWebIngestorConfig:
     """Tests for WebIngestorConfig dataclass."""
@@ -87,6 +120,14 @@ class TestWebIngestionResult:
 class TestWebIngestor:
     """Tests for WebIngestor class."""
 
+    @pytest.fixture(autouse=True)
+    def no_robots_fetch(self) -> Iterator[MagicMock]:
+        """Allow every URL without downloading robots.txt."""
+        with patch.object(
+            WebIngestor, "_fetch_robots", side_effect=lambda url: _allow_all()
+        ) as mock_fetch:
+            yield mock_fetch
+
     def test_ingestor_initialization_default(self) -> None:
         """Test ingestor initializes with default config."""
         ingestor = WebIngestor()
@@ -255,6 +296,202 @@ class TestWebIngestor:
         assert results[1].title == "Page 2"
 
 
+class TestWebIngestorConcurrency:
+    """Tests for concurrent ingestion with a shared crawler."""
+
+    @pytest.fixture
+    def crawler(self) -> Iterator[AsyncMock]:
+        """Patched AsyncWebCrawler whose arun returns a page per URL."""
+        with patch("knowledge_mcp.ingest.web_ingestor.CrawlerRunConfig"), \
+             patch("knowledge_mcp.ingest.web_ingestor.AsyncWebCrawler") as mock_crawler_class:
+            mock_crawler = AsyncMock()
+            mock_crawler.__aenter__.return_value = mock_crawler
+            mock_crawler.arun.side_effect = lambda url, config: _page(url)
+            mock_crawler_class.return_value = mock_crawler
+            yield mock_crawler
+
+    @pytest.fixture
+    def robots(self) -> Iterator[MagicMock]:
+        """robots.txt fetch, allowing everything unless reconfigured."""
+        with patch.object(
+            WebIngestor, "_fetch_robots", side_effect=lambda url: _allow_all()
+        ) as mock_fetch:
+            yield mock_fetch
+
+    @pytest.mark.asyncio
+    async def test_one_crawler_for_the_batch(
+        self, crawler: AsyncMock, robots: MagicMock
+    ) -> None:
+        """Test every URL is crawled by one browser and results keep input order."""
+        ingestor = WebIngestor(WebIngestorConfig(delay_between_requests=0))
+        urls = [f"https://site{i}.example.com/page" for i in range(5)]
+
+        with patch("knowledge_mcp.ingest.web_ingestor.AsyncWebCrawler") as mock_class:
+            mock_class.return_value = crawler
+            results = await ingestor.ingest_many(urls)
+
+        mock_class.assert_called_once()
+        assert [r.url for r in results] == urls
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_global_and_per_host_limits(
+        self, crawler: AsyncMock, robots: MagicMock
+    ) -> None:
+        """Test max_concurrent bounds all crawls and max_per_host each host."""
+        # Arrange
+        active: dict[str, int] = {}
+        peak = {"all": 0, "a.example.com": 0}
+
+        async def arun(url: str, config: object) -> MagicMock:
+            host = url.split("/")[2]
+            active[host] = active.get(host, 0) + 1
+            peak["all"] = max(peak["all"], sum(active.values()))
+            peak[host] = max(peak.get(host, 0), active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return _page(url)
+
+        crawler.arun.side_effect = arun
+        config = WebIngestorConfig(max_concurrent=3, max_per_host=1, delay_between_requests=0)
+        urls = [f"https://a.example.com/{i}" for i in range(4)]
+        urls += [f"https://host{i}.example.com/" for i in range(6)]
+
+        # Act
+        results = await WebIngestor(config).ingest_many(urls)
+
+        # Assert
+        assert len(results) == 10
+        assert peak["all"] == 3
+        assert peak["a.example.com"] == 1
+
+    @pytest.mark.asyncio
+    async def test_iter_ingest_streams_in_completion_order(
+        self, crawler: AsyncMock, robots: MagicMock
+    ) -> None:
+        """Test results are yielded as each crawl finishes."""
+        async def arun(url: str, config: object) -> MagicMock:
+            await asyncio.sleep(0.05 if "slow" in url else 0)
+            return _page(url)
+
+        crawler.arun.side_effect = arun
+        ingestor = WebIngestor(WebIngestorConfig(delay_between_requests=0))
+
+        seen = [
+            r.url
+            async for r in ingestor.iter_ingest(["https://slow.example.com/", "https://fast.example.com/"])
+        ]
+
+        assert seen == ["https://fast.example.com/", "https://slow.example.com/"]
+
+    @pytest.mark.asyncio
+    async def test_robots_disallow_and_host_delay(
+        self, crawler: AsyncMock, robots: MagicMock
+    ) -> None:
+        """Test disallowed URLs are skipped and same-host requests are spaced."""
+        # Arrange
+        robots.side_effect = lambda url: _robots("User-agent: *\nDisallow: /private")
+        starts: list[float] = []
+
+        async def arun(url: str, config: object) -> MagicMock:
+            starts.append(asyncio.get_running_loop().time())
+            return _page(url)
+
+        crawler.arun.side_effect = arun
+        ingestor = WebIngestor(WebIngestorConfig(delay_between_requests=0.05))
+
+        # Act
+        results = await ingestor.ingest_many(
+            ["https://a.example.com/1", "https://a.example.com/private/x", "https://a.example.com/2"]
+        )
+
+        # Assert
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "Disallowed by robots.txt"
+        assert crawler.arun.await_count == 2
+        assert starts[1] - starts[0] >= 0.045
+        robots.assert_called_once_with("https://a.example.com/robots.txt")
+
+    def test_crawl_delay_overrides_shorter_config_delay(self) -> None:
+        """Test a robots.txt Crawl-delay longer than the configured delay wins."""
+        ingestor = WebIngestor(WebIngestorConfig(delay_between_requests=1.5))
+
+        assert ingestor._host_delay(_robots("User-agent: *\nCrawl-delay: 10")) == 10
+        assert ingestor._host_delay(_robots("User-agent: *\nCrawl-delay: 1")) == 1.5
+        assert ingestor._host_delay(None) == 1.5
+
+    @pytest.mark.asyncio
+    async def test_robots_ignored_when_disabled(
+        self, crawler: AsyncMock, robots: MagicMock
+    ) -> None:
+        """Test robots.txt is not fetched when respect_robots_txt is False."""
+        config = WebIngestorConfig(respect_robots_txt=False, delay_between_requests=0)
+
+        result = await WebIngestor(config).ingest("https://a.example.com/private")
+
+        assert result.success is True
+        robots.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_crawler_start_failure_fails_every_url(self, robots: MagicMock) -> None:
+        """Test a browser that cannot start yields a failure per URL."""
+        with patch("knowledge_mcp.ingest.web_ingestor.CrawlerRunConfig"), \
+             patch("knowledge_mcp.ingest.web_ingestor.AsyncWebCrawler") as mock_crawler_class:
+            mock_crawler = AsyncMock()
+            mock_crawler.__aenter__.side_effect = RuntimeError("browser missing")
+            mock_crawler_class.return_value = mock_crawler
+
+            results = await WebIngestor().ingest_many(["https://a.com/", "https://b.com/"])
+
+        assert [r.error for r in results] == ["browser missing", "browser missing"]
+
+    @pytest.mark.asyncio
+    async def test_one_url_failure_does_not_abort_batch(
+        self, crawler: AsyncMock, robots: MagicMock
+    ) -> None:
+        """Test an unexpected error for one URL fails only that URL."""
+        # Arrange
+        def fetch(robots_url: str) -> RobotFileParser:
+            if "broken" in robots_url:
+                raise RuntimeError("robots parser crashed")
+            return _allow_all()
+
+        robots.side_effect = fetch
+        ingestor = WebIngestor(WebIngestorConfig(delay_between_requests=0))
+
+        # Act
+        results = await ingestor.ingest_many(
+            ["https://a.example.com/", "https://broken.example.com/", "https://b.example.com/"]
+        )
+
+        # Assert
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "robots parser crashed"
+
+    def test_fetch_robots_forbidden_disallows_all(self) -> None:
+        """Test a 403 robots.txt blocks the host, matching urllib.robotparser."""
+        error = urllib.error.HTTPError("https://a.com/robots.txt", 403, "Forbidden", {}, None)  # type: ignore[arg-type]
+
+        with patch("urllib.request.urlopen", side_effect=error):
+            parser = WebIngestor()._fetch_robots("https://a.com/robots.txt")
+
+        assert parser.can_fetch("*", "https://a.com/page") is False
+
+    def test_fetch_robots_unreachable_allows_all(self) -> None:
+        """Test network errors fall back to allowing the host."""
+        with patch("urllib.request.urlopen", side_effect=OSError("no route")):
+            parser = WebIngestor()._fetch_robots("https://a.com/robots.txt")
+
+        assert parser.can_fetch("*", "https://a.com/page") is True
+
+    def test_fetch_robots_malformed_response_allows_all(self) -> None:
+        """Test a truncated robots.txt response falls back to allowing the host."""
+        with patch("urllib.request.urlopen", side_effect=http.client.IncompleteRead(b"")):
+            parser = WebIngestor()._fetch_robots("https://a.com/robots.txt")
+
+        assert parser.can_fetch("*", "https://a.com/page") is True
+
+
 class TestCheckUrlAccessible:
     """Tests for check_url_accessible utility function."""
 
@@ -4,12 +4,14 @@ from __future__ import annotations
 
 import json
 import tempfile
+import time
 from pathlib import Path
 
 import pytest
 
 from knowledge_mcp.monitoring.token_tracker import TokenTracker
 from knowledge_mcp.monitoring.logger import setup_json_logger
+from knowledge_mcp.monitoring.spans import SpanHistogram, SpanRecorder, get_recorder, timed
 
 
 class TestTokenTracker:
@@ -65,6 +67,7 @@ class TestTokenTracker:
         """Test that stats persist across instances."""
         tracker1 = TokenTracker(log_file)
         tracker1.track_embedding("Persistent text")
+        tracker1.flush()
         tokens_1 = tracker1.get_daily_summary()["embedding_tokens"]
 
         tracker2 = TokenTracker(log_file)
@@ -86,8 +89,9 @@ class TestTokenTracker:
         assert summary == {}
 
     def test_json_file_created(self, log_file: Path, tracker: TokenTracker) -> None:
-        """Test that JSON file is created on first track."""
+        """Test that JSON snapshot is written on close."""
         tracker.track_embedding("Test")
+        tracker.close()
         assert log_file.exists()
 
         with open(log_file, encoding="utf-8") as f:
@@ -113,6 +117,113 @@ class TestTokenTracker:
         assert summary["cache_hits"] == 1
 
 
+class TestTokenTrackerJournal:
+    """Tests for buffered, journaled TokenTracker persistence."""
+
+    @pytest.fixture
+    def log_file(self, tmp_path: Path) -> Path:
+        """Token log path in an isolated directory."""
+        return tmp_path / "tokens.json"
+
+    def test_tracking_is_buffered_until_threshold(self, log_file: Path) -> None:
+        """Test nothing is written until flush_threshold events are pending."""
+        tracker = TokenTracker(log_file, flush_interval=3600, flush_threshold=3)
+
+        tracker.track_embedding("one", tokens=1)
+        tracker.track_embedding("two", tokens=1)
+        assert not tracker.journal_file.exists()
+
+        tracker.track_embedding("three", tokens=1)
+        assert len(tracker.journal_file.read_text().splitlines()) == 1
+
+    def test_pending_usage_flushed_after_interval(self, log_file: Path) -> None:
+        """Test a background timer journals usage with no further tracking."""
+        tracker = TokenTracker(log_file, flush_interval=0.05, flush_threshold=100)
+
+        tracker.track_embedding("one", tokens=7)
+        deadline = time.monotonic() + 5
+        while not tracker.journal_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        record = json.loads(tracker.journal_file.read_text())
+        assert record["embedding_tokens"] == 7
+        tracker.close()
+
+    def test_track_batch_uses_precomputed_tokens(self, log_file: Path) -> None:
+        """Test batch tracking records one update without tokenizing."""
+        tracker = TokenTracker(log_file, flush_interval=3600)
+        tracker.encoding = None  # type: ignore[assignment]  # Would fail if used
+
+        tracker.track_batch(["a", "b", "c"], tokens=42)
+        tracker.track_batch(["d", "e"], cache_hit=True)
+
+        summary = tracker.get_daily_summary()
+        assert summary == {"embedding_tokens": 42, "embedding_requests": 3, "cache_hits": 2}
+
+    def test_track_batch_counts_when_not_given(self, log_file: Path) -> None:
+        """Test batch tracking falls back to tiktoken batch counting."""
+        tracker = TokenTracker(log_file)
+        texts = ["Hello world", "Another text"]
+
+        tokens = tracker.track_batch(texts)
+
+        assert tokens == sum(tracker.count_tokens(t) for t in texts)
+
+    def test_journal_replayed_on_load(self, log_file: Path) -> None:
+        """Test flushed usage survives without a snapshot rewrite."""
+        tracker1 = TokenTracker(log_file, flush_interval=3600)
+        tracker1.track_batch(["a", "b"], tokens=10)
+        tracker1.flush()
+
+        tracker2 = TokenTracker(log_file)
+
+        assert not log_file.exists()
+        assert tracker2.get_daily_summary()["embedding_tokens"] == 10
+
+    def test_compaction_truncates_journal(self, log_file: Path) -> None:
+        """Test reaching compact_threshold folds the journal into the snapshot."""
+        tracker = TokenTracker(log_file, flush_threshold=1, compact_threshold=2)
+
+        tracker.track_embedding("one", tokens=5)
+        tracker.track_embedding("two", tokens=5)
+
+        assert tracker.journal_file.read_text() == ""
+        assert TokenTracker(log_file).get_daily_summary()["embedding_tokens"] == 10
+
+    def test_crash_before_truncate_does_not_double_count(self, log_file: Path) -> None:
+        """Test journal records already in the snapshot are skipped."""
+        tracker = TokenTracker(log_file, flush_interval=3600)
+        tracker.track_embedding("one", tokens=5)
+        tracker.flush()
+        journal = tracker.journal_file.read_text()
+        tracker.compact()
+
+        # Simulate a crash between snapshot replace and journal truncation
+        tracker.journal_file.write_text(journal)
+
+        assert TokenTracker(log_file).get_daily_summary()["embedding_tokens"] == 5
+
+    def test_torn_journal_line_skipped(self, log_file: Path) -> None:
+        """Test a partially written final line is ignored on replay."""
+        tracker = TokenTracker(log_file, flush_interval=3600)
+        tracker.track_embedding("one", tokens=5)
+        tracker.flush()
+        with open(tracker.journal_file, "a", encoding="utf-8") as f:
+            f.write('{"seq": 9, "day": "2026-')
+
+        assert TokenTracker(log_file).get_daily_summary()["embedding_tokens"] == 5
+
+    def test_snapshot_excludes_sequence_key_from_days(self, log_file: Path) -> None:
+        """Test the journal sequence marker is not reported as a day."""
+        tracker = TokenTracker(log_file)
+        tracker.track_embedding("one", tokens=5)
+        tracker.close()
+
+        days = TokenTracker(log_file).get_all_days()
+
+        assert all(not day.startswith("_") for day in days)
+
+
 class TestSetupJsonLogger:
     """Tests for structured JSON logger."""
 
@@ -142,3 +253,83 @@ class TestSetupJsonLogger:
         handler_count_2 = len(logger2.handlers)
 
         assert handler_count_1 == handler_count_2
+
+
+class TestSpanRecorder:
+    """Tests for per-stage latency spans."""
+
+    @pytest.fixture
+    def global_recorder(self) -> SpanRecorder:
+        """Enable the process-wide recorder for one test."""
+        recorder = get_recorder()
+        recorder.reset()
+        recorder.enabled = True
+        yield recorder
+        recorder.enabled = False
+        recorder.reset()
+
+    def test_disabled_recorder_records_nothing(self) -> None:
+        """Test spans and counters are no-ops while disabled."""
+        recorder = SpanRecorder()
+
+        with recorder.span("store.search"):
+            pass
+        recorder.increment("embedding_cache.hits")
+
+        assert recorder.snapshot() == {"enabled": False, "spans": {}, "counters": {}}
+
+    def test_span_records_count_and_errors(self) -> None:
+        """Test spans count calls and calls that raised."""
+        recorder = SpanRecorder(enabled=True)
+
+        with recorder.span("store.search"):
+            pass
+        with pytest.raises(RuntimeError), recorder.span("store.search"):
+            raise RuntimeError("boom")
+
+        summary = recorder.snapshot()["spans"]["store.search"]
+        assert summary["count"] == 2
+        assert summary["errors"] == 1
+
+    def test_quantiles_interpolate_within_buckets(self) -> None:
+        """Test quantile estimates stay within the observed range."""
+        histogram = SpanHistogram()
+        for _ in range(99):
+            histogram.observe(0.002)
+        histogram.observe(0.2)
+
+        assert 0.001 <= histogram.quantile(0.5) <= 0.0025
+        assert histogram.quantile(0.999) <= 0.2
+        assert SpanHistogram().quantile(0.5) == 0.0
+
+    async def test_timed_wraps_sync_and_async(self, global_recorder: SpanRecorder) -> None:
+        """Test timed() records both plain and coroutine functions."""
+
+        @timed("test.sync")
+        def add(a: int, b: int) -> int:
+            return a + b
+
+        @timed("test.async")
+        async def double(a: int) -> int:
+            return a * 2
+
+        assert add(1, 2) == 3
+        assert await double(4) == 8
+
+        spans = global_recorder.snapshot()["spans"]
+        assert spans["test.sync"]["count"] == 1
+        assert spans["test.async"]["count"] == 1
+
+    def test_prometheus_export(self) -> None:
+        """Test Prometheus output has cumulative buckets and counters."""
+        recorder = SpanRecorder(enabled=True)
+        recorder.histogram("embedder.embed").observe(0.003)
+        recorder.histogram("embedder.embed").observe(0.3)
+        recorder.increment("embedding_cache.hits", 5)
+
+        text = recorder.to_prometheus()
+
+        assert 'knowledge_mcp_span_duration_seconds_bucket{span="embedder.embed",le="0.005"} 1' in text
+        assert 'knowledge_mcp_span_duration_seconds_bucket{span="embedder.embed",le="+Inf"} 2' in text
+        assert 'knowledge_mcp_span_duration_seconds_count{span="embedder.embed"} 2' in text
+        assert 'knowledge_mcp_events_total{name="embedding_cache.hits"} 5' in text
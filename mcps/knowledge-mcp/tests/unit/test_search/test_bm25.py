@@ -1,5 +1,8 @@
 """Unit tests for BM25Searcher."""
 
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from knowledge_mcp.search.bm25 import BM25Searcher
@@ -197,3 +200,222 @@ class TestBM25Searcher:
 
         # Assert after indexing
         assert searcher.document_count == len(sample_documents)
+
+
+class TestBM25SearcherIncremental:
+    """Tests for incremental updates to BM25Searcher."""
+
+    @pytest.fixture
+    def indexed_searcher(self) -> BM25Searcher:
+        """Create an in-memory searcher that never auto-compacts."""
+        searcher = BM25Searcher(compaction_ratio=10.0)
+        searcher.build_index([
+            {"id": f"doc{i}", "content": f"system review item{i}"} for i in range(20)
+        ])
+        return searcher
+
+    def test_add_documents_searchable(self, indexed_searcher: BM25Searcher) -> None:
+        """Test appended documents are returned without a rebuild."""
+        # Act
+        added = indexed_searcher.add_documents([{"id": "new", "content": "fmea severity"}])
+        results = indexed_searcher.search("severity")
+
+        # Assert
+        assert added == 1
+        assert indexed_searcher.document_count == 21
+        assert [r["id"] for r in results] == ["new"]
+
+    def test_add_documents_replaces_existing_id(self, indexed_searcher: BM25Searcher) -> None:
+        """Test re-adding an id replaces the previous content."""
+        # Act
+        indexed_searcher.add_documents([{"id": "doc3", "content": "hazard analysis"}])
+
+        # Assert
+        assert indexed_searcher.document_count == 20
+        assert indexed_searcher.search("item3") == []
+        assert indexed_searcher.search("hazard")[0]["id"] == "doc3"
+
+    def test_add_documents_missing_field(self, indexed_searcher: BM25Searcher) -> None:
+        """Test that adding a document without content raises ValueError."""
+        with pytest.raises(ValueError, match="missing 'id' or 'content'"):
+            indexed_searcher.add_documents([{"id": "bad"}])
+
+    def test_delta_scores_comparable_with_main(self, indexed_searcher: BM25Searcher) -> None:
+        """Test delta documents score like an equivalent main document."""
+        # Arrange
+        reference = indexed_searcher.search("item5")[0]["score"]
+
+        # Act
+        indexed_searcher.add_documents([{"id": "copy", "content": "system review item5"}])
+        scores = {r["id"]: r["score"] for r in indexed_searcher.search("item5")}
+
+        # Assert
+        assert scores["copy"] == pytest.approx(reference, rel=0.25)
+
+    def test_remove_documents_tombstones(self, indexed_searcher: BM25Searcher) -> None:
+        """Test removed documents are excluded from results."""
+        # Act
+        removed = indexed_searcher.remove_documents(["doc1", "missing"])
+        results = indexed_searcher.search("system", n_results=20)
+
+        # Assert
+        assert removed == 1
+        assert indexed_searcher.document_count == 19
+        assert "doc1" not in {r["id"] for r in results}
+        assert len(results) == 19
+
+    def test_compact_merges_segments(self, indexed_searcher: BM25Searcher) -> None:
+        """Test compaction folds delta and tombstones into the main segment."""
+        # Arrange
+        indexed_searcher.add_documents([{"id": "new", "content": "fmea severity"}])
+        indexed_searcher.remove_documents(["doc0"])
+
+        # Act
+        indexed_searcher.compact()
+
+        # Assert
+        assert indexed_searcher.document_count == 20
+        assert indexed_searcher.search("severity")[0]["id"] == "new"
+        assert indexed_searcher.search("item0") == []
+
+    def test_auto_compaction(self) -> None:
+        """Test compaction triggers once the delta exceeds the ratio."""
+        # Arrange
+        searcher = BM25Searcher(compaction_ratio=0.1)
+        searcher.build_index([{"id": f"d{i}", "content": f"text{i}"} for i in range(10)])
+
+        # Act
+        searcher.add_documents([{"id": "a", "content": "alpha"}, {"id": "b", "content": "beta"}])
+
+        # Assert
+        assert searcher.document_count == 12
+        assert searcher.search("beta")[0]["id"] == "b"
+
+
+class TestBM25SearcherPersistence:
+    """Tests for persisting BM25Searcher to disk."""
+
+    @pytest.fixture
+    def documents(self) -> list[dict[str, str]]:
+        """Create sample documents for testing."""
+        return [
+            {"id": "doc1", "content": "System requirements review process"},
+            {"id": "doc2", "content": "Software verification and validation methods"},
+            {"id": "doc3", "content": "Requirements traceability matrix"},
+        ]
+
+    def test_open_empty_directory(self, tmp_path: Path) -> None:
+        """Test opening a missing index yields an empty persistent searcher."""
+        # Act
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+
+        # Assert
+        assert not searcher.is_indexed
+        assert searcher.index_dir == tmp_path / "kb_v1_te3small"
+
+    def test_round_trip(self, tmp_path: Path, documents: list[dict[str, str]]) -> None:
+        """Test a built index is reloaded with the same results."""
+        # Arrange
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+        searcher.build_index(documents)
+        expected = searcher.search("requirements")
+
+        # Act
+        reloaded = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+
+        # Assert
+        assert reloaded.document_count == 3
+        assert reloaded.search("requirements") == expected
+
+    def test_delta_log_replayed(self, tmp_path: Path, documents: list[dict[str, str]]) -> None:
+        """Test appends and deletes since the last save survive a reload."""
+        # Arrange
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small", compaction_ratio=10.0)
+        searcher.build_index(documents)
+        searcher.add_documents([{"id": "doc4", "content": "hazard analysis"}])
+        searcher.remove_documents(["doc1"])
+
+        # Act
+        reloaded = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+
+        # Assert
+        assert reloaded.document_count == 3
+        assert reloaded.search("hazard")[0]["id"] == "doc4"
+        assert "doc1" not in {r["id"] for r in reloaded.search("review")}
+
+    def test_corrupt_delta_record_skipped(
+        self, tmp_path: Path, documents: list[dict[str, str]]
+    ) -> None:
+        """Test a torn trailing delta record does not prevent loading."""
+        # Arrange
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small", compaction_ratio=10.0)
+        searcher.build_index(documents)
+        searcher.add_documents([{"id": "doc4", "content": "hazard analysis"}])
+        with open(tmp_path / "kb_v1_te3small" / "delta.jsonl", "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "id": "doc5", "con')
+
+        # Act
+        reloaded = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+
+        # Assert
+        assert reloaded.document_count == 4
+
+    def test_stale_collection_version_ignored(
+        self, tmp_path: Path, documents: list[dict[str, str]]
+    ) -> None:
+        """Test an index built for another collection version is not loaded."""
+        # Arrange
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+        searcher.build_index(documents)
+
+        # Act
+        loaded = BM25Searcher.load(
+            tmp_path / "kb_v1_te3small", collection_version="kb_v1_te3large"
+        )
+
+        # Assert
+        assert loaded is None
+
+    def test_save_without_directory_raises(self, documents: list[dict[str, str]]) -> None:
+        """Test saving an in-memory index without a target raises ValueError."""
+        # Arrange
+        searcher = BM25Searcher()
+        searcher.build_index(documents)
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="No index directory"):
+            searcher.save()
+
+    def test_crash_before_manifest_swap_keeps_old_index(
+        self, tmp_path: Path, documents: list[dict[str, str]]
+    ) -> None:
+        """Test a save interrupted before the manifest swap loses nothing."""
+        # Arrange
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small", compaction_ratio=10.0)
+        searcher.build_index(documents)
+        searcher.add_documents([{"id": "doc4", "content": "hazard analysis"}])
+
+        # Act
+        with patch.object(BM25Searcher, "_write_manifest", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                searcher.save()
+        reloaded = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+
+        # Assert
+        assert reloaded.document_count == 4
+        assert reloaded.search("hazard")[0]["id"] == "doc4"
+
+    def test_save_replaces_segment(self, tmp_path: Path, documents: list[dict[str, str]]) -> None:
+        """Test each save leaves exactly one segment directory behind."""
+        # Arrange
+        searcher = BM25Searcher.open(tmp_path, "kb_v1_te3small")
+        searcher.build_index(documents)
+
+        # Act
+        searcher.add_documents([{"id": "doc4", "content": "hazard analysis"}])
+        searcher.save()
+
+        # Assert
+        segments = [p for p in (tmp_path / "kb_v1_te3small").iterdir() if p.is_dir()]
+        assert len(segments) == 1
+        assert BM25Searcher.open(tmp_path, "kb_v1_te3small").document_count == 4
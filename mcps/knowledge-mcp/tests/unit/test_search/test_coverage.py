@@ -1,6 +1,7 @@
 """Unit tests for coverage assessment."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -319,6 +320,104 @@ class TestCoverageAssessor:
         assert report.overall_priority == CoveragePriority.SUFFICIENT
 
 
+def _result(score: float, title: str = "Doc") -> SearchResult:
+    """Build a search result with the given score."""
+    return SearchResult(
+        id=f"chunk-{score}",
+        content="content",
+        score=score,
+        document_title=title,
+        document_type="standard",
+        section_title="Section",
+        chunk_type="paragraph",
+        section_hierarchy=[],
+        clause_number="",
+        page_numbers=[],
+        normative=True,
+    )
+
+
+class TestCoverageAssessorParallel:
+    """Tests for concurrent, batched and streaming assessment."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test at most max_concurrency searches run at once."""
+        active = 0
+        peak = 0
+
+        async def slow_search(query: str, n_results: int) -> list[SearchResult]:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [_result(0.8)]
+
+        searcher = MagicMock()
+        searcher.search = AsyncMock(side_effect=slow_search)
+        assessor = CoverageAssessor(searcher, CoverageConfig(max_concurrency=3))
+
+        report = await assessor.assess([f"area{i}" for i in range(10)])
+
+        assert peak == 3
+        assert len(report.covered) == 10
+        assert [c.area for c in report.covered] == [f"area{i}" for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_search_error_isolated_to_area(self) -> None:
+        """Test a failing search marks only that area as an assessment error."""
+        async def search(query: str, n_results: int) -> list[SearchResult]:
+            if query == "broken":
+                raise RuntimeError("store unavailable")
+            return [_result(0.8)]
+
+        searcher = MagicMock()
+        searcher.search = AsyncMock(side_effect=search)
+
+        report = await CoverageAssessor(searcher).assess(["ok", "broken"])
+
+        assert [c.area for c in report.covered] == ["ok"]
+        assert report.gaps[0].area == "broken"
+        assert report.gaps[0].priority == CoveragePriority.MEDIUM
+        assert "store unavailable" in report.gaps[0].reason
+
+    @pytest.mark.asyncio
+    async def test_batch_search_uses_one_call(self) -> None:
+        """Test batch_search assesses every area from one search_many call."""
+        searcher = MagicMock()
+        searcher.search = AsyncMock()
+        searcher.search_many = AsyncMock(
+            return_value=[[_result(0.9, "IEEE 15288"), _result(0.7)], [], [_result(0.2)]]
+        )
+        assessor = CoverageAssessor(searcher, CoverageConfig(batch_search=True))
+
+        report = await assessor.assess(["covered", "empty", "weak"])
+
+        searcher.search_many.assert_awaited_once_with(
+            ["covered", "empty", "weak"], n_results=10
+        )
+        searcher.search.assert_not_called()
+        assert report.covered[0].best_match_title == "IEEE 15288"
+        assert report.covered[0].avg_similarity == pytest.approx(0.8)
+        assert [g.area for g in report.gaps] == ["empty", "weak"]
+        assert report.gaps[0].reason == "No content found"
+        assert report.gaps[1].max_similarity == pytest.approx(0.2)
+
+    @pytest.mark.asyncio
+    async def test_assess_iter_streams_partial_reports(self) -> None:
+        """Test partial reports grow as areas complete and end complete."""
+        searcher = MagicMock()
+        searcher.search = AsyncMock(return_value=[_result(0.8)])
+        assessor = CoverageAssessor(searcher)
+
+        reports = [r async for r in assessor.assess_iter(["a", "b", "c"])]
+
+        assert [r.pending_areas for r in reports] == [2, 1, 0]
+        assert all(r.total_areas == 3 for r in reports)
+        assert reports[-1].to_dict() == (await assessor.assess(["a", "b", "c"])).to_dict()
+
+
 class TestAssessKnowledgeCoverage:
     """Tests for convenience function."""
 
@@ -343,3 +442,53 @@ class TestAssessKnowledgeCoverage:
         report = await assess_knowledge_coverage(mock_searcher, ["test"], config)
 
         assert isinstance(report, CoverageReport)
+
+
+class TestCoverageNativeHybrid:
+    """Tests for coverage assessment over Qdrant's fused hybrid search."""
+
+    @pytest.mark.asyncio
+    async def test_fused_scores_are_similarities(self, tmp_path) -> None:
+        """Test fused hits keep cosine scores, so covered areas are not gaps."""
+        from qdrant_client.models import ScoredPoint
+
+        from knowledge_mcp.search.semantic_search import SemanticSearcher
+        from knowledge_mcp.store.qdrant_store import QdrantStore
+        from knowledge_mcp.utils.config import KnowledgeConfig
+
+        # Arrange
+        config = KnowledgeConfig(
+            openai_api_key="test-api-key-not-real",
+            vector_store="qdrant",
+            qdrant_url="http://localhost:6333",
+            qdrant_api_key="test-qdrant-key-not-real",
+            qdrant_hybrid_search=True,
+            chromadb_path=tmp_path / "chromadb",
+        )
+        query = [0.1] * 1536
+        # RRF scores (1/61, 1/62, ...) would all fall below every threshold
+        points = [
+            ScoredPoint(
+                id=f"chunk-{rank}",
+                version=1,
+                score=1 / (60 + rank),
+                payload={"content": f"Content {rank}", "document_title": "IEEE 15288"},
+                vector={"dense": query},
+            )
+            for rank in range(1, 4)
+        ]
+        embedder = MagicMock()
+        embedder.embed = AsyncMock(return_value=query)
+
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            MockClient.return_value.get_collections.return_value.collections = []
+            MockClient.return_value.query_points.return_value.points = points
+            searcher = SemanticSearcher(embedder, QdrantStore(config), native_hybrid=True)
+
+            # Act
+            report = await CoverageAssessor(searcher).assess(["requirements management"])
+
+        # Assert
+        MockClient.return_value.query_points.assert_called_once()
+        assert report.gaps == []
+        assert report.covered[0].avg_similarity == pytest.approx(1.0)
@@ -1,12 +1,18 @@
 """Unit tests for HybridSearcher and RRF fusion."""
 
+import asyncio
+import threading
+import time
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from knowledge_mcp.exceptions import TimeoutError as SearchTimeoutError
 from knowledge_mcp.search.bm25 import BM25Searcher
 from knowledge_mcp.search.hybrid import HybridSearcher, reciprocal_rank_fusion
 from knowledge_mcp.search.models import SearchResult
+from knowledge_mcp.search.result_cache import SearchResultCache
 from knowledge_mcp.search.semantic_search import SemanticSearcher
 
 
@@ -311,3 +317,194 @@ class TestHybridSearcher:
         assert result.id == "doc1"
         assert result.content == "test content"
         assert "rrf_score" in str(result.score) or result.score > 0
+
+    @pytest.mark.asyncio
+    async def test_search_runs_bm25_off_event_loop(
+        self,
+        hybrid_searcher: HybridSearcher,
+        mock_semantic_searcher: AsyncMock,
+        mock_bm25_searcher: MagicMock,
+    ) -> None:
+        """Test BM25 runs in a worker thread while semantic search is pending."""
+        # Arrange
+        loop_thread = threading.get_ident()
+        bm25_threads: list[int] = []
+        bm25_started = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        def bm25_search(query: str, n_results: int) -> list[dict[str, object]]:
+            bm25_threads.append(threading.get_ident())
+            loop.call_soon_threadsafe(bm25_started.set)
+            return [{"id": "doc2", "content": "test2", "score": 5.0}]
+
+        async def semantic_search(**kwargs: object) -> list[SearchResult]:
+            # Only completes once BM25 has started, proving the legs overlap
+            await asyncio.wait_for(bm25_started.wait(), timeout=5)
+            return [SearchResult(id="doc1", content="test1", score=0.9)]
+
+        mock_bm25_searcher.search.side_effect = bm25_search
+        mock_semantic_searcher.search.side_effect = semantic_search
+
+        # Act
+        results = await hybrid_searcher.search("test query", n_results=5)
+
+        # Assert
+        assert {r.id for r in results} == {"doc1", "doc2"}
+        assert bm25_threads and bm25_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_search_degrades_when_bm25_times_out(
+        self,
+        mock_semantic_searcher: AsyncMock,
+        mock_bm25_searcher: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test semantic results are returned when BM25 exceeds its timeout."""
+        # Arrange
+        def slow_bm25(query: str, n_results: int) -> list[dict[str, object]]:
+            time.sleep(0.5)
+            return [{"id": "doc2", "content": "test2", "score": 5.0}]
+
+        mock_bm25_searcher.search.side_effect = slow_bm25
+        mock_semantic_searcher.search.return_value = [
+            SearchResult(id="doc1", content="test1", score=0.9)
+        ]
+        hybrid = HybridSearcher(
+            mock_semantic_searcher, mock_bm25_searcher, bm25_timeout=0.05
+        )
+
+        # Act
+        results = await hybrid.search("test query", n_results=5)
+
+        # Assert
+        assert [r.id for r in results] == ["doc1"]
+        assert "bm25 leg exceeded 0.05s timeout" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_search_degrades_when_semantic_fails(
+        self,
+        hybrid_searcher: HybridSearcher,
+        mock_semantic_searcher: AsyncMock,
+        mock_bm25_searcher: MagicMock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        """Test BM25 results are returned when the semantic leg raises."""
+        # Arrange
+        mock_semantic_searcher.search.side_effect = RuntimeError("store down")
+        mock_bm25_searcher.search.return_value = [
+            {"id": "doc2", "content": "test2", "score": 5.0}
+        ]
+
+        # Act
+        results = await hybrid_searcher.search("test query", n_results=5)
+
+        # Assert
+        assert [r.id for r in results] == ["doc2"]
+        assert "semantic leg failed" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_search_raises_when_both_legs_fail(
+        self,
+        hybrid_searcher: HybridSearcher,
+        mock_semantic_searcher: AsyncMock,
+        mock_bm25_searcher: MagicMock,
+    ) -> None:
+        """Test a search with no working leg raises instead of returning nothing."""
+        # Arrange
+        mock_semantic_searcher.search.side_effect = ConnectionError("store down")
+        mock_bm25_searcher.search.side_effect = RuntimeError("index corrupt")
+
+        # Act / Assert
+        with pytest.raises(ConnectionError, match="store down"):
+            await hybrid_searcher.search("test query", n_results=5)
+
+    @pytest.mark.asyncio
+    async def test_search_raises_bm25_error_when_semantic_times_out(
+        self,
+        mock_semantic_searcher: AsyncMock,
+        mock_bm25_searcher: MagicMock,
+    ) -> None:
+        """Test the failing leg's error is preferred over the other leg's timeout."""
+        # Arrange
+        async def slow_semantic(**kwargs: object) -> list[SearchResult]:
+            await asyncio.sleep(0.5)
+            return []
+
+        mock_semantic_searcher.search.side_effect = slow_semantic
+        mock_bm25_searcher.search.side_effect = RuntimeError("index corrupt")
+        hybrid = HybridSearcher(
+            mock_semantic_searcher, mock_bm25_searcher, semantic_timeout=0.05
+        )
+
+        # Act / Assert
+        with pytest.raises(RuntimeError, match="index corrupt"):
+            await hybrid.search("test query", n_results=5)
+
+    @pytest.mark.asyncio
+    async def test_search_raises_timeout_when_both_legs_time_out(
+        self,
+        mock_semantic_searcher: AsyncMock,
+        mock_bm25_searcher: MagicMock,
+    ) -> None:
+        """Test two timed-out legs surface as a Knowledge MCP TimeoutError."""
+        # Arrange
+        async def slow_semantic(**kwargs: object) -> list[SearchResult]:
+            await asyncio.sleep(0.5)
+            return []
+
+        def slow_bm25(query: str, n_results: int) -> list[dict[str, object]]:
+            time.sleep(0.2)
+            return []
+
+        mock_semantic_searcher.search.side_effect = slow_semantic
+        mock_bm25_searcher.search.side_effect = slow_bm25
+        hybrid = HybridSearcher(
+            mock_semantic_searcher,
+            mock_bm25_searcher,
+            semantic_timeout=0.05,
+            bm25_timeout=0.05,
+        )
+
+        # Act / Assert
+        with pytest.raises(SearchTimeoutError, match="bm25 leg exceeded"):
+            await hybrid.search("test query", n_results=5)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_search_does_not_hide_degraded_leg(self) -> None:
+        """Test a degraded search stays uncached while another search completes."""
+        # Arrange
+        other_done = asyncio.Event()
+
+        async def semantic_search(query: str, **kwargs: Any) -> list[SearchResult]:
+            if query == "slow bm25":
+                # Finish only after the concurrent search has completed
+                await other_done.wait()
+            return [SearchResult(id="chunk-1", content="SRR entry criteria", score=0.9)]
+
+        def bm25_search(query: str, n_results: int) -> list[dict[str, Any]]:
+            if query == "slow bm25":
+                time.sleep(0.2)
+            return [{"id": "chunk-2", "content": "keyword", "score": 3.0}]
+
+        semantic = MagicMock()
+        semantic.store.collection_name = "se_knowledge_base_v1"
+        semantic.store.generation = 0
+        semantic.search = AsyncMock(side_effect=semantic_search)
+        bm25 = MagicMock()
+        bm25.is_indexed = True
+        bm25.generation = 0
+        bm25.search.side_effect = bm25_search
+        cache = SearchResultCache(max_bytes=1024 * 1024)
+        hybrid = HybridSearcher(semantic, bm25, bm25_timeout=0.05, result_cache=cache)
+
+        async def other_search() -> None:
+            await asyncio.sleep(0.1)  # Start after the slow search's BM25 leg timed out
+            await hybrid.search("fast query")
+            other_done.set()
+
+        # Act
+        degraded, _ = await asyncio.gather(hybrid.search("slow bm25"), other_search())
+
+        # Assert
+        assert [r.id for r in degraded] == ["chunk-1"]
+        assert cache.stats()["entries"] == 1  # Only the complete search was cached
@@ -84,6 +84,55 @@ class TestRerankerInit:
             Reranker(provider="local", model="cross-encoder/ms-marco-TinyBERT-L2-v2")
             mock_st.CrossEncoder.assert_called_once_with("cross-encoder/ms-marco-TinyBERT-L2-v2")
 
+    def test_local_init_onnx_backend(self) -> None:
+        """Test local provider loads the cross-encoder on ONNX Runtime."""
+        mock_st = MagicMock()
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            Reranker(
+                provider="local",
+                model="models/rerank-onnx",
+                backend="onnx",
+                onnx_file_name="onnx/model_qint8_avx2.onnx",
+            )
+            mock_st.CrossEncoder.assert_called_once_with(
+                "models/rerank-onnx",
+                backend="onnx",
+                model_kwargs={
+                    "provider": "CPUExecutionProvider",
+                    "file_name": "onnx/model_qint8_avx2.onnx",
+                },
+            )
+
+    def test_from_config_uses_local_backend(self) -> None:
+        """Test from_config applies the configured local backend."""
+        mock_st = MagicMock()
+        config = MagicMock()
+        config.local_backend = "onnx"
+        config.local_onnx_file_name = ""
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            Reranker.from_config(config, model="models/rerank-onnx")
+            mock_st.CrossEncoder.assert_called_once_with(
+                "models/rerank-onnx",
+                backend="onnx",
+                model_kwargs={"provider": "CPUExecutionProvider"},
+            )
+
+    def test_local_init_with_loaded_cross_encoder(self) -> None:
+        """Test a preloaded cross-encoder is used without loading a model."""
+        mock_st = MagicMock()
+        model = MagicMock()
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            reranker = Reranker(provider="local", cross_encoder=model)
+
+        assert reranker._model is model
+        mock_st.CrossEncoder.assert_not_called()
+
 
 class TestRerankerRerank:
     """Tests for Reranker.rerank method."""
@@ -259,3 +308,132 @@ class TestRerankerRerank:
             assert reranked[0].score == 0.95
             assert reranked[1].score == 0.85
             assert reranked[2].score == 0.70
+
+
+class TestRerankerCacheAndPruning:
+    """Tests for score caching, candidate pruning and passage truncation."""
+
+    @pytest.fixture
+    def mock_st(self) -> MagicMock:
+        """Create mock sentence_transformers scoring passages by length."""
+        mock_st = MagicMock()
+        mock_model = MagicMock()
+        mock_model.max_length = 512
+        mock_model.predict.side_effect = lambda pairs: [float(len(p)) for _, p in pairs]
+        mock_st.CrossEncoder.return_value = mock_model
+        return mock_st
+
+    @pytest.mark.asyncio
+    async def test_repeat_query_uses_cached_scores(self, mock_st: MagicMock) -> None:
+        """Test a repeated query only scores chunks not seen before."""
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            reranker = Reranker(provider="local")
+            model = mock_st.CrossEncoder.return_value
+            first = [make_result("1", "a", 0.9), make_result("2", "bb", 0.8)]
+            await reranker.rerank("SRR entry criteria", first)
+
+            second = [*first, make_result("3", "ccc", 0.7)]
+            reranked = await reranker.rerank("SRR  entry criteria", second)
+
+            assert model.predict.call_count == 2
+            assert model.predict.call_args[0][0] == [("SRR  entry criteria", "ccc")]
+            assert [r.id for r in reranked] == ["3", "2", "1"]
+            assert reranker.cache_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_only_top_candidates_are_scored(self, mock_st: MagicMock) -> None:
+        """Test max_candidates keeps the best first-stage results."""
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            reranker = Reranker(provider="local", max_candidates=2)
+            results = [
+                make_result("low", "content low", 0.1),
+                make_result("high", "content high", 0.9),
+                make_result("mid", "content mid", 0.5),
+            ]
+
+            reranked = await reranker.rerank("query", results)
+
+            assert {r.id for r in reranked[:2]} == {"high", "mid"}
+            assert len(mock_st.CrossEncoder.return_value.predict.call_args[0][0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_unscored_tail_follows_reranked_head(self, mock_st: MagicMock) -> None:
+        """Test results beyond max_candidates keep first-stage order below the head."""
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            # Arrange
+            reranker = Reranker(provider="local", max_candidates=2)
+            results = [
+                make_result("a", "short", 0.9),
+                make_result("b", "longer passage", 0.8),
+                make_result("c", "content c", 0.7),
+                make_result("d", "content d", 0.6),
+            ]
+
+            # Act
+            reranked = await reranker.rerank("query", results)
+
+            # Assert
+            assert [r.id for r in reranked] == ["b", "a", "c", "d"]
+            # Passage length scores: head is 14.0, 5.0; tail steps down from 5.0
+            assert [r.score for r in reranked] == [14.0, 5.0, 4.0, 3.0]
+
+    @pytest.mark.asyncio
+    async def test_long_passages_truncated(self, mock_st: MagicMock) -> None:
+        """Test passages are cut to the model's max length before scoring."""
+        with patch.dict(sys.modules, {"sentence_transformers": mock_st}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            reranker = Reranker(provider="local", max_passage_tokens=3)
+            results = [make_result("1", "one two three four five", 0.9)]
+
+            reranked = await reranker.rerank("query", results)
+
+            pairs = mock_st.CrossEncoder.return_value.predict.call_args[0][0]
+            assert pairs == [("query", "one two three")]
+            # Returned results keep the full content
+            assert reranked[0].content == "one two three four five"
+
+    @pytest.mark.asyncio
+    async def test_cohere_scores_cached(self) -> None:
+        """Test Cohere scores every passage once and reuses them with top_n."""
+        mock_cohere = MagicMock()
+        mock_client = mock_cohere.ClientV2.return_value
+        first_item = MagicMock(index=1, relevance_score=0.9)
+        second_item = MagicMock(index=0, relevance_score=0.4)
+        mock_client.rerank.return_value = MagicMock(results=[first_item, second_item])
+
+        with patch.dict(sys.modules, {"cohere": mock_cohere}):
+            from knowledge_mcp.search.reranker import Reranker
+
+            reranker = Reranker(provider="cohere", api_key=TEST_COHERE_API_KEY)
+            results = [make_result("1", "content 1", 0.9), make_result("2", "content 2", 0.8)]
+
+            first = await reranker.rerank("query", results, top_n=1)
+            second = await reranker.rerank("query", results, top_n=1)
+
+            mock_client.rerank.assert_called_once()
+            assert mock_client.rerank.call_args.kwargs["top_n"] == 2
+            assert [r.id for r in first] == ["2"]
+            assert first == second
+
+
+class TestTruncatePassage:
+    """Tests for truncate_passage."""
+
+    def test_short_text_unchanged(self) -> None:
+        """Test text within the limit is returned as is."""
+        from knowledge_mcp.search.reranker import truncate_passage
+
+        assert truncate_passage("shall  be verified", 10) == "shall  be verified"
+
+    def test_cuts_after_word_limit(self) -> None:
+        """Test text beyond the limit keeps the first max_tokens words."""
+        from knowledge_mcp.search.reranker import truncate_passage
+
+        assert truncate_passage("a b c d e f", 4) == "a b c d"
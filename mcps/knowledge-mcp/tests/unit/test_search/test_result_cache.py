@@ -0,0 +1,299 @@
+# tests/unit/test_search/test_result_cache.py
+"""
+Unit tests for SearchResultCache and its use by the searchers.
+
+Tests cover:
+- Key normalization and separation by generation/strategy
+- TTL expiry and byte-bounded LRU eviction
+- Copy isolation from in-place score adjustments
+- SemanticSearcher/HybridSearcher cache hits and write invalidation
+
+Uses AAA pattern (Arrange-Act-Assert) per testing.md.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from knowledge_mcp.search import HybridSearcher, SearchResult, SemanticSearcher
+from knowledge_mcp.search.result_cache import SearchResultCache
+
+
+def _result(chunk_id: str = "chunk-1", content: str = "SRR entry criteria") -> SearchResult:
+    """Build a search result."""
+    return SearchResult(id=chunk_id, content=content, score=0.9)
+
+
+def _store_result(chunk_id: str = "chunk-1") -> dict[str, Any]:
+    """Build a raw store result."""
+    return {
+        "id": chunk_id,
+        "content": "SRR entry criteria",
+        "score": 0.9,
+        "metadata": {"document_id": "ieee-15288", "document_title": "IEEE 15288.2"},
+    }
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestSearchResultCache:
+    """Tests for SearchResultCache."""
+
+    def test_key_normalizes_whitespace(self) -> None:
+        """Test queries differing only in whitespace share a key."""
+        # Act
+        a = SearchResultCache.make_key("SRR  entry\tcriteria ", strategy="semantic", collection="c")
+        b = SearchResultCache.make_key("SRR entry criteria", strategy="semantic", collection="c")
+
+        # Assert
+        assert a == b
+
+    def test_key_separates_generation_strategy_and_filters(self) -> None:
+        """Test generation, strategy and filters each change the key."""
+        # Arrange
+        base = {"strategy": "semantic", "collection": "c", "generation": 0}
+
+        # Act
+        key = SearchResultCache.make_key("q", **base)  # type: ignore[arg-type]
+
+        # Assert
+        assert key != SearchResultCache.make_key("q", **{**base, "generation": 1})  # type: ignore[arg-type]
+        assert key != SearchResultCache.make_key("q", **{**base, "strategy": "hybrid"})  # type: ignore[arg-type]
+        assert key != SearchResultCache.make_key(
+            "q", **base, filter_dict={"normative": True}  # type: ignore[arg-type]
+        )
+
+    def test_get_returns_copies(self) -> None:
+        """Test in-place score changes by callers do not leak into the cache."""
+        # Arrange
+        cache = SearchResultCache(max_bytes=1024 * 1024)
+        results = [_result()]
+        cache.set("k", results)
+        results[0].score = 0.1
+
+        # Act
+        first = cache.get("k")
+        assert first is not None
+        first[0].score = 0.2
+        second = cache.get("k")
+
+        # Assert
+        assert second is not None
+        assert second[0].score == 0.9
+        assert cache.hits == 2
+
+    def test_non_positive_ttl_rejected(self) -> None:
+        """Test a cache that would never expire entries cannot be built."""
+        with pytest.raises(ValueError, match="ttl_seconds must be positive"):
+            SearchResultCache(max_bytes=1024, ttl_seconds=0)
+
+    def test_entries_expire_after_ttl(self) -> None:
+        """Test an entry past its TTL is a miss and is dropped."""
+        # Arrange
+        clock = FakeClock()
+        cache = SearchResultCache(max_bytes=1024 * 1024, ttl_seconds=60, clock=clock)
+        cache.set("k", [_result()])
+
+        # Act
+        clock.now = 59.0
+        fresh = cache.get("k")
+        clock.now = 61.0
+        stale = cache.get("k")
+
+        # Assert
+        assert fresh is not None
+        assert stale is None
+        assert cache.expirations == 1
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+    def test_evicts_least_recently_used_within_budget(self) -> None:
+        """Test the byte budget evicts the least recently used entry."""
+        # Arrange
+        probe = SearchResultCache(max_bytes=1024 * 1024)
+        probe.set("probe", [_result(content="x" * 1000)])
+        entry_size = probe.size_bytes
+        cache = SearchResultCache(max_bytes=entry_size * 2)
+        cache.set("a", [_result(content="x" * 1000)])
+        cache.set("b", [_result(content="y" * 1000)])
+        cache.get("a")
+
+        # Act
+        cache.set("c", [_result(content="z" * 1000)])
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.evictions == 1
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_zero_budget_disables(self) -> None:
+        """Test max_bytes=0 stores nothing."""
+        # Arrange
+        cache = SearchResultCache(max_bytes=0)
+
+        # Act
+        cache.set("k", [_result()])
+
+        # Assert
+        assert cache.get("k") is None
+
+    def test_stats(self) -> None:
+        """Test stats report counters and hit rate."""
+        # Arrange
+        cache = SearchResultCache(max_bytes=1024 * 1024, ttl_seconds=30)
+        cache.set("k", [_result()])
+        cache.get("k")
+        cache.get("missing")
+
+        # Act
+        stats = cache.stats()
+
+        # Assert
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+        assert stats["ttl_seconds"] == 30
+
+
+class TestSemanticSearcherResultCache:
+    """Tests for SemanticSearcher with a result cache."""
+
+    @pytest.fixture
+    def mock_embedder(self) -> AsyncMock:
+        """Create mock embedder."""
+        embedder = AsyncMock()
+        embedder.embed.return_value = [0.1] * 1536
+        embedder.embed_batch.side_effect = lambda texts: [[0.1] * 1536 for _ in texts]
+        return embedder
+
+    @pytest.fixture
+    def mock_store(self) -> MagicMock:
+        """Create mock store with a collection name and write generation."""
+        store = MagicMock()
+        store.collection_name = "se_knowledge_base_v1"
+        store.generation = 0
+        store.search.return_value = [_store_result()]
+        store.search_batch.side_effect = lambda embeddings, **_: [
+            [_store_result()] for _ in embeddings
+        ]
+        return store
+
+    @pytest.fixture
+    def searcher(self, mock_embedder: AsyncMock, mock_store: MagicMock) -> SemanticSearcher:
+        """Create searcher with a result cache."""
+        return SemanticSearcher(
+            mock_embedder, mock_store, result_cache=SearchResultCache(max_bytes=1024 * 1024)
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_search_is_served_from_cache(
+        self,
+        searcher: SemanticSearcher,
+        mock_embedder: AsyncMock,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test an identical search skips the embedder and the store."""
+        # Act
+        first = await searcher.search("SRR entry criteria", n_results=5)
+        second = await searcher.search("SRR  entry criteria ", n_results=5)
+
+        # Assert
+        assert first == second
+        mock_embedder.embed.assert_awaited_once()
+        mock_store.search.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_write_generation_invalidates(
+        self,
+        searcher: SemanticSearcher,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test a store write forces the next search to query again."""
+        # Arrange
+        await searcher.search("SRR entry criteria")
+
+        # Act
+        mock_store.generation = 1
+        await searcher.search("SRR entry criteria")
+
+        # Assert
+        assert mock_store.search.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_search_is_not_cached(
+        self,
+        searcher: SemanticSearcher,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test a store error is retried rather than cached as empty."""
+        # Arrange
+        mock_store.search.side_effect = [ConnectionError("down"), [_store_result()]]
+
+        # Act
+        failed = await searcher.search("SRR entry criteria")
+        retried = await searcher.search("SRR entry criteria")
+
+        # Assert
+        assert failed == []
+        assert len(retried) == 1
+
+    @pytest.mark.asyncio
+    async def test_search_many_embeds_only_misses(
+        self,
+        searcher: SemanticSearcher,
+        mock_embedder: AsyncMock,
+    ) -> None:
+        """Test cached queries are left out of the batched embed call."""
+        # Arrange
+        await searcher.search("SRR entry criteria")
+
+        # Act
+        results = await searcher.search_many(["SRR entry criteria", "PDR exit criteria"])
+
+        # Assert
+        assert [len(r) for r in results] == [1, 1]
+        mock_embedder.embed_batch.assert_awaited_once_with(["PDR exit criteria"])
+
+
+class TestHybridSearcherResultCache:
+    """Tests for HybridSearcher with a result cache."""
+
+    @pytest.mark.asyncio
+    async def test_bm25_mutation_invalidates(self) -> None:
+        """Test a BM25 index change forces the next hybrid search to run."""
+        # Arrange
+        semantic = MagicMock()
+        semantic.store.collection_name = "se_knowledge_base_v1"
+        semantic.store.generation = 0
+        semantic.search = AsyncMock(return_value=[_result()])
+        bm25 = MagicMock()
+        bm25.is_indexed = True
+        bm25.generation = 0
+        bm25.search.return_value = [{"id": "chunk-2", "content": "keyword", "score": 3.0}]
+        hybrid = HybridSearcher(
+            semantic, bm25, result_cache=SearchResultCache(max_bytes=1024 * 1024)
+        )
+
+        # Act
+        await hybrid.search("traceability")
+        await hybrid.search("traceability")
+        bm25.generation = 1
+        await hybrid.search("traceability")
+
+        # Assert
+        assert semantic.search.await_count == 2
+        assert bm25.search.call_count == 2
@@ -21,6 +21,7 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from knowledge_mcp.search import SearchResult, SemanticSearcher
+from knowledge_mcp.store import AsyncStore
 
 
 class TestSemanticSearcherSearch:
@@ -116,6 +117,24 @@ class TestSemanticSearcherSearch:
         call_kwargs = mock_store.search.call_args[1]
         assert call_kwargs["query_embedding"] == expected_embedding
         assert call_kwargs["n_results"] == 5
+        assert "query_text" not in call_kwargs
+
+    @pytest.mark.asyncio
+    async def test_search_native_hybrid_passes_query_text(
+        self,
+        mock_embedder: AsyncMock,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test that native_hybrid forwards the raw query to the store."""
+        # Arrange
+        searcher = SemanticSearcher(mock_embedder, mock_store, native_hybrid=True)
+
+        # Act
+        await searcher.search("SRR requirements", n_results=5)
+
+        # Assert
+        call_kwargs = mock_store.search.call_args[1]
+        assert call_kwargs["query_text"] == "SRR requirements"
 
     @pytest.mark.asyncio
     async def test_search_transforms_metadata_to_search_result(
@@ -139,6 +158,29 @@ class TestSemanticSearcherSearch:
         assert result.clause_number == "5.3.1"
         assert result.page_numbers == [42, 43]
 
+    def test_close_shuts_down_wrapped_store(
+        self, mock_embedder: AsyncMock, mock_store: MagicMock
+    ) -> None:
+        """Test close() stops the AsyncStore the searcher created."""
+        searcher = SemanticSearcher(mock_embedder, mock_store)
+
+        searcher.close()
+
+        with pytest.raises(RuntimeError):
+            searcher._async_store._executor.submit(print)
+
+    def test_close_leaves_shared_store_open(
+        self, mock_embedder: AsyncMock, mock_store: MagicMock
+    ) -> None:
+        """Test close() does not stop an AsyncStore passed in by the caller."""
+        shared = AsyncStore(mock_store)
+        searcher = SemanticSearcher(mock_embedder, shared)
+
+        searcher.close()
+
+        shared._executor.submit(print).result()
+        shared.close()
+
 
 class TestSemanticSearcherEmptyHandling:
     """Tests for empty query and no results handling."""
@@ -284,6 +326,84 @@ class TestSemanticSearcherFiltering:
         assert call_kwargs["n_results"] == n_results
 
 
+class TestSemanticSearcherSearchMany:
+    """Tests for SemanticSearcher.search_many method."""
+
+    @pytest.fixture
+    def mock_embedder(self) -> AsyncMock:
+        """Create mock embedder returning one embedding per text."""
+        embedder = AsyncMock()
+        embedder.embed_batch.side_effect = lambda texts: [[float(i)] * 4 for i in range(len(texts))]
+        return embedder
+
+    @pytest.fixture
+    def mock_store(self) -> MagicMock:
+        """Create mock store answering each batched query with its index."""
+        store = MagicMock()
+        store.search_batch.side_effect = lambda embeddings, **kwargs: [
+            [{"id": f"chunk-{int(e[0])}", "content": "c", "score": 0.8, "metadata": {}}]
+            for e in embeddings
+        ]
+        return store
+
+    @pytest.fixture
+    def searcher(self, mock_embedder: AsyncMock, mock_store: MagicMock) -> SemanticSearcher:
+        """Create SemanticSearcher with mocked dependencies."""
+        return SemanticSearcher(mock_embedder, mock_store)
+
+    @pytest.mark.asyncio
+    async def test_one_embed_and_one_store_call(
+        self,
+        searcher: SemanticSearcher,
+        mock_embedder: AsyncMock,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test all queries share one embed_batch and one search_batch call."""
+        # Act
+        results = await searcher.search_many(["SRR", "PDR", "CDR"], n_results=5)
+
+        # Assert
+        mock_embedder.embed_batch.assert_awaited_once_with(["SRR", "PDR", "CDR"])
+        mock_embedder.embed.assert_not_called()
+        mock_store.search_batch.assert_called_once()
+        assert mock_store.search_batch.call_args.kwargs["n_results"] == 5
+        assert [[r.id for r in batch] for batch in results] == [
+            ["chunk-0"], ["chunk-1"], ["chunk-2"]
+        ]
+
+    @pytest.mark.asyncio
+    async def test_empty_queries_keep_positions(
+        self,
+        searcher: SemanticSearcher,
+        mock_embedder: AsyncMock,
+    ) -> None:
+        """Test empty queries get empty lists without being embedded."""
+        # Act
+        results = await searcher.search_many(["", "PDR", "   "])
+
+        # Assert
+        mock_embedder.embed_batch.assert_awaited_once_with(["PDR"])
+        assert results[0] == []
+        assert [r.id for r in results[1]] == ["chunk-0"]
+        assert results[2] == []
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_empty_lists(
+        self,
+        searcher: SemanticSearcher,
+        mock_embedder: AsyncMock,
+    ) -> None:
+        """Test a failed batch degrades to empty results per query."""
+        # Arrange
+        mock_embedder.embed_batch.side_effect = ConnectionError("API down")
+
+        # Act
+        results = await searcher.search_many(["SRR", "PDR"])
+
+        # Assert
+        assert results == [[], []]
+
+
 class TestSemanticSearcherErrorHandling:
     """Tests for error handling and graceful degradation."""
 
@@ -9,7 +9,7 @@ import pytest
 
 from knowledge_mcp.search.models import SearchResult
 from knowledge_mcp.search.strategies.base import SearchQuery, SearchStrategy
-from knowledge_mcp.search.workflow_search import WorkflowSearcher
+from knowledge_mcp.search.workflow_search import WorkflowSearcher, fuse_results
 
 
 class MockStrategy(SearchStrategy):
@@ -188,3 +188,136 @@ class TestWorkflowSearcher:
         result = await workflow.search("test")
         assert "error" in result
         assert result["result_type"] == "error"
+
+
+class TestWorkflowSearcherFanOut:
+    """Tests for fan-out (multi-query) workflow search."""
+
+    @pytest.fixture
+    def mock_semantic_searcher(self) -> MagicMock:
+        """Create mock searcher whose sub-queries overlap on result 2."""
+        searcher = MagicMock()
+        searcher.search = AsyncMock(return_value=[])
+        searcher.search_many = AsyncMock(
+            side_effect=lambda queries, **kwargs: [
+                [
+                    SearchResult(id="2", content="Shared", score=0.7),
+                    SearchResult(id=f"q{i}", content=q, score=0.9),
+                ]
+                for i, q in enumerate(queries)
+            ]
+        )
+        return searcher
+
+    @pytest.fixture
+    def facet_strategy(self) -> MockStrategy:
+        """Strategy adding two facets and one expansion."""
+        strategy = MockStrategy()
+        base = strategy.preprocess_query
+
+        async def preprocess(query: str, params: dict[str, Any]) -> SearchQuery:
+            search_query = await base(query, params)
+            search_query.facets = ["definitions", "examples"]
+            return search_query
+
+        strategy.preprocess_query = preprocess  # type: ignore[method-assign]
+        return strategy
+
+    @pytest.mark.asyncio
+    async def test_sub_queries_sent_in_one_batch(
+        self,
+        mock_semantic_searcher: MagicMock,
+        facet_strategy: MockStrategy,
+    ) -> None:
+        """Original, each facet and the expansion go to one search_many call."""
+        workflow = WorkflowSearcher(mock_semantic_searcher, facet_strategy, fan_out=True)
+
+        await workflow.search("risk", n_results=5)
+
+        mock_semantic_searcher.search.assert_not_called()
+        mock_semantic_searcher.search_many.assert_awaited_once()
+        queries = mock_semantic_searcher.search_many.call_args.args[0]
+        assert queries == [
+            "risk",
+            "risk definitions",
+            "risk examples",
+            "risk risk expanded",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_results_fused_and_truncated(
+        self,
+        mock_semantic_searcher: MagicMock,
+        facet_strategy: MockStrategy,
+    ) -> None:
+        """Results found by every sub-query survive truncation; n_results is honoured."""
+        workflow = WorkflowSearcher(mock_semantic_searcher, facet_strategy, fan_out=True)
+
+        result = await workflow.search("risk", n_results=3)
+
+        assert result["total_results"] == 3
+        contents = [r["content"] for r in result["results"]]
+        assert contents == ["risk", "risk definitions", "Shared"]
+        # Strategies rank by the fused results' original similarities
+        assert result["results"][2]["score"] == pytest.approx(0.77)
+
+    @pytest.mark.asyncio
+    async def test_max_fan_out_caps_sub_queries(
+        self,
+        mock_semantic_searcher: MagicMock,
+        facet_strategy: MockStrategy,
+    ) -> None:
+        """Sub-queries beyond max_fan_out are dropped."""
+        workflow = WorkflowSearcher(
+            mock_semantic_searcher, facet_strategy, fan_out=True, max_fan_out=2
+        )
+
+        await workflow.search("risk")
+
+        queries = mock_semantic_searcher.search_many.call_args.args[0]
+        assert queries == ["risk", "risk definitions"]
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(
+        self,
+        mock_semantic_searcher: MagicMock,
+        facet_strategy: MockStrategy,
+    ) -> None:
+        """Without fan_out only the original query is searched."""
+        workflow = WorkflowSearcher(mock_semantic_searcher, facet_strategy)
+
+        await workflow.search("risk")
+
+        mock_semantic_searcher.search.assert_awaited_once()
+        mock_semantic_searcher.search_many.assert_not_called()
+
+
+class TestFuseResults:
+    """Tests for fuse_results."""
+
+    def test_scores_keep_best_similarity(self) -> None:
+        """Fused results carry their best similarity across sub-queries."""
+        a = SearchResult(id="a", content="A", score=0.5)
+        a_again = SearchResult(id="a", content="A", score=0.7)
+        b = SearchResult(id="b", content="B", score=0.4)
+
+        fused = fuse_results([[a, b], [a_again], []])
+
+        assert [r.id for r in fused] == ["a", "b"]
+        assert fused[0].score == pytest.approx(0.7)
+        assert fused[1].score == pytest.approx(0.4)
+        assert a.score == 0.5  # Inputs are not mutated
+
+    def test_order_follows_rrf_not_similarity(self) -> None:
+        """A result found by more sub-queries ranks above a single strong hit."""
+        common = SearchResult(id="common", content="C", score=0.6)
+        strong = SearchResult(id="strong", content="S", score=0.9)
+
+        fused = fuse_results([[strong, common], [common], [common]])
+
+        assert [r.id for r in fused] == ["common", "strong"]
+        assert [r.score for r in fused] == pytest.approx([0.6, 0.9])
+
+    def test_empty_batches(self) -> None:
+        """No results in any list yields an empty list."""
+        assert fuse_results([[], []]) == []
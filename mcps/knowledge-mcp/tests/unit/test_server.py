@@ -45,6 +45,7 @@ class TestListTools:
         tool_names = [tool.name for tool in response.root.tools]
         # Original tools (v1.0)
         assert "knowledge_search" in tool_names
+        assert "knowledge_search_batch" in tool_names
         assert "knowledge_stats" in tool_names
         # Phase 1 acquisition tools (v2.0)
         assert "knowledge_ingest" in tool_names
@@ -82,11 +83,11 @@ class TestListTools:
         assert "score_threshold" in search_tool.inputSchema["properties"]
 
     @pytest.mark.asyncio
-    async def test_knowledge_stats_tool_has_empty_schema(
+    async def test_knowledge_stats_tool_has_no_required_parameters(
         self,
         server: KnowledgeMCPServer,
     ) -> None:
-        """Test that knowledge_stats tool has no required parameters."""
+        """Test that knowledge_stats tool only takes an optional output format."""
         # Arrange
         request = ListToolsRequest()
 
@@ -96,7 +97,7 @@ class TestListTools:
 
         # Assert
         assert stats_tool.inputSchema["required"] == []
-        assert stats_tool.inputSchema["properties"] == {}
+        assert list(stats_tool.inputSchema["properties"]) == ["format"]
 
 
 class TestKnowledgeSearch:
@@ -257,6 +258,100 @@ class TestKnowledgeSearch:
         assert data["results"] == []
 
 
+class TestKnowledgeSearchBatch:
+    """Tests for knowledge_search_batch tool handler."""
+
+    @pytest.fixture
+    def mock_embedder(self) -> AsyncMock:
+        """Create a mock embedder."""
+        embedder = AsyncMock()
+        embedder.embed_batch.side_effect = lambda texts: [[0.1] * 1536 for _ in texts]
+        return embedder
+
+    @pytest.fixture
+    def mock_store(self) -> MagicMock:
+        """Create a mock store with a batched search."""
+        store = MagicMock()
+        store.search_batch.return_value = [
+            [
+                {
+                    "id": "chunk-1",
+                    "content": "Verification planning",
+                    "score": 0.9,
+                    "metadata": {"document_id": "ieee-15288", "clause_number": "6.4.9"},
+                }
+            ],
+            [],
+        ]
+        return store
+
+    @pytest.fixture
+    def server(
+        self,
+        mock_embedder: AsyncMock,
+        mock_store: MagicMock,
+    ) -> KnowledgeMCPServer:
+        """Create server instance with mocked dependencies."""
+        return KnowledgeMCPServer(
+            name="test-server",
+            embedder=mock_embedder,
+            store=mock_store,
+        )
+
+    @pytest.mark.asyncio
+    async def test_batch_returns_results_per_query(
+        self,
+        server: KnowledgeMCPServer,
+        mock_embedder: AsyncMock,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test one embed call and one store call serve every query, in order."""
+        # Arrange
+        request = CallToolRequest(
+            params={
+                "name": "knowledge_search_batch",
+                "arguments": {"queries": ["verification", "nothing"], "n_results": 3},
+            }
+        )
+
+        # Act
+        response = await server.server.request_handlers[CallToolRequest](request)
+
+        # Assert
+        import json
+        data = json.loads(response.root.content[0].text)
+        assert data["count"] == 2
+        assert data["results"][0]["query"] == "verification"
+        assert data["results"][0]["count"] == 1
+        assert "citation" in data["results"][0]["results"][0]
+        assert data["results"][0]["results"][0]["relevance"] == "90%"
+        assert data["results"][1] == {"query": "nothing", "results": [], "count": 0}
+        mock_embedder.embed_batch.assert_awaited_once_with(["verification", "nothing"])
+        mock_embedder.embed.assert_not_called()
+        mock_store.search_batch.assert_called_once()
+        assert mock_store.search_batch.call_args.kwargs["n_results"] == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_empty_queries(
+        self,
+        server: KnowledgeMCPServer,
+        mock_store: MagicMock,
+    ) -> None:
+        """Test an empty query list fails input validation without searching."""
+        # Arrange
+        request = CallToolRequest(
+            params={"name": "knowledge_search_batch", "arguments": {"queries": []}}
+        )
+
+        # Act
+        response = await server.server.request_handlers[CallToolRequest](request)
+
+        # Assert
+        assert response.root.isError is True
+        assert "Input validation error" in response.root.content[0].text
+        mock_store.search_batch.assert_not_called()
+
+
 class TestKnowledgeStats:
     """Tests for knowledge_stats tool handler."""
 
@@ -331,6 +426,79 @@ class TestKnowledgeStats:
         # Assert
         mock_store.get_stats.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_stats_includes_search_cache_counters(
+        self,
+        server: KnowledgeMCPServer,
+    ) -> None:
+        """Test that stats surface search result cache hits and misses."""
+        # Arrange
+        from knowledge_mcp.search.result_cache import SearchResultCache
+
+        server._result_cache = SearchResultCache(max_bytes=1024 * 1024)
+        server._result_cache.get("missing")
+        request = CallToolRequest(params={"name": "knowledge_stats", "arguments": {}})
+
+        # Act
+        response = await server.server.request_handlers[CallToolRequest](request)
+
+        # Assert
+        import json
+        data = json.loads(response.root.content[0].text)
+        assert data["total_chunks"] == 1234
+        assert data["search_cache"]["hits"] == 0
+        assert data["search_cache"]["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_includes_latency_spans(
+        self,
+        server: KnowledgeMCPServer,
+    ) -> None:
+        """Test that stats report per-tool latency once recording is enabled."""
+        # Arrange
+        from knowledge_mcp.monitoring.spans import get_recorder
+
+        recorder = get_recorder()
+        recorder.reset()
+        recorder.enabled = True
+        request = CallToolRequest(params={"name": "knowledge_stats", "arguments": {}})
+
+        # Act
+        await server.server.request_handlers[CallToolRequest](request)
+        response = await server.server.request_handlers[CallToolRequest](request)
+
+        # Assert
+        import json
+        data = json.loads(response.root.content[0].text)
+        assert data["latency"]["spans"]["tool.knowledge_stats"]["count"] == 1
+        assert "p95_ms" in data["latency"]["spans"]["tool.knowledge_stats"]
+
+    @pytest.mark.asyncio
+    async def test_stats_prometheus_format(
+        self,
+        server: KnowledgeMCPServer,
+    ) -> None:
+        """Test that stats can be exported as Prometheus text."""
+        # Arrange
+        from knowledge_mcp.monitoring.spans import get_recorder
+
+        recorder = get_recorder()
+        recorder.reset()
+        recorder.enabled = True
+        with recorder.span("store.search"):
+            pass
+        request = CallToolRequest(
+            params={"name": "knowledge_stats", "arguments": {"format": "prometheus"}}
+        )
+
+        # Act
+        response = await server.server.request_handlers[CallToolRequest](request)
+
+        # Assert
+        text = response.root.content[0].text
+        assert "# TYPE knowledge_mcp_span_duration_seconds histogram" in text
+        assert 'knowledge_mcp_span_duration_seconds_count{span="store.search"} 1' in text
+
 
 class TestErrorHandling:
     """Tests for error handling in tool handlers."""
@@ -376,6 +544,29 @@ class TestErrorHandling:
         assert data["isError"] is True
         assert "Unknown tool: unknown_tool" in data["error"]
 
+    @pytest.mark.asyncio
+    async def test_unknown_tools_share_one_latency_span(
+        self,
+        server: KnowledgeMCPServer,
+    ) -> None:
+        """Test that arbitrary tool names do not each create a span."""
+        # Arrange
+        from knowledge_mcp.monitoring.spans import get_recorder
+
+        recorder = get_recorder()
+        recorder.reset()
+        recorder.enabled = True
+
+        # Act
+        for name in ("unknown_tool", "another_unknown_tool"):
+            request = CallToolRequest(params={"name": name, "arguments": {}})
+            await server.server.request_handlers[CallToolRequest](request)
+
+        # Assert
+        spans = recorder.snapshot()["spans"]
+        assert spans["tool.unknown"]["count"] == 2
+        assert "tool.unknown_tool" not in spans
+
     @pytest.mark.asyncio
     async def test_search_connection_error_returns_structured_error(
         self,
@@ -522,11 +713,12 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_config.cache_enabled = False
             mock_config.token_tracking_enabled = False
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+            with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                 mock_embedder_cls.return_value = MagicMock()
                 with patch("knowledge_mcp.server.create_store") as mock_create_store:
                     mock_create_store.return_value = MagicMock()
@@ -542,16 +734,20 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_config.cache_enabled = True
             mock_config.cache_dir = "/tmp/cache"
             mock_config.embedding_model = "text-embedding-3-small"
+            mock_config.embedding_cache_model = "text-embedding-3-small"
             mock_config.cache_size_limit = 100
+            mock_config.cache_memory_size_limit = 10
+            mock_config.cache_dtype = "float16"
             mock_config.token_tracking_enabled = False
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.EmbeddingCache") as mock_cache_cls:
+            with patch("knowledge_mcp.embed.cache.EmbeddingCache") as mock_cache_cls:
                 mock_cache_cls.return_value = MagicMock()
-                with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+                with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                     mock_embedder_cls.return_value = MagicMock()
                     with patch("knowledge_mcp.server.create_store") as mock_create_store:
                         mock_create_store.return_value = MagicMock()
@@ -562,6 +758,8 @@ class TestEnsureDependencies:
                                 "/tmp/cache",
                                 "text-embedding-3-small",
                                 size_limit=100,
+                                memory_size_limit=10,
+                                dtype="float16",
                             )
 
     def test_ensure_dependencies_creates_embedder_with_tracker(self) -> None:
@@ -572,6 +770,7 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_config.cache_enabled = False
             mock_config.token_tracking_enabled = True
             mock_config.token_log_file = "/tmp/tokens.log"
@@ -579,9 +778,9 @@ class TestEnsureDependencies:
             mock_config.daily_token_warning_threshold = 1000
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.TokenTracker") as mock_tracker_cls:
+            with patch("knowledge_mcp.monitoring.token_tracker.TokenTracker") as mock_tracker_cls:
                 mock_tracker_cls.return_value = MagicMock()
-                with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+                with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                     mock_embedder_cls.return_value = MagicMock()
                     with patch("knowledge_mcp.server.create_store") as mock_create_store:
                         mock_create_store.return_value = MagicMock()
@@ -602,11 +801,12 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_config.cache_enabled = False
             mock_config.token_tracking_enabled = False
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+            with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                 mock_embedder_cls.return_value = MagicMock()
                 with patch("knowledge_mcp.server.create_store") as mock_create_store:
                     mock_store = MagicMock()
@@ -624,11 +824,12 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_config.cache_enabled = False
             mock_config.token_tracking_enabled = False
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+            with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                 mock_embedder = MagicMock()
                 mock_embedder_cls.return_value = mock_embedder
                 with patch("knowledge_mcp.server.create_store") as mock_create_store:
@@ -637,7 +838,14 @@ class TestEnsureDependencies:
                     with patch("knowledge_mcp.server.SemanticSearcher") as mock_searcher_cls:
                         server._ensure_dependencies()
 
-                        mock_searcher_cls.assert_called_once_with(mock_embedder, mock_store)
+                        mock_searcher_cls.assert_called_once_with(
+                            mock_embedder,
+                            server._async_store,
+                            native_hybrid=mock_config.qdrant_hybrid_search,
+                            result_cache=server._result_cache,
+                        )
+                        assert server._async_store.store is mock_store
+                        assert server._async_store.max_concurrency == 8
 
     def test_ensure_dependencies_skips_if_already_initialized(self) -> None:
         """Test that _ensure_dependencies is idempotent."""
@@ -670,9 +878,10 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+            with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                 with patch("knowledge_mcp.server.create_store") as mock_create_store:
                     mock_create_store.return_value = MagicMock()
                     with patch("knowledge_mcp.server.SemanticSearcher") as mock_searcher_cls:
@@ -694,11 +903,12 @@ class TestEnsureDependencies:
 
         with patch("knowledge_mcp.server.load_config") as mock_load:
             mock_config = MagicMock()
+            mock_config.store_max_concurrency = 8
             mock_config.cache_enabled = False
             mock_config.token_tracking_enabled = False
             mock_load.return_value = mock_config
 
-            with patch("knowledge_mcp.server.OpenAIEmbedder") as mock_embedder_cls:
+            with patch("knowledge_mcp.embed.openai_embedder.OpenAIEmbedder") as mock_embedder_cls:
                 mock_embedder_cls.return_value = MagicMock()
                 with patch("knowledge_mcp.server.create_store") as mock_create_store:
                     with patch("knowledge_mcp.server.SemanticSearcher") as mock_searcher_cls:
@@ -709,7 +919,7 @@ class TestEnsureDependencies:
                         # But SemanticSearcher should use our injected store
                         mock_searcher_cls.assert_called_once()
                         call_args = mock_searcher_cls.call_args
-                        assert call_args[0][1] is mock_store
+                        assert call_args[0][1].store is mock_store
 
 
 class TestServerRun:
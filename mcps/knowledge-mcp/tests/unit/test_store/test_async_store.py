@@ -0,0 +1,137 @@
+"""Unit tests for AsyncStore."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from knowledge_mcp.store.async_store import AsyncStore
+
+
+class TestAsyncStore:
+    """Tests for AsyncStore class."""
+
+    @pytest.fixture
+    def mock_store(self) -> MagicMock:
+        """Create a mock synchronous store."""
+        store = MagicMock()
+        store.search.return_value = [{"id": "chunk-1", "content": "c", "score": 0.9}]
+        store.get_stats.return_value = {"total_chunks": 3}
+        store.health_check.return_value = True
+        store.validate_embedding_model.return_value = True
+        store.add_chunks.return_value = 2
+        return store
+
+    def test_rejects_invalid_concurrency(self, mock_store: MagicMock) -> None:
+        """Test max_concurrency below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncStore(mock_store, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_delegates_to_store(self, mock_store: MagicMock) -> None:
+        """Test each method forwards to the wrapped store."""
+        # Arrange
+        async_store = AsyncStore(mock_store)
+
+        # Act
+        results = await async_store.search(
+            [0.1, 0.2], n_results=3, filter_dict={"normative": True}, query_text="q"
+        )
+        stats = await async_store.get_stats()
+        healthy = await async_store.health_check()
+        valid = await async_store.validate_embedding_model("text-embedding-3-small")
+        added = await async_store.add_chunks([MagicMock(), MagicMock()])
+
+        # Assert
+        assert results[0]["id"] == "chunk-1"
+        mock_store.search.assert_called_once_with(
+            query_embedding=[0.1, 0.2],
+            n_results=3,
+            filter_dict={"normative": True},
+            score_threshold=0.0,
+            query_text="q",
+        )
+        assert stats == {"total_chunks": 3}
+        assert healthy is True
+        assert valid is True
+        assert added == 2
+
+    @pytest.mark.asyncio
+    async def test_runs_off_event_loop(self, mock_store: MagicMock) -> None:
+        """Test store calls do not run on the event loop thread."""
+        # Arrange
+        loop_thread = threading.get_ident()
+        call_threads: list[int] = []
+        mock_store.get_stats.side_effect = lambda: call_threads.append(threading.get_ident())
+        async_store = AsyncStore(mock_store)
+
+        # Act
+        await async_store.get_stats()
+
+        # Assert
+        assert call_threads and call_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self, mock_store: MagicMock) -> None:
+        """Test no more than max_concurrency calls run at once."""
+        # Arrange
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def slow_search(**kwargs: object) -> list[dict[str, object]]:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            return []
+
+        mock_store.search.side_effect = slow_search
+        async_store = AsyncStore(mock_store, max_concurrency=2)
+
+        # Act
+        await asyncio.gather(*(async_store.search([0.1]) for _ in range(6)))
+
+        # Assert
+        assert peak == 2
+        async_store.close()
+
+    @pytest.mark.asyncio
+    async def test_search_batch_uses_store_batch(self, mock_store: MagicMock) -> None:
+        """Test search_batch makes one batched store call when available."""
+        # Arrange
+        mock_store.search_batch.return_value = [[{"id": "a"}], [{"id": "b"}]]
+        async_store = AsyncStore(mock_store)
+
+        # Act
+        results = await async_store.search_batch([[0.1], [0.2]], n_results=3)
+
+        # Assert
+        assert results == [[{"id": "a"}], [{"id": "b"}]]
+        mock_store.search_batch.assert_called_once()
+        assert mock_store.search_batch.call_args.kwargs["n_results"] == 3
+        mock_store.search.assert_not_called()
+        async_store.close()
+
+    @pytest.mark.asyncio
+    async def test_search_batch_falls_back_to_search(self) -> None:
+        """Test stores without search_batch get one search per query."""
+        # Arrange
+        store = MagicMock(spec=["search"])
+        store.search.side_effect = lambda **kwargs: [{"id": str(kwargs["query_embedding"])}]
+        async_store = AsyncStore(store)
+
+        # Act
+        results = await async_store.search_batch([[0.1], [0.2]])
+
+        # Assert
+        assert results == [[{"id": "[0.1]"}], [{"id": "[0.2]"}]]
+        assert store.search.call_count == 2
+        async_store.close()
@@ -0,0 +1,149 @@
+"""Unit tests for batched bulk uploads."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from knowledge_mcp.store.base import BaseStore
+from knowledge_mcp.store.bulk import UploadStats, iter_batches, upload_batches
+
+
+class ListStore(BaseStore):
+    """Store recording add_chunks batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[Any]] = []
+
+    def add_chunks(self, chunks: list[Any]) -> int:
+        self.batches.append(chunks)
+        return len(chunks)
+
+    def search(self, query_embedding: list[float], **kwargs: Any) -> list[dict[str, Any]]:
+        return []
+
+    def get_stats(self) -> dict[str, Any]:
+        return {}
+
+    def health_check(self) -> bool:
+        return True
+
+
+class TestIterBatches:
+    """Tests for iter_batches."""
+
+    def test_groups_stream_lazily(self) -> None:
+        """Test batches are cut from a generator without consuming it upfront."""
+        # Arrange
+        consumed: list[int] = []
+
+        def stream():
+            for i in range(5):
+                consumed.append(i)
+                yield i
+
+        # Act
+        batches = iter_batches(stream(), 2)
+        first = next(batches)
+
+        # Assert
+        assert first == [0, 1]
+        assert consumed == [0, 1]
+        assert list(batches) == [[2, 3], [4]]
+
+    def test_rejects_invalid_size(self) -> None:
+        """Test a batch size below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="batch size"):
+            list(iter_batches([1], 0))
+
+
+class TestUploadBatches:
+    """Tests for upload_batches."""
+
+    def test_sequential_upload_keeps_order(self) -> None:
+        """Test parallelism 1 sends batches in order and counts them."""
+        # Arrange
+        sent: list[list[int]] = []
+
+        # Act
+        stats = upload_batches(iter_batches(range(7), 3), sent.append)
+
+        # Assert
+        assert sent == [[0, 1, 2], [3, 4, 5], [6]]
+        assert (stats.points, stats.batches) == (7, 3)
+
+    def test_parallel_upload_is_bounded(self) -> None:
+        """Test no more than parallelism sends run at once, and all complete."""
+        # Arrange
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+        sent: list[int] = []
+
+        def send(batch: list[int]) -> None:
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+                sent.extend(batch)
+
+        # Act
+        stats = upload_batches(iter_batches(range(100), 10), send, parallelism=3)
+
+        # Assert
+        assert peak == 3
+        assert sorted(sent) == list(range(100))
+        assert (stats.points, stats.batches) == (100, 10)
+        assert stats.points_per_second > 0
+
+    def test_parallel_upload_stops_on_failure(self) -> None:
+        """Test the first failed send is raised and later batches are not sent."""
+        # Arrange
+        sent: list[int] = []
+
+        def send(batch: list[int]) -> None:
+            if batch[0] == 0:
+                raise ConnectionError("upsert failed")
+            time.sleep(0.01)
+            sent.extend(batch)
+
+        # Act / Assert
+        with pytest.raises(ConnectionError, match="upsert failed"):
+            upload_batches(iter_batches(range(1000), 10), send, parallelism=2)
+        assert len(sent) < 990
+
+    def test_rejects_invalid_parallelism(self) -> None:
+        """Test parallelism below 1 raises ValueError."""
+        with pytest.raises(ValueError, match="parallelism"):
+            upload_batches([], print, parallelism=0)
+
+
+def test_base_store_bulk_load_batches_add_chunks() -> None:
+    """Test the default bulk_load calls add_chunks once per batch."""
+    # Arrange
+    store = ListStore()
+
+    # Act
+    stats = store.bulk_load(iter(range(5)), batch_size=2)
+
+    # Assert
+    assert store.batches == [[0, 1], [2, 3], [4]]
+    assert stats.points == 5
+
+
+def test_upload_stats_to_dict() -> None:
+    """Test stats serialize with derived throughput."""
+    stats = UploadStats(points=500, batches=2, elapsed_seconds=0.25)
+    assert stats.to_dict() == {
+        "points": 500,
+        "batches": 2,
+        "elapsed_seconds": 0.25,
+        "points_per_second": 2000.0,
+    }
+    assert UploadStats().points_per_second == 0.0
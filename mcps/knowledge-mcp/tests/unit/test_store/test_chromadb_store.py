@@ -39,6 +39,7 @@ def create_mock_chromadb() -> tuple[MagicMock, MagicMock, MagicMock]:
     mock_collection = MagicMock()
     mock_chromadb.PersistentClient.return_value = mock_client
     mock_client.get_or_create_collection.return_value = mock_collection
+    mock_client.get_max_batch_size.return_value = 5461
     return mock_chromadb, mock_client, mock_collection
 
 
@@ -182,6 +183,36 @@ class TestChromaDBStoreAddChunks:
             result = store.add_chunks(sample_chunks)
             assert result == 2
 
+    def test_add_chunks_bumps_generation(
+        self, mock_config: KnowledgeConfig, sample_chunks: list[KnowledgeChunk]
+    ) -> None:
+        """Verify each write advances the generation used by result caches."""
+        mock_chromadb, mock_client, mock_collection = create_mock_chromadb()
+
+        with patch.dict(sys.modules, {"chromadb": mock_chromadb}):
+            from knowledge_mcp.store.chromadb_store import ChromaDBStore
+            store = ChromaDBStore(mock_config)
+
+            assert store.generation == 0
+            store.add_chunks(sample_chunks)
+
+            assert store.generation == 1
+            assert store.collection_name == mock_config.versioned_chromadb_collection_name
+
+    def test_delete_chunks_by_id(self, mock_config: KnowledgeConfig) -> None:
+        """Verify delete_chunks removes ids and bumps the generation."""
+        mock_chromadb, mock_client, mock_collection = create_mock_chromadb()
+
+        with patch.dict(sys.modules, {"chromadb": mock_chromadb}):
+            from knowledge_mcp.store.chromadb_store import ChromaDBStore
+            store = ChromaDBStore(mock_config)
+
+            deleted = store.delete_chunks(["chunk-1"])
+
+            assert deleted == 1
+            mock_collection.delete.assert_called_once_with(ids=["chunk-1"])
+            assert store.generation == 1
+
     def test_add_empty_chunks_returns_zero(self, mock_config: KnowledgeConfig) -> None:
         """Verify 0 returned for empty list."""
         mock_chromadb, mock_client, mock_collection = create_mock_chromadb()
@@ -247,6 +278,36 @@ class TestChromaDBStoreAddChunks:
             assert "created_at" in metadata
 
 
+    def test_bulk_load_respects_max_batch_size(self, mock_config: KnowledgeConfig) -> None:
+        """Verify upserts never exceed the client's maximum batch size."""
+        mock_chromadb, mock_client, mock_collection = create_mock_chromadb()
+        mock_client.get_max_batch_size.return_value = 4
+
+        with patch.dict(sys.modules, {"chromadb": mock_chromadb}):
+            from knowledge_mcp.store.chromadb_store import ChromaDBStore
+            store = ChromaDBStore(mock_config)
+
+            chunks = (
+                KnowledgeChunk(
+                    id=f"chunk-{i}",
+                    document_id="doc-1",
+                    document_title="Test Doc",
+                    document_type="standard",
+                    content=f"Content {i}",
+                    content_hash=f"hash{i}",
+                    token_count=10,
+                    embedding=[0.1] * 8,
+                )
+                for i in range(10)
+            )
+
+            stats = store.bulk_load(chunks, batch_size=100)
+
+            sizes = [len(c.kwargs["ids"]) for c in mock_collection.upsert.call_args_list]
+            assert sizes == [4, 4, 2]
+            assert (stats.points, stats.batches) == (10, 3)
+            assert store.generation == 1
+
 class TestChromaDBStoreSearch:
     """Tests for ChromaDBStore.search method."""
 
@@ -289,6 +350,32 @@ class TestChromaDBStoreSearch:
             assert results[0]["metadata"]["document_id"] == "doc-1"
             assert "score" in results[0]
 
+    def test_search_batch_single_query_call(self, mock_config: KnowledgeConfig) -> None:
+        """Verify several embeddings are answered by one collection.query call."""
+        mock_chromadb, mock_client, mock_collection = create_mock_chromadb()
+
+        mock_collection.query.return_value = {
+            "ids": [["chunk-1"], ["chunk-2", "chunk-3"]],
+            "documents": [["Content 1"], ["Content 2", "Content 3"]],
+            "metadatas": [[{}], [{}, {}]],
+            "distances": [[0.1], [0.2, 0.9]],
+        }
+
+        with patch.dict(sys.modules, {"chromadb": mock_chromadb}):
+            from knowledge_mcp.store.chromadb_store import ChromaDBStore
+            store = ChromaDBStore(mock_config)
+
+            results = store.search_batch(
+                [[0.1] * 1536, [0.2] * 1536], n_results=2, score_threshold=0.5
+            )
+
+            mock_collection.query.assert_called_once()
+            assert len(mock_collection.query.call_args[1]["query_embeddings"]) == 2
+            assert [[r["id"] for r in batch] for batch in results] == [
+                ["chunk-1"],
+                ["chunk-2"],
+            ]
+
     def test_search_converts_distance_to_score(
         self, mock_config: KnowledgeConfig
     ) -> None:
@@ -15,18 +15,26 @@ from unittest.mock import MagicMock, patch
 import pytest
 from qdrant_client.http.exceptions import UnexpectedResponse
 from qdrant_client.models import (
+    BinaryQuantization,
+    BinaryQuantizationConfig,
     CollectionInfo,
     CollectionStatus,
+    Disabled,
     Distance,
     FieldCondition,
     Filter,
+    FusionQuery,
     MatchAny,
     MatchValue,
     NamedVector,
     OptimizersConfigDiff,
     PayloadSchemaType,
     PointStruct,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
     ScoredPoint,
+    SparseVector,
     VectorParams,
 )
 
@@ -230,6 +238,44 @@ class TestQdrantStoreAddChunks:
 
             assert result == 2
 
+    def test_add_chunks_bumps_generation(
+        self, mock_config: KnowledgeConfig, sample_chunks: list[KnowledgeChunk]
+    ) -> None:
+        """Verify each write advances the generation used by result caches."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config)
+
+            assert store.generation == 0
+            store.add_chunks(sample_chunks)
+            store.add_chunks([])
+
+            assert store.generation == 1
+            assert store.collection_name == mock_config.versioned_collection_name
+
+    def test_delete_chunks_by_id(self, mock_config: KnowledgeConfig) -> None:
+        """Verify delete_chunks removes points by id and bumps the generation."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config)
+
+            assert store.delete_chunks([]) == 0
+            deleted = store.delete_chunks(["chunk-1", "chunk-2"])
+
+            assert deleted == 2
+            mock_client.delete.assert_called_once()
+            selector = mock_client.delete.call_args.kwargs["points_selector"]
+            assert selector.points == ["chunk-1", "chunk-2"]
+            assert store.generation == 1
+
     def test_add_empty_chunks_returns_zero(self, mock_config: KnowledgeConfig) -> None:
         """Verify empty list returns 0 without calling upsert."""
         with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
@@ -275,14 +321,14 @@ class TestQdrantStoreAddChunks:
                 store.add_chunks([chunk_without_embedding])
 
     def test_add_chunks_batches_large_lists(self, mock_config: KnowledgeConfig) -> None:
-        """Verify batching for >100 chunks."""
+        """Verify batching by store_upload_batch_size."""
         with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
             mock_client = MagicMock()
             MockClient.return_value = mock_client
             mock_client.get_collections.return_value.collections = []
 
             from knowledge_mcp.store.qdrant_store import QdrantStore
-            store = QdrantStore(mock_config)
+            store = QdrantStore(mock_config.model_copy(update={"store_upload_batch_size": 100}))
 
             # Create 250 chunks
             large_chunks = [
@@ -301,10 +347,59 @@ class TestQdrantStoreAddChunks:
 
             result = store.add_chunks(large_chunks)
 
-            # Should batch into 3 calls (100, 100, 50)
+            # Should batch into 3 calls (100, 100, 50), each acknowledged once applied
             assert mock_client.upsert.call_count == 3
+            assert all(c.kwargs["wait"] is True for c in mock_client.upsert.call_args_list)
+            assert sorted(len(c.kwargs["points"]) for c in mock_client.upsert.call_args_list) == [
+                50,
+                100,
+                100,
+            ]
             assert result == 250
 
+    def test_bulk_load_streams_concurrent_batches(self, mock_config: KnowledgeConfig) -> None:
+        """Verify bulk_load consumes a generator and upserts without waiting."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config)
+
+            chunks = (
+                KnowledgeChunk(
+                    id=f"chunk-{i}",
+                    document_id="doc-1",
+                    document_title="Test Doc",
+                    document_type="standard",
+                    content=f"Content {i}",
+                    content_hash=f"hash{i}",
+                    token_count=10,
+                    embedding=[0.1] * 1536,
+                )
+                for i in range(1000)
+            )
+
+            generations: list[int] = []
+            mock_client.upsert.side_effect = lambda **kwargs: generations.append(
+                store.generation
+            )
+
+            stats = store.bulk_load(chunks, batch_size=64, parallelism=4)
+
+            assert stats.points == 1000
+            assert stats.batches == 16
+            *batches, barrier = mock_client.upsert.call_args_list
+            assert len(batches) == 16
+            assert all(c.kwargs["wait"] is False for c in batches)
+            uploaded = {p.id for c in batches for p in c.kwargs["points"]}
+            assert len(uploaded) == 1000
+            # Caches are invalidated only once the final waiting upsert returns
+            assert barrier.kwargs["wait"] is True
+            assert generations == [0] * 17
+            assert store.generation == 1
+
     def test_add_chunks_hybrid_mode(
         self, mock_config_hybrid: KnowledgeConfig, sample_chunks: list[KnowledgeChunk]
     ) -> None:
@@ -325,6 +420,27 @@ class TestQdrantStoreAddChunks:
             assert isinstance(point.vector, dict)
             assert "dense" in point.vector
 
+    def test_add_chunks_hybrid_writes_sparse_vectors(
+        self, mock_config_hybrid: KnowledgeConfig, sample_chunks: list[KnowledgeChunk]
+    ) -> None:
+        """Verify BM25 sparse vectors are written alongside dense vectors."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config_hybrid)
+
+            store.add_chunks(sample_chunks)
+
+            point = mock_client.upsert.call_args[1]["points"][0]
+            sparse = point.vector["sparse"]
+            assert isinstance(sparse, SparseVector)
+            # "Test content 1" -> three distinct tokens
+            assert len(sparse.indices) == 3
+            assert all(v > 0 for v in sparse.values)
+
 
 class TestQdrantStoreSearch:
     """Tests for QdrantStore.search method."""
@@ -403,6 +519,15 @@ class TestQdrantStoreSearch:
             ),
         ]
 
+    @pytest.fixture
+    def mock_fused_results(self, mock_search_results: list[ScoredPoint]) -> list[ScoredPoint]:
+        """Create fused hits carrying RRF scores and their dense vectors."""
+        vectors = [[0.1] * 1536, [0.1] * 768 + [0.0] * 768]
+        return [
+            point.model_copy(update={"score": 1 / (60 + rank), "vector": {"dense": vector}})
+            for rank, (point, vector) in enumerate(zip(mock_search_results, vectors), start=1)
+        ]
+
     def test_search_returns_formatted_results(
         self, mock_config: KnowledgeConfig, mock_search_results: list[ScoredPoint]
     ) -> None:
@@ -556,6 +681,157 @@ class TestQdrantStoreSearch:
             # Should be a plain list, not NamedVector
             assert isinstance(call_kwargs["query_vector"], list)
 
+    def test_search_hybrid_with_query_text_fuses_server_side(
+        self, mock_config_hybrid: KnowledgeConfig, mock_fused_results: list[ScoredPoint]
+    ) -> None:
+        """Verify query_text triggers a single prefetch + RRF query."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            mock_client.query_points.return_value.points = mock_fused_results
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config_hybrid)
+
+            results = store.search(
+                [0.1] * 1536,
+                n_results=5,
+                filter_dict={"normative": True},
+                score_threshold=0.3,
+                query_text="verification requirements",
+            )
+
+            mock_client.search.assert_not_called()
+            call_kwargs = mock_client.query_points.call_args[1]
+            assert isinstance(call_kwargs["query"], FusionQuery)
+            assert call_kwargs["limit"] == 5
+            dense, sparse = call_kwargs["prefetch"]
+            assert dense.using == "dense"
+            assert dense.limit == 10
+            assert dense.score_threshold == 0.3
+            assert dense.filter is not None
+            assert sparse.using == "sparse"
+            assert isinstance(sparse.query, SparseVector)
+            assert sparse.filter is not None
+            assert call_kwargs["with_vectors"] == ["dense"]
+            assert [r["id"] for r in results] == ["chunk-1", "chunk-2"]
+
+    def test_search_hybrid_scores_fused_hits_by_cosine(
+        self, mock_config_hybrid: KnowledgeConfig, mock_fused_results: list[ScoredPoint]
+    ) -> None:
+        """Verify fused hits keep RRF order but report dense cosine similarity."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            mock_client.query_points.return_value.points = mock_fused_results
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config_hybrid)
+
+            results = store.search([0.1] * 1536, n_results=5, query_text="verification")
+            above_threshold = store.search(
+                [0.1] * 1536, n_results=5, score_threshold=0.8, query_text="verification"
+            )
+
+            assert [r["id"] for r in results] == ["chunk-1", "chunk-2"]
+            assert results[0]["score"] == pytest.approx(1.0)
+            assert results[1]["score"] == pytest.approx(0.5**0.5)
+            assert [r["id"] for r in above_threshold] == ["chunk-1"]
+
+    def test_search_hybrid_without_tokens_skips_sparse_leg(
+        self, mock_config_hybrid: KnowledgeConfig, mock_search_results: list[ScoredPoint]
+    ) -> None:
+        """Verify punctuation-only query text only prefetches dense."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            mock_client.query_points.return_value.points = mock_search_results
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config_hybrid)
+
+            store.search([0.1] * 1536, n_results=5, query_text="?!")
+
+            prefetch = mock_client.query_points.call_args[1]["prefetch"]
+            assert [p.using for p in prefetch] == ["dense"]
+
+
+    def test_search_batch_sends_one_request(
+        self, mock_config: KnowledgeConfig, mock_search_results: list[ScoredPoint]
+    ) -> None:
+        """Verify several embeddings are sent as one query_batch_points call."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            first, second = MagicMock(), MagicMock()
+            first.points = mock_search_results
+            second.points = mock_search_results[:1]
+            mock_client.query_batch_points.return_value = [first, second]
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config)
+
+            results = store.search_batch(
+                [[0.1] * 1536, [0.2] * 1536],
+                n_results=5,
+                filter_dict={"normative": True},
+                score_threshold=0.3,
+            )
+
+            mock_client.query_batch_points.assert_called_once()
+            mock_client.search.assert_not_called()
+            requests = mock_client.query_batch_points.call_args[1]["requests"]
+            assert len(requests) == 2
+            assert requests[0].limit == 5
+            assert requests[0].score_threshold == 0.3
+            assert requests[0].filter is not None
+            assert requests[0].using is None
+            assert [len(batch) for batch in results] == [2, 1]
+            assert results[0][0]["id"] == "chunk-1"
+
+    def test_search_batch_hybrid_fuses_per_query(
+        self, mock_config_hybrid: KnowledgeConfig, mock_fused_results: list[ScoredPoint]
+    ) -> None:
+        """Verify query_texts turn each batched request into a fused query."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            response = MagicMock()
+            response.points = mock_fused_results
+            mock_client.query_batch_points.return_value = [response, response]
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config_hybrid)
+
+            results = store.search_batch(
+                [[0.1] * 1536, [0.2] * 1536],
+                n_results=5,
+                query_texts=["verification", "validation"],
+            )
+
+            requests = mock_client.query_batch_points.call_args[1]["requests"]
+            assert all(isinstance(r.query, FusionQuery) for r in requests)
+            assert all(r.with_vector == ["dense"] for r in requests)
+            assert [p.using for p in requests[0].prefetch] == ["dense", "sparse"]
+            assert results[1][0]["score"] == pytest.approx(1.0)
+
+    def test_search_batch_rejects_misaligned_texts(
+        self, mock_config: KnowledgeConfig
+    ) -> None:
+        """Verify query_texts must align with query_embeddings."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            MockClient.return_value.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config)
+
+            with pytest.raises(ValueError, match="query_texts"):
+                store.search_batch([[0.1] * 1536], query_texts=["a", "b"])
 
 class TestQdrantStoreStats:
     """Tests for QdrantStore.get_stats method."""
@@ -751,3 +1027,169 @@ class TestQdrantStoreHealthCheck:
             result = store.health_check()
 
             assert result is False
+
+
+class TestQdrantStoreQuantization:
+    """Tests for dense vector quantization."""
+
+    @pytest.fixture
+    def mock_config(self, tmp_path: Path) -> KnowledgeConfig:
+        """Create test configuration with scalar quantization."""
+        return KnowledgeConfig(
+            openai_api_key=TEST_OPENAI_API_KEY,
+            embedding_model="text-embedding-3-small",
+            embedding_dimensions=1536,
+            vector_store="qdrant",
+            qdrant_url="http://localhost:6333",
+            qdrant_api_key=TEST_QDRANT_API_KEY,
+            qdrant_collection="test_collection",
+            qdrant_hybrid_search=False,
+            qdrant_quantization="scalar",
+            qdrant_quantization_oversampling=3.0,
+            chromadb_path=tmp_path / "chromadb",
+        )
+
+    def test_creates_collection_with_scalar_quantization(
+        self, mock_config: KnowledgeConfig
+    ) -> None:
+        """Verify int8 quantization in RAM with originals moved to disk."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            QdrantStore(mock_config)
+
+            call_kwargs = mock_client.create_collection.call_args[1]
+            quantization = call_kwargs["quantization_config"]
+            assert isinstance(quantization, ScalarQuantization)
+            assert quantization.scalar.type == ScalarType.INT8
+            assert quantization.scalar.always_ram is True
+            assert call_kwargs["vectors_config"]["dense"].on_disk is True
+
+    def test_creates_collection_with_binary_quantization(
+        self, mock_config: KnowledgeConfig
+    ) -> None:
+        """Verify binary quantization config."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            QdrantStore(mock_config.model_copy(update={"qdrant_quantization": "binary"}))
+
+            call_kwargs = mock_client.create_collection.call_args[1]
+            assert isinstance(call_kwargs["quantization_config"], BinaryQuantization)
+
+    def test_no_quantization_by_default(self, mock_config: KnowledgeConfig) -> None:
+        """Verify unquantized collections keep vectors in memory and search plainly."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            mock_client.search.return_value = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config.model_copy(update={"qdrant_quantization": "none"}))
+            store.search([0.1] * 1536, n_results=5)
+
+            call_kwargs = mock_client.create_collection.call_args[1]
+            assert call_kwargs["quantization_config"] is None
+            assert call_kwargs["vectors_config"]["dense"].on_disk is None
+            assert mock_client.search.call_args[1]["search_params"] is None
+
+    def test_quantizes_existing_collection(self, mock_config: KnowledgeConfig) -> None:
+        """Verify an existing collection is updated instead of recreated."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            existing_collection = MagicMock()
+            existing_collection.name = mock_config.versioned_collection_name
+            mock_client.get_collections.return_value.collections = [existing_collection]
+            mock_client.get_collection.return_value.config.quantization_config = None
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            QdrantStore(mock_config)
+
+            mock_client.create_collection.assert_not_called()
+            call_kwargs = mock_client.update_collection.call_args[1]
+            assert isinstance(call_kwargs["quantization_config"], ScalarQuantization)
+            assert call_kwargs["vectors_config"]["dense"].on_disk is True
+
+    def test_matching_collection_is_not_updated(self, mock_config: KnowledgeConfig) -> None:
+        """Verify reopening an already quantized collection sends no update."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            existing_collection = MagicMock()
+            existing_collection.name = mock_config.versioned_collection_name
+            mock_client.get_collections.return_value.collections = [existing_collection]
+            # Collection already carries the configured int8 quantization
+            mock_client.get_collection.return_value.config.quantization_config = (
+                ScalarQuantization(
+                    scalar=ScalarQuantizationConfig(
+                        type=ScalarType.INT8, quantile=0.99, always_ram=True
+                    )
+                )
+            )
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            QdrantStore(mock_config)
+
+            mock_client.update_collection.assert_not_called()
+
+    def test_switching_to_none_disables_quantization(
+        self, mock_config: KnowledgeConfig
+    ) -> None:
+        """Verify quantization is removed and vectors return to RAM for "none"."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            existing_collection = MagicMock()
+            existing_collection.name = mock_config.versioned_collection_name
+            mock_client.get_collections.return_value.collections = [existing_collection]
+            mock_client.get_collection.return_value.config.quantization_config = (
+                BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+            )
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            QdrantStore(mock_config.model_copy(update={"qdrant_quantization": "none"}))
+
+            call_kwargs = mock_client.update_collection.call_args[1]
+            assert call_kwargs["quantization_config"] == Disabled.DISABLED
+            assert call_kwargs["vectors_config"]["dense"].on_disk is False
+
+    def test_search_oversamples_and_rescores(self, mock_config: KnowledgeConfig) -> None:
+        """Verify searches ask Qdrant to rescore oversampled candidates."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            mock_client.search.return_value = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config)
+            store.search([0.1] * 1536, n_results=5)
+
+            params = mock_client.search.call_args[1]["search_params"]
+            assert params.quantization.oversampling == 3.0
+            assert params.quantization.rescore is True
+            assert store.get_stats()["config"]["quantization"] == "scalar"
+
+    def test_hybrid_dense_leg_uses_quantized_search(self, mock_config: KnowledgeConfig) -> None:
+        """Verify the dense prefetch carries the quantization search params."""
+        with patch("knowledge_mcp.store.qdrant_store.QdrantClient") as MockClient:
+            mock_client = MagicMock()
+            MockClient.return_value = mock_client
+            mock_client.get_collections.return_value.collections = []
+            mock_client.query_points.return_value.points = []
+
+            from knowledge_mcp.store.qdrant_store import QdrantStore
+            store = QdrantStore(mock_config.model_copy(update={"qdrant_hybrid_search": True}))
+            store.search([0.1] * 1536, n_results=5, query_text="verification requirements")
+
+            dense, sparse = mock_client.query_points.call_args[1]["prefetch"]
+            assert dense.params.quantization.rescore is True
+            assert sparse.params is None
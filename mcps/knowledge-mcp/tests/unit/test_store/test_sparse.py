@@ -0,0 +1,69 @@
+"""Unit tests for BM25-style sparse vector encoding."""
+
+from __future__ import annotations
+
+import pytest
+
+from knowledge_mcp.store.sparse import (
+    encode_document,
+    encode_query,
+    token_index,
+    tokenize,
+)
+
+
+class TestTokenize:
+    """Tests for tokenize function."""
+
+    def test_lowercases_and_strips_punctuation(self) -> None:
+        """Test tokens are lowercase words without punctuation."""
+        assert tokenize("The SRR, per IEEE-15288.") == ["the", "srr", "per", "ieee", "15288"]
+
+    def test_token_index_is_stable(self) -> None:
+        """Test token hashing is deterministic and 32-bit."""
+        assert token_index("requirements") == token_index("requirements")
+        assert 0 <= token_index("requirements") < 2**32
+
+
+class TestEncodeDocument:
+    """Tests for encode_document function."""
+
+    def test_empty_text(self) -> None:
+        """Test text without tokens yields an empty vector."""
+        assert encode_document("  ...  ") == ([], [])
+
+    def test_indices_sorted_and_unique(self) -> None:
+        """Test each distinct token maps to one sorted dimension."""
+        indices, values = encode_document("review requirements review")
+
+        assert len(indices) == 2
+        assert indices == sorted(indices)
+        assert len(values) == 2
+
+    def test_term_frequency_saturates(self) -> None:
+        """Test repeated terms weigh more, but sub-linearly."""
+        indices, values = encode_document("shall shall shall verify", avg_len=4)
+        weights = dict(zip(indices, values))
+
+        shall = weights[token_index("shall")]
+        verify = weights[token_index("verify")]
+        assert verify < shall < 3 * verify
+
+    def test_longer_documents_weigh_less(self) -> None:
+        """Test length normalization lowers weights in long documents."""
+        idx = token_index("verify")
+        short = dict(zip(*encode_document("verify")))
+        long = dict(zip(*encode_document("verify " + "filler " * 500)))
+
+        assert long[idx] < short[idx]
+
+
+class TestEncodeQuery:
+    """Tests for encode_query function."""
+
+    def test_binary_weights(self) -> None:
+        """Test each unique query token has weight 1.0."""
+        indices, values = encode_query("system requirements system")
+
+        assert len(indices) == 2
+        assert values == pytest.approx([1.0, 1.0])
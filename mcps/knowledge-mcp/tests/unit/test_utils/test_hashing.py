@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from knowledge_mcp.utils.hashing import compute_content_hash
+import uuid
+
+from knowledge_mcp.utils.hashing import compute_chunk_id, compute_content_hash
 
 
 class TestComputeContentHash:
@@ -127,3 +129,23 @@ Line 3"""
         hash2 = compute_content_hash(text)
 
         assert hash1 == hash2
+
+
+class TestComputeChunkId:
+    """Tests for compute_chunk_id function."""
+
+    def test_deterministic_uuid(self) -> None:
+        """Test the same inputs give the same UUID string."""
+        chunk_id = compute_chunk_id("ieee-15288", "6 > 6.4#6.4.7", "abc")
+
+        assert chunk_id == compute_chunk_id("ieee-15288", "6 > 6.4#6.4.7", "abc")
+        assert str(uuid.UUID(chunk_id)) == chunk_id
+
+    def test_each_component_changes_id(self) -> None:
+        """Test document, clause path, hash and occurrence all affect the id."""
+        base = compute_chunk_id("doc", "path", "hash")
+
+        assert base != compute_chunk_id("doc-2", "path", "hash")
+        assert base != compute_chunk_id("doc", "path-2", "hash")
+        assert base != compute_chunk_id("doc", "path", "hash-2")
+        assert base != compute_chunk_id("doc", "path", "hash", occurrence=1)
@@ -7,6 +7,9 @@ import pytest
 from knowledge_mcp.utils.tokenizer import (
     TokenizerConfig,
     count_tokens,
+    encode_batch,
+    get_encoding,
+    token_offsets,
     truncate_to_tokens,
 )
 
@@ -182,3 +185,43 @@ class TestTruncateToTokens:
         assert isinstance(result, str)
         assert len(result) > 0
         assert count_tokens(result) <= 3
+
+
+class TestEncodeBatch:
+    """Tests for encode_batch function."""
+
+    def test_matches_single_encode(self) -> None:
+        """Test batched ids equal encoding each text separately."""
+        texts = ["Hello world", "", "The system shall be verified."]
+        encoding = get_encoding()
+
+        assert encode_batch(texts) == [encoding.encode(t) for t in texts]
+
+    def test_large_batch_uses_thread_pool(self) -> None:
+        """Test large batches keep input order through tiktoken's pool."""
+        texts = [f"Requirement {i} " * 2000 for i in range(8)]
+
+        result = encode_batch(texts)
+
+        assert [len(ids) for ids in result] == [count_tokens(t) for t in texts]
+
+    def test_empty_batch(self) -> None:
+        """Test an empty batch returns no encodings."""
+        assert encode_batch([]) == []
+
+
+class TestTokenOffsets:
+    """Tests for token_offsets function."""
+
+    @pytest.mark.parametrize(
+        "text",
+        ["Hello world", "Unicode 你好 café", "Line one\n\nLine two | cell |", ""],
+    )
+    def test_matches_decode_with_offsets(self, text: str) -> None:
+        """Test offsets agree with tiktoken's decode_with_offsets."""
+        encoding = get_encoding()
+        token_ids = encoding.encode(text)
+
+        _, expected = encoding.decode_with_offsets(token_ids)
+
+        assert token_offsets(token_ids) == expected
@@ -7,7 +7,12 @@ from unittest.mock import AsyncMock
 
 import pytest
 
-from knowledge_mcp.validation.table_validator import TableValidator, ValidationResult
+from knowledge_mcp.validation.table_validator import (
+    BatchSearcherProtocol,
+    SearcherProtocol,
+    TableValidator,
+    ValidationResult,
+)
 
 
 @dataclass
@@ -68,7 +73,7 @@ class TestTableValidator:
     @pytest.fixture
     def mock_searcher(self) -> AsyncMock:
         """Create a mock searcher."""
-        return AsyncMock()
+        return AsyncMock(spec=SearcherProtocol)
 
     @pytest.fixture
     def validator(self, mock_searcher: AsyncMock) -> TableValidator:
@@ -311,6 +316,55 @@ class TestTableValidator:
         assert result.details["occurrence_scale"] is True
 
 
+class TestTableValidatorBatchSearch:
+    """Tests for TableValidator with a batch-capable searcher."""
+
+    @pytest.fixture
+    def mock_searcher(self) -> AsyncMock:
+        """Create a mock searcher with search_many."""
+        return AsyncMock(spec=BatchSearcherProtocol)
+
+    @pytest.fixture
+    def validator(self, mock_searcher: AsyncMock) -> TableValidator:
+        """Create validator with mock searcher."""
+        return TableValidator(mock_searcher, "test_collection")
+
+    @pytest.mark.asyncio
+    async def test_uses_single_batch_call(
+        self,
+        validator: TableValidator,
+        mock_searcher: AsyncMock,
+    ) -> None:
+        """Test all validation queries go through one search_many call."""
+        mock_searcher.search_many.side_effect = lambda queries, **_: [
+            [MockChunk(id="chunk-1", content="MIL-STD-882 severity categories")],
+            [MockChunk(id="chunk-1", content="MIL-STD-882 severity categories")],
+            [MockChunk(id="chunk-2", content="Catastrophic Critical Marginal Negligible")],
+        ][: len(queries)]
+
+        result = await validator.validate_mil_std_severity()
+
+        mock_searcher.search_many.assert_awaited_once()
+        assert mock_searcher.search_many.call_args.kwargs["collection"] == "test_collection"
+        mock_searcher.search.assert_not_called()
+        assert result.chunks_retrieved == 2
+        assert result.passed is True
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_returns_failed_result(
+        self,
+        validator: TableValidator,
+        mock_searcher: AsyncMock,
+    ) -> None:
+        """Test a failed batch call yields a failed validation, not an error."""
+        mock_searcher.search_many.side_effect = Exception("Network error")
+
+        result = await validator.validate_ap_matrix()
+
+        assert result.passed is False
+        assert result.chunks_retrieved == 0
+
+
 class TestCriticalTables:
     """Tests for critical table registry."""
 